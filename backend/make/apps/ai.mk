@@ -1,9 +1,18 @@
-.PHONY: ai-run-agentic-rag ai-update-chapter-chunks ai-update-chapter-context \
-	ai-update-committee-chunks ai-update-committee-context ai-update-event-chunks \
-	ai-update-event-context ai-update-project-chunks ai-update-project-context \
+.PHONY: ai-benchmark-chunk-retrieval ai-evaluate-retrieval ai-run-agentic-rag \
+	ai-update-chapter-chunks ai-update-chapter-context ai-update-committee-chunks \
+	ai-update-committee-context ai-update-event-chunks ai-update-event-context \
+	ai-update-project-chunks ai-update-project-context \
 	ai-update-repository-chunks ai-update-repository-context ai-update-slack-message-chunks \
 	ai-update-slack-message-context
 
+ai-benchmark-chunk-retrieval:
+	@echo "Benchmarking chunk retrieval"
+	@CMD="python manage.py ai_benchmark_chunk_retrieval" $(MAKE) backend-exec-command
+
+ai-evaluate-retrieval:
+	@echo "Evaluating chunk retrieval"
+	@CMD="python manage.py ai_evaluate_retrieval" $(MAKE) backend-exec-command
+
 ai-run-agentic-rag:
 	@echo "Running agentic RAG"
 	@CMD="python manage.py ai_run_agentic_rag" $(MAKE) backend-exec-command
@@ -1,5 +1,5 @@
-.PHONY: github-add-related-repositories github-enrich-issues github-update-owasp-organization \
-	github-update-pull-requests github-update-related-organizations github-update-users
+.PHONY: github-add-related-repositories github-enrich-issues github-update-daily-contributions \
+	github-update-owasp-organization github-update-pull-requests github-update-related-organizations github-update-users
 
 github-add-related-repositories:
 	@echo "Adding OWASP related repositories"
@@ -9,6 +9,10 @@ github-enrich-issues:
 	@echo "Enriching GitHub issues"
 	@CMD="python manage.py github_enrich_issues" $(MAKE) backend-exec-command
 
+github-update-daily-contributions:
+	@echo "Updating GitHub daily contributions"
+	@CMD="python manage.py github_update_daily_contributions" $(MAKE) backend-exec-command
+
 github-update-owasp-organization:
 	@echo "Updating OWASP GitHub organization"
 	@CMD="python manage.py github_update_owasp_organization" $(MAKE) backend-exec-command
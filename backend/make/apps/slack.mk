@@ -1,5 +1,6 @@
 .PHONY: slack-check-invite-link slack-export-data slack-match-owasp-channels \
-	slack-set-conversation-sync-messages-flags slack-sync-data slack-sync-messages
+	slack-set-conversation-sync-messages-flags slack-sync-data slack-sync-messages \
+	slack-train-question-classifier slack-update-message-text slack-warm-command-cache
 
 slack-check-invite-link:
 	@echo "Checking Slack invite link usage"
@@ -33,3 +34,15 @@ slack-sync-data:
 slack-sync-messages:
 	@echo "Syncing Slack messages"
 	@CMD="python manage.py slack_sync_messages" $(MAKE) backend-exec-command
+
+slack-train-question-classifier:
+	@echo "Training Slack question classifier"
+	@CMD="python manage.py slack_train_question_classifier" $(MAKE) backend-exec-command
+
+slack-update-message-text:
+	@echo "Backfilling Slack messages text"
+	@CMD="python manage.py slack_update_message_text" $(MAKE) backend-exec-command
+
+slack-warm-command-cache:
+	@echo "Warming Slack command results cache"
+	@CMD="python manage.py slack_warm_command_cache" $(MAKE) backend-exec-command
@@ -85,6 +85,7 @@ backend-data-index:
 	@CMD="python manage.py algolia_reindex" $(MAKE) backend-exec-command
 	@CMD="python manage.py algolia_update_replicas" $(MAKE) backend-exec-command
 	@CMD="python manage.py algolia_update_synonyms" $(MAKE) backend-exec-command
+	@$(MAKE) slack-warm-command-cache
 
 backend-data-load: backend-data-fetch-nest-dump
 	@echo "Loading Nest data"
@@ -146,6 +147,7 @@ backend-data-update:
 	@$(MAKE) github-add-related-repositories
 	@$(MAKE) github-update-related-organizations
 	@$(MAKE) github-update-users
+	@$(MAKE) github-update-daily-contributions
 	@$(MAKE) owasp-aggregate-projects
 	@$(MAKE) owasp-aggregate-entity-contributions
 	@$(MAKE) owasp-aggregate-member-contributions
@@ -153,6 +155,7 @@ backend-data-update:
 	@$(MAKE) owasp-sync-posts
 	@$(MAKE) owasp-update-sponsors
 	@$(MAKE) slack-sync-data
+	@$(MAKE) slack-update-message-text
 
 # TODO(arkid15r): Dockerize this command.
 backend-data-upload-nest-dump:
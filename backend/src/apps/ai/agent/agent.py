@@ -3,16 +3,20 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from langgraph.graph import END, START, StateGraph
 
+from apps.ai.agent.answer_cache import AnswerCache
 from apps.ai.agent.nodes import AgentNodes
 from apps.ai.common.constants import (
     DEFAULT_CHUNKS_RETRIEVAL_LIMIT,
     DEFAULT_SIMILARITY_THRESHOLD,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
 logger = logging.getLogger(__name__)
 
 
@@ -21,14 +25,29 @@ class AgenticRAGAgent:
 
     def __init__(self) -> None:
         """Initialize the AgenticRAGAgent."""
+        self.answer_cache = AnswerCache()
         self.nodes = AgentNodes()
         self.graph = self.build_graph()
 
     def run(
         self,
         query: str,
+        on_token: Callable[[str], None] | None = None,
     ) -> dict[str, Any]:
-        """Execute the full RAG loop."""
+        """Execute the full RAG loop.
+
+        Answers are cached per query and retrieved chunks, so repeated questions
+        skip generation and evaluation.
+
+        Args:
+            query (str): The user query.
+            on_token (Callable[[str], None] | None): An optional callback the first
+                answer is streamed to while it is generated.
+
+        Returns:
+            dict[str, Any]: The answer along with the workflow details.
+
+        """
         initial_state: dict[str, Any] = {
             "query": query,
             "iteration": 0,
@@ -40,9 +59,18 @@ class AgenticRAGAgent:
         }
 
         logger.info("Starting Agentic RAG workflow with metadata-aware retrieval")
-        final_state = self.graph.invoke(initial_state)
+        state = self.nodes.retrieve(initial_state)
+        chunk_ids = [chunk["chunk_id"] for chunk in state["context_chunks"]]
+
+        if (result := self.answer_cache.get_answer(query, chunk_ids)) is not None:
+            logger.info("Serving cached answer")
+            if on_token:
+                on_token(result["answer"])
+            return result
 
-        return {
+        final_state = self.graph.invoke({**state, "on_token": on_token})
+
+        result = {
             "answer": final_state.get("answer", ""),
             "iterations": final_state.get("iteration", 0),
             "evaluation": final_state.get("evaluation", {}),
@@ -50,6 +78,10 @@ class AgenticRAGAgent:
             "history": final_state.get("history", []),
             "extracted_metadata": final_state.get("extracted_metadata", {}),
         }
+        if result["evaluation"].get("complete"):
+            self.answer_cache.set_answer(query, chunk_ids, result)
+
+        return result
 
     def build_graph(self):
         """Build the LangGraph state machine for the RAG workflow."""
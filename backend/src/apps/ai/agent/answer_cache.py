@@ -0,0 +1,74 @@
+"""Answer cache for the agentic RAG workflow."""
+
+from __future__ import annotations
+
+import hashlib
+from typing import Any
+
+from django.core.cache import cache
+
+from apps.ai.common.constants import ANSWER_CACHE_KEY_PREFIX, ANSWER_CACHE_TTL_SECONDS
+
+
+class AnswerCache:
+    """Shared cache for query metadata and answers keyed on the retrieved chunks.
+
+    Answers are keyed on the normalized query and the IDs of the retrieved chunks.
+    Chunks are immutable: updated content creates new chunks and deletes vanished ones,
+    so a cached answer is no longer hit once any of its chunks change.
+    """
+
+    def __init__(self, ttl: int = ANSWER_CACHE_TTL_SECONDS) -> None:
+        """Initialize the answer cache.
+
+        Args:
+            ttl (int): The cache entry time-to-live in seconds.
+
+        """
+        self.ttl = ttl
+
+    @staticmethod
+    def normalize(query: str) -> str:
+        """Normalize query text before hashing."""
+        return " ".join(query.lower().split())
+
+    def get_key(self, namespace: str, query: str, chunk_ids: list[int] | None = None) -> str:
+        """Get the content-hashed cache key for a query and its chunks."""
+        value = self.normalize(query)
+        if chunk_ids is not None:
+            value = f"{value}|{','.join(str(chunk_id) for chunk_id in sorted(chunk_ids))}"
+
+        digest = hashlib.sha256(value.encode()).hexdigest()
+        return f"{ANSWER_CACHE_KEY_PREFIX}:{namespace}:{digest}"
+
+    def get_answer(self, query: str, chunk_ids: list[int]) -> dict[str, Any] | None:
+        """Get a cached answer.
+
+        Args:
+            query (str): The user query.
+            chunk_ids (list[int]): The IDs of the retrieved chunks.
+
+        Returns:
+            dict[str, Any] | None: The cached result or None if not found.
+
+        """
+        return cache.get(self.get_key("answer", query, chunk_ids))
+
+    def set_answer(self, query: str, chunk_ids: list[int], result: dict[str, Any]) -> None:
+        """Store an answer.
+
+        Args:
+            query (str): The user query.
+            chunk_ids (list[int]): The IDs of the retrieved chunks.
+            result (dict[str, Any]): The agent result.
+
+        """
+        cache.set(self.get_key("answer", query, chunk_ids), result, timeout=self.ttl)
+
+    def get_metadata(self, query: str) -> dict[str, Any] | None:
+        """Get cached query metadata."""
+        return cache.get(self.get_key("metadata", query))
+
+    def set_metadata(self, query: str, metadata: dict[str, Any]) -> None:
+        """Store query metadata."""
+        cache.set(self.get_key("metadata", query), metadata, timeout=self.ttl)
@@ -4,11 +4,12 @@ from __future__ import annotations
 
 import json
 import os
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import openai
 from django.core.exceptions import ObjectDoesNotExist
 
+from apps.ai.agent.answer_cache import AnswerCache
 from apps.ai.agent.tools.rag.generator import Generator
 from apps.ai.agent.tools.rag.retriever import Retriever
 from apps.ai.common.constants import (
@@ -17,9 +18,13 @@ from apps.ai.common.constants import (
     DEFAULT_REASONING_MODEL,
     DEFAULT_SIMILARITY_THRESHOLD,
 )
+from apps.ai.common.token_budget import TokenBudget
 from apps.ai.common.utils import extract_json_from_markdown
 from apps.core.models.prompt import Prompt
 
+if TYPE_CHECKING:
+    from openai.types.chat import ChatCompletionMessageParam
+
 
 class AgentNodes:
     """Collection of LangGraph node functions with injected dependencies."""
@@ -31,13 +36,15 @@ class AgentNodes:
             raise ValueError(error_msg)
 
         self.openai_client = openai.OpenAI(api_key=openai_api_key)
+        self.token_budget = TokenBudget()
 
+        self.answer_cache = AnswerCache()
         self.retriever = Retriever()
         self.generator = Generator()
 
     def retrieve(self, state: dict[str, Any]) -> dict[str, Any]:
         """Retrieve context chunks based on the query."""
-        if state.get("context_chunks"):
+        if "context_chunks" in state:
             return state
 
         limit = state.get("limit", DEFAULT_CHUNKS_RETRIEVAL_LIMIT)
@@ -68,9 +75,11 @@ class AgentNodes:
         query = state["query"]
         augmented_query = query if not feedback else f"{query}\n\nRevise per feedback:\n{feedback}"
 
+        # Only the first answer is streamed, refined answers replace it once evaluated.
         answer = self.generator.generate_answer(
             query=augmented_query,
             context_chunks=state.get("context_chunks", []),
+            on_token=state.get("on_token") if iteration == 1 else None,
         )
 
         history = state.get("history", [])
@@ -191,25 +200,30 @@ class AgentNodes:
 
     def extract_query_metadata(self, query: str) -> dict[str, Any]:
         """Extract metadata from the user's query using an LLM."""
+        if (metadata := self.answer_cache.get_metadata(query)) is not None:
+            return metadata
+
         metadata_extractor_prompt = Prompt.get_metadata_extractor_prompt()
 
         if not metadata_extractor_prompt:
             error_msg = "Prompt with key 'metadata-extractor-prompt' not found."
             raise ObjectDoesNotExist(error_msg)
 
+        messages: list[ChatCompletionMessageParam] = [
+            {"role": "system", "content": metadata_extractor_prompt},
+            {"role": "user", "content": f"Query: {query}"},
+        ]
         try:
+            self.token_budget.acquire(TokenBudget.estimate_tokens(messages, 500))
             response = self.openai_client.chat.completions.create(
                 model=DEFAULT_REASONING_MODEL,
-                messages=[
-                    {"role": "system", "content": metadata_extractor_prompt},
-                    {"role": "user", "content": f"Query: {query}"},
-                ],
+                messages=messages,
                 max_tokens=500,
                 temperature=0.7,
             )
             content = response.choices[0].message.content.strip()
             content = extract_json_from_markdown(content)
-            return json.loads(content)
+            metadata = json.loads(content)
 
         except openai.OpenAIError:
             return {
@@ -219,6 +233,9 @@ class AgentNodes:
                 "intent": "general query",
             }
 
+        self.answer_cache.set_metadata(query, metadata)
+        return metadata
+
     def call_evaluator(
         self, *, query: str, answer: str, context_chunks: list[dict[str, Any]]
     ) -> dict[str, Any]:
@@ -237,13 +254,15 @@ class AgentNodes:
             error_msg = "Prompt with key 'evaluator-system-prompt' not found."
             raise ObjectDoesNotExist(error_msg)
 
+        messages: list[ChatCompletionMessageParam] = [
+            {"role": "system", "content": evaluator_system_prompt},
+            {"role": "user", "content": evaluation_prompt},
+        ]
         try:
+            self.token_budget.acquire(TokenBudget.estimate_tokens(messages, 2000))
             response = self.openai_client.chat.completions.create(
                 model=DEFAULT_REASONING_MODEL,
-                messages=[
-                    {"role": "system", "content": evaluator_system_prompt},
-                    {"role": "user", "content": evaluation_prompt},
-                ],
+                messages=messages,
                 max_tokens=2000,
                 temperature=0.7,
             )
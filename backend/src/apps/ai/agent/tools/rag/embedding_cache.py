@@ -0,0 +1,134 @@
+"""Query embedding cache for the RAG retriever."""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+from django.core.cache import cache
+
+from apps.ai.common.constants import (
+    EMBEDDING_CACHE_KEY_PREFIX,
+    EMBEDDING_CACHE_LOCAL_MAX_SIZE,
+    EMBEDDING_CACHE_LOCAL_TTL_SECONDS,
+    EMBEDDING_CACHE_TTL_SECONDS,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingCache:
+    """Two-tier (in-process LRU and shared cache) store for query embeddings."""
+
+    _instances: dict[str, EmbeddingCache] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(
+        self,
+        model: str,
+        local_max_size: int = EMBEDDING_CACHE_LOCAL_MAX_SIZE,
+        local_ttl: int = EMBEDDING_CACHE_LOCAL_TTL_SECONDS,
+        ttl: int = EMBEDDING_CACHE_TTL_SECONDS,
+    ) -> None:
+        """Initialize the embedding cache.
+
+        Args:
+            model (str): The embedding model used as the cache namespace.
+            local_max_size (int): The maximum number of in-process entries.
+            local_ttl (int): The in-process entry time-to-live in seconds.
+            ttl (int): The shared cache entry time-to-live in seconds.
+
+        """
+        self.local: OrderedDict[str, tuple[float, list[float]]] = OrderedDict()
+        self.local_max_size = local_max_size
+        self.local_ttl = local_ttl
+        self.lock = threading.Lock()
+        self.model = model
+        self.stats = {"local_hits": 0, "shared_hits": 0, "misses": 0}
+        self.ttl = ttl
+
+    @classmethod
+    def for_model(cls, model: str) -> EmbeddingCache:
+        """Get or create the process-wide embedding cache for a model."""
+        with cls._instances_lock:
+            if model not in cls._instances:
+                cls._instances[model] = EmbeddingCache(model)
+            return cls._instances[model]
+
+    @classmethod
+    def reset(cls) -> None:
+        """Drop all process-wide embedding caches."""
+        with cls._instances_lock:
+            cls._instances.clear()
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        """Normalize query text before hashing."""
+        return " ".join(text.split())
+
+    def get_key(self, text: str) -> str:
+        """Get the content-hashed cache key for a query text."""
+        digest = hashlib.sha256(self.normalize(text).encode()).hexdigest()
+        return f"{EMBEDDING_CACHE_KEY_PREFIX}:{self.model}:{digest}"
+
+    def get(self, text: str) -> list[float] | None:
+        """Get a cached embedding.
+
+        Args:
+            text (str): The query text.
+
+        Returns:
+            list[float] | None: The cached embedding or None if not found.
+
+        """
+        key = self.get_key(text)
+        now = time.monotonic()
+
+        with self.lock:
+            if (entry := self.local.get(key)) and entry[0] > now:
+                self.local.move_to_end(key)
+                self.stats["local_hits"] += 1
+                return entry[1]
+            self.local.pop(key, None)
+
+        try:
+            embedding = cache.get(key)
+        except Exception:
+            logger.warning("Failed to get a shared query embedding", exc_info=True)
+            embedding = None
+
+        if embedding is not None:
+            self.set_local(key, embedding)
+            with self.lock:
+                self.stats["shared_hits"] += 1
+            return embedding
+
+        with self.lock:
+            self.stats["misses"] += 1
+        return None
+
+    def set(self, text: str, embedding: list[float]) -> None:
+        """Store an embedding in both cache tiers.
+
+        Args:
+            text (str): The query text.
+            embedding (list[float]): The query embedding.
+
+        """
+        key = self.get_key(text)
+        self.set_local(key, embedding)
+        try:
+            cache.set(key, embedding, timeout=self.ttl)
+        except Exception:
+            logger.warning("Failed to store a shared query embedding", exc_info=True)
+
+    def set_local(self, key: str, embedding: list[float]) -> None:
+        """Store an embedding in the in-process LRU tier."""
+        with self.lock:
+            self.local[key] = (time.monotonic() + self.local_ttl, embedding)
+            self.local.move_to_end(key)
+            while len(self.local) > self.local_max_size:
+                self.local.popitem(last=False)
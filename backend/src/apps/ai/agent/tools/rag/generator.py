@@ -2,13 +2,18 @@
 
 import logging
 import os
-from typing import Any
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
 
 import openai
 from django.core.exceptions import ObjectDoesNotExist
 
+from apps.ai.common.token_budget import TokenBudget
 from apps.core.models.prompt import Prompt
 
+if TYPE_CHECKING:
+    from openai.types.chat import ChatCompletionMessageParam
+
 logger = logging.getLogger(__name__)
 
 
@@ -34,6 +39,7 @@ class Generator:
 
         self.chat_model = chat_model
         self.openai_client = openai.OpenAI(api_key=openai_api_key)
+        self.token_budget = TokenBudget()
         logger.info("Generator initialized with chat model: %s", self.chat_model)
 
     def prepare_context(self, context_chunks: list[dict[str, Any]]) -> str:
@@ -67,12 +73,18 @@ class Generator:
 
         return "\n\n---\n\n".join(formatted_context)
 
-    def generate_answer(self, query: str, context_chunks: list[dict[str, Any]]) -> str:
+    def generate_answer(
+        self,
+        query: str,
+        context_chunks: list[dict[str, Any]],
+        on_token: Callable[[str], None] | None = None,
+    ) -> str:
         """Generate an answer to the user's query using provided context chunks.
 
         Args:
           query: The user's query text.
           context_chunks: A list of context chunks retrieved by the retriever.
+          on_token: An optional callback the answer is streamed to as it is generated.
 
         Returns:
           The generated answer as a string.
@@ -102,18 +114,49 @@ Answer:
                 error_msg = "Prompt with key 'rag-system-prompt' not found."
                 raise ObjectDoesNotExist(error_msg)
 
-            response = self.openai_client.chat.completions.create(
-                model=self.chat_model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt},
-                ],
-                temperature=self.TEMPERATURE,
-                max_tokens=self.MAX_TOKENS,
-            )
-            answer = response.choices[0].message.content.strip()
+            messages: list[ChatCompletionMessageParam] = [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt},
+            ]
+            self.token_budget.acquire(TokenBudget.estimate_tokens(messages, self.MAX_TOKENS))
+            if on_token is None:
+                response = self.openai_client.chat.completions.create(
+                    model=self.chat_model,
+                    messages=messages,
+                    temperature=self.TEMPERATURE,
+                    max_tokens=self.MAX_TOKENS,
+                )
+                answer = (response.choices[0].message.content or "").strip()
+            else:
+                stream = self.openai_client.chat.completions.create(
+                    model=self.chat_model,
+                    messages=messages,
+                    temperature=self.TEMPERATURE,
+                    max_tokens=self.MAX_TOKENS,
+                    stream=True,
+                )
+                answer = self.stream_answer(stream, on_token)
         except openai.OpenAIError:
             logger.exception("OpenAI API error")
             answer = "I'm sorry, I'm currently unable to process your request."
 
         return answer
+
+    def stream_answer(self, response, on_token: Callable[[str], None]) -> str:
+        """Pass streamed answer tokens to a callback.
+
+        Args:
+          response: The streamed chat completion response.
+          on_token: The callback the answer tokens are passed to.
+
+        Returns:
+          The full answer as a string.
+
+        """
+        tokens = []
+        for event in response:
+            if event.choices and (token := event.choices[0].delta.content):
+                tokens.append(token)
+                on_token(token)
+
+        return "".join(tokens).strip()
@@ -3,24 +3,82 @@
 import logging
 import os
 import re
+from collections import defaultdict
 from typing import Any
 
 import openai
-from django.db.models import Q
+from django.contrib.contenttypes.models import ContentType
+from django.db import connection, transaction
+from django.db.models import Q, prefetch_related_objects
 from pgvector.django.functions import CosineDistance
 
+from apps.ai.agent.tools.rag.embedding_cache import EmbeddingCache
 from apps.ai.common.constants import (
     DEFAULT_CHUNKS_RETRIEVAL_LIMIT,
+    DEFAULT_HNSW_EF_SEARCH,
     DEFAULT_SIMILARITY_THRESHOLD,
+    HYBRID_SEARCH_CANDIDATES_MULTIPLIER,
+    RRF_K,
+    TEXT_SEARCH_CONFIG,
 )
 from apps.ai.models.chunk import Chunk
 
 logger = logging.getLogger(__name__)
 
+# Vector and full-text candidates are ranked separately and fused with
+# reciprocal-rank fusion within a single query.
+HYBRID_SEARCH_QUERY = """
+WITH vector_matches AS (
+    SELECT chunk.id, row_number() OVER (ORDER BY chunk.embedding <=> %(embedding)s::vector) AS rank
+    FROM ai_chunks AS chunk
+    JOIN ai_contexts AS context ON context.id = chunk.context_id
+    WHERE chunk.embedding <=> %(embedding)s::vector <= %(max_distance)s
+    AND (
+        %(entity_type_ids)s::integer[] IS NULL
+        OR context.entity_type_id = ANY(%(entity_type_ids)s::integer[])
+    )
+    ORDER BY chunk.embedding <=> %(embedding)s::vector
+    LIMIT %(candidates_limit)s
+),
+text_matches AS (
+    SELECT chunk.id, row_number() OVER (
+        ORDER BY ts_rank_cd(chunk.search_vector, text_query) DESC
+    ) AS rank
+    FROM ai_chunks AS chunk
+    JOIN ai_contexts AS context ON context.id = chunk.context_id
+    CROSS JOIN websearch_to_tsquery(%(config)s::regconfig, %(query)s) AS text_query
+    WHERE chunk.search_vector @@ text_query
+    AND (
+        %(entity_type_ids)s::integer[] IS NULL
+        OR context.entity_type_id = ANY(%(entity_type_ids)s::integer[])
+    )
+    ORDER BY ts_rank_cd(chunk.search_vector, text_query) DESC
+    LIMIT %(candidates_limit)s
+),
+fused_matches AS (
+    SELECT matches.id, SUM(1.0 / (%(rrf_k)s + matches.rank)) AS score
+    FROM (
+        SELECT id, rank FROM vector_matches
+        UNION ALL
+        SELECT id, rank FROM text_matches
+    ) AS matches
+    GROUP BY matches.id
+)
+SELECT chunk.*, fused_matches.score, chunk.embedding <=> %(embedding)s::vector AS distance
+FROM fused_matches
+JOIN ai_chunks AS chunk ON chunk.id = fused_matches.id
+ORDER BY fused_matches.score DESC, distance
+LIMIT %(limit)s
+"""
+
 
 class Retriever:
     """A class for retrieving relevant text chunks for a RAG."""
 
+    ENTITY_RELATED_FIELDS = {
+        "message": ("author", "conversation", "parent_message"),
+    }
+
     SUPPORTED_ENTITY_TYPES = (
         "chapter",
         "committee",
@@ -43,12 +101,15 @@ class Retriever:
             error_msg = "DJANGO_OPEN_AI_SECRET_KEY environment variable not set"
             raise ValueError(error_msg)
         self.openai_client = openai.OpenAI(api_key=openai_api_key)
+        self.embedding_cache = EmbeddingCache.for_model(embedding_model)
         self.embedding_model = embedding_model
         logger.info("Retriever initialized with embedding model: %s", self.embedding_model)
 
     def get_query_embedding(self, query: str) -> list[float]:
         """Generate embedding for the user query.
 
+        Cached embeddings are returned without calling the embeddings API.
+
         Args:
             query: The query text.
 
@@ -56,12 +117,15 @@ class Retriever:
             A list of floats representing the query embedding.
 
         """
+        if (embedding := self.embedding_cache.get(query)) is not None:
+            return embedding
+
         try:
             response = self.openai_client.embeddings.create(
                 input=[query],
                 model=self.embedding_model,
             )
-            return response.data[0].embedding
+            embedding = response.data[0].embedding
         except openai.OpenAIError:
             logger.exception("OpenAI API error")
             raise
@@ -69,6 +133,9 @@ class Retriever:
             logger.exception("Unexpected error while generating embedding")
             raise
 
+        self.embedding_cache.set(query, embedding)
+        return embedding
+
     def get_source_name(self, entity) -> str:
         """Get the name/identifier for the content object."""
         for attr in ("name", "title", "login", "key", "summary"):
@@ -187,6 +254,8 @@ class Retriever:
         limit: int = DEFAULT_CHUNKS_RETRIEVAL_LIMIT,
         similarity_threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
         content_types: list[str] | None = None,
+        *,
+        hybrid: bool = False,
     ) -> list[dict[str, Any]]:
         """Retrieve the most relevant chunks based on vector similarity.
 
@@ -195,6 +264,7 @@ class Retriever:
             limit: The maximum number of chunks to retrieve.
             similarity_threshold: The minimum similarity score (0-1).
             content_types: An optional list of content types to filter by.
+            hybrid: Whether to fuse vector and full-text search results.
 
         Returns:
             A list of dictionaries, each containing chunk text and rich metadata.
@@ -203,38 +273,45 @@ class Retriever:
         query_embedding = self.get_query_embedding(query)
         if not content_types:
             content_types = self.extract_content_types_from_query(query)
-        queryset = Chunk.objects.annotate(
-            similarity=1 - CosineDistance("embedding", query_embedding)
-        ).filter(similarity__gte=similarity_threshold)
-        if content_types:
-            content_type_query = Q()
-            for name in content_types:
-                lower_name = name.lower()
-                if "." in lower_name:
-                    app_label, model = lower_name.split(".", 1)
-                    content_type_query |= Q(
-                        context__entity_type__app_label=app_label,
-                        context__entity_type__model=model,
-                    )
-                else:
-                    content_type_query |= Q(context__entity_type__model=lower_name)
-            queryset = queryset.filter(content_type_query)
-
-        chunks = queryset.select_related("context__entity_type").order_by("-similarity")[:limit]
+
+        entity_type_ids = self.get_entity_type_ids(content_types) if content_types else None
+
+        if hybrid:
+            chunks = self.get_hybrid_chunks(
+                query, query_embedding, limit, similarity_threshold, entity_type_ids
+            )
+        else:
+            # Filter and order by the raw distance so that the HNSW index can be used.
+            queryset = Chunk.objects.annotate(
+                distance=CosineDistance("embedding", query_embedding)
+            ).filter(distance__lte=1 - similarity_threshold)
+            if entity_type_ids is not None:
+                queryset = queryset.filter(context__entity_type_id__in=entity_type_ids)
+
+            with transaction.atomic():
+                self.set_search_options()
+                chunks = list(
+                    queryset.select_related("context__entity_type").order_by("distance")[:limit]
+                )
+
+        entities = self.get_entities(chunks)
 
         results = []
         for chunk in chunks:
-            if not chunk.context or not chunk.context.entity:
+            if not chunk.context or not (
+                entity := entities.get((chunk.context.entity_type_id, chunk.context.entity_id))
+            ):
                 logger.warning("Content object is None for chunk %s. Skipping.", chunk.id)
                 continue
 
-            source_name = self.get_source_name(chunk.context.entity)
-            additional_context = self.get_additional_context(chunk.context.entity)
+            source_name = self.get_source_name(entity)
+            additional_context = self.get_additional_context(entity)
 
             results.append(
                 {
+                    "chunk_id": chunk.id,
                     "text": chunk.text,
-                    "similarity": float(chunk.similarity),
+                    "similarity": 1 - float(chunk.distance),
                     "source_type": chunk.context.entity_type.model,
                     "source_name": source_name,
                     "source_id": chunk.context.entity_id,
@@ -244,6 +321,106 @@ class Retriever:
 
         return results
 
+    def get_entities(self, chunks: list[Chunk]) -> dict[tuple[int, int], Any]:
+        """Load the entities of chunks with one query per entity type.
+
+        Relations used by `get_additional_context` are loaded along with the entities.
+
+        Args:
+            chunks: The retrieved chunks.
+
+        Returns:
+            A dictionary of entities keyed by (entity type ID, entity ID).
+
+        """
+        entity_ids_by_type: dict[ContentType, set[int]] = defaultdict(set)
+        for chunk in chunks:
+            if chunk.context:
+                entity_ids_by_type[chunk.context.entity_type].add(chunk.context.entity_id)
+
+        entities = {}
+        for entity_type, entity_ids in entity_ids_by_type.items():
+            queryset = entity_type.get_all_objects_for_this_type(pk__in=entity_ids)
+            if related_fields := self.ENTITY_RELATED_FIELDS.get(entity_type.model):
+                queryset = queryset.select_related(*related_fields)
+
+            entities.update({(entity_type.id, entity.pk): entity for entity in queryset})
+
+        return entities
+
+    def get_hybrid_chunks(
+        self,
+        query: str,
+        query_embedding: list[float],
+        limit: int,
+        similarity_threshold: float,
+        entity_type_ids: list[int] | None = None,
+    ) -> list[Chunk]:
+        """Retrieve chunks ranked by reciprocal-rank fusion of vector and full-text search.
+
+        Args:
+            query: The user's query text.
+            query_embedding: The query embedding.
+            limit: The maximum number of chunks to retrieve.
+            similarity_threshold: The minimum similarity score (0-1) of vector matches.
+            entity_type_ids: An optional list of entity type IDs to filter by.
+
+        Returns:
+            A list of chunks annotated with `distance` and fused `score`.
+
+        """
+        with transaction.atomic():
+            self.set_search_options()
+            chunks = list(
+                Chunk.objects.raw(
+                    HYBRID_SEARCH_QUERY,
+                    {
+                        "candidates_limit": limit * HYBRID_SEARCH_CANDIDATES_MULTIPLIER,
+                        "config": TEXT_SEARCH_CONFIG,
+                        "embedding": str(query_embedding),
+                        "entity_type_ids": entity_type_ids,
+                        "limit": limit,
+                        "max_distance": 1 - similarity_threshold,
+                        "query": query,
+                        "rrf_k": RRF_K,
+                    },
+                )
+            )
+
+        prefetch_related_objects(chunks, "context__entity_type")
+        return chunks
+
+    def get_entity_type_ids(self, content_types: list[str]) -> list[int]:
+        """Resolve content type names to content type IDs.
+
+        Args:
+            content_types: A list of content type names (`model` or `app_label.model`).
+
+        Returns:
+            A list of matching content type IDs.
+
+        """
+        content_type_query = Q()
+        for name in content_types:
+            lower_name = name.lower()
+            if "." in lower_name:
+                app_label, model = lower_name.split(".", 1)
+                content_type_query |= Q(app_label=app_label, model=model)
+            else:
+                content_type_query |= Q(model=lower_name)
+
+        return list(ContentType.objects.filter(content_type_query).values_list("id", flat=True))
+
+    def set_search_options(self) -> None:
+        """Set HNSW index search options for the current transaction.
+
+        Iterative index scans keep returning candidates until the filtered
+        result set is filled instead of stopping after `ef_search` rows.
+        """
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL hnsw.ef_search = %s", [DEFAULT_HNSW_EF_SEARCH])
+            cursor.execute("SET LOCAL hnsw.iterative_scan = relaxed_order")
+
     def extract_content_types_from_query(self, query: str) -> list[str]:
         """Scan the query for keywords matching supported content types.
 
@@ -5,9 +5,15 @@ from collections.abc import Callable
 from typing import Any
 
 import openai
+from django.core.cache import cache
 from django.core.management.base import BaseCommand
 from django.db.models import Model, QuerySet
 
+from apps.ai.common.constants import (
+    AI_COMMAND_CHECKPOINT_KEY_PREFIX,
+    AI_COMMAND_CHECKPOINT_TTL_SECONDS,
+)
+
 
 class BaseAICommand(BaseCommand):
     """Base class for AI management commands with common functionality."""
@@ -52,6 +58,15 @@ class BaseAICommand(BaseCommand):
             default=50,
             help=f"Number of {self.entity_name_plural} to process in each batch",
         )
+        self.add_resume_argument(parser)
+
+    def add_resume_argument(self, parser):
+        """Add the argument for resuming an interrupted run."""
+        parser.add_argument(
+            "--resume",
+            action="store_true",
+            help=f"Resume after the last {self.entity_name} processed by an interrupted run",
+        )
 
     def add_arguments(self, parser):
         """Add arguments to the command. Override to add custom arguments."""
@@ -82,25 +97,61 @@ class BaseAICommand(BaseCommand):
         )
         return False
 
+    def get_checkpoint_key(self, options: dict[str, Any]) -> str | None:
+        """Return the cache key of the last processed primary key checkpoint.
+
+        The key is scoped by the queryset options so that runs over different entity
+        sets don't share a checkpoint. Single entity runs aren't checkpointed.
+        """
+        if options.get(f"{self.entity_name}_key"):
+            return None
+
+        scope = "all" if options.get("all") else "default"
+        return f"{AI_COMMAND_CHECKPOINT_KEY_PREFIX}:{self.__module__.rsplit('.', 1)[-1]}:{scope}"
+
     def handle_batch_processing(
         self,
         queryset: QuerySet,
         batch_size: int,
         process_batch_func: Callable[[list[Model]], int],
+        *,
+        checkpoint_key: str | None = None,
+        resume: bool = False,
     ) -> None:
-        """Handle the common batch processing logic."""
+        """Handle the common batch processing logic.
+
+        Batches are fetched in primary key order using keyset pagination. When a
+        checkpoint key is provided, the last processed primary key is checkpointed after
+        each batch so that an interrupted run can be resumed instead of restarted.
+        """
+        queryset = queryset.order_by("pk")
+
+        if checkpoint_key and resume and (last_pk := cache.get(checkpoint_key)) is not None:
+            self.stdout.write(f"Resuming after {self.entity_name} with ID {last_pk}")
+            queryset = queryset.filter(pk__gt=last_pk)
+
         total_count = queryset.count()
 
         if not total_count:
             self.stdout.write(f"No {self.entity_name_plural} found to process")
+            if checkpoint_key:
+                cache.delete(checkpoint_key)
             return
 
         self.stdout.write(f"Found {total_count} {self.entity_name_plural} to process")
 
+        batch_queryset = queryset
         processed_count = 0
-        for offset in range(0, total_count, batch_size):
-            batch_items = queryset[offset : offset + batch_size]
-            processed_count += process_batch_func(list(batch_items))
+        while batch_items := list(batch_queryset[:batch_size]):
+            processed_count += process_batch_func(batch_items)
+
+            last_pk = batch_items[-1].pk
+            if checkpoint_key:
+                cache.set(checkpoint_key, last_pk, timeout=AI_COMMAND_CHECKPOINT_TTL_SECONDS)
+            batch_queryset = queryset.filter(pk__gt=last_pk)
+
+        if checkpoint_key:
+            cache.delete(checkpoint_key)
 
         self.stdout.write(
             self.style.SUCCESS(
@@ -1,10 +1,16 @@
 """Base chunk command class for creating chunks."""
 
+import operator
+from collections import Counter, defaultdict
+from functools import reduce
+
 from django.contrib.contenttypes.models import ContentType
-from django.db.models import Max, Model
+from django.db.models import Max, Model, Q
+from django.utils import timezone
 
 from apps.ai.common.base.ai_command import BaseAICommand
-from apps.ai.common.utils import create_chunks_and_embeddings
+from apps.ai.common.constants import EMBEDDING_MAX_WORKERS
+from apps.ai.common.embedding_pipeline import EmbeddingPipeline
 from apps.ai.models.chunk import Chunk
 from apps.ai.models.context import Context
 from apps.common.utils import is_valid_json
@@ -13,72 +19,146 @@ from apps.common.utils import is_valid_json
 class BaseChunkCommand(BaseAICommand):
     """Base class for chunk creation commands."""
 
+    max_workers = EMBEDDING_MAX_WORKERS
+
     def help(self) -> str:
         """Return help text for the chunk creation command."""
         return f"Create or update chunks for OWASP {self.entity_name} data"
 
+    def add_arguments(self, parser):
+        """Add arguments to the command."""
+        super().add_arguments(parser)
+        self.add_max_workers_argument(parser)
+
+    def add_max_workers_argument(self, parser):
+        """Add the embedding concurrency argument."""
+        parser.add_argument(
+            "--max-workers",
+            type=int,
+            default=EMBEDDING_MAX_WORKERS,
+            help="Maximum number of concurrent embedding requests",
+        )
+
     def process_chunks_batch(self, entities: list[Model]) -> int:
-        """Process a batch of entities to create or update chunks."""
-        processed = 0
-        batch_chunks_to_create = []
-        content_type = ContentType.objects.get_for_model(self.model_class)
+        """Process a batch of entities to create or update chunks.
 
+        Chunks of updated contexts are diffed by text: unchanged chunks are kept,
+        vanished ones are deleted and only new texts are embedded.
+        """
+        content_type = ContentType.objects.get_for_model(self.model_class)
+        contexts: dict[int, Context] = {}
+        for context in (
+            Context.objects.filter(
+                entity_type=content_type,
+                entity_id__in=[entity.id for entity in entities],
+            )
+            .annotate(latest_chunk_updated_at=Max("chunks__nest_updated_at"))
+            .order_by("id")
+        ):
+            contexts.setdefault(context.entity_id, context)
+
+        entity_keys: dict[int, str] = {}
+        pipeline = EmbeddingPipeline(self.openai_client, max_workers=self.max_workers)
+        updated_contexts: list[tuple[Context, set[str]]] = []
         for entity in entities:
             entity_key = self.get_entity_key(entity)
-            context = Context.objects.filter(entity_type=content_type, entity_id=entity.id).first()
 
-            if not context:
+            if not (context := contexts.get(entity.id)):
                 self.stdout.write(
                     self.style.WARNING(f"No context found for {self.entity_name} {entity_key}")
                 )
                 continue
 
-            latest_chunk_timestamp = context.chunks.aggregate(
-                latest_created=Max("nest_created_at")
-            )["latest_created"]
-
-            if not latest_chunk_timestamp or context.nest_updated_at > latest_chunk_timestamp:
-                self.stdout.write(f"Context for {entity_key} requires chunk creation/update")
-
-                if latest_chunk_timestamp:
-                    count, _ = context.chunks.all().delete()
-                    self.stdout.write(f"Deleted {count} stale chunks for {entity_key}")
-
-                content, metadata_content = self.extract_content(entity)
-
-                if is_valid_json(content):
-                    full_content = content
-                else:
-                    full_content = (
-                        f"{metadata_content}\n\n{content}" if metadata_content else content
-                    )
-
-                if not full_content.strip():
-                    self.stdout.write(f"No content to chunk for {self.entity_name} {entity_key}")
-                    continue
-
-                if not (unique_chunk_texts := set(Chunk.split_text(full_content))):
-                    self.stdout.write(f"No chunks created for {self.entity_name} {entity_key}")
-                    continue
-
-                if chunks := create_chunks_and_embeddings(
-                    chunk_texts=list(unique_chunk_texts),
-                    context=context,
-                    openai_client=self.openai_client,
-                    save=False,
-                ):
-                    batch_chunks_to_create.extend(chunks)
-                    processed += 1
-                    self.stdout.write(
-                        self.style.SUCCESS(f"Created {len(chunks)} new chunks for {entity_key}")
-                    )
-            else:
+            latest_chunk_timestamp = context.latest_chunk_updated_at
+            if latest_chunk_timestamp and context.nest_updated_at <= latest_chunk_timestamp:
                 self.stdout.write(f"Chunks for {entity_key} are already up to date.")
+                continue
 
-        if batch_chunks_to_create:
-            Chunk.bulk_save(batch_chunks_to_create)
+            self.stdout.write(f"Context for {entity_key} requires chunk creation/update")
+            entity_keys[context.id] = entity_key
+
+            content, metadata_content = self.extract_content(entity)
+
+            if is_valid_json(content):
+                full_content = content
+            else:
+                full_content = f"{metadata_content}\n\n{content}" if metadata_content else content
+
+            chunk_texts = set(Chunk.split_text(full_content)) if full_content.strip() else set()
+            if latest_chunk_timestamp:
+                updated_contexts.append((context, chunk_texts))
+
+            if not full_content.strip():
+                self.stdout.write(f"No content to chunk for {self.entity_name} {entity_key}")
+                continue
+
+            if not chunk_texts:
+                self.stdout.write(f"No chunks created for {self.entity_name} {entity_key}")
+                continue
 
-        return processed
+            if not latest_chunk_timestamp:
+                pipeline.add(context, sorted(chunk_texts))
+
+        if updated_contexts:
+            self.diff_chunks(updated_contexts, entity_keys, pipeline)
+
+        if not (chunks := pipeline.run()):
+            return 0
+
+        created_counts = Counter(chunk.context.id for chunk in chunks)
+        Chunk.bulk_save(chunks)
+
+        for context_id, count in created_counts.items():
+            self.stdout.write(
+                self.style.SUCCESS(f"Created {count} new chunks for {entity_keys[context_id]}")
+            )
+
+        return len(created_counts)
+
+    def diff_chunks(
+        self,
+        updated_contexts: list[tuple[Context, set[str]]],
+        entity_keys: dict[int, str],
+        pipeline: EmbeddingPipeline,
+    ) -> None:
+        """Diff existing chunks of updated contexts against their new chunk texts.
+
+        Args:
+            updated_contexts (list[tuple[Context, set[str]]]): Updated contexts that
+                already have chunks along with their new chunk texts.
+            entity_keys (dict[int, str]): Entity keys by context ID for display purposes.
+            pipeline (EmbeddingPipeline): The pipeline new chunk texts are added to.
+
+        """
+        existing_texts: dict[int, set[str]] = defaultdict(set)
+        for context_id, text in Chunk.objects.filter(
+            context_id__in=[context.id for context, _ in updated_contexts]
+        ).values_list("context_id", "text"):
+            existing_texts[context_id].add(text)
+
+        unchanged_context_ids = []
+        vanished_chunks = []
+        for context, chunk_texts in updated_contexts:
+            entity_key = entity_keys[context.id]
+
+            if vanished_texts := existing_texts[context.id] - chunk_texts:
+                vanished_chunks.append(Q(context_id=context.id, text__in=vanished_texts))
+                self.stdout.write(f"Deleted {len(vanished_texts)} stale chunks for {entity_key}")
+
+            if new_texts := chunk_texts - existing_texts[context.id]:
+                pipeline.add(context, sorted(new_texts))
+            elif chunk_texts:
+                unchanged_context_ids.append(context.id)
+
+        if vanished_chunks:
+            Chunk.objects.filter(reduce(operator.or_, vanished_chunks)).delete()
+
+        if unchanged_context_ids:
+            # Mark kept chunks as fresh so that contexts without new chunk texts
+            # are not processed again on the next run.
+            Chunk.objects.filter(context_id__in=unchanged_context_ids).update(
+                nest_updated_at=timezone.now()
+            )
 
     def handle(self, *args, **options):
         """Handle the chunk creation command."""
@@ -87,9 +167,12 @@ class BaseChunkCommand(BaseAICommand):
 
         queryset = self.get_queryset(options)
         batch_size = options["batch_size"]
+        self.max_workers = options["max_workers"]
 
         self.handle_batch_processing(
             queryset=queryset,
             batch_size=batch_size,
             process_batch_func=self.process_chunks_batch,
+            checkpoint_key=self.get_checkpoint_key(options),
+            resume=options["resume"],
         )
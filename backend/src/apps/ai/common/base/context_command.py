@@ -53,4 +53,6 @@ class BaseContextCommand(BaseAICommand):
             queryset=queryset,
             batch_size=batch_size,
             process_batch_func=self.process_context_batch,
+            checkpoint_key=self.get_checkpoint_key(options),
+            resume=options["resume"],
         )
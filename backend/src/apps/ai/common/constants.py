@@ -1,11 +1,33 @@
 """AI app constants."""
 
+AI_COMMAND_CHECKPOINT_KEY_PREFIX = "ai-command-checkpoint"
+AI_COMMAND_CHECKPOINT_TTL_SECONDS = 604800  # 7 days.
+AI_WORKER_CONCURRENCY = 4
+AI_WORKER_DEQUEUE_TIMEOUT_SECONDS = 5
+ANSWER_CACHE_KEY_PREFIX = "ai-answer"
+ANSWER_CACHE_TTL_SECONDS = 86400  # 24 hours.
 DEFAULT_CHUNKS_RETRIEVAL_LIMIT = 32
+DEFAULT_HNSW_EF_SEARCH = 100
 DEFAULT_LAST_REQUEST_OFFSET_SECONDS = 2
 DEFAULT_MAX_ITERATIONS = 3
 DEFAULT_REASONING_MODEL = "gpt-4o"
 DEFAULT_SIMILARITY_THRESHOLD = 0.1
 DELIMITER = "\n\n"
+EMBEDDING_BATCH_MAX_INPUTS = 2048
+EMBEDDING_BATCH_MAX_TOKENS = 250000
+EMBEDDING_CACHE_KEY_PREFIX = "ai-query-embedding"
+EMBEDDING_CACHE_LOCAL_MAX_SIZE = 1024
+EMBEDDING_CACHE_LOCAL_TTL_SECONDS = 3600  # 1 hour.
+EMBEDDING_CACHE_TTL_SECONDS = 604800  # 7 days.
+EMBEDDING_MAX_RETRIES = 5
+EMBEDDING_MAX_WORKERS = 4
+EMBEDDING_RETRY_BASE_DELAY_SECONDS = 1
+EMBEDDING_RETRY_MAX_DELAY_SECONDS = 60
 GITHUB_REQUEST_INTERVAL_SECONDS = 0.5
+HYBRID_SEARCH_CANDIDATES_MULTIPLIER = 4
 MIN_REQUEST_INTERVAL_SECONDS = 1.2
 QUEUE_RESPONSE_TIME_MINUTES = 1
+RRF_K = 60
+TEXT_SEARCH_CONFIG = "english"
+TOKEN_BUDGET_KEY_PREFIX = "ai-token-budget"  # noqa: S105
+TOKEN_BUDGET_TOKENS_PER_MINUTE = 400000
@@ -0,0 +1,225 @@
+"""Batched, concurrent embedding pipeline for chunk creation."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import TYPE_CHECKING
+
+import openai
+
+from apps.ai.common.constants import (
+    EMBEDDING_BATCH_MAX_INPUTS,
+    EMBEDDING_BATCH_MAX_TOKENS,
+    EMBEDDING_MAX_RETRIES,
+    EMBEDDING_MAX_WORKERS,
+    EMBEDDING_RETRY_BASE_DELAY_SECONDS,
+    EMBEDDING_RETRY_MAX_DELAY_SECONDS,
+)
+from apps.ai.models.chunk import Chunk
+
+if TYPE_CHECKING:
+    from apps.ai.models.context import Context
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+RETRYABLE_ERRORS = (
+    openai.APIConnectionError,
+    openai.APITimeoutError,
+    openai.InternalServerError,
+    openai.RateLimitError,
+)
+
+
+class EmbeddingPipeline:
+    """Pack chunk texts of many contexts into embedding batches and run them concurrently."""
+
+    def __init__(
+        self,
+        openai_client,
+        model: str = "text-embedding-3-small",
+        *,
+        max_batch_inputs: int = EMBEDDING_BATCH_MAX_INPUTS,
+        max_batch_tokens: int = EMBEDDING_BATCH_MAX_TOKENS,
+        max_workers: int = EMBEDDING_MAX_WORKERS,
+    ) -> None:
+        """Initialize the embedding pipeline.
+
+        Args:
+            openai_client: Initialized OpenAI client.
+            model (str): Embedding model to use.
+            max_batch_inputs (int): Maximum number of texts per embeddings request.
+            max_batch_tokens (int): Maximum estimated tokens per embeddings request.
+            max_workers (int): Maximum number of concurrent embeddings requests.
+
+        """
+        self.max_batch_inputs = max_batch_inputs
+        self.max_batch_tokens = max_batch_tokens
+        self.max_workers = max_workers
+        self.model = model
+        self.openai_client = openai_client
+        self.requests: list[tuple[Context, str]] = []
+        self.resume_at = 0.0
+        self.resume_at_lock = threading.Lock()
+
+    @staticmethod
+    def estimate_tokens(text: str) -> int:
+        """Estimate the number of tokens in a text."""
+        return len(text) // 4 + 1
+
+    def add(self, context: Context, chunk_texts: list[str]) -> None:
+        """Queue chunk texts of a context for embedding.
+
+        Args:
+            context (Context): The context the chunks belong to.
+            chunk_texts (list[str]): The chunk texts.
+
+        """
+        self.requests.extend((context, text) for text in chunk_texts)
+
+    def embed(self, texts: list[str]) -> list[list[float]]:
+        """Create embeddings for a batch of texts with rate limit aware backoff.
+
+        Args:
+            texts (list[str]): The texts to embed.
+
+        Returns:
+            list[list[float]]: The embeddings in the order of the texts.
+
+        Raises:
+            openai.OpenAIError: If the request keeps failing after all retries.
+
+        """
+        attempt = 0
+        while True:
+            with self.resume_at_lock:
+                delay = self.resume_at - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+
+            try:
+                response = self.openai_client.embeddings.create(input=texts, model=self.model)
+            except RETRYABLE_ERRORS as error:
+                if attempt >= EMBEDDING_MAX_RETRIES:
+                    raise
+
+                delay = self.get_retry_delay(error, attempt)
+                logger.warning("Embeddings request failed, retrying in %.1fs: %s", delay, error)
+                # Pause all workers so that they do not keep hitting the rate limit.
+                with self.resume_at_lock:
+                    self.resume_at = max(self.resume_at, time.monotonic() + delay)
+                attempt += 1
+            else:
+                return [d.embedding for d in response.data]
+
+    @staticmethod
+    def get_retry_delay(error: openai.OpenAIError, attempt: int) -> float:
+        """Get the delay before retrying a failed request.
+
+        Args:
+            error (openai.OpenAIError): The request error.
+            attempt (int): The zero-based attempt number.
+
+        Returns:
+            float: The delay in seconds.
+
+        """
+        response = getattr(error, "response", None)
+        if response is not None and (retry_after := response.headers.get("retry-after")):
+            try:
+                return min(float(retry_after), EMBEDDING_RETRY_MAX_DELAY_SECONDS)
+            except ValueError:
+                pass
+
+        return min(
+            EMBEDDING_RETRY_BASE_DELAY_SECONDS * 2**attempt,
+            EMBEDDING_RETRY_MAX_DELAY_SECONDS,
+        )
+
+    def get_new_requests(self) -> list[tuple[Context, str]]:
+        """Get queued requests that do not have chunks yet.
+
+        Existing chunks are looked up with a single set-based query.
+
+        Returns:
+            list[tuple[Context, str]]: The deduplicated requests.
+
+        """
+        existing = set(
+            Chunk.objects.filter(
+                context_id__in={context.id for context, _ in self.requests},
+                text__in={text for _, text in self.requests},
+            ).values_list("context_id", "text")
+        )
+
+        new_requests = []
+        for context, text in self.requests:
+            if (key := (context.id, text)) not in existing:
+                existing.add(key)
+                new_requests.append((context, text))
+
+        return new_requests
+
+    def pack(self, requests: list[tuple[Context, str]]) -> list[list[tuple[Context, str]]]:
+        """Pack requests into size and token bounded batches.
+
+        Args:
+            requests (list[tuple[Context, str]]): The requests to pack.
+
+        Returns:
+            list[list[tuple[Context, str]]]: The batches.
+
+        """
+        batches: list[list[tuple[Context, str]]] = []
+        batch: list[tuple[Context, str]] = []
+        batch_tokens = 0
+        for context, text in requests:
+            tokens = self.estimate_tokens(text)
+            is_full = len(batch) >= self.max_batch_inputs
+            if batch and (is_full or batch_tokens + tokens > self.max_batch_tokens):
+                batches.append(batch)
+                batch, batch_tokens = [], 0
+
+            batch.append((context, text))
+            batch_tokens += tokens
+
+        if batch:
+            batches.append(batch)
+
+        return batches
+
+    def run(self) -> list[Chunk]:
+        """Embed all queued chunk texts.
+
+        Returns:
+            list[Chunk]: Unsaved chunks for the texts that were embedded successfully.
+
+        """
+        if not self.requests:
+            return []
+
+        batches = self.pack(self.get_new_requests())
+        self.requests = []
+
+        chunks: list[Chunk] = []
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                executor.submit(self.embed, [text for _, text in batch]): batch
+                for batch in batches
+            }
+            for future in as_completed(futures):
+                batch = futures[future]
+                try:
+                    embeddings = future.result()
+                except openai.OpenAIError:
+                    logger.exception("Failed to create embeddings for %s chunks", len(batch))
+                    continue
+
+                chunks.extend(
+                    Chunk(context=context, embedding=embedding, text=text)
+                    for (context, text), embedding in zip(batch, embeddings, strict=True)
+                )
+
+        return chunks
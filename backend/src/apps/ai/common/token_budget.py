@@ -0,0 +1,60 @@
+"""Global token-per-minute budget for OpenAI chat completions."""
+
+from __future__ import annotations
+
+import logging
+import time
+from typing import TYPE_CHECKING, Any
+
+from django.core.cache import cache
+
+from apps.ai.common.constants import TOKEN_BUDGET_KEY_PREFIX, TOKEN_BUDGET_TOKENS_PER_MINUTE
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBudget:
+    """Fixed-window token-per-minute budget shared by all workers via the cache."""
+
+    def __init__(self, tokens_per_minute: int = TOKEN_BUDGET_TOKENS_PER_MINUTE) -> None:
+        """Initialize the token budget.
+
+        Args:
+            tokens_per_minute (int): The maximum number of tokens used per minute.
+
+        """
+        self.tokens_per_minute = tokens_per_minute
+
+    @staticmethod
+    def estimate_tokens(messages: Iterable[Mapping[str, Any]], max_tokens: int) -> int:
+        """Estimate the number of tokens a chat completion request uses."""
+        return sum(len(message["content"]) // 4 + 1 for message in messages) + max_tokens
+
+    def acquire(self, tokens: int) -> None:
+        """Wait until the tokens fit into the current minute budget and reserve them.
+
+        Args:
+            tokens (int): The number of tokens to reserve.
+
+        """
+        tokens = min(tokens, self.tokens_per_minute)
+        while True:
+            now = time.time()
+            key = f"{TOKEN_BUDGET_KEY_PREFIX}:{int(now // 60)}"
+            cache.add(key, 0, timeout=120)
+            try:
+                used_tokens = cache.incr(key, tokens)
+            except ValueError:
+                # The window key expired between add and incr.
+                continue
+
+            if used_tokens <= self.tokens_per_minute:
+                return
+
+            cache.decr(key, tokens)
+            delay = 60 - now % 60
+            logger.info("Token budget exhausted, waiting %.1fs", delay)
+            time.sleep(delay)
@@ -0,0 +1,54 @@
+"""RQ worker running jobs in a thread of a shared long-lived process."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from django.db import close_old_connections, connection
+from rq.timeouts import TimerDeathPenalty
+from rq.worker import SimpleWorker
+
+from apps.ai.common.constants import AI_WORKER_DEQUEUE_TIMEOUT_SECONDS
+
+if TYPE_CHECKING:
+    from rq.job import Job
+    from rq.queue import Queue
+
+
+class ThreadWorker(SimpleWorker):
+    """RQ worker that runs jobs without forking so that clients are reused across jobs.
+
+    Several thread workers share one process. Job timeouts are enforced with timers
+    because signal based timeouts only work in the main thread. Each thread keeps its own
+    database connection, so stale connections are closed around every job the way Django
+    does around every request.
+    """
+
+    death_penalty_class = TimerDeathPenalty
+
+    @property
+    def dequeue_timeout(self) -> int:
+        """Return the dequeue timeout, kept short to notice stop requests."""
+        return AI_WORKER_DEQUEUE_TIMEOUT_SECONDS
+
+    def _install_signal_handlers(self) -> None:
+        """Leave signal handling to the main thread."""
+
+    def request_thread_stop(self) -> None:
+        """Stop the work loop once the current job is finished."""
+        self._stop_requested = True
+
+    def perform_job(self, job: Job, queue: Queue) -> bool:
+        """Perform a job with a usable database connection."""
+        close_old_connections()
+        try:
+            return super().perform_job(job, queue)
+        finally:
+            close_old_connections()
+
+    def work(self, *args, **kwargs) -> bool:
+        """Run the work loop and close the thread database connection once it stops."""
+        try:
+            return super().work(*args, **kwargs)
+        finally:
+            connection.close()
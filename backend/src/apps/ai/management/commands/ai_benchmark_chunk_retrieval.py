@@ -0,0 +1,175 @@
+"""A command to benchmark chunk retrieval latency against a synthetic table."""
+
+import random
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from psycopg2 import sql
+
+from apps.ai.common.constants import (
+    DEFAULT_CHUNKS_RETRIEVAL_LIMIT,
+    DEFAULT_HNSW_EF_SEARCH,
+    DEFAULT_SIMILARITY_THRESHOLD,
+)
+
+BENCHMARK_TABLE_NAME = "ai_chunks_benchmark"
+ENTITY_TYPES_COUNT = 5
+INSERT_BATCH_SIZE = 10_000
+
+
+class Command(BaseCommand):
+    help = "Benchmark exact and HNSW-backed chunk retrieval against a synthetic chunk table."
+
+    def add_arguments(self, parser):
+        """Add arguments to the command."""
+        parser.add_argument(
+            "--rows",
+            type=int,
+            default=1_000_000,
+            help="Number of synthetic chunks to generate",
+        )
+        parser.add_argument(
+            "--dimensions",
+            type=int,
+            default=1536,
+            help="Embedding dimensions",
+        )
+        parser.add_argument(
+            "--queries",
+            type=int,
+            default=100,
+            help="Number of queries to run per retrieval mode",
+        )
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=DEFAULT_CHUNKS_RETRIEVAL_LIMIT,
+            help="Number of chunks to retrieve per query",
+        )
+        parser.add_argument(
+            "--ef-search",
+            type=int,
+            default=DEFAULT_HNSW_EF_SEARCH,
+            help="HNSW ef_search value",
+        )
+        parser.add_argument(
+            "--reuse-table",
+            action="store_true",
+            help="Reuse an existing synthetic table instead of generating a new one",
+        )
+        parser.add_argument(
+            "--keep-table",
+            action="store_true",
+            help="Keep the synthetic table after the benchmark",
+        )
+
+    def handle(self, *args, **options):
+        """Handle the command."""
+        dimensions = options["dimensions"]
+        table = sql.Identifier(BENCHMARK_TABLE_NAME)
+
+        if not options["reuse_table"]:
+            self.create_table(table, options["rows"], dimensions)
+
+        queries = {
+            "exact": sql.SQL(
+                "SELECT id, 1 - (embedding <=> %(embedding)s::vector) AS similarity "
+                "FROM {table} "
+                "WHERE 1 - (embedding <=> %(embedding)s::vector) >= %(threshold)s "
+                "ORDER BY similarity DESC LIMIT %(limit)s"
+            ).format(table=table),
+            "hnsw": sql.SQL(
+                "SELECT id, embedding <=> %(embedding)s::vector AS distance "
+                "FROM {table} "
+                "WHERE embedding <=> %(embedding)s::vector <= %(max_distance)s "
+                "ORDER BY distance LIMIT %(limit)s"
+            ).format(table=table),
+            "hnsw-filtered": sql.SQL(
+                "SELECT id, embedding <=> %(embedding)s::vector AS distance "
+                "FROM {table} "
+                "WHERE entity_type_id = %(entity_type_id)s "
+                "AND embedding <=> %(embedding)s::vector <= %(max_distance)s "
+                "ORDER BY distance LIMIT %(limit)s"
+            ).format(table=table),
+        }
+
+        for mode, query in queries.items():
+            latencies = self.run_queries(query, dimensions, options)
+            p50, p95 = self.get_percentiles(latencies)
+            self.stdout.write(f"{mode}: p50={p50:.2f}ms p95={p95:.2f}ms")
+
+        if not options["keep_table"]:
+            with connection.cursor() as cursor:
+                cursor.execute(sql.SQL("DROP TABLE IF EXISTS {table}").format(table=table))
+
+    def create_table(self, table: sql.Identifier, rows: int, dimensions: int) -> None:
+        """Create and populate the synthetic chunk table."""
+        with connection.cursor() as cursor:
+            cursor.execute(sql.SQL("DROP TABLE IF EXISTS {table}").format(table=table))
+            cursor.execute(
+                sql.SQL(
+                    "CREATE UNLOGGED TABLE {table} ("
+                    "id bigserial PRIMARY KEY, "
+                    "entity_type_id integer NOT NULL, "
+                    "embedding vector({dimensions}) NOT NULL)"
+                ).format(table=table, dimensions=sql.Literal(dimensions))
+            )
+
+            for offset in range(0, rows, INSERT_BATCH_SIZE):
+                cursor.execute(
+                    sql.SQL(
+                        "INSERT INTO {table} (entity_type_id, embedding) "
+                        "SELECT floor(random() * %(entity_types)s)::integer, "
+                        "(SELECT array_agg(random()) FROM generate_series(1, %(dimensions)s) "
+                        "WHERE s.i > 0)::vector "
+                        "FROM generate_series(1, %(count)s) AS s(i)"
+                    ).format(table=table),
+                    {
+                        "count": min(INSERT_BATCH_SIZE, rows - offset),
+                        "dimensions": dimensions,
+                        "entity_types": ENTITY_TYPES_COUNT,
+                    },
+                )
+                self.stdout.write(f"Inserted {min(offset + INSERT_BATCH_SIZE, rows)}/{rows} rows")
+
+            self.stdout.write("Building HNSW index")
+            cursor.execute(
+                sql.SQL(
+                    "CREATE INDEX ON {table} USING hnsw (embedding vector_cosine_ops) "
+                    "WITH (m = 16, ef_construction = 64)"
+                ).format(table=table)
+            )
+            cursor.execute(sql.SQL("ANALYZE {table}").format(table=table))
+
+    def get_percentiles(self, latencies: list[float]) -> tuple[float, float]:
+        """Return p50 and p95 latencies."""
+        if len(latencies) < 2:  # noqa: PLR2004
+            return (latencies[0], latencies[0]) if latencies else (0.0, 0.0)
+
+        percentiles = statistics.quantiles(latencies, n=100, method="inclusive")
+        return percentiles[49], percentiles[94]
+
+    def run_queries(self, query: sql.Composed, dimensions: int, options: dict) -> list[float]:
+        """Run random queries and return their latencies in milliseconds."""
+        latencies = []
+        for _ in range(options["queries"]):
+            params = {
+                "embedding": str([random.random() for _ in range(dimensions)]),  # noqa: S311
+                "entity_type_id": random.randrange(ENTITY_TYPES_COUNT),  # noqa: S311
+                "limit": options["limit"],
+                "max_distance": 1 - DEFAULT_SIMILARITY_THRESHOLD,
+                "threshold": DEFAULT_SIMILARITY_THRESHOLD,
+            }
+
+            with transaction.atomic(), connection.cursor() as cursor:
+                cursor.execute("SET LOCAL hnsw.ef_search = %s", [options["ef_search"]])
+                cursor.execute("SET LOCAL hnsw.iterative_scan = relaxed_order")
+
+                start = time.perf_counter()
+                cursor.execute(query, params)
+                cursor.fetchall()
+                latencies.append((time.perf_counter() - start) * 1000)
+
+        return latencies
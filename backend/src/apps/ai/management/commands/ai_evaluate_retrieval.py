@@ -0,0 +1,83 @@
+"""A command to evaluate chunk retrieval recall against a labelled query set."""
+
+import json
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from apps.ai.agent.tools.rag.retriever import Retriever
+from apps.ai.common.constants import DEFAULT_CHUNKS_RETRIEVAL_LIMIT, DEFAULT_SIMILARITY_THRESHOLD
+
+RETRIEVAL_MODES = ("vector", "hybrid")
+
+
+class Command(BaseCommand):
+    help = "Evaluate vector and hybrid chunk retrieval recall@k on a labelled query set."
+
+    def add_arguments(self, parser):
+        """Add arguments to the command."""
+        parser.add_argument(
+            "--file-name",
+            type=str,
+            default="owasp.json",
+            help="The name of the labelled query set file. "
+            "The file should be placed in the data/retrieval-eval directory.",
+        )
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=DEFAULT_CHUNKS_RETRIEVAL_LIMIT,
+            help="Number of chunks to retrieve per query (k)",
+        )
+        parser.add_argument(
+            "--similarity-threshold",
+            type=float,
+            default=DEFAULT_SIMILARITY_THRESHOLD,
+            help="Minimum similarity score of vector matches",
+        )
+
+    def handle(self, *args, **options):
+        """Handle the command."""
+        file_path = Path(settings.BASE_DIR / f"data/retrieval-eval/{options['file_name']}")
+        if not file_path.exists():
+            self.stderr.write(f"File not found: {file_path}")
+            return
+
+        with Path.open(file_path) as file:
+            queries = json.load(file)["queries"]
+
+        try:
+            retriever = Retriever()
+        except ValueError as error:
+            self.stderr.write(self.style.ERROR(str(error)))
+            return
+
+        limit = options["limit"]
+        recalls: dict[str, list[float]] = {mode: [] for mode in RETRIEVAL_MODES}
+        for item in queries:
+            relevant = {
+                (source["source_type"], source["source_name"]) for source in item["relevant"]
+            }
+            for mode in RETRIEVAL_MODES:
+                chunks = retriever.retrieve(
+                    query=item["query"],
+                    limit=limit,
+                    similarity_threshold=options["similarity_threshold"],
+                    hybrid=mode == "hybrid",
+                )
+                recall = self.get_recall(chunks, relevant)
+                recalls[mode].append(recall)
+                self.stdout.write(f"{mode}: recall@{limit}={recall:.2f} {item['query']}")
+
+        for mode, values in recalls.items():
+            mean_recall = sum(values) / len(values) if values else 0.0
+            self.stdout.write(self.style.SUCCESS(f"{mode}: mean recall@{limit}={mean_recall:.3f}"))
+
+    def get_recall(self, chunks: list[dict], relevant: set[tuple[str, str]]) -> float:
+        """Return the share of relevant sources found in the retrieved chunks."""
+        if not relevant:
+            return 0.0
+
+        retrieved = {(chunk["source_type"], chunk["source_name"]) for chunk in chunks}
+        return len(relevant & retrieved) / len(relevant)
@@ -28,8 +28,17 @@ class Command(BaseCommand):
             self.stderr.write(self.style.ERROR(str(error)))
             return
 
-        result = agent.run(query=options["query"])
+        self.stdout.write("Draft answer:")
+        streamed_tokens = []
+
+        def on_token(token: str) -> None:
+            streamed_tokens.append(token)
+            self.stdout.write(token, ending="")
+            self.stdout.flush()
+
+        result = agent.run(query=options["query"], on_token=on_token)
         answer = result.get("answer", "")
 
-        self.stdout.write(self.style.SUCCESS("Agentic RAG workflow completed"))
-        self.stdout.write(f"\nAnswer:\n{answer}")
+        self.stdout.write(self.style.SUCCESS("\n\nAgentic RAG workflow completed"))
+        if answer != "".join(streamed_tokens):
+            self.stdout.write(f"\nAnswer:\n{answer}")
@@ -0,0 +1,77 @@
+"""A command to run concurrent long-lived workers for the AI queue."""
+
+import asyncio
+import signal
+
+import django_rq
+from django.core.management.base import BaseCommand
+
+from apps.ai.common.constants import AI_WORKER_CONCURRENCY
+from apps.ai.common.worker import ThreadWorker
+
+
+class Command(BaseCommand):
+    help = "Run several AI queue workers concurrently in one long-lived process."
+
+    def add_arguments(self, parser):
+        """Add arguments to the command."""
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=AI_WORKER_CONCURRENCY,
+            help="Number of jobs to run concurrently",
+        )
+        parser.add_argument(
+            "--queue",
+            type=str,
+            default="ai",
+            help="Name of the queue to process",
+        )
+        parser.add_argument(
+            "--burst",
+            action="store_true",
+            help="Quit once the queue is empty",
+        )
+        parser.add_argument(
+            "--with-scheduler",
+            action="store_true",
+            help="Run the scheduler for delayed jobs",
+        )
+
+    def handle(self, *args, **options):
+        """Handle the command."""
+        queue = django_rq.get_queue(options["queue"])
+        workers = [
+            ThreadWorker([queue], connection=queue.connection)
+            for _ in range(options["concurrency"])
+        ]
+
+        self.stdout.write(f"Starting {len(workers)} workers for the {queue.name} queue")
+        asyncio.run(
+            self.run_workers(
+                workers, burst=options["burst"], with_scheduler=options["with_scheduler"]
+            )
+        )
+
+    async def run_workers(
+        self, workers: list[ThreadWorker], *, burst: bool, with_scheduler: bool
+    ) -> None:
+        """Run the workers on the event loop until they stop."""
+        loop = asyncio.get_running_loop()
+        for signal_number in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(signal_number, self.stop_workers, workers)
+
+        await asyncio.gather(
+            *(
+                asyncio.to_thread(
+                    worker.work, burst=burst, with_scheduler=with_scheduler and index == 0
+                )
+                for index, worker in enumerate(workers)
+            )
+        )
+
+    def stop_workers(self, workers: list[ThreadWorker]) -> None:
+        """Request all workers to stop after their current job."""
+        self.stdout.write("Stopping workers after their current jobs")
+        for worker in workers:
+            worker.request_thread_stop()
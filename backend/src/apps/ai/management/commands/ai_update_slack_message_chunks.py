@@ -28,11 +28,17 @@ class Command(BaseChunkCommand):
             default=100,
             help="Number of messages to process in each batch",
         )
+        self.add_max_workers_argument(parser)
+        self.add_resume_argument(parser)
 
     def extract_content(self, entity: Message) -> tuple[str, str]:
         """Extract content from the message."""
         return entity.cleaned_text or "", ""
 
+    def get_base_queryset(self) -> QuerySet:
+        """Return messages without their raw data, the cleaned text is materialized."""
+        return super().get_base_queryset().defer("raw_data")
+
     def get_default_queryset(self) -> QuerySet:
         """Return all messages by default since Message model doesn't have is_active field."""
         return self.get_base_queryset()
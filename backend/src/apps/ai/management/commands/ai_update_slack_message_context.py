@@ -14,6 +14,10 @@ class Command(BaseContextCommand):
         """Extract content from the message."""
         return entity.cleaned_text or "", ""
 
+    def get_base_queryset(self) -> QuerySet:
+        """Return messages without their raw data, the cleaned text is materialized."""
+        return super().get_base_queryset().defer("raw_data")
+
     def get_default_queryset(self) -> QuerySet:
         """Return all messages by default since Message model doesn't have is_active field."""
         return self.get_base_queryset()
@@ -0,0 +1,23 @@
+# Generated by Django 6.0.8 on 2026-10-18 02:54
+
+import pgvector.django.indexes
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("ai", "0010_alter_context_unique_together"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="chunk",
+            index=pgvector.django.indexes.HnswIndex(
+                ef_construction=64,
+                fields=["embedding"],
+                m=16,
+                name="chunk_embedding_hnsw_idx",
+                opclasses=["vector_cosine_ops"],
+            ),
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 6.0.8 on 2026-10-18 03:12
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("ai", "0011_chunk_embedding_hnsw_idx"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="chunk",
+            name="search_vector",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=django.contrib.postgres.search.SearchVector("text", config="english"),
+                output_field=django.contrib.postgres.search.SearchVectorField(),
+                verbose_name="Search vector",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="chunk",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="chunk_search_vector_gin_idx"
+            ),
+        ),
+    ]
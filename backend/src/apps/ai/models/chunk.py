@@ -1,8 +1,11 @@
 """AI app chunk model."""
 
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.db import models
-from pgvector.django import VectorField
+from pgvector.django import HnswIndex, VectorField
 
+from apps.ai.common.constants import TEXT_SEARCH_CONFIG
 from apps.ai.models.context import Context
 from apps.ai.text_splitting import split_recursive_character_text
 from apps.common.models import BulkSaveModel, TimestampedModel
@@ -16,11 +19,27 @@ class Chunk(TimestampedModel):
         """Model options."""
 
         db_table = "ai_chunks"
+        indexes = [
+            GinIndex(fields=["search_vector"], name="chunk_search_vector_gin_idx"),
+            HnswIndex(
+                ef_construction=64,
+                fields=["embedding"],
+                m=16,
+                name="chunk_embedding_hnsw_idx",
+                opclasses=["vector_cosine_ops"],
+            ),
+        ]
         verbose_name = "Chunk"
         unique_together = ("context", "text")
 
     context = models.ForeignKey(Context, on_delete=models.CASCADE, related_name="chunks")
     embedding = VectorField(verbose_name="Embedding", dimensions=1536)
+    search_vector = models.GeneratedField(
+        db_persist=True,
+        expression=SearchVector("text", config=TEXT_SEARCH_CONFIG),
+        output_field=SearchVectorField(),
+        verbose_name="Search vector",
+    )
     text = models.TextField(verbose_name="Text")
 
     def __str__(self):
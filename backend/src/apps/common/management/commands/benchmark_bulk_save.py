@@ -0,0 +1,103 @@
+"""A command to benchmark OWASP Nest bulk save strategies."""
+
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from apps.common.models import BulkSaveModel
+from apps.github.models.label import Label
+
+
+class Command(BaseCommand):
+    help = "Benchmark primary key and natural key (upsert) bulk saves."
+
+    def add_arguments(self, parser) -> None:
+        """Add command-line arguments to the parser.
+
+        Args:
+            parser (argparse.ArgumentParser): The argument parser instance.
+
+        """
+        parser.add_argument(
+            "--rows",
+            default=10000,
+            required=False,
+            type=int,
+            help="The number of rows to save",
+        )
+
+    def handle(self, *_args, **options) -> None:
+        """Benchmark bulk save strategies.
+
+        Each strategy inserts, updates and then rewrites unchanged rows within
+        a transaction that is rolled back afterwards.
+        """
+        node_ids = [f"benchmark-label-{idx}" for idx in range(options["rows"])]
+
+        for name, save in (
+            ("primary key", self.save_by_primary_key),
+            ("upsert", self.save_by_natural_key),
+        ):
+            with transaction.atomic():
+                insert, update, unchanged = (
+                    self.measure(save, node_ids, color) for color in ("000000", "ffffff", "ffffff")
+                )
+                transaction.set_rollback(True)
+
+            self.stdout.write(
+                f"{name}: insert {insert:,.0f} rows/s, update {update:,.0f} rows/s, "
+                f"unchanged {unchanged:,.0f} rows/s"
+            )
+
+    def measure(self, save, node_ids: list[str], color: str) -> float:
+        """Measure a bulk save strategy throughput.
+
+        Args:
+            save (Callable): The bulk save strategy.
+            node_ids (list[str]): The label node IDs.
+            color (str): The label color.
+
+        Returns:
+            float: The number of saved rows per second.
+
+        """
+        started_at = time.perf_counter()
+        save(node_ids, color)
+
+        return len(node_ids) / max(time.perf_counter() - started_at, 1e-9)
+
+    def save_by_natural_key(self, node_ids: list[str], color: str) -> None:
+        """Save labels with an upsert on their node IDs.
+
+        Args:
+            node_ids (list[str]): The label node IDs.
+            color (str): The label color.
+
+        """
+        BulkSaveModel.bulk_save(
+            Label,
+            [Label(color=color, name=node_id, node_id=node_id) for node_id in node_ids],
+            unique_fields=("node_id",),
+        )
+
+    def save_by_primary_key(self, node_ids: list[str], color: str) -> None:
+        """Save labels looked up one by one as the sync did.
+
+        Args:
+            node_ids (list[str]): The label node IDs.
+            color (str): The label color.
+
+        """
+        labels = []
+        for node_id in node_ids:
+            try:
+                label = Label.objects.get(node_id=node_id)
+            except Label.DoesNotExist:
+                label = Label(node_id=node_id)
+
+            label.color = color
+            label.name = node_id
+            labels.append(label)
+
+        BulkSaveModel.bulk_save(Label, labels)
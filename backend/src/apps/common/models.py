@@ -2,11 +2,36 @@
 
 # ruff: noqa: SLF001 https://docs.astral.sh/ruff/rules/private-member-access/
 
+import copy
+from dataclasses import dataclass
+
 from django.db import models
+from django.db.models import DEFERRED, Q
 
 BATCH_SIZE = 1000
 
 
+@dataclass(frozen=True)
+class BulkSaveResult:
+    """Bulk save row counts."""
+
+    created: int = 0
+    unchanged: int = 0
+    updated: int = 0
+
+    def __add__(self, other: "BulkSaveResult") -> "BulkSaveResult":
+        """Add up bulk save row counts."""
+        return BulkSaveResult(
+            created=self.created + other.created,
+            unchanged=self.unchanged + other.unchanged,
+            updated=self.updated + other.updated,
+        )
+
+    def __str__(self) -> str:
+        """Return a human-readable representation of the row counts."""
+        return f"{self.created} created, {self.updated} updated, {self.unchanged} unchanged"
+
+
 class BulkSaveModel(models.Model):
     """Base model for bulk save action."""
 
@@ -16,23 +41,211 @@ class BulkSaveModel(models.Model):
         abstract = True
 
     @staticmethod
-    def bulk_save(model, objects, fields=None) -> None:
+    def bulk_save(model, objects, fields=None, *, unique_fields=None) -> BulkSaveResult:
         """Bulk save objects.
 
+        Existing objects of models with dirty field tracking are only updated when
+        any of the saved fields changed since they were loaded.
+
         Args:
             model (Model): The Django model class.
             objects (list): List of model instances to save.
             fields (list, optional): List of fields to update.
+            unique_fields (list, optional): Natural key fields to upsert objects on
+                instead of splitting them by primary key.
+
+        Returns:
+            BulkSaveResult: The created, updated and unchanged row counts.
 
         """
-        model.objects.bulk_create((o for o in objects if not o.id), BATCH_SIZE)
+        if unique_fields:
+            return BulkSaveModel.bulk_upsert(model, objects, unique_fields, fields=fields)
+
+        created_objects = [o for o in objects if not o.id]
+        updated_objects = [o for o in objects if o.id]
+        unchanged_count = 0
+        if issubclass(model, DirtyFieldsMixin):
+            changed_objects = [o for o in updated_objects if o.get_dirty_fields(fields)]
+            unchanged_count = len(updated_objects) - len(changed_objects)
+            updated_objects = changed_objects
+
+        model.objects.bulk_create(created_objects, BATCH_SIZE)
         model.objects.bulk_update(
-            (o for o in objects if o.id),
-            fields=fields or [field.name for field in model._meta.fields if not field.primary_key],
+            updated_objects,
+            fields=fields
+            or [
+                field.name
+                for field in model._meta.fields
+                if not (field.primary_key or field.generated)
+            ],
             batch_size=BATCH_SIZE,
         )
+
+        if issubclass(model, DirtyFieldsMixin):
+            for o in (*created_objects, *updated_objects):
+                o.mark_clean()
+        objects.clear()
+
+        return BulkSaveResult(
+            created=len(created_objects),
+            unchanged=unchanged_count,
+            updated=len(updated_objects),
+        )
+
+    @staticmethod
+    def bulk_upsert(model, objects, unique_fields, fields=None) -> BulkSaveResult:
+        """Bulk upsert objects on their natural key using INSERT ... ON CONFLICT.
+
+        Objects don't need a primary key. Objects sharing a natural key are deduplicated,
+        the last one wins. Existing rows are read once to skip objects whose tracked
+        fields are unchanged, the rest are inserted or updated in batches. Saved objects
+        get the primary keys of their rows.
+
+        Args:
+            model (Model): The Django model class.
+            objects (list): List of model instances to save.
+            unique_fields (list): The natural key fields.
+            fields (list, optional): List of tracked fields to update.
+
+        Returns:
+            BulkSaveResult: The created, updated and unchanged row counts.
+
+        """
+        key_fields = [model._meta.get_field(name) for name in unique_fields]
+        tracked_fields = [model._meta.get_field(name) for name in fields or ()] or [
+            field
+            for field in model._meta.concrete_fields
+            if not (
+                field.primary_key
+                or field.generated
+                or field.name in unique_fields
+                or getattr(field, "auto_now", False)
+                or getattr(field, "auto_now_add", False)
+            )
+        ]
+        key_attnames = [field.attname for field in key_fields]
+        tracked_attnames = [field.attname for field in tracked_fields]
+
+        # Postgres can't upsert the same row twice in a single statement.
+        objects_by_key = {
+            tuple(getattr(o, attname) for attname in key_attnames): o for o in objects
+        }
+
+        key_filter = Q()
+        for index, attname in enumerate(key_attnames):
+            values = {key[index] for key in objects_by_key}
+            condition = Q(**{f"{attname}__in": values - {None}})
+            if None in values:
+                condition |= Q(**{f"{attname}__isnull": True})
+            key_filter &= condition
+
+        existing_rows = {
+            tuple(row[1 : len(key_attnames) + 1]): row
+            for row in model.objects.filter(key_filter).values_list(
+                "pk", *key_attnames, *tracked_attnames
+            )
+        }
+
+        changed_objects = []
+        created_count = 0
+        for key, o in objects_by_key.items():
+            row = existing_rows.get(key)
+            if row is None:
+                changed_objects.append(o)
+                created_count += 1
+            elif list(row[len(key_attnames) + 1 :]) != [
+                getattr(o, attname) for attname in tracked_attnames
+            ]:
+                changed_objects.append(o)
+            else:
+                o.pk = row[0]
+
+        if changed_objects:
+            model.objects.bulk_create(
+                changed_objects,
+                batch_size=BATCH_SIZE,
+                unique_fields=unique_fields,
+                update_conflicts=True,
+                update_fields=[field.name for field in tracked_fields]
+                + [
+                    field.name
+                    for field in model._meta.concrete_fields
+                    if getattr(field, "auto_now", False)
+                ],
+            )
+
+        for o in objects:
+            o.pk = objects_by_key[tuple(getattr(o, attname) for attname in key_attnames)].pk
+
+        result = BulkSaveResult(
+            created=created_count,
+            unchanged=len(objects_by_key) - len(changed_objects),
+            updated=len(changed_objects) - created_count,
+        )
         objects.clear()
 
+        return result
+
+
+class DirtyFieldsMixin(models.Model):
+    """Tracks model field changes since the instance was loaded or saved.
+
+    Bulk saves skip updating the rows of unchanged instances.
+    """
+
+    class Meta:
+        """Meta options for DirtyFieldsMixin."""
+
+        abstract = True
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Create an instance from a database row and snapshot its loaded values."""
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_values = {
+            attname: copy.deepcopy(value) if isinstance(value, (dict, list)) else value
+            for attname, value in zip(field_names, values, strict=True)
+        }
+
+        return instance
+
+    def get_dirty_fields(self, fields=None) -> set[str]:
+        """Get the names of the fields changed since the instance was loaded or saved.
+
+        Args:
+            fields (list, optional): The field names to check, all non primary key
+                fields by default.
+
+        Returns:
+            set[str]: The changed field names.
+
+        """
+        loaded_values = getattr(self, "_loaded_values", {})
+
+        return {
+            field.name
+            for field in (
+                [self._meta.get_field(name) for name in fields]
+                if fields
+                else [field for field in self._meta.concrete_fields if not field.primary_key]
+            )
+            if field.attname not in loaded_values
+            or getattr(self, field.attname) != loaded_values[field.attname]
+        }
+
+    def mark_clean(self) -> None:
+        """Snapshot the current field values as saved."""
+        self._loaded_values = {
+            field.attname: copy.deepcopy(value) if isinstance(value, (dict, list)) else value
+            for field in self._meta.concrete_fields
+            if (value := self.__dict__.get(field.attname, DEFERRED)) is not DEFERRED
+        }
+
+    def save(self, *args, **kwargs) -> None:
+        """Save the instance and snapshot its field values."""
+        super().save(*args, **kwargs)
+        self.mark_clean()
+
 
 class TimestampedModel(models.Model):
     """Base model with auto created_at and updated_at fields."""
@@ -8,6 +8,7 @@ from github import Auth, Github
 from github.GithubException import BadCredentialsException
 
 from apps.github.constants import GITHUB_ITEMS_PER_PAGE
+from apps.github.http_cache import enable_conditional_requests
 
 logger = logging.getLogger(__name__)
 
@@ -58,20 +59,22 @@ class GitHubAppAuth:
 
         if self._is_app_configured():
             logger.warning("Using GitHub App authentication")
-            return Github(
-                auth=Auth.AppInstallationAuth(
-                    app_auth=Auth.AppAuth(
-                        app_id=self.app_id,
-                        private_key=self.private_key,
+            return enable_conditional_requests(
+                Github(
+                    auth=Auth.AppInstallationAuth(
+                        app_auth=Auth.AppAuth(
+                            app_id=self.app_id,
+                            private_key=self.private_key,
+                        ),
+                        installation_id=int(self.app_installation_id),
                     ),
-                    installation_id=int(self.app_installation_id),
-                ),
-                per_page=per_page,
+                    per_page=per_page,
+                )
             )
 
         if self.pat_token:
             logger.warning("Using GitHub PAT token")
-            return Github(self.pat_token, per_page=per_page)
+            return enable_conditional_requests(Github(self.pat_token, per_page=per_page))
 
         raise BadCredentialsException(401, "Invalid GitHub credentials", None)
 
@@ -10,9 +10,14 @@ from django.utils import timezone
 from github.GithubException import UnknownObjectException
 
 if TYPE_CHECKING:
+    from datetime import datetime
+
     from github import Github
 
+from apps.github.graphql_fetcher import RepositoryGraphQLFetcher
+from apps.github.identity_map import IdentityMap
 from apps.github.models.comment import Comment
+from apps.github.models.daily_contribution import DailyContribution
 from apps.github.models.issue import Issue
 from apps.github.models.label import Label
 from apps.github.models.milestone import Milestone
@@ -22,13 +27,19 @@ from apps.github.models.release import Release
 from apps.github.models.repository import Repository
 from apps.github.models.repository_contributor import RepositoryContributor
 from apps.github.models.user import User
+from apps.github.relation_writer import RelationWriter
 from apps.github.utils import check_owasp_site_repository
 
 logger: logging.Logger = logging.getLogger(__name__)
 
 
 def sync_repository(
-    gh_repository, organization=None, user=None
+    gh_repository,
+    organization=None,
+    user=None,
+    *,
+    graphql: bool = False,
+    identity_map: IdentityMap | None = None,
 ) -> tuple[Organization, Repository]:
     """Sync GitHub repository data.
 
@@ -36,11 +47,19 @@ def sync_repository(
         gh_repository (github.Repository.Repository): The GitHub repository object.
         organization (Organization, optional): The organization instance.
         user (User, optional): The user instance.
+        graphql (bool, optional): Whether to fetch issues and pull requests using GraphQL.
+        identity_map (IdentityMap, optional): The identity map shared by syncs, which
+            the caller flushes. A repository scoped one is used by default.
 
     Returns:
         tuple: A tuple containing the updated organization and repository instances.
 
     """
+    is_shared_identity_map = identity_map is not None
+    identity_map = identity_map or IdentityMap()
+    # Creation dates of the synced contributions, bounding the rollup refresh.
+    contributed_at: list[datetime] = []
+
     entity_key = gh_repository.name.lower()
     is_owasp_site_repository = check_owasp_site_repository(entity_key)
 
@@ -52,7 +71,7 @@ def sync_repository(
 
     # GitHub repository owner.
     if user is None:
-        user = User.update_data(gh_repository.owner)
+        user = identity_map.update(User, gh_repository.owner)
 
     # GitHub repository.
     commits = gh_repository.get_commits()
@@ -69,6 +88,9 @@ def sync_repository(
     )
 
     if not repository.is_archived:
+        graphql_fetcher = RepositoryGraphQLFetcher(gh_repository) if graphql else None
+        relation_writer = RelationWriter()
+
         # GitHub repository milestones.
         kwargs = {
             "direction": "desc",
@@ -86,19 +108,27 @@ def sync_repository(
             if gh_milestone.updated_at < until:
                 break
 
-            milestone = Milestone.update_data(
-                gh_milestone,
-                author=User.update_data(gh_milestone.creator),
-                repository=repository,
-            )
+            if not (
+                milestone := identity_map.update(
+                    Milestone,
+                    gh_milestone,
+                    author=identity_map.update(User, gh_milestone.creator),
+                    repository=repository,
+                )
+            ):
+                continue
 
             # Labels.
-            milestone.labels.clear()
-            for gh_milestone_label in gh_milestone.get_labels():
+            labels = []
+            gh_milestone_labels = list(gh_milestone.get_labels())
+            identity_map.load(Label, gh_milestone_labels)
+            for gh_milestone_label in gh_milestone_labels:
                 try:
-                    milestone.labels.add(Label.update_data(gh_milestone_label))
+                    if label := identity_map.update(Label, gh_milestone_label):
+                        labels.append(label)
                 except UnknownObjectException:
                     logger.exception("Couldn't get GitHub milestone label %s", milestone.url)
+            relation_writer.set_related(milestone, "labels", labels)
 
         # GitHub repository issues.
         project_track_issues = repository.project.track_issues if repository.project else True
@@ -115,21 +145,29 @@ def sync_repository(
                 if (latest_updated_issue := repository.latest_updated_issue)
                 else month_ago
             )
-            for gh_issue in gh_repository.get_issues(**kwargs):
+            gh_issues = (
+                graphql_fetcher.get_issues()
+                if graphql_fetcher
+                else gh_repository.get_issues(**kwargs)
+            )
+            for gh_issue in gh_issues:
                 if gh_issue.pull_request:  # Skip pull requests.
                     continue
 
                 if gh_issue.updated_at < until:
                     break
 
-                author = User.update_data(gh_issue.user)
+                identity_map.load(User, (gh_issue.user, *gh_issue.assignees))
+                identity_map.load(Label, gh_issue.labels)
+                author = identity_map.update(User, gh_issue.user)
 
                 # Milestone
                 milestone = None
                 if gh_issue.milestone:
-                    milestone = Milestone.update_data(
+                    milestone = identity_map.update(
+                        Milestone,
                         gh_issue.milestone,
-                        author=User.update_data(gh_issue.milestone.creator),
+                        author=identity_map.update(User, gh_issue.milestone.creator),
                         repository=repository,
                     )
                 issue = Issue.update_data(
@@ -138,20 +176,28 @@ def sync_repository(
                     milestone=milestone,
                     repository=repository,
                 )
+                contributed_at.append(gh_issue.created_at)
 
                 # Assignees.
-                issue.assignees.clear()
-                for gh_issue_assignee in gh_issue.assignees:
-                    if issue_assignee := User.update_data(gh_issue_assignee):
-                        issue.assignees.add(issue_assignee)
+                relation_writer.set_related(
+                    issue,
+                    "assignees",
+                    [
+                        issue_assignee
+                        for gh_issue_assignee in gh_issue.assignees
+                        if (issue_assignee := identity_map.update(User, gh_issue_assignee))
+                    ],
+                )
 
                 # Labels.
-                issue.labels.clear()
+                labels = []
                 for gh_issue_label in gh_issue.labels:
                     try:
-                        issue.labels.add(Label.update_data(gh_issue_label))
+                        if label := identity_map.update(Label, gh_issue_label):
+                            labels.append(label)
                     except UnknownObjectException:
                         logger.exception("Couldn't get GitHub issue label %s", issue.url)
+                relation_writer.set_related(issue, "labels", labels)
         else:
             logger.info("Skipping issues sync for %s", repository.name)
 
@@ -166,18 +212,26 @@ def sync_repository(
             if (latest_updated_pull_request := repository.latest_updated_pull_request)
             else month_ago
         )
-        for gh_pull_request in gh_repository.get_pulls(**kwargs):
+        gh_pull_requests = (
+            graphql_fetcher.get_pull_requests()
+            if graphql_fetcher
+            else gh_repository.get_pulls(**kwargs)
+        )
+        for gh_pull_request in gh_pull_requests:
             if gh_pull_request.updated_at < until:
                 break
 
-            author = User.update_data(gh_pull_request.user)
+            identity_map.load(User, (gh_pull_request.user, *gh_pull_request.assignees))
+            identity_map.load(Label, gh_pull_request.labels)
+            author = identity_map.update(User, gh_pull_request.user)
 
             # Milestone
             milestone = None
             if gh_pull_request.milestone:
-                milestone = Milestone.update_data(
+                milestone = identity_map.update(
+                    Milestone,
                     gh_pull_request.milestone,
-                    author=User.update_data(gh_pull_request.milestone.creator),
+                    author=identity_map.update(User, gh_pull_request.milestone.creator),
                     repository=repository,
                 )
             pull_request = PullRequest.update_data(
@@ -186,20 +240,34 @@ def sync_repository(
                 milestone=milestone,
                 repository=repository,
             )
+            contributed_at.append(gh_pull_request.created_at)
 
             # Assignees.
-            pull_request.assignees.clear()
-            for gh_pull_request_assignee in gh_pull_request.assignees:
-                if pull_request_assignee := User.update_data(gh_pull_request_assignee):
-                    pull_request.assignees.add(pull_request_assignee)
+            relation_writer.set_related(
+                pull_request,
+                "assignees",
+                [
+                    pull_request_assignee
+                    for gh_pull_request_assignee in gh_pull_request.assignees
+                    if (
+                        pull_request_assignee := identity_map.update(
+                            User, gh_pull_request_assignee
+                        )
+                    )
+                ],
+            )
 
             # Labels.
-            pull_request.labels.clear()
+            labels = []
             for gh_pull_request_label in gh_pull_request.labels:
                 try:
-                    pull_request.labels.add(Label.update_data(gh_pull_request_label))
+                    if label := identity_map.update(Label, gh_pull_request_label):
+                        labels.append(label)
                 except UnknownObjectException:
                     logger.exception("Couldn't get GitHub pull request label %s", pull_request.url)
+            relation_writer.set_related(pull_request, "labels", labels)
+
+        relation_writer.flush()
 
     # GitHub repository releases.
     releases = []
@@ -214,23 +282,38 @@ def sync_repository(
             if release_node_id in existing_release_node_ids:
                 break
 
-            author = User.update_data(gh_release.author)
+            author = identity_map.update(User, gh_release.author)
             releases.append(Release.update_data(gh_release, author=author, repository=repository))
+            if gh_release.published_at:
+                contributed_at.append(gh_release.published_at)
     Release.bulk_save(releases)
 
     # GitHub repository contributors.
+    gh_contributors = list(contributors)
+    identity_map.load(User, gh_contributors)
     RepositoryContributor.bulk_save(
         [
             RepositoryContributor.update_data(
                 gh_contributor,
                 repository=repository,
                 user=user,
+                save=False,
             )
-            for gh_contributor in gh_repository.get_contributors()
-            if (user := User.update_data(gh_contributor))
+            for gh_contributor in gh_contributors
+            if (user := identity_map.update(User, gh_contributor))
         ]
     )
 
+    if not is_shared_identity_map:
+        identity_map.flush()
+
+    # Daily contributions rollup.
+    if contributed_at:
+        DailyContribution.refresh(
+            repository_ids=[repository.id],
+            start_date=timezone.localdate(min(contributed_at)),
+        )
+
     return organization, repository
 
 
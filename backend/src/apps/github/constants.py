@@ -4,8 +4,18 @@ import re
 
 GITHUB_ACTIONS_USER_LOGIN = "actions-user"
 GITHUB_GHOST_USER_LOGIN = "ghost"
+GITHUB_GRAPHQL_ASSIGNEES_PAGE_SIZE = 10
+GITHUB_GRAPHQL_LABELS_PAGE_SIZE = 100
+GITHUB_GRAPHQL_PAGE_SIZE = 50
+GITHUB_HTTP_CACHE_ALIAS = "github-http"
+GITHUB_HTTP_CACHE_KEY_PREFIX = "github-http"
+GITHUB_HTTP_CACHE_TTL_SECONDS = 172800  # 2 days, the daily sync interval with a margin.
 GITHUB_ITEMS_PER_PAGE = 100
+GITHUB_RATE_LIMIT_RESERVE = 100
 GITHUB_REPOSITORY_RE = re.compile("^https://github.com/([^/]+)/([^/]+)(/.*)?$")
+GITHUB_SYNC_BATCH_SIZE = 10
+GITHUB_SYNC_PROGRESS_KEY_PREFIX = "github-sync-progress"
+GITHUB_SYNC_PROGRESS_TTL_SECONDS = 604800  # 7 days.
 GITHUB_USER_RE = re.compile("^https://github.com/([^/]+)/?$")
 
 OWASP_FOUNDATION_LOGIN = "OWASPFoundation"
@@ -0,0 +1,362 @@
+"""GitHub GraphQL bulk fetch of repository issues and pull requests."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any
+
+from apps.github.constants import (
+    GITHUB_GRAPHQL_ASSIGNEES_PAGE_SIZE,
+    GITHUB_GRAPHQL_LABELS_PAGE_SIZE,
+    GITHUB_GRAPHQL_PAGE_SIZE,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from github.Repository import Repository as GithubRepository
+
+# REST issue lock reasons by GraphQL LockReason value.
+ACTIVE_LOCK_REASONS = {
+    "OFF_TOPIC": "off-topic",
+    "RESOLVED": "resolved",
+    "SPAM": "spam",
+    "TOO_HEATED": "too heated",
+}
+
+FRAGMENTS = """
+fragment UserFields on User {
+  avatarUrl
+  bio
+  company
+  createdAt
+  email
+  followers { totalCount }
+  following { totalCount }
+  gists(privacy: PUBLIC) { totalCount }
+  id
+  isHireable
+  location
+  login
+  name
+  repositories(privacy: PUBLIC, ownerAffiliations: OWNER) { totalCount }
+  twitterUsername
+  updatedAt
+}
+
+fragment ActorFields on Actor {
+  __typename
+  avatarUrl
+  login
+  ... on Bot { createdAt id updatedAt }
+  ... on Organization { createdAt id name updatedAt }
+  ... on User { ...UserFields }
+}
+
+fragment LabelFields on Label {
+  color
+  description
+  id
+  name
+}
+
+fragment MilestoneFields on Milestone {
+  closedAt
+  closedIssues: issues(states: CLOSED) { totalCount }
+  closedPullRequests: pullRequests(states: [CLOSED, MERGED]) { totalCount }
+  createdAt
+  creator { ...ActorFields }
+  description
+  dueOn
+  id
+  number
+  openIssues: issues(states: OPEN) { totalCount }
+  openPullRequests: pullRequests(states: OPEN) { totalCount }
+  state
+  title
+  updatedAt
+  url
+}
+"""
+
+ISSUES_QUERY = (
+    FRAGMENTS
+    + """
+query Issues(
+  $assigneesPageSize: Int!
+  $cursor: String
+  $labelsPageSize: Int!
+  $name: String!
+  $owner: String!
+  $pageSize: Int!
+) {
+  repository(owner: $owner, name: $name) {
+    issues(first: $pageSize, after: $cursor, orderBy: {field: UPDATED_AT, direction: DESC}) {
+      pageInfo { endCursor hasNextPage }
+      nodes {
+        activeLockReason
+        assignees(first: $assigneesPageSize) { nodes { ...UserFields } }
+        author { ...ActorFields }
+        body
+        closedAt
+        comments { totalCount }
+        createdAt
+        databaseId
+        id
+        labels(first: $labelsPageSize) { nodes { ...LabelFields } }
+        locked
+        milestone { ...MilestoneFields }
+        number
+        state
+        stateReason
+        title
+        updatedAt
+        url
+      }
+    }
+  }
+}
+"""
+)
+
+PULL_REQUESTS_QUERY = (
+    FRAGMENTS
+    + """
+query PullRequests(
+  $assigneesPageSize: Int!
+  $cursor: String
+  $labelsPageSize: Int!
+  $name: String!
+  $owner: String!
+  $pageSize: Int!
+) {
+  repository(owner: $owner, name: $name) {
+    pullRequests(
+      first: $pageSize
+      after: $cursor
+      orderBy: {field: UPDATED_AT, direction: DESC}
+    ) {
+      pageInfo { endCursor hasNextPage }
+      nodes {
+        assignees(first: $assigneesPageSize) { nodes { ...UserFields } }
+        author { ...ActorFields }
+        body
+        closedAt
+        createdAt
+        databaseId
+        id
+        labels(first: $labelsPageSize) { nodes { ...LabelFields } }
+        mergedAt
+        milestone { ...MilestoneFields }
+        number
+        state
+        title
+        updatedAt
+        url
+      }
+    }
+  }
+}
+"""
+)
+
+
+class GraphQLObject(SimpleNamespace):
+    """GitHub object built from GraphQL data using PyGithub attribute names."""
+
+    def __init__(self, node_id: str, **attributes) -> None:
+        """Initialize the object.
+
+        Args:
+            node_id (str): The GitHub node ID.
+            **attributes: The PyGithub attributes of the object.
+
+        """
+        super().__init__(node_id=node_id, raw_data={"node_id": node_id}, **attributes)
+
+
+def parse_datetime(value: str | None) -> datetime | None:
+    """Parse a GraphQL DateTime value."""
+    return datetime.fromisoformat(value) if value else None
+
+
+def lower(value: str | None) -> str | None:
+    """Convert a GraphQL enum value to its REST representation."""
+    return value.lower() if value else None
+
+
+class RepositoryGraphQLFetcher:
+    """Fetches repository issues and pull requests with nested related objects.
+
+    A single GraphQL query returns a page of issues or pull requests along with their
+    authors, assignees, labels and milestones, which the REST API returns partially and
+    completes with a request per related object.
+    """
+
+    def __init__(self, gh_repository: GithubRepository) -> None:
+        """Initialize the fetcher.
+
+        Args:
+            gh_repository (GithubRepository): The GitHub repository.
+
+        """
+        self.owner, self.name = gh_repository.full_name.split("/", 1)
+        self.requester = gh_repository.requester
+
+    def get_issues(self) -> Iterator[GraphQLObject]:
+        """Get issues ordered by the most recently updated."""
+        for node in self.get_nodes(ISSUES_QUERY, "issues"):
+            yield self.to_issue(node)
+
+    def get_nodes(self, query: str, connection_name: str) -> Iterator[dict[str, Any]]:
+        """Get repository connection nodes page by page.
+
+        Args:
+            query (str): The GraphQL query.
+            connection_name (str): The repository connection name.
+
+        Yields:
+            dict[str, Any]: The connection nodes.
+
+        """
+        cursor = None
+        while True:
+            _, data = self.requester.graphql_query(
+                query,
+                {
+                    "assigneesPageSize": GITHUB_GRAPHQL_ASSIGNEES_PAGE_SIZE,
+                    "cursor": cursor,
+                    "labelsPageSize": GITHUB_GRAPHQL_LABELS_PAGE_SIZE,
+                    "name": self.name,
+                    "owner": self.owner,
+                    "pageSize": GITHUB_GRAPHQL_PAGE_SIZE,
+                },
+            )
+            connection = data["data"]["repository"][connection_name]
+            yield from connection["nodes"]
+
+            if not connection["pageInfo"]["hasNextPage"]:
+                return
+            cursor = connection["pageInfo"]["endCursor"]
+
+    def get_pull_requests(self) -> Iterator[GraphQLObject]:
+        """Get pull requests ordered by the most recently updated."""
+        for node in self.get_nodes(PULL_REQUESTS_QUERY, "pullRequests"):
+            yield self.to_pull_request(node)
+
+    def to_issue(self, node: dict[str, Any]) -> GraphQLObject:
+        """Convert an issue node."""
+        return GraphQLObject(
+            node["id"],
+            active_lock_reason=ACTIVE_LOCK_REASONS.get(node["activeLockReason"]),
+            assignees=[self.to_user(assignee) for assignee in node["assignees"]["nodes"]],
+            body=node["body"],
+            closed_at=parse_datetime(node["closedAt"]),
+            comments=node["comments"]["totalCount"],
+            created_at=parse_datetime(node["createdAt"]),
+            html_url=node["url"],
+            id=node["databaseId"],
+            labels=[self.to_label(label) for label in node["labels"]["nodes"]],
+            locked=node["locked"],
+            milestone=self.to_milestone(node["milestone"]),
+            number=node["number"],
+            pull_request=None,
+            state=lower(node["state"]),
+            state_reason=lower(node["stateReason"]),
+            title=node["title"],
+            updated_at=parse_datetime(node["updatedAt"]),
+            user=self.to_user(node["author"]),
+        )
+
+    def to_label(self, node: dict[str, Any]) -> GraphQLObject:
+        """Convert a label node."""
+        return GraphQLObject(
+            node["id"],
+            color=node["color"],
+            description=node["description"],
+            name=node["name"],
+        )
+
+    def to_milestone(self, node: dict[str, Any] | None) -> GraphQLObject | None:
+        """Convert a milestone node."""
+        if node is None:
+            return None
+
+        return GraphQLObject(
+            node["id"],
+            closed_at=parse_datetime(node["closedAt"]),
+            # REST milestone counts include pull requests.
+            closed_issues=(
+                node["closedIssues"]["totalCount"] + node["closedPullRequests"]["totalCount"]
+            ),
+            created_at=parse_datetime(node["createdAt"]),
+            creator=self.to_user(node["creator"]),
+            description=node["description"],
+            due_on=parse_datetime(node["dueOn"]),
+            html_url=node["url"],
+            number=node["number"],
+            open_issues=(
+                node["openIssues"]["totalCount"] + node["openPullRequests"]["totalCount"]
+            ),
+            state=lower(node["state"]),
+            title=node["title"],
+            updated_at=parse_datetime(node["updatedAt"]),
+        )
+
+    def to_pull_request(self, node: dict[str, Any]) -> GraphQLObject:
+        """Convert a pull request node."""
+        return GraphQLObject(
+            node["id"],
+            assignees=[self.to_user(assignee) for assignee in node["assignees"]["nodes"]],
+            body=node["body"],
+            closed_at=parse_datetime(node["closedAt"]),
+            created_at=parse_datetime(node["createdAt"]),
+            html_url=node["url"],
+            id=node["databaseId"],
+            labels=[self.to_label(label) for label in node["labels"]["nodes"]],
+            merged_at=parse_datetime(node["mergedAt"]),
+            milestone=self.to_milestone(node["milestone"]),
+            number=node["number"],
+            # REST reports merged pull requests as closed.
+            state="open" if node["state"] == "OPEN" else "closed",
+            title=node["title"],
+            updated_at=parse_datetime(node["updatedAt"]),
+            user=self.to_user(node["author"]),
+        )
+
+    def to_user(self, node: dict[str, Any] | None) -> GraphQLObject | None:
+        """Convert an actor node.
+
+        Deleted accounts have no author node and are skipped like the REST ghost user
+        without a node ID.
+        """
+        if node is None or "id" not in node:
+            return None
+
+        user_type = node.get("__typename", "User")
+        login = node["login"]
+        if user_type == "Bot":
+            # REST bot logins have the "[bot]" suffix.
+            login = f"{login}[bot]"
+
+        return GraphQLObject(
+            node["id"],
+            avatar_url=node["avatarUrl"],
+            bio=node.get("bio"),
+            collaborators=None,
+            company=node.get("company"),
+            created_at=parse_datetime(node["createdAt"]),
+            email=node.get("email"),
+            followers=node.get("followers", {}).get("totalCount"),
+            following=node.get("following", {}).get("totalCount"),
+            hireable=node.get("isHireable"),
+            location=node.get("location"),
+            login=login,
+            name=node.get("name"),
+            public_gists=node.get("gists", {}).get("totalCount"),
+            public_repos=node.get("repositories", {}).get("totalCount"),
+            twitter_username=node.get("twitterUsername"),
+            type=user_type,
+            updated_at=parse_datetime(node["updatedAt"]),
+        )
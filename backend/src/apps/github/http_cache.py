@@ -0,0 +1,188 @@
+"""GitHub conditional request (ETag/Last-Modified) cache."""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+from typing import TYPE_CHECKING
+
+from django.core.cache import caches
+from github.Requester import HTTPRequestsConnectionClass, HTTPSRequestsConnectionClass
+from requests import Response
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+from apps.github.constants import (
+    GITHUB_HTTP_CACHE_ALIAS,
+    GITHUB_HTTP_CACHE_KEY_PREFIX,
+    GITHUB_HTTP_CACHE_TTL_SECONDS,
+)
+
+if TYPE_CHECKING:
+    from github import Github
+    from github.Requester import Requester
+    from requests import PreparedRequest
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+# The private Requester attribute holding the connection class, see set_connection_class.
+REQUESTER_CONNECTION_CLASS_ATTRIBUTE = "_Requester__connectionClass"
+
+
+class ConditionalRequestAdapter(HTTPAdapter):
+    """Transport adapter that revalidates cached GET responses with conditional requests.
+
+    Responses with an ETag or Last-Modified header are stored in the bounded GitHub HTTP
+    cache store. Subsequent requests for the same URL send If-None-Match/If-Modified-Since
+    and a 304 Not Modified response is served from the stored copy. Conditional requests
+    answered with 304 don't count against the GitHub API rate limit.
+    """
+
+    @staticmethod
+    def get_key(request: PreparedRequest) -> str:
+        """Get the cache key of a request.
+
+        The key doesn't include credentials as installation tokens are rotated hourly
+        while the responses stay the same for a single app or token identity.
+        """
+        value = f"{request.headers.get('Accept', '')}|{request.url}"
+        return f"{GITHUB_HTTP_CACHE_KEY_PREFIX}:{hashlib.sha256(value.encode()).hexdigest()}"
+
+    def send(self, request: PreparedRequest, **kwargs) -> Response:
+        """Send a request, using conditional headers for cached GET responses."""
+        if request.method != "GET" or kwargs.get("stream"):
+            return super().send(request, **kwargs)
+
+        cache = caches[GITHUB_HTTP_CACHE_ALIAS]
+        key = self.get_key(request)
+        if entry := cache.get(key):
+            if etag := entry["headers"].get("etag"):
+                request.headers["If-None-Match"] = etag
+            if last_modified := entry["headers"].get("last-modified"):
+                request.headers["If-Modified-Since"] = last_modified
+
+        response = super().send(request, **kwargs)
+
+        if response.status_code == 304 and entry:  # noqa: PLR2004
+            return self.build_cached_response(request, response, entry)
+
+        if response.status_code == 200 and (  # noqa: PLR2004
+            "etag" in response.headers or "last-modified" in response.headers
+        ):
+            cache.set(
+                key,
+                {
+                    "body": response.content,
+                    "headers": {k.lower(): v for k, v in response.headers.items()},
+                },
+                timeout=GITHUB_HTTP_CACHE_TTL_SECONDS,
+            )
+
+        return response
+
+    def build_cached_response(
+        self, request: PreparedRequest, not_modified_response: Response, entry: dict
+    ) -> Response:
+        """Build a response from a stored entry and a 304 Not Modified response.
+
+        Args:
+            request (PreparedRequest): The request.
+            not_modified_response (Response): The 304 Not Modified response.
+            entry (dict): The stored response entry.
+
+        Returns:
+            Response: The stored response with up to date rate limit headers.
+
+        """
+        response = Response()
+        response._content = entry["body"]  # noqa: SLF001
+        response.connection = self
+        response.headers = CaseInsensitiveDict(entry["headers"])
+        # Keep rate limit and other headers of the fresh response.
+        response.headers.update(not_modified_response.headers)
+        response.reason = "OK"
+        response.request = request
+        response.status_code = 200
+        response.url = not_modified_response.url
+        not_modified_response.close()
+
+        logger.debug("Serving %s from the conditional request cache", request.url)
+        return response
+
+
+class ConditionalHTTPRequestsConnection(HTTPRequestsConnectionClass):
+    """PyGithub HTTP connection using the conditional request adapter."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        """Initialize the connection."""
+        super().__init__(*args, **kwargs)
+        self.adapter = ConditionalRequestAdapter(
+            max_retries=self.retry,
+            pool_connections=self.pool_size,
+            pool_maxsize=self.pool_size,
+        )
+        self.session.mount("http://", self.adapter)
+
+
+class ConditionalHTTPSRequestsConnection(HTTPSRequestsConnectionClass):
+    """PyGithub HTTPS connection using the conditional request adapter."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        """Initialize the connection."""
+        super().__init__(*args, **kwargs)
+        self.adapter = ConditionalRequestAdapter(
+            max_retries=self.retry,
+            pool_connections=self.pool_size,
+            pool_maxsize=self.pool_size,
+        )
+        self.session.mount("https://", self.adapter)
+
+
+def set_connection_class(
+    requester: Requester,
+    connection_class: type[HTTPRequestsConnectionClass | HTTPSRequestsConnectionClass],
+) -> bool:
+    """Replace the connection class of a PyGithub requester.
+
+    PyGithub only supports replacing connection classes globally, which also turns off
+    connection reuse, so the private per requester attribute is replaced instead. The
+    replacement is skipped if the installed PyGithub version doesn't have it.
+
+    Args:
+        requester (Requester): The PyGithub requester.
+        connection_class (type): The connection class to use.
+
+    Returns:
+        bool: Whether the connection class was replaced.
+
+    """
+    current_class = getattr(requester, REQUESTER_CONNECTION_CLASS_ATTRIBUTE, None)
+    if not (
+        isinstance(current_class, type)
+        and issubclass(current_class, HTTPRequestsConnectionClass | HTTPSRequestsConnectionClass)
+    ):
+        logger.warning("Unsupported PyGithub requester, conditional requests are disabled")
+        return False
+
+    setattr(requester, REQUESTER_CONNECTION_CLASS_ATTRIBUTE, connection_class)
+    return True
+
+
+def enable_conditional_requests(gh: Github) -> Github:
+    """Route GitHub client requests through the conditional request cache.
+
+    Args:
+        gh (Github): The GitHub client.
+
+    Returns:
+        Github: The same GitHub client.
+
+    """
+    requester = gh.requester
+    set_connection_class(
+        requester,
+        ConditionalHTTPSRequestsConnection
+        if requester.scheme == "https"
+        else ConditionalHTTPRequestsConnection,
+    )
+    return gh
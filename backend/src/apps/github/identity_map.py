@@ -0,0 +1,113 @@
+"""GitHub sync identity map."""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import TYPE_CHECKING, Any
+
+from django.db import IntegrityError, transaction
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from apps.github.models.common import NodeModel
+
+
+class IdentityMap:
+    """Sync-scoped identity map of GitHub entities keyed by node ID.
+
+    Each entity is loaded and updated from GitHub data once per sync. New entities are
+    inserted right away as related rows need their primary keys, while changes to
+    existing entities are written with a bulk update when the map is flushed. An entity
+    inserted concurrently by another sync is reloaded and updated instead.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the identity map."""
+        self.dirty: dict[type[NodeModel], set[str]] = defaultdict(set)
+        self.instances: dict[type[NodeModel], dict[str, NodeModel]] = defaultdict(dict)
+        self.missing: dict[type[NodeModel], set[str]] = defaultdict(set)
+        self.updated: dict[type[NodeModel], set[str]] = defaultdict(set)
+
+    def flush(self) -> None:
+        """Bulk update the changed existing entities."""
+        for model, node_ids in self.dirty.items():
+            if node_ids:
+                model.bulk_save([self.instances[model][node_id] for node_id in node_ids])
+                node_ids.clear()
+
+    def get_node_id(self, model: type[NodeModel], gh_object) -> str | None:
+        """Get the node ID of a GitHub object.
+
+        Related PyGithub objects are returned incomplete: reading the node ID attribute
+        instead of the raw data doesn't send a request to complete them.
+        """
+        return getattr(gh_object, "node_id", None) or model.get_node_id(gh_object)
+
+    def get_node_ids(self, model: type[NodeModel], gh_objects: Iterable) -> set[str]:
+        """Get the node IDs of GitHub objects."""
+        return {
+            node_id
+            for gh_object in gh_objects
+            if gh_object is not None and (node_id := self.get_node_id(model, gh_object))
+        }
+
+    def load(self, model: type[NodeModel], gh_objects: Iterable) -> None:
+        """Load the entities of GitHub objects not seen before with a single query.
+
+        Args:
+            model (type[NodeModel]): The model class.
+            gh_objects (Iterable): The GitHub objects.
+
+        """
+        node_ids = (
+            self.get_node_ids(model, gh_objects)
+            - self.instances[model].keys()
+            - self.missing[model]
+        )
+        if not node_ids:
+            return
+
+        for instance in model.objects.filter(node_id__in=node_ids):
+            self.instances[model][instance.node_id] = instance
+
+        self.missing[model].update(node_ids - self.instances[model].keys())
+
+    def update(self, model: type[NodeModel], gh_object, **kwargs: Any) -> NodeModel | None:
+        """Get an entity updated from GitHub data.
+
+        Args:
+            model (type[NodeModel]): The model class.
+            gh_object: The GitHub object.
+            **kwargs: The extra arguments of the model `from_github` method.
+
+        Returns:
+            NodeModel | None: The entity or None if the GitHub object has no node ID.
+
+        """
+        if gh_object is None or not (node_id := self.get_node_id(model, gh_object)):
+            return None
+
+        if node_id in self.updated[model]:
+            return self.instances[model][node_id]
+
+        self.load(model, (gh_object,))
+        instance = self.instances[model].get(node_id) or model(node_id=node_id)
+        instance.from_github(gh_object, **kwargs)
+
+        if instance.pk is None:
+            try:
+                with transaction.atomic():
+                    instance.save()
+            except IntegrityError:
+                instance = model.objects.get(node_id=node_id)
+                instance.from_github(gh_object, **kwargs)
+                self.dirty[model].add(node_id)
+            self.missing[model].discard(node_id)
+        else:
+            self.dirty[model].add(node_id)
+
+        self.instances[model][node_id] = instance
+        self.updated[model].add(node_id)
+
+        return instance
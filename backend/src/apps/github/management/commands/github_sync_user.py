@@ -8,6 +8,7 @@ from github.GithubException import GithubException
 
 from apps.github.auth import get_github_client
 from apps.github.models.commit import Commit
+from apps.github.models.daily_contribution import DailyContribution
 from apps.github.models.issue import Issue
 from apps.github.models.organization import Organization
 from apps.github.models.pull_request import PullRequest
@@ -463,6 +464,7 @@ class Command(BaseCommand):
             )
 
         if total_synced:
+            DailyContribution.refresh(user_ids=[user.id])
             self.stdout.write(
                 self.style.SUCCESS(
                     f"\nTotal: Synced {len(pull_requests_data)} PRs, "
@@ -0,0 +1,55 @@
+"""A command to update GitHub daily contributions."""
+
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from apps.common.models import BulkSaveResult
+from apps.github.models.daily_contribution import DailyContribution
+from apps.github.models.repository import Repository
+
+
+class Command(BaseCommand):
+    help = "Update GitHub daily contributions rollup."
+
+    def add_arguments(self, parser):
+        """Add command-line arguments to the parser.
+
+        Args:
+            parser (argparse.ArgumentParser): The argument parser instance.
+
+        """
+        parser.add_argument(
+            "--days",
+            help="Number of days to recompute, all days by default",
+            required=False,
+            type=int,
+        )
+        parser.add_argument("--offset", default=0, required=False, type=int)
+
+    def handle(self, *args, **options):
+        """Handle the command execution.
+
+        Args:
+            *args: Variable length argument list.
+            **options: Arbitrary keyword arguments containing command options.
+
+        """
+        days = options["days"]
+        offset = options["offset"]
+        start_date = (timezone.now() - timedelta(days=days)).date() if days else None
+
+        repository_ids = list(Repository.objects.order_by("id").values_list("id", flat=True))
+        repositories_count = len(repository_ids)
+        result = BulkSaveResult()
+        for idx, repository_id in enumerate(repository_ids[offset:]):
+            prefix = f"{idx + offset + 1} of {repositories_count}"
+            self.stdout.write(f"{prefix:<10} repository #{repository_id}\n")
+
+            result += DailyContribution.refresh(
+                repository_ids=[repository_id],
+                start_date=start_date,
+            )
+
+        self.stdout.write(f"Updated daily contributions: {result}\n")
@@ -1,13 +1,28 @@
 """A command to update OWASP entities from GitHub data."""
 
 import logging
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from queue import Empty, Queue
 
+from django.core.cache import cache
 from django.core.management.base import BaseCommand
+from django.db import connection
+from github import Github
+from github.Repository import Repository as GithubRepository
 
 from apps.core.utils import index
 from apps.github.auth import get_github_client
 from apps.github.common import sync_repository
+from apps.github.constants import (
+    GITHUB_SYNC_BATCH_SIZE,
+    GITHUB_SYNC_PROGRESS_KEY_PREFIX,
+    GITHUB_SYNC_PROGRESS_TTL_SECONDS,
+)
+from apps.github.identity_map import IdentityMap
 from apps.github.models.repository import Repository
+from apps.github.rate_limit import RateLimitBudget
 from apps.owasp.constants import OWASP_ORGANIZATION_NAME
 from apps.owasp.models.chapter import Chapter
 from apps.owasp.models.committee import Committee
@@ -16,6 +31,41 @@ from apps.owasp.models.project import Project
 logger: logging.Logger = logging.getLogger(__name__)
 
 
+class SyncProgress:
+    """Resumable record of the repositories synced during an organization run."""
+
+    def __init__(self, *, resume: bool = False) -> None:
+        """Initialize the progress of a new run or of the previous run when resuming.
+
+        Args:
+            resume (bool): Whether to continue the previous run.
+
+        """
+        run_key = f"{GITHUB_SYNC_PROGRESS_KEY_PREFIX}:run"
+        run_id = cache.get(run_key) if resume else None
+        if run_id is None:
+            run_id = uuid.uuid4().hex
+            cache.set(run_key, run_id, timeout=GITHUB_SYNC_PROGRESS_TTL_SECONDS)
+
+        self.run_id = run_id
+
+    def get_key(self, repository_name: str) -> str:
+        """Get the cache key of a synced repository."""
+        return f"{GITHUB_SYNC_PROGRESS_KEY_PREFIX}:{self.run_id}:{repository_name}"
+
+    def get_synced(self, repository_names: list[str]) -> set[str]:
+        """Get the names of repositories already synced during the run."""
+        keys = {self.get_key(name): name for name in repository_names}
+        return {keys[key] for key in cache.get_many(list(keys))}
+
+    def mark_synced(self, repository_names: list[str]) -> None:
+        """Record repositories as synced."""
+        cache.set_many(
+            {self.get_key(name): True for name in repository_names},
+            timeout=GITHUB_SYNC_PROGRESS_TTL_SECONDS,
+        )
+
+
 class Command(BaseCommand):
     """Fetch OWASP GitHub repository and update relevant entities."""
 
@@ -28,13 +78,29 @@ class Command(BaseCommand):
             parser (argparse.ArgumentParser): The argument parser instance.
 
         """
-        parser.add_argument("--offset", default=0, required=False, type=int)
+        parser.add_argument(
+            "--graphql",
+            action="store_true",
+            help="Fetch issues and pull requests using the GitHub GraphQL API",
+        )
         parser.add_argument(
             "--repository",
             required=False,
             type=str,
             help="The OWASP organization's repository name (e.g. Nest, www-project-nest')",
         )
+        parser.add_argument(
+            "--resume",
+            action="store_true",
+            help="Skip repositories synced by the previous organization run",
+        )
+        parser.add_argument(
+            "--workers",
+            default=1,
+            required=False,
+            type=int,
+            help="Number of repositories to sync concurrently",
+        )
 
     def handle(self, *_args, **options) -> None:
         """Handle the command execution.
@@ -48,64 +114,38 @@ class Command(BaseCommand):
             gh = get_github_client()
             gh_owasp_organization = gh.get_organization(OWASP_ORGANIZATION_NAME)
 
-            owasp_organization = None
-            owasp_user = None
-
-            chapters = []
-            committees = []
-            projects = []
-
-            offset = options["offset"]
+            progress = None
             repository = options["repository"]
 
             if repository:
                 gh_repositories = [gh_owasp_organization.get_repo(repository)]
-                gh_repositories_count = 1
+                synced_repository_names = set()
             else:
-                gh_repositories = gh_owasp_organization.get_repos(
-                    type="public",
-                    sort="created",
-                    direction="desc",
-                )
-                gh_repositories_count = gh_repositories.totalCount  # type: ignore[attr-defined]
-
-            for idx, gh_repository in enumerate(gh_repositories[offset:]):
-                prefix = f"{idx + offset + 1} of {gh_repositories_count}"
-                entity_key = gh_repository.name.lower()
-                repository_url = f"https://github.com/OWASP/{entity_key}"
-                self.stdout.write(f"{prefix:<12} {repository_url}\n")
-
-                try:
-                    owasp_organization, owasp_repository = sync_repository(
-                        gh_repository,
-                        organization=owasp_organization,
-                        user=owasp_user,
+                progress = SyncProgress(resume=options.get("resume", False))
+                gh_repositories = list(
+                    gh_owasp_organization.get_repos(
+                        type="public",
+                        sort="created",
+                        direction="desc",
                     )
+                )
+                synced_repository_names = progress.get_synced(
+                    [gh_repository.name for gh_repository in gh_repositories]
+                )
 
-                    # OWASP chapters.
-                    if entity_key.startswith("www-chapter-"):
-                        chapters.append(
-                            Chapter.update_data(gh_repository, owasp_repository, save=False)
-                        )
-
-                    # OWASP projects.
-                    elif entity_key.startswith("www-project-"):
-                        projects.append(
-                            Project.update_data(gh_repository, owasp_repository, save=False)
-                        )
-
-                    # OWASP committees.
-                    elif entity_key.startswith("www-committee-"):
-                        committees.append(
-                            Committee.update_data(gh_repository, owasp_repository, save=False)
-                        )
-                except Exception:
-                    logger.exception("Error syncing repository %s", repository_url)
-                    continue
-
-            Chapter.bulk_save(chapters)
-            Committee.bulk_save(committees)
-            Project.bulk_save(projects)
+            self.graphql = options.get("graphql", False)
+            self.repositories_count = len(gh_repositories)
+            self.synced_count = len(synced_repository_names)
+            self.sync_repositories(
+                [
+                    gh_repository
+                    for gh_repository in gh_repositories
+                    if gh_repository.name not in synced_repository_names
+                ],
+                gh=gh,
+                progress=progress,
+                workers=max(options.get("workers", 1), 1),
+            )
 
             if not repository:  # The entire organization is being synced.
                 # Check repository counts.
@@ -129,3 +169,171 @@ class Command(BaseCommand):
             for project in Project.objects.all():
                 if project.owasp_repository:
                     project.repositories.add(project.owasp_repository)
+
+    def sync_repositories(
+        self,
+        gh_repositories: list[GithubRepository],
+        gh: Github,
+        progress: SyncProgress | None,
+        workers: int,
+    ) -> None:
+        """Sync repositories using a pool of workers with their own GitHub clients.
+
+        Args:
+            gh_repositories (list[GithubRepository]): The GitHub repositories to sync.
+            gh (Github): The GitHub client used when syncing without a pool.
+            progress (SyncProgress | None): The organization run progress.
+            workers (int): The number of concurrent workers.
+
+        """
+        budget = RateLimitBudget()
+        repositories: Queue[GithubRepository] = Queue()
+        for gh_repository in gh_repositories:
+            repositories.put(gh_repository)
+
+        self.lock = threading.Lock()
+        if workers == 1:
+            self.sync_worker(gh, repositories, budget, progress)
+            return
+
+        def run_worker() -> None:
+            worker_gh = get_github_client()
+            try:
+                self.sync_worker(worker_gh, repositories, budget, progress)
+            finally:
+                worker_gh.close()
+                connection.close()
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for future in [executor.submit(run_worker) for _ in range(workers)]:
+                future.result()
+
+    def sync_worker(
+        self,
+        gh: Github,
+        repositories: Queue[GithubRepository],
+        budget: RateLimitBudget,
+        progress: SyncProgress | None,
+    ) -> None:
+        """Sync repositories from the shared queue until it is empty.
+
+        Args:
+            gh (Github): The worker GitHub client.
+            repositories (Queue[GithubRepository]): The repositories left to sync.
+            budget (RateLimitBudget): The rate limit budget shared by workers.
+            progress (SyncProgress | None): The organization run progress.
+
+        """
+        identity_map = IdentityMap()
+        owasp_organization = None
+        owasp_user = None
+
+        chapters: list[Chapter] = []
+        committees: list[Committee] = []
+        projects: list[Project] = []
+        synced_repository_names: list[str] = []
+
+        while True:
+            try:
+                listed_gh_repository = repositories.get_nowait()
+            except Empty:
+                break
+
+            budget.wait()
+            # Bind the listed repository to the worker client without refetching it.
+            gh_repository = gh.create_from_raw_data(
+                GithubRepository,
+                listed_gh_repository.raw_data,
+                listed_gh_repository.raw_headers,
+            )
+
+            with self.lock:
+                self.synced_count += 1
+                prefix = f"{self.synced_count} of {self.repositories_count}"
+
+            entity_key = gh_repository.name.lower()
+            repository_url = f"https://github.com/OWASP/{entity_key}"
+            self.stdout.write(f"{prefix:<12} {repository_url}\n")
+
+            try:
+                owasp_organization, owasp_repository = sync_repository(
+                    gh_repository,
+                    organization=owasp_organization,
+                    user=owasp_user,
+                    graphql=self.graphql,
+                    identity_map=identity_map,
+                )
+
+                # OWASP chapters.
+                if entity_key.startswith("www-chapter-"):
+                    chapters.append(
+                        Chapter.update_data(gh_repository, owasp_repository, save=False)
+                    )
+
+                # OWASP projects.
+                elif entity_key.startswith("www-project-"):
+                    projects.append(
+                        Project.update_data(gh_repository, owasp_repository, save=False)
+                    )
+
+                # OWASP committees.
+                elif entity_key.startswith("www-committee-"):
+                    committees.append(
+                        Committee.update_data(gh_repository, owasp_repository, save=False)
+                    )
+            except Exception:
+                logger.exception("Error syncing repository %s", repository_url)
+                continue
+            finally:
+                budget.update(gh)
+
+            synced_repository_names.append(gh_repository.name)
+            if len(synced_repository_names) >= GITHUB_SYNC_BATCH_SIZE:
+                self.save_batch(
+                    identity_map,
+                    chapters,
+                    committees,
+                    projects,
+                    synced_repository_names,
+                    progress=progress,
+                )
+
+        self.save_batch(
+            identity_map,
+            chapters,
+            committees,
+            projects,
+            synced_repository_names,
+            progress=progress,
+        )
+
+    def save_batch(
+        self,
+        identity_map: IdentityMap,
+        chapters: list[Chapter],
+        committees: list[Committee],
+        projects: list[Project],
+        synced_repository_names: list[str],
+        *,
+        progress: SyncProgress | None,
+    ) -> None:
+        """Save the synced entities and record their repositories as synced.
+
+        Args:
+            identity_map (IdentityMap): The worker identity map.
+            chapters (list[Chapter]): The chapters to save.
+            committees (list[Committee]): The committees to save.
+            projects (list[Project]): The projects to save.
+            synced_repository_names (list[str]): The names of the synced repositories.
+            progress (SyncProgress | None): The organization run progress.
+
+        """
+        identity_map.flush()
+        Chapter.bulk_save(chapters)
+        Committee.bulk_save(committees)
+        Project.bulk_save(projects)
+
+        if progress is not None and synced_repository_names:
+            progress.mark_synced(synced_repository_names)
+
+        synced_repository_names.clear()
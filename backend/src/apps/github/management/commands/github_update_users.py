@@ -5,7 +5,7 @@ import logging
 from django.core.management.base import BaseCommand
 from django.db.models import Q, Sum
 
-from apps.common.models import BATCH_SIZE
+from apps.common.models import BATCH_SIZE, BulkSaveResult
 from apps.github.models.repository_contributor import RepositoryContributor
 from apps.github.models.user import User
 
@@ -45,6 +45,7 @@ class Command(BaseCommand):
             .values("user_id")
             .annotate(total_contributions=Sum("contributions_count"))
         }
+        result = BulkSaveResult()
         users = []
         for idx, user in enumerate(active_users[offset:]):
             prefix = f"{idx + offset + 1} of {active_users_count - offset}"
@@ -54,6 +55,7 @@ class Command(BaseCommand):
             users.append(user)
 
             if not len(users) % BATCH_SIZE:
-                User.bulk_save(users, fields=("contributions_count",))
+                result += User.bulk_save(users, fields=("contributions_count",))
 
-        User.bulk_save(users, fields=("contributions_count",))
+        result += User.bulk_save(users, fields=("contributions_count",))
+        self.stdout.write(f"Updated users: {result}\n")
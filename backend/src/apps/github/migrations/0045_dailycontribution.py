@@ -0,0 +1,74 @@
+# Generated by Django 6.0.2 on 2026-10-18 10:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("github", "0044_user_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DailyContribution",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("count", models.PositiveIntegerField(default=0, verbose_name="Count")),
+                ("date", models.DateField(verbose_name="Date")),
+                (
+                    "kind",
+                    models.CharField(
+                        choices=[
+                            ("commit", "Commit"),
+                            ("issue", "Issue"),
+                            ("pull_request", "Pull request"),
+                            ("release", "Release"),
+                        ],
+                        max_length=20,
+                        verbose_name="Kind",
+                    ),
+                ),
+                (
+                    "repository",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="daily_contributions",
+                        to="github.repository",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="daily_contributions",
+                        to="github.user",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name_plural": "Daily contributions",
+                "db_table": "github_daily_contributions",
+                "indexes": [
+                    models.Index(
+                        fields=["repository", "date"], name="daily_contribution_repo_date"
+                    ),
+                    models.Index(fields=["user", "date"], name="daily_contribution_user_date"),
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("date", "user", "repository", "kind"),
+                        name="unique_daily_contribution",
+                        nulls_distinct=False,
+                    )
+                ],
+            },
+        ),
+    ]
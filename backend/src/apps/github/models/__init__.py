@@ -2,6 +2,7 @@
 
 from .comment import Comment
 from .commit import Commit
+from .daily_contribution import DailyContribution
 from .issue import Issue
 from .label import Label
 from .milestone import Milestone
@@ -0,0 +1,170 @@
+"""Github app daily contribution model."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from django.db import models
+from django.db.models.functions import TruncDate
+
+from apps.common.models import BulkSaveModel, BulkSaveResult
+from apps.github.models.commit import Commit
+from apps.github.models.issue import Issue
+from apps.github.models.pull_request import PullRequest
+from apps.github.models.release import Release
+
+if TYPE_CHECKING:
+    import datetime
+    from collections.abc import Iterable
+
+
+class DailyContribution(BulkSaveModel):
+    """Daily contribution counts rollup of GitHub users in repositories."""
+
+    class Kind(models.TextChoices):
+        """Contribution kind choices."""
+
+        COMMIT = "commit", "Commit"
+        ISSUE = "issue", "Issue"
+        PULL_REQUEST = "pull_request", "Pull request"
+        RELEASE = "release", "Release"
+
+    class Meta:
+        """Model options."""
+
+        constraints = [
+            models.UniqueConstraint(
+                fields=["date", "user", "repository", "kind"],
+                name="unique_daily_contribution",
+                nulls_distinct=False,
+            ),
+        ]
+        db_table = "github_daily_contributions"
+        indexes = [
+            models.Index(fields=["repository", "date"], name="daily_contribution_repo_date"),
+            models.Index(fields=["user", "date"], name="daily_contribution_user_date"),
+        ]
+        verbose_name_plural = "Daily contributions"
+
+    count = models.PositiveIntegerField(verbose_name="Count", default=0)
+    date = models.DateField(verbose_name="Date")
+    kind = models.CharField(verbose_name="Kind", max_length=20, choices=Kind.choices)
+
+    # FKs.
+    repository = models.ForeignKey(
+        "github.Repository",
+        on_delete=models.CASCADE,
+        related_name="daily_contributions",
+    )
+    user = models.ForeignKey(
+        "github.User",
+        on_delete=models.CASCADE,
+        blank=True,
+        null=True,
+        related_name="daily_contributions",
+    )
+
+    def __str__(self) -> str:
+        """Return a human-readable representation of the daily contribution."""
+        return f"{self.count} {self.kind} contribution(s) on {self.date}"
+
+    @staticmethod
+    def bulk_save(daily_contributions) -> BulkSaveResult:  # type: ignore[override]
+        """Bulk save daily contributions."""
+        return BulkSaveModel.bulk_save(
+            DailyContribution,
+            daily_contributions,
+            unique_fields=("date", "user", "repository", "kind"),
+        )
+
+    @staticmethod
+    def get_sources() -> dict[str, tuple[type[models.Model], str, dict]]:
+        """Get the contribution sources.
+
+        Returns:
+            dict: The model, date field and extra filters by contribution kind value.
+
+        """
+        return {
+            str(DailyContribution.Kind.COMMIT): (Commit, "created_at", {}),
+            str(DailyContribution.Kind.ISSUE): (Issue, "created_at", {}),
+            str(DailyContribution.Kind.PULL_REQUEST): (PullRequest, "created_at", {}),
+            str(DailyContribution.Kind.RELEASE): (Release, "published_at", {"is_draft": False}),
+        }
+
+    @staticmethod
+    def refresh(
+        *,
+        repository_ids: Iterable[int] | None = None,
+        start_date: datetime.date | None = None,
+        user_ids: Iterable[int] | None = None,
+    ) -> BulkSaveResult:
+        """Recompute daily contributions from GitHub entities.
+
+        Only the rollup rows within the given scope are recomputed: changed counts are
+        upserted and rows of days without contributions anymore are deleted.
+
+        Args:
+            repository_ids (Iterable[int], optional): Repository IDs to recompute.
+            start_date (datetime.date, optional): The first day to recompute.
+            user_ids (Iterable[int], optional): User IDs to recompute.
+
+        Returns:
+            BulkSaveResult: The created, updated and unchanged row counts.
+
+        """
+        scope = {}
+        source_scope = {}
+        if repository_ids is not None:
+            scope["repository_id__in"] = source_scope["repository_id__in"] = list(repository_ids)
+        if user_ids is not None:
+            scope["user_id__in"] = source_scope["author_id__in"] = list(user_ids)
+
+        contributions = {}
+        for kind, (model, date_field, filters) in DailyContribution.get_sources().items():
+            queryset = model.objects.filter(
+                **filters,
+                **source_scope,
+                **{f"{date_field}__isnull": False},
+                repository__isnull=False,
+            )
+            if start_date:
+                queryset = queryset.filter(**{f"{date_field}__date__gte": start_date})
+
+            for date, user_id, repository_id, count in (
+                queryset.order_by()
+                .annotate(day=TruncDate(date_field))
+                .values_list("day", "author_id", "repository_id")
+                .annotate(count=models.Count("id"))
+            ):
+                contributions[date, user_id, repository_id, kind] = DailyContribution(
+                    count=count,
+                    date=date,
+                    kind=kind,
+                    repository_id=repository_id,
+                    user_id=user_id,
+                )
+
+        existing_contributions = DailyContribution.objects.filter(**scope)
+        if start_date:
+            existing_contributions = existing_contributions.filter(date__gte=start_date)
+
+        stale_contribution_ids = [
+            pk
+            for pk, *key in existing_contributions.values_list(
+                "pk", "date", "user_id", "repository_id", "kind"
+            )
+            if tuple(key) not in contributions
+        ]
+        if stale_contribution_ids:
+            DailyContribution.objects.filter(pk__in=stale_contribution_ids).delete()
+
+        return DailyContribution.bulk_save(list(contributions.values()))
+
+
+# The contribution kinds authored by members.
+MEMBER_CONTRIBUTION_KINDS = (
+    DailyContribution.Kind.COMMIT,
+    DailyContribution.Kind.ISSUE,
+    DailyContribution.Kind.PULL_REQUEST,
+)
@@ -78,7 +78,11 @@ class RepositoryContributor(BulkSaveModel, TimestampedModel):
     @staticmethod
     def bulk_save(repository_contributors) -> None:  # type: ignore[override]
         """Bulk save repository contributors."""
-        BulkSaveModel.bulk_save(RepositoryContributor, repository_contributors)
+        BulkSaveModel.bulk_save(
+            RepositoryContributor,
+            repository_contributors,
+            unique_fields=("repository", "user"),
+        )
 
     @staticmethod
     def update_data(
@@ -100,20 +104,13 @@ class RepositoryContributor(BulkSaveModel, TimestampedModel):
             RepositoryContributor: The updated or created repository contributor instance.
 
         """
-        try:
-            repository_contributor = RepositoryContributor.objects.get(
-                repository=repository,
-                user=user,
-            )
-        except RepositoryContributor.DoesNotExist:
-            repository_contributor = RepositoryContributor(
-                repository=repository,
-                user=user,
-            )
+        # The row is upserted on the (repository, user) natural key, so there is no need
+        # to look up the existing primary key.
+        repository_contributor = RepositoryContributor(repository=repository, user=user)
         repository_contributor.from_github(gh_contributor)
 
         if save:
-            repository_contributor.save()
+            RepositoryContributor.bulk_save([repository_contributor])
 
         return repository_contributor
 
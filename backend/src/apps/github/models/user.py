@@ -7,7 +7,12 @@ from typing import TYPE_CHECKING
 from django.contrib.contenttypes.models import ContentType
 from django.db import models
 
-from apps.common.models import BulkSaveModel, TimestampedModel
+from apps.common.models import (
+    BulkSaveModel,
+    BulkSaveResult,
+    DirtyFieldsMixin,
+    TimestampedModel,
+)
 from apps.common.utils import get_absolute_url
 from apps.github.constants import (
     GITHUB_ACTIONS_USER_LOGIN,
@@ -25,7 +30,7 @@ if TYPE_CHECKING:
     from apps.owasp.models.project import Project
 
 
-class User(NodeModel, GenericUserModel, TimestampedModel, UserIndexMixin):
+class User(DirtyFieldsMixin, NodeModel, GenericUserModel, TimestampedModel, UserIndexMixin):
     """User model."""
 
     class Meta:
@@ -186,9 +191,9 @@ class User(NodeModel, GenericUserModel, TimestampedModel, UserIndexMixin):
         return f"/members/{self.nest_key}"
 
     @staticmethod
-    def bulk_save(users, fields=None) -> None:
+    def bulk_save(users, fields=None) -> BulkSaveResult:
         """Bulk save users."""
-        BulkSaveModel.bulk_save(User, users, fields=fields)
+        return BulkSaveModel.bulk_save(User, users, fields=fields)
 
     @staticmethod
     def get_non_indexable_logins() -> set:
@@ -0,0 +1,58 @@
+"""GitHub API rate limit budget shared by concurrent clients."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING
+
+from apps.github.constants import GITHUB_RATE_LIMIT_RESERVE
+
+if TYPE_CHECKING:
+    from github import Github
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class RateLimitBudget:
+    """Rate limit budget shared by GitHub clients using the same credentials.
+
+    Clients report the rate limit headers of their latest response. Once the remaining
+    requests drop to the reserve, all clients pause until the rate limit window resets.
+    """
+
+    def __init__(self, reserve: int = GITHUB_RATE_LIMIT_RESERVE) -> None:
+        """Initialize the rate limit budget.
+
+        Args:
+            reserve (int): The number of requests to keep unused.
+
+        """
+        self.lock = threading.Lock()
+        self.reserve = reserve
+        self.resume_at = 0.0
+
+    def update(self, gh: Github) -> None:
+        """Update the budget from the latest rate limit headers of a client.
+
+        Args:
+            gh (Github): The GitHub client.
+
+        """
+        remaining, _ = gh.requester.rate_limiting
+        # The rate limit is unknown until the first response is received.
+        if remaining < 0 or remaining > self.reserve:
+            return
+
+        with self.lock:
+            self.resume_at = max(self.resume_at, float(gh.requester.rate_limiting_resettime))
+
+    def wait(self) -> None:
+        """Wait until the rate limit window resets if the budget is exhausted."""
+        with self.lock:
+            resume_at = self.resume_at
+
+        if (delay := resume_at - time.time()) > 0:
+            logger.info("GitHub rate limit budget exhausted, waiting %.0fs", delay)
+            time.sleep(delay)
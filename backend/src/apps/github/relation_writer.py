@@ -0,0 +1,85 @@
+"""GitHub sync many-to-many relation writer."""
+
+# ruff: noqa: SLF001 https://docs.astral.sh/ruff/rules/private-member-access/
+
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from django.db.models import Model
+
+
+class RelationWriter:
+    """Writes many-to-many relations of synced entities with bulk diffs.
+
+    The desired related objects are collected per entity and compared with the
+    existing through table rows on flush. Each relation is then written with at most
+    one bulk delete and one bulk insert, so unchanged relations cause no writes.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the relation writer."""
+        self.relations: dict[tuple[type[Model], str], dict[int, set[int]]] = defaultdict(dict)
+
+    def flush(self) -> None:
+        """Write the collected relations."""
+        for (model, field_name), related_ids in self.relations.items():
+            self.write(model, field_name, related_ids)
+
+        self.relations.clear()
+
+    def set_related(
+        self, instance: Model, field_name: str, related_instances: Iterable[Model]
+    ) -> None:
+        """Set the related objects of an entity.
+
+        Args:
+            instance (Model): The entity.
+            field_name (str): The many-to-many field name.
+            related_instances (Iterable[Model]): The related objects.
+
+        """
+        self.relations[type(instance), field_name][instance.pk] = {
+            related_instance.pk for related_instance in related_instances
+        }
+
+    def write(self, model: type[Model], field_name: str, related_ids: dict[int, set[int]]) -> None:
+        """Write a relation diff.
+
+        Args:
+            model (type[Model]): The model class.
+            field_name (str): The many-to-many field name.
+            related_ids (dict[int, set[int]]): The related object IDs by entity ID.
+
+        """
+        field = model._meta.get_field(field_name)
+        through = field.remote_field.through
+        source = through._meta.get_field(field.m2m_field_name()).attname
+        target = through._meta.get_field(field.m2m_reverse_field_name()).attname
+
+        existing_rows: dict[int, dict[int, int]] = defaultdict(dict)
+        for row_id, source_id, target_id in through.objects.filter(
+            **{f"{source}__in": related_ids}
+        ).values_list("pk", source, target):
+            existing_rows[source_id][target_id] = row_id
+
+        deleted_row_ids = [
+            row_id
+            for source_id, rows in existing_rows.items()
+            for target_id, row_id in rows.items()
+            if target_id not in related_ids[source_id]
+        ]
+        if deleted_row_ids:
+            through.objects.filter(pk__in=deleted_row_ids).delete()
+
+        created_rows = [
+            through(**{source: source_id, target: target_id})
+            for source_id, target_ids in related_ids.items()
+            for target_id in target_ids - existing_rows[source_id].keys()
+        ]
+        if created_rows:
+            through.objects.bulk_create(created_rows)
@@ -53,7 +53,8 @@ class BaseBadgeCommand(BaseCommand, ABC):
                 badge.css_class = self.badge_css_class
                 badge.description = self.badge_description
                 badge.weight = self.badge_weight
-                badge.save(update_fields=["css_class", "description", "weight"])
+                if update_fields := badge.get_dirty_fields(("css_class", "description", "weight")):
+                    badge.save(update_fields=sorted(update_fields))
 
             eligible_users = self.get_eligible_users()
             users_to_add_ids = eligible_users.exclude(
@@ -64,8 +65,8 @@ class BaseBadgeCommand(BaseCommand, ABC):
             new_badges = [
                 UserBadge(user=user, badge=badge, is_active=True) for user in users_to_add_ids
             ]
-            UserBadge.bulk_save(new_badges, fields=["is_active"])
-            added_count = len(new_badges)
+            result = UserBadge.bulk_save(new_badges, fields=["is_active"])
+            added_count = result.created + result.updated
             self._log(
                 f"Added '{self.badge_name}' badge to {added_count} user{pluralize(added_count)}"
             )
@@ -4,10 +4,10 @@ from __future__ import annotations
 
 from django.db import models
 
-from apps.common.models import BulkSaveModel, TimestampedModel
+from apps.common.models import BulkSaveModel, DirtyFieldsMixin, TimestampedModel
 
 
-class Badge(BulkSaveModel, TimestampedModel):
+class Badge(DirtyFieldsMixin, BulkSaveModel, TimestampedModel):
     """Represents a user badge for roles or achievements."""
 
     class BadgeCssClass(models.TextChoices):
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from django.db import models
 
-from apps.common.models import BulkSaveModel, TimestampedModel
+from apps.common.models import BulkSaveModel, BulkSaveResult, TimestampedModel
 
 
 class UserBadge(BulkSaveModel, TimestampedModel):
@@ -52,6 +52,8 @@ class UserBadge(BulkSaveModel, TimestampedModel):
         return f"{self.user.login} - {self.badge.name}"
 
     @staticmethod
-    def bulk_save(user_badges, fields=None) -> None:  # type: ignore[override]
-        """Bulk save user badges."""
-        BulkSaveModel.bulk_save(UserBadge, user_badges, fields=fields)
+    def bulk_save(user_badges, fields=None) -> BulkSaveResult:  # type: ignore[override]
+        """Bulk upsert user badges on their badge and user."""
+        return BulkSaveModel.bulk_save(
+            UserBadge, user_badges, fields=fields, unique_fields=("badge", "user")
+        )
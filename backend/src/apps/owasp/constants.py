@@ -1,3 +1,5 @@
 """OWASP app constants."""
 
+OWASP_CONTRIBUTIONS_LAST_RUN_KEY_PREFIX = "owasp-contributions-last-run"
 OWASP_ORGANIZATION_NAME = "OWASP"
+OWASP_PROJECT_RECENT_RELEASES_DAYS = 60
@@ -1,20 +1,28 @@
 """Management command to aggregate contributions for chapters and projects."""
 
 from argparse import ArgumentParser
+from collections import defaultdict
 from datetime import datetime, timedelta
 from typing import Any
 
+from django.core.cache import cache
 from django.core.management.base import BaseCommand
-from django.db.models import QuerySet
+from django.db.models import QuerySet, Sum
 from django.utils import timezone
 
-from apps.github.models.commit import Commit
-from apps.github.models.issue import Issue
-from apps.github.models.pull_request import PullRequest
-from apps.github.models.release import Release
+from apps.github.models.daily_contribution import DailyContribution
+from apps.owasp.constants import OWASP_CONTRIBUTIONS_LAST_RUN_KEY_PREFIX
 from apps.owasp.models.chapter import Chapter
 from apps.owasp.models.project import Project
 
+# Contribution stats key by daily contribution kind.
+CONTRIBUTION_KINDS = {
+    DailyContribution.Kind.COMMIT: "commits",
+    DailyContribution.Kind.ISSUE: "issues",
+    DailyContribution.Kind.PULL_REQUEST: "pull_requests",
+    DailyContribution.Kind.RELEASE: "releases",
+}
+
 
 class Command(BaseCommand):
     """Aggregate contribution data for chapters and projects."""
@@ -36,6 +44,11 @@ class Command(BaseCommand):
             help="Number of days to look back for contributions (default: 365)",
             type=int,
         )
+        parser.add_argument(
+            "--incremental",
+            action="store_true",
+            help="Recompute only the days since the last run",
+        )
         parser.add_argument(
             "--key",
             help="Specific chapter or project key to aggregate",
@@ -48,34 +61,13 @@ class Command(BaseCommand):
             type=int,
         )
 
-    def _aggregate_contribution_dates(
-        self,
-        queryset: QuerySet[Any],
-        date_field: str,
-        contribution_map: dict[str, int],
-    ) -> None:
-        """Aggregate contribution dates from a queryset into the contribution map.
-
-        Args:
-            queryset: Django queryset to aggregate
-            date_field: Name of the date field to aggregate on
-            contribution_map: Dictionary to update with counts
-
-        """
-        for date_value in queryset.values_list(date_field, flat=True):
-            if not date_value:
-                continue
-
-            date_key = date_value.date().isoformat()
-            contribution_map[date_key] = contribution_map.get(date_key, 0) + 1
-
     def _get_repository_ids(self, entity: Chapter | Project) -> list[int]:
         """Extract repository IDs from chapter or project."""
         repository_ids: set[int] = set()
 
         # Handle single owasp_repository.
-        if hasattr(entity, "owasp_repository") and entity.owasp_repository:
-            repository_ids.add(entity.owasp_repository.id)
+        if entity.owasp_repository_id:
+            repository_ids.add(entity.owasp_repository_id)
 
         # Handle multiple repositories (for projects).
         if hasattr(entity, "repositories"):
@@ -83,123 +75,93 @@ class Command(BaseCommand):
 
         return list(repository_ids)
 
-    def aggregate_contributions(
-        self, entity: Chapter | Project, start_date: datetime
-    ) -> dict[str, int]:
-        """Aggregate contributions for a chapter or project.
+    def get_contribution_counts(
+        self,
+        repository_ids: list[int],
+        start_date: datetime,
+        *,
+        daily: bool = True,
+    ) -> list[tuple]:
+        """Count contributions of repositories with a single daily contributions query.
 
         Args:
-            entity: Chapter or Project instance
+            repository_ids: Repository IDs
             start_date: Start date for aggregation
+            daily: Whether to group the counts by day
 
         Returns:
-            Dictionary mapping YYYY-MM-DD to contribution count
+            List of (kind, repository ID, day, count) rows, the day is None for
+            non daily counts
 
         """
-        contribution_map: dict[str, int] = {}
-
-        repository_ids = self._get_repository_ids(entity)
-        if not repository_ids:
-            return contribution_map
-
-        # Aggregate commits.
-        self._aggregate_contribution_dates(
-            Commit.objects.filter(
-                created_at__gte=start_date,
-                repository_id__in=repository_ids,
-            ),
-            "created_at",
-            contribution_map,
-        )
-
-        # Aggregate issues.
-        self._aggregate_contribution_dates(
-            Issue.objects.filter(
-                created_at__gte=start_date,
-                repository_id__in=repository_ids,
-            ),
-            "created_at",
-            contribution_map,
-        )
-
-        # Aggregate pull requests.
-        self._aggregate_contribution_dates(
-            PullRequest.objects.filter(
-                created_at__gte=start_date,
-                repository_id__in=repository_ids,
-            ),
-            "created_at",
-            contribution_map,
-        )
+        group_fields = ("kind", "repository_id", "date") if daily else ("kind", "repository_id")
 
-        # Aggregate releases.
-        self._aggregate_contribution_dates(
-            Release.objects.filter(
-                is_draft=False,
-                published_at__gte=start_date,
+        return [
+            (CONTRIBUTION_KINDS[row[0]], row[1], row[2] if daily else None, row[-1])
+            for row in DailyContribution.objects.filter(
+                date__gte=start_date.date(),
                 repository_id__in=repository_ids,
-            ),
-            "published_at",
-            contribution_map,
-        )
+            )
+            .order_by()
+            .values_list(*group_fields)
+            .annotate(count=Sum("count"))
+        ]
 
-        return contribution_map
+    def aggregate_contributions(
+        self,
+        entities: list[Chapter] | list[Project],
+        start_date: datetime,
+        since: datetime | None = None,
+    ) -> None:
+        """Aggregate contributions for chapters or projects.
 
-    def calculate_contribution_stats(
-        self, entity: Chapter | Project, start_date: datetime
-    ) -> dict[str, int]:
-        """Calculate contribution statistics for a chapter or project.
+        Daily contribution counts of all entities are computed at once and fanned out
+        to entities by their repositories. In incremental mode only the days since the
+        last run are recomputed and merged with the existing contribution data.
 
         Args:
-            entity: Chapter or Project instance
-            start_date: Start date for calculation
-
-        Returns:
-            Dictionary with commits, issues, pull requests, releases counts
+            entities: Chapter or Project instances
+            start_date: Start date for aggregation
+            since: Start of the first day to recompute, None to recompute all days
 
         """
-        stats = {
-            "commits": 0,
-            "issues": 0,
-            "pull_requests": 0,
-            "releases": 0,
-            "total": 0,
-        }
-
-        repository_ids = self._get_repository_ids(entity)
-        if not repository_ids:
-            return stats
-
-        # Count commits.
-        stats["commits"] = Commit.objects.filter(
-            created_at__gte=start_date,
-            repository_id__in=repository_ids,
-        ).count()
-
-        # Count issues.
-        stats["issues"] = Issue.objects.filter(
-            created_at__gte=start_date,
-            repository_id__in=repository_ids,
-        ).count()
-
-        # Count pull requests.
-        stats["pull_requests"] = PullRequest.objects.filter(
-            created_at__gte=start_date,
-            repository_id__in=repository_ids,
-        ).count()
-
-        # Count releases.
-        stats["releases"] = Release.objects.filter(
-            is_draft=False,
-            published_at__gte=start_date,
-            repository_id__in=repository_ids,
-        ).count()
-
-        stats["total"] = sum(
-            (stats["commits"], stats["issues"], stats["pull_requests"], stats["releases"])
-        )
+        repository_entities: dict[int, list[Chapter | Project]] = defaultdict(list)
+        for entity in entities:
+            for repository_id in self._get_repository_ids(entity):
+                repository_entities[repository_id].append(entity)
 
-        return stats
+        contribution_data: dict[int, dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        contribution_stats: dict[int, dict[str, int]] = defaultdict(
+            lambda: dict.fromkeys((*CONTRIBUTION_KINDS.values(), "total"), 0)
+        )
+        if repository_entities:
+            repository_ids = list(repository_entities)
+            for kind, repository_id, day, count in self.get_contribution_counts(
+                repository_ids, since or start_date
+            ):
+                for entity in repository_entities[repository_id]:
+                    contribution_data[entity.id][day.isoformat()] += count
+                    if since is None:
+                        contribution_stats[entity.id][kind] += count
+                        contribution_stats[entity.id]["total"] += count
+
+            if since is not None:
+                for kind, repository_id, _, count in self.get_contribution_counts(
+                    repository_ids, start_date, daily=False
+                ):
+                    for entity in repository_entities[repository_id]:
+                        contribution_stats[entity.id][kind] += count
+                        contribution_stats[entity.id]["total"] += count
+
+        first_day = start_date.date().isoformat()
+        since_day = since.date().isoformat() if since else first_day
+        for entity in entities:
+            entity.contribution_data = {
+                day: count
+                for day, count in (entity.contribution_data or {}).items()
+                if first_day <= day < since_day
+            } | dict(contribution_data[entity.id])
+            entity.contribution_stats = contribution_stats[entity.id]
 
     def handle(self, *args: Any, **options: Any) -> None:
         """Execute the command."""
@@ -208,7 +170,14 @@ class Command(BaseCommand):
         key = options.get("key")
         offset = options["offset"]
 
-        start_date = timezone.now() - timedelta(days=days)
+        started_at = timezone.now()
+        start_date = started_at - timedelta(days=days)
+
+        last_run_key = f"{OWASP_CONTRIBUTIONS_LAST_RUN_KEY_PREFIX}:{entity_type}:{days}"
+        since = None
+        if options.get("incremental") and (last_run := cache.get(last_run_key)):
+            since = max(last_run, start_date).replace(hour=0, minute=0, second=0, microsecond=0)
+            self.stdout.write(f"Recomputing contributions since {since.date()}")
 
         self.stdout.write(
             self.style.SUCCESS(
@@ -217,33 +186,35 @@ class Command(BaseCommand):
         )
 
         if entity_type == "chapter":
-            self._process_chapters(start_date, key, offset)
+            self._process_chapters(start_date, key, offset, since)
         elif entity_type == "project":
-            self._process_projects(start_date, key, offset)
+            self._process_projects(start_date, key, offset, since)
+
+        if not key and not offset:
+            cache.set(last_run_key, started_at, timeout=None)
 
         self.stdout.write(self.style.SUCCESS("Done!"))
 
-    def _process_chapters(self, start_date: datetime, key: str | None, offset: int) -> None:
+    def _process_chapters(
+        self, start_date: datetime, key: str | None, offset: int, since: datetime | None = None
+    ) -> None:
         """Process chapters for contribution aggregation."""
         queryset = Chapter.objects.filter(is_active=True).order_by("id")
 
         if key:
             queryset = queryset.filter(key=key)
 
-        queryset = queryset.select_related("owasp_repository")
-
         if offset:
             queryset = queryset[offset:]
 
-        self._process_entities(queryset, start_date, Chapter)
+        self._process_entities(queryset, start_date, Chapter, since)
 
-    def _process_projects(self, start_date: datetime, key: str | None, offset: int) -> None:
+    def _process_projects(
+        self, start_date: datetime, key: str | None, offset: int, since: datetime | None = None
+    ) -> None:
         """Process projects for contribution aggregation."""
         queryset = (
-            Project.objects.filter(is_active=True)
-            .order_by("id")
-            .select_related("owasp_repository")
-            .prefetch_related("repositories")
+            Project.objects.filter(is_active=True).order_by("id").prefetch_related("repositories")
         )
 
         if key:
@@ -252,13 +223,14 @@ class Command(BaseCommand):
         if offset:
             queryset = queryset[offset:]
 
-        self._process_entities(queryset, start_date, Project)
+        self._process_entities(queryset, start_date, Project, since)
 
     def _process_entities(
         self,
         queryset: QuerySet[Chapter] | QuerySet[Project],
         start_date: datetime,
         model_class: type[Chapter] | type[Project],
+        since: datetime | None = None,
     ) -> None:
         """Process entities (chapters or projects) for contribution aggregation."""
         entities = list(queryset)
@@ -267,11 +239,9 @@ class Command(BaseCommand):
 
         self.stdout.write(f"Processing {total_count} {label}...")
 
-        for entity in entities:
-            entity.contribution_data = self.aggregate_contributions(entity, start_date)
-            entity.contribution_stats = self.calculate_contribution_stats(entity, start_date)
-
         if entities:
+            self.aggregate_contributions(entities, start_date, since)
+
             fields = ("contribution_data", "contribution_stats")
             if model_class is Chapter:
                 Chapter.bulk_save(entities, fields=fields)
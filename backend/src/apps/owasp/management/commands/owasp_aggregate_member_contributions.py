@@ -4,13 +4,10 @@ from datetime import datetime, timedelta
 from typing import Any
 
 from django.core.management.base import BaseCommand
-from django.db.models import Count
-from django.db.models.functions import TruncDate
+from django.db.models import Sum
 from django.utils import timezone
 
-from apps.github.models.commit import Commit
-from apps.github.models.issue import Issue
-from apps.github.models.pull_request import PullRequest
+from apps.github.models.daily_contribution import MEMBER_CONTRIBUTION_KINDS, DailyContribution
 from apps.github.models.user import User
 
 
@@ -76,7 +73,7 @@ class Command(BaseCommand):
         )
 
     def _aggregate_user_contributions(self, user: User, start_date: datetime) -> dict[str, int]:
-        """Aggregate contributions for a user.
+        """Aggregate contributions for a user from the daily contributions rollup.
 
         Args:
             user: User instance
@@ -95,46 +92,16 @@ class Command(BaseCommand):
             contribution_data[date_str] = 0
             current_date += timedelta(days=1)
 
-        commits = (
-            Commit.objects.filter(
-                author=user,
-                created_at__gte=start_date,
+        for item in (
+            DailyContribution.objects.filter(
+                date__gte=start_date.date(),
+                kind__in=MEMBER_CONTRIBUTION_KINDS,
+                user=user,
             )
-            .annotate(date=TruncDate("created_at"))
             .values("date")
-            .annotate(count=Count("id"))
-        )
-
-        for commit in commits:
-            date_str = commit["date"].strftime("%Y-%m-%d")
-            contribution_data[date_str] = contribution_data.get(date_str, 0) + commit["count"]
-
-        prs = (
-            PullRequest.objects.filter(
-                author=user,
-                created_at__gte=start_date,
-            )
-            .annotate(date=TruncDate("created_at"))
-            .values("date")
-            .annotate(count=Count("id"))
-        )
-
-        for pr in prs:
-            date_str = pr["date"].strftime("%Y-%m-%d")
-            contribution_data[date_str] = contribution_data.get(date_str, 0) + pr["count"]
-
-        issues = (
-            Issue.objects.filter(
-                author=user,
-                created_at__gte=start_date,
-            )
-            .annotate(date=TruncDate("created_at"))
-            .values("date")
-            .annotate(count=Count("id"))
-        )
-
-        for issue in issues:
-            date_str = issue["date"].strftime("%Y-%m-%d")
-            contribution_data[date_str] = contribution_data.get(date_str, 0) + issue["count"]
+            .annotate(count=Sum("count"))
+        ):
+            date_str = item["date"].strftime("%Y-%m-%d")
+            contribution_data[date_str] = contribution_data.get(date_str, 0) + item["count"]
 
         return contribution_data
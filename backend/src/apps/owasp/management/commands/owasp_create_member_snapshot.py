@@ -6,8 +6,10 @@ from datetime import UTC, datetime, timedelta
 
 from django.contrib.contenttypes.models import ContentType
 from django.core.management.base import BaseCommand
+from django.db.models import Sum
 
 from apps.github.models.commit import Commit
+from apps.github.models.daily_contribution import MEMBER_CONTRIBUTION_KINDS, DailyContribution
 from apps.github.models.issue import Issue
 from apps.github.models.pull_request import PullRequest
 from apps.github.models.user import User
@@ -73,13 +75,30 @@ class Command(BaseCommand):
             self.stderr.write(self.style.ERROR(error_msg))
             raise
 
-    def generate_heatmap_data(self, commits, pull_requests, issues, start_at, end_at) -> dict:
+    def get_daily_contributions(self, user, start_at, end_at):
+        """Get the daily contributions of the user within the date range.
+
+        Args:
+            user: User instance to get contributions for.
+            start_at: Start date of the snapshot period.
+            end_at: End date of the snapshot period.
+
+        Returns:
+            QuerySet: The daily commit, pull request and issue contributions.
+
+        """
+        return DailyContribution.objects.filter(
+            date__gte=start_at.date(),
+            date__lte=end_at.date(),
+            kind__in=MEMBER_CONTRIBUTION_KINDS,
+            user=user,
+        ).order_by()
+
+    def generate_heatmap_data(self, user, start_at, end_at) -> dict:
         """Generate heatmap data from contributions within the date range.
 
         Args:
-            commits: Queryset or iterable of Commit objects.
-            pull_requests: Queryset or iterable of PullRequest objects.
-            issues: Queryset or iterable of Issue objects.
+            user: User instance to get contributions for.
             start_at: Start date of the snapshot period.
             end_at: End date of the snapshot period.
 
@@ -96,29 +115,18 @@ class Command(BaseCommand):
             current_date += timedelta(days=1)
 
         # Count contributions
-        for commit in commits:
-            if start_at <= commit.created_at <= end_at:
-                date_key = commit.created_at.date().isoformat()
-                heatmap_data[date_key] += 1
-
-        for pr in pull_requests:
-            if start_at <= pr.created_at <= end_at:
-                date_key = pr.created_at.date().isoformat()
-                heatmap_data[date_key] += 1
-
-        for issue in issues:
-            if start_at <= issue.created_at <= end_at:
-                date_key = issue.created_at.date().isoformat()
-                heatmap_data[date_key] += 1
+        for date, count in (
+            self.get_daily_contributions(user, start_at, end_at)
+            .values_list("date")
+            .annotate(count=Sum("count"))
+        ):
+            heatmap_data[date.isoformat()] += count
 
         return heatmap_data
 
     def generate_entity_contributions(
         self,
         user,
-        commits,
-        pull_requests,
-        issues,
         *,
         entity_type: str,
         start_at,
@@ -128,9 +136,6 @@ class Command(BaseCommand):
 
         Args:
             user: User instance to get led entities for.
-            commits: Queryset or iterable of Commit objects.
-            pull_requests: Queryset or iterable of PullRequest objects.
-            issues: Queryset or iterable of Issue objects.
             entity_type: Either "chapter" or "project".
             start_at: Start date of the snapshot period.
             end_at: End date of the snapshot period.
@@ -161,15 +166,6 @@ class Command(BaseCommand):
             for chapter in led_chapters:
                 entity_contributions[chapter.nest_key] = 0
 
-        # Get all unique repository IDs from contributions
-        repository_ids = set()
-        for commit in commits.select_related("repository"):
-            repository_ids.add(commit.repository_id)
-        for pr in pull_requests.select_related("repository"):
-            repository_ids.add(pr.repository_id)
-        for issue in issues.select_related("repository"):
-            repository_ids.add(issue.repository_id)
-
         # Build a mapping of repository_id -> entity key (only for led entities)
         # Use nest_key (without www- prefix) to match GraphQL API format
         repo_to_entity: dict[int, str] = {}
@@ -192,26 +188,15 @@ class Command(BaseCommand):
                 if chapter.owasp_repository_id:
                     repo_to_entity[chapter.owasp_repository_id] = chapter.nest_key
 
-        # Count commits (only within date range)
-        for commit in commits:
-            if commit.created_at and start_at <= commit.created_at <= end_at:
-                entity_key = repo_to_entity.get(commit.repository_id)
-                if entity_key:
-                    entity_contributions[entity_key] += 1
-
-        # Count pull requests (only within date range)
-        for pr in pull_requests:
-            if pr.created_at and start_at <= pr.created_at <= end_at:
-                entity_key = repo_to_entity.get(pr.repository_id)
-                if entity_key:
-                    entity_contributions[entity_key] += 1
-
-        # Count issues (only within date range)
-        for issue in issues:
-            if issue.created_at and start_at <= issue.created_at <= end_at:
-                entity_key = repo_to_entity.get(issue.repository_id)
-                if entity_key:
-                    entity_contributions[entity_key] += 1
+        # Count contributions to the led entities repositories
+        if repo_to_entity:
+            for repository_id, count in (
+                self.get_daily_contributions(user, start_at, end_at)
+                .filter(repository_id__in=list(repo_to_entity))
+                .values_list("repository_id")
+                .annotate(count=Sum("count"))
+            ):
+                entity_contributions[repo_to_entity[repository_id]] += count
 
         return dict(entity_contributions)
 
@@ -444,15 +429,12 @@ class Command(BaseCommand):
             logger.info("No member profile found for user %s", username)
 
         # Generate heatmap data
-        heatmap_data = self.generate_heatmap_data(commits, pull_requests, issues, start_at, end_at)
+        heatmap_data = self.generate_heatmap_data(user, start_at, end_at)
         snapshot.contribution_heatmap_data = heatmap_data
 
         # Generate chapter contributions (only for chapters led by the user)
         chapter_contributions = self.generate_entity_contributions(
             user,
-            commits,
-            pull_requests,
-            issues,
             entity_type="chapter",
             start_at=start_at,
             end_at=end_at,
@@ -462,9 +444,6 @@ class Command(BaseCommand):
         # Generate project contributions (only for projects led by the user)
         project_contributions = self.generate_entity_contributions(
             user,
-            commits,
-            pull_requests,
-            issues,
             entity_type="project",
             start_at=start_at,
             end_at=end_at,
@@ -3,67 +3,54 @@
 from django.core.management.base import BaseCommand
 
 from apps.owasp.models.project_health_metrics import ProjectHealthMetrics
-from apps.owasp.models.project_health_requirements import ProjectHealthRequirements
+from apps.owasp.project_health_scoring import (
+    LATEST_SCORING_PROFILE_VERSION,
+    SCORING_PROFILES,
+    score_project_health_metrics,
+)
 
 
 class Command(BaseCommand):
     help = "Update OWASP project health scores."
 
-    def handle(self, *args, **options):
-        forward_fields = {
-            "age_days": 6.0,
-            "contributors_count": 6.0,
-            "forks_count": 6.0,
-            "is_funding_requirements_compliant": 5.0,
-            "is_leader_requirements_compliant": 5.0,
-            "open_pull_requests_count": 6.0,
-            "recent_releases_count": 6.0,
-            "stars_count": 6.0,
-            "total_pull_requests_count": 6.0,
-            "total_releases_count": 6.0,
-        }
-        backward_fields = {
-            "last_commit_days": 6.0,
-            "last_pull_request_days": 6.0,
-            "last_release_days": 6.0,
-            "open_issues_count": 6.0,
-            "owasp_page_last_update_days": 6.0,
-            "unanswered_issues_count": 6.0,
-            "unassigned_issues_count": 6.0,
-        }
-
-        project_health_metrics = []
-        project_health_requirements = {
-            phr.level: phr for phr in ProjectHealthRequirements.objects.all()
-        }
-        for metric in ProjectHealthMetrics.objects.filter(
-            score__isnull=True,
-        ).select_related(
-            "project",
-        ):
-            # Calculate the score based on requirements.
-            self.stdout.write(
-                self.style.NOTICE(f"Updating score for project: {metric.project.name}")
-            )
-
-            requirements = project_health_requirements[metric.project.level]
+    def add_arguments(self, parser) -> None:
+        """Add command-line arguments to the parser.
 
-            score = 0.0
-            for field, weight in forward_fields.items():
-                if int(getattr(metric, field)) >= int(getattr(requirements, field)):
-                    score += weight
+        Args:
+            parser (argparse.ArgumentParser): The argument parser instance.
 
-            for field, weight in backward_fields.items():
-                if int(getattr(metric, field)) <= int(getattr(requirements, field)):
-                    score += weight
+        """
+        parser.add_argument(
+            "--backfill",
+            action="store_true",
+            help="Re-score historical metrics not scored with the scoring profile",
+        )
+        parser.add_argument(
+            "--profile",
+            choices=sorted(SCORING_PROFILES),
+            default=LATEST_SCORING_PROFILE_VERSION,
+            help="The scoring profile version",
+            type=int,
+        )
 
-            metric.score = score
-            project_health_metrics.append(metric)
+    def handle(self, *args, **options):
+        profile = SCORING_PROFILES[options["profile"]]
+        metrics = (
+            ProjectHealthMetrics.objects.exclude(score_profile_version=profile.version)
+            if options["backfill"]
+            else ProjectHealthMetrics.objects.filter(score__isnull=True)
+        )
 
-        ProjectHealthMetrics.bulk_save(
-            project_health_metrics,
+        self.stdout.write(
+            self.style.NOTICE(f"Updating scores with scoring profile v{profile.version}")
+        )
+        result = ProjectHealthMetrics.bulk_save(
+            score_project_health_metrics(metrics, profile),
             fields=[
                 "score",
+                "score_profile_version",
             ],
         )
-        self.stdout.write(self.style.SUCCESS("Updated project health scores successfully."))
+        self.stdout.write(
+            self.style.SUCCESS(f"Updated project health scores successfully: {result}.")
+        )
@@ -0,0 +1,22 @@
+# Generated by Django 6.0 on 2026-10-18 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("owasp", "0072_project_project_name_gin_idx_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="projecthealthmetrics",
+            name="score_profile_version",
+            field=models.PositiveSmallIntegerField(
+                blank=True,
+                help_text="The version of the scoring profile used to compute the score",
+                null=True,
+                verbose_name="Score profile version",
+            ),
+        ),
+    ]
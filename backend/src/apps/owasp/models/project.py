@@ -17,6 +17,7 @@ from apps.github.models.issue import Issue
 from apps.github.models.milestone import Milestone
 from apps.github.models.pull_request import PullRequest
 from apps.github.models.release import Release
+from apps.owasp.constants import OWASP_PROJECT_RECENT_RELEASES_DAYS
 from apps.owasp.models.common import RepositoryBasedEntityModel
 from apps.owasp.models.enums.project import (
     ProjectLevel,
@@ -428,7 +429,9 @@ class Project(
             int: Count of releases published recently.
 
         """
-        recent_period = timezone.now() - datetime.timedelta(days=60)
+        recent_period = timezone.now() - datetime.timedelta(
+            days=OWASP_PROJECT_RECENT_RELEASES_DAYS
+        )
         return self.published_releases.filter(
             published_at__gte=recent_period,
         ).count()
@@ -7,7 +7,12 @@ from django.db import models
 from django.db.models.functions import Coalesce, ExtractMonth, TruncDate
 from django.utils import timezone
 
-from apps.common.models import BulkSaveModel, TimestampedModel
+from apps.common.models import (
+    BulkSaveModel,
+    BulkSaveResult,
+    DirtyFieldsMixin,
+    TimestampedModel,
+)
 from apps.owasp.api.internal.nodes.project_health_stats import ProjectHealthStatsNode
 from apps.owasp.models.project_health_requirements import ProjectHealthRequirements
 
@@ -15,7 +20,7 @@ HEALTH_SCORE_THRESHOLD_HEALTHY = 75
 HEALTH_SCORE_THRESHOLD_NEED_ATTENTION = 50
 
 
-class ProjectHealthMetrics(BulkSaveModel, TimestampedModel):
+class ProjectHealthMetrics(DirtyFieldsMixin, BulkSaveModel, TimestampedModel):
     """Project health metrics model."""
 
     class Meta:
@@ -69,6 +74,12 @@ class ProjectHealthMetrics(BulkSaveModel, TimestampedModel):
         validators=[MinValueValidator(0.0), MaxValueValidator(100.0)],
         help_text="0-100",
     )
+    score_profile_version = models.PositiveSmallIntegerField(
+        blank=True,
+        null=True,
+        verbose_name="Score profile version",
+        help_text="The version of the scoring profile used to compute the score",
+    )
     stars_count = models.PositiveIntegerField(verbose_name="Stars", default=0)
     total_issues_count = models.PositiveIntegerField(verbose_name="Total issues", default=0)
     total_pull_requests_count = models.PositiveIntegerField(
@@ -154,15 +165,20 @@ class ProjectHealthMetrics(BulkSaveModel, TimestampedModel):
         return ProjectHealthRequirements.objects.filter(level=self.project.level).first()
 
     @staticmethod
-    def bulk_save(metrics: list, fields: list | None = None) -> None:  # type: ignore[override]
+    def bulk_save(  # type: ignore[override]
+        metrics: list, fields: list | None = None
+    ) -> BulkSaveResult:
         """Bulk save method for ProjectHealthMetrics.
 
         Args:
             metrics (list[ProjectHealthMetrics]): List of ProjectHealthMetrics instances to save.
             fields (list[str], optional): List of fields to update. Defaults to None.
 
+        Returns:
+            BulkSaveResult: The created, updated and unchanged row counts.
+
         """
-        BulkSaveModel.bulk_save(ProjectHealthMetrics, metrics, fields=fields)
+        return BulkSaveModel.bulk_save(ProjectHealthMetrics, metrics, fields=fields)
 
     @staticmethod
     def get_latest_health_metrics() -> models.QuerySet["ProjectHealthMetrics"]:
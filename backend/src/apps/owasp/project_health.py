@@ -0,0 +1,123 @@
+"""OWASP project health metrics evaluation."""
+
+from __future__ import annotations
+
+import datetime
+from typing import TYPE_CHECKING, Any
+
+from django.db.models import Count, F, Max, Q
+from django.utils import timezone
+
+from apps.github.models.issue import Issue
+from apps.github.models.pull_request import PullRequest
+from apps.github.models.release import Release
+from apps.github.models.repository import Repository
+from apps.owasp.constants import OWASP_PROJECT_RECENT_RELEASES_DAYS
+from apps.owasp.models.project_health_metrics import ProjectHealthMetrics
+
+if TYPE_CHECKING:
+    from django.db.models import QuerySet
+
+    from apps.owasp.models.project import Project
+
+PROJECT_FIELD_MAPPING = {
+    "contributors_count": "contributors_count",
+    "created_at": "created_at",
+    "forks_count": "forks_count",
+    "last_committed_at": "pushed_at",
+    "last_released_at": "released_at",
+    "open_issues_count": "open_issues_count",
+    "owasp_page_last_updated_at": "owasp_page_last_updated_at",
+    "stars_count": "stars_count",
+    "total_releases_count": "releases_count",
+}
+
+
+def get_project_aggregates(
+    queryset: QuerySet, project_lookup: str, project_ids: list[int], **aggregates: Any
+) -> dict[int, dict[str, Any]]:
+    """Aggregate entities per project with a single grouped query.
+
+    Args:
+        queryset (QuerySet): The entities queryset.
+        project_lookup (str): The lookup from an entity to its projects.
+        project_ids (list[int]): The project IDs.
+        **aggregates: The aggregate expressions by metric name.
+
+    Returns:
+        dict[int, dict[str, Any]]: The metric values by project ID.
+
+    """
+    return {
+        row.pop("project_id"): row
+        for row in queryset.filter(**{f"{project_lookup}__in": project_ids})
+        .order_by()
+        .values(project_id=F(project_lookup))
+        .annotate(**aggregates)
+    }
+
+
+def evaluate_project_health_metrics(projects: QuerySet[Project]) -> list[ProjectHealthMetrics]:
+    """Evaluate the health metrics of projects.
+
+    Repository based metrics of all projects are computed with a fixed number of
+    grouped queries instead of per project aggregates.
+
+    Args:
+        projects (QuerySet[Project]): The projects to evaluate.
+
+    Returns:
+        list[ProjectHealthMetrics]: The unsaved project health metrics.
+
+    """
+    projects = list(projects.select_related("owasp_repository"))
+    project_ids = [project.id for project in projects]
+
+    issues = get_project_aggregates(
+        Issue.objects,
+        "repository__project",
+        project_ids,
+        total_issues_count=Count("id", distinct=True),
+        unanswered_issues_count=Count("id", distinct=True, filter=Q(comments_count=0)),
+        unassigned_issues_count=Count("id", distinct=True, filter=Q(assignees__isnull=True)),
+    )
+    pull_requests = get_project_aggregates(
+        PullRequest.objects,
+        "repository__project",
+        project_ids,
+        open_pull_requests_count=Count("id", filter=Q(state="open")),
+        pull_request_last_created_at=Max("created_at"),
+        total_pull_requests_count=Count("id"),
+    )
+    releases = get_project_aggregates(
+        Release.objects.filter(
+            is_draft=False,
+            published_at__gte=timezone.now()
+            - datetime.timedelta(days=OWASP_PROJECT_RECENT_RELEASES_DAYS),
+        ),
+        "repository__project",
+        project_ids,
+        recent_releases_count=Count("id"),
+    )
+    funding_non_compliant_repositories = get_project_aggregates(
+        Repository.objects.filter(is_funding_policy_compliant=False),
+        "project",
+        project_ids,
+        repositories_count=Count("id"),
+    )
+
+    return [
+        ProjectHealthMetrics(
+            is_funding_requirements_compliant=project.id not in funding_non_compliant_repositories,
+            is_leader_requirements_compliant=project.is_leader_requirements_compliant,
+            project=project,
+            **{
+                metric_field: getattr(project, project_field)
+                for metric_field, project_field in PROJECT_FIELD_MAPPING.items()
+            },
+            **issues.get(project.id, {}),
+            **pull_requests.get(project.id, {}),
+            **releases.get(project.id, {}),
+        )
+        for project in projects
+    ]
@@ -0,0 +1,199 @@
+"""OWASP project health score computation."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from apps.owasp.models.project_health_metrics import ProjectHealthMetrics
+from apps.owasp.models.project_health_requirements import ProjectHealthRequirements
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from django.db.models import QuerySet
+
+SECONDS_PER_DAY = 86400
+
+# The metrics timestamp fields of the days since metrics.
+DAYS_FIELDS = {
+    "age_days": "created_at",
+    "last_commit_days": "last_committed_at",
+    "last_pull_request_days": "pull_request_last_created_at",
+    "last_release_days": "last_released_at",
+    "owasp_page_last_update_days": "owasp_page_last_updated_at",
+}
+
+
+@dataclass(frozen=True)
+class ScoringProfile:
+    """Project health scoring profile.
+
+    A forward field adds its weight when the metric reaches the project level
+    requirement, a backward field when the metric doesn't exceed it.
+    """
+
+    version: int
+    backward_weights: dict[str, float]
+    forward_weights: dict[str, float]
+
+    @property
+    def fields(self) -> list[str]:
+        """Scored metric fields."""
+        return [*self.forward_weights, *self.backward_weights]
+
+
+SCORING_PROFILES = {
+    profile.version: profile
+    for profile in (
+        ScoringProfile(
+            version=1,
+            backward_weights={
+                "last_commit_days": 6.0,
+                "last_pull_request_days": 6.0,
+                "last_release_days": 6.0,
+                "open_issues_count": 6.0,
+                "owasp_page_last_update_days": 6.0,
+                "unanswered_issues_count": 6.0,
+                "unassigned_issues_count": 6.0,
+            },
+            forward_weights={
+                "age_days": 6.0,
+                "contributors_count": 6.0,
+                "forks_count": 6.0,
+                "is_funding_requirements_compliant": 5.0,
+                "is_leader_requirements_compliant": 5.0,
+                "open_pull_requests_count": 6.0,
+                "recent_releases_count": 6.0,
+                "stars_count": 6.0,
+                "total_pull_requests_count": 6.0,
+                "total_releases_count": 6.0,
+            },
+        ),
+    )
+}
+LATEST_SCORING_PROFILE_VERSION = max(SCORING_PROFILES)
+
+
+def compute_scores(
+    profile: ScoringProfile,
+    metrics: dict[str, np.ndarray],
+    requirements: dict[str, np.ndarray],
+) -> np.ndarray:
+    """Compute health scores of all metrics rows at once.
+
+    Args:
+        profile (ScoringProfile): The scoring profile.
+        metrics (dict[str, np.ndarray]): The metric columns by field name.
+        requirements (dict[str, np.ndarray]): The requirement columns aligned with the
+            metrics rows by field name.
+
+    Returns:
+        np.ndarray: The scores.
+
+    """
+    scores = np.zeros(len(next(iter(metrics.values()))), dtype=np.float64)
+    for field, weight in profile.forward_weights.items():
+        scores += np.where(metrics[field] >= requirements[field], weight, 0.0)
+
+    for field, weight in profile.backward_weights.items():
+        scores += np.where(metrics[field] <= requirements[field], weight, 0.0)
+
+    return scores
+
+
+def get_days_since(timestamps: Sequence, references: np.ndarray) -> np.ndarray:
+    """Get the whole days passed since timestamps, zero for missing ones.
+
+    Args:
+        timestamps (Sequence): The timestamps.
+        references (np.ndarray): The reference POSIX timestamps.
+
+    Returns:
+        np.ndarray: The days.
+
+    """
+    seconds = np.array(
+        [timestamp.timestamp() if timestamp else np.nan for timestamp in timestamps],
+        dtype=np.float64,
+    )
+
+    return np.where(
+        np.isnan(seconds), 0, np.floor((references - seconds) / SECONDS_PER_DAY)
+    ).astype(np.int64)
+
+
+def score_project_health_metrics(
+    queryset: QuerySet[ProjectHealthMetrics], profile: ScoringProfile
+) -> list[ProjectHealthMetrics]:
+    """Score project health metrics with a scoring profile.
+
+    The metrics are loaded into columns with a single query. Days since metrics are
+    counted as of the metrics creation so that historical rows are scored the way
+    they were on their day.
+
+    Args:
+        queryset (QuerySet[ProjectHealthMetrics]): The metrics to score.
+        profile (ScoringProfile): The scoring profile.
+
+    Returns:
+        list[ProjectHealthMetrics]: The unsaved metrics which score changed.
+
+    """
+    stored_fields = sorted({DAYS_FIELDS.get(field, field) for field in profile.fields})
+    rows = list(
+        queryset.order_by().values_list(
+            "id",
+            "nest_created_at",
+            "project__level",
+            "score",
+            "score_profile_version",
+            *stored_fields,
+        )
+    )
+    requirements_by_level = {
+        requirements.level: requirements
+        for requirements in ProjectHealthRequirements.objects.all()
+    }
+    rows = [row for row in rows if row[2] in requirements_by_level]
+    if not rows:
+        return []
+
+    ids, created_at, levels, scores, versions, *values = zip(*rows, strict=True)
+    columns = dict(zip(stored_fields, values, strict=True))
+    references = np.array([value.timestamp() for value in created_at], dtype=np.float64)
+    metrics = {
+        field: (
+            get_days_since(columns[DAYS_FIELDS[field]], references)
+            if field in DAYS_FIELDS
+            else np.array(columns[field], dtype=np.int64)
+        )
+        for field in profile.fields
+    }
+
+    level_indexes = {level: idx for idx, level in enumerate(requirements_by_level)}
+    row_level_indexes = np.array([level_indexes[level] for level in levels], dtype=np.int64)
+    requirements = {
+        field: np.array(
+            [getattr(requirement, field) for requirement in requirements_by_level.values()],
+            dtype=np.int64,
+        )[row_level_indexes]
+        for field in profile.fields
+    }
+
+    new_scores = compute_scores(profile, metrics, requirements)
+    current_scores = np.array(
+        [np.nan if score is None else score for score in scores], dtype=np.float64
+    )
+    changed = (np.array(versions) != profile.version) | ~np.isclose(new_scores, current_scores)
+
+    return [
+        ProjectHealthMetrics(
+            id=ids[idx],
+            score=float(new_scores[idx]),
+            score_profile_version=profile.version,
+        )
+        for idx in np.flatnonzero(changed)
+    ]
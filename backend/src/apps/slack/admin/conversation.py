@@ -42,7 +42,7 @@ class ConversationAdmin(admin.ModelAdmin):
         ),
         (
             "Additional attributes",
-            {"fields": ("sync_messages",)},
+            {"fields": ("sync_messages", "sync_messages_ts")},
         ),
     )
     list_display = (
@@ -63,6 +63,7 @@ class ConversationAdmin(admin.ModelAdmin):
         "slack_channel_id",
         "created_at",
         "slack_creator_id",
+        "sync_messages_ts",
     )
     search_fields = (
         "name",
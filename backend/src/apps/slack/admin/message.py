@@ -23,10 +23,17 @@ class MessageAdmin(admin.ModelAdmin):
         "has_replies",
         "conversation",
     )
-    search_fields = (
-        "slack_message_id",
-        "raw_data__text",
-    )
+    search_fields = ("slack_message_id",)
+
+    def get_search_results(self, request, queryset, search_term):
+        """Search messages by ID or by keywords using the full-text index."""
+        search_queryset, may_have_duplicates = super().get_search_results(
+            request, queryset, search_term
+        )
+        if search_term:
+            search_queryset |= Message.search(search_term, queryset=queryset)
+
+        return search_queryset, may_have_duplicates
 
 
 admin.site.register(Message, MessageAdmin)
@@ -0,0 +1,160 @@
+"""Slack entity commands result cache."""
+
+from __future__ import annotations
+
+import hashlib
+import inspect
+import json
+import logging
+import time
+from dataclasses import asdict
+from functools import wraps
+from typing import TYPE_CHECKING
+
+from django.core.cache import cache
+
+from apps.slack.common.presentation import EntityPresentation
+from apps.slack.constants import (
+    COMMAND_CACHE_KEY_PREFIX,
+    COMMAND_CACHE_STALE_TTL_SECONDS,
+    COMMAND_CACHE_TTL_SECONDS,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class CommandCache:
+    """Shared cache for pre-rendered Block Kit results of an entity command.
+
+    Results are keyed on the normalized query, page, limit and presentation. A result
+    is fresh until its TTL expires or the command is invalidated by an entity update.
+    Stale results are kept longer and served when rendering fails, e.g. during
+    an Algolia outage.
+    """
+
+    def __init__(
+        self,
+        command: str,
+        ttl: int = COMMAND_CACHE_TTL_SECONDS,
+        stale_ttl: int = COMMAND_CACHE_STALE_TTL_SECONDS,
+    ) -> None:
+        """Initialize the command cache.
+
+        Args:
+            command (str): The command name, e.g. projects.
+            ttl (int): The time-to-live of a fresh result in seconds.
+            stale_ttl (int): The time-to-live of a stale result in seconds.
+
+        """
+        self.command = command
+        self.stale_ttl = stale_ttl
+        self.ttl = ttl
+
+    @property
+    def invalidated_at_key(self) -> str:
+        """Get the cache key of the command invalidation time."""
+        return f"{COMMAND_CACHE_KEY_PREFIX}:{self.command}:invalidated-at"
+
+    @staticmethod
+    def normalize(query: str) -> str:
+        """Normalize query whitespace, keeping the case shown in the rendered blocks."""
+        return " ".join(query.split())
+
+    def get_key(
+        self, *, limit: int, page: int, presentation: EntityPresentation, search_query: str
+    ) -> str:
+        """Get the cache key for the command options."""
+        value = json.dumps(
+            {
+                "limit": limit,
+                "page": page,
+                "presentation": asdict(presentation),
+                "search_query": self.normalize(search_query),
+            },
+            sort_keys=True,
+        )
+
+        digest = hashlib.sha256(value.encode()).hexdigest()
+        return f"{COMMAND_CACHE_KEY_PREFIX}:{self.command}:{digest}"
+
+    def get_blocks(
+        self,
+        render: Callable[..., list[dict]],
+        *,
+        limit: int = 10,
+        page: int = 1,
+        presentation: EntityPresentation | None = None,
+        search_query: str = "",
+    ) -> list[dict]:
+        """Get the command blocks, rendering them on a cache miss.
+
+        Args:
+            render (Callable): The function rendering the blocks.
+            limit (int): The maximum number of entities per page.
+            page (int): The current page number.
+            presentation (EntityPresentation | None): Configuration for entity presentation.
+            search_query (str): The search query.
+
+        Returns:
+            list[dict]: The Slack blocks.
+
+        """
+        presentation = presentation or EntityPresentation()
+        search_query = self.normalize(search_query)
+        key = self.get_key(
+            limit=limit, page=page, presentation=presentation, search_query=search_query
+        )
+
+        entries = cache.get_many((key, self.invalidated_at_key))
+        entry = entries.get(key)
+        if (
+            entry is not None
+            and entry["rendered_at"] > time.time() - self.ttl
+            and entry["rendered_at"] > entries.get(self.invalidated_at_key, 0)
+        ):
+            return entry["blocks"]
+
+        try:
+            blocks = render(
+                limit=limit, page=page, presentation=presentation, search_query=search_query
+            )
+        except Exception:
+            if entry is None:
+                raise
+
+            logger.warning("Serving stale /%s command result", self.command, exc_info=True)
+            return entry["blocks"]
+
+        cache.set(key, {"blocks": blocks, "rendered_at": time.time()}, timeout=self.stale_ttl)
+
+        return blocks
+
+    def invalidate(self) -> None:
+        """Mark the cached command results as stale."""
+        cache.set(self.invalidated_at_key, time.time(), timeout=self.stale_ttl)
+
+
+def cache_blocks(command: str) -> Callable:
+    """Cache the blocks of an entity command handler.
+
+    Args:
+        command (str): The command name, e.g. projects.
+
+    """
+
+    def decorator(get_blocks: Callable[..., list[dict]]) -> Callable[..., list[dict]]:
+        signature = inspect.signature(get_blocks)
+
+        @wraps(get_blocks)
+        def _wrapper(*args, **kwargs) -> list[dict]:
+            options = signature.bind(*args, **kwargs)
+            options.apply_defaults()
+
+            return CommandCache(command).get_blocks(get_blocks, **options.arguments)
+
+        return _wrapper
+
+    return decorator
@@ -3,51 +3,79 @@
 from __future__ import annotations
 
 import logging
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
 from apps.ai.agent.agent import AgenticRAGAgent
 from apps.slack.blocks import markdown
 from apps.slack.common.question_detector import QuestionDetector
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
 logger = logging.getLogger(__name__)
 
 
-def get_blocks(query: str) -> list[dict]:
+def get_blocks(query: str, on_token: Callable[[str], None] | None = None) -> list[dict]:
     """Get AI response blocks.
 
     Args:
         query (str): The user's question.
-        presentation (EntityPresentation | None): Configuration for entity presentation.
+        on_token (Callable[[str], None] | None): An optional callback the first
+            answer is streamed to while it is generated.
 
     Returns:
         list: A list of Slack blocks representing the AI response.
 
     """
-    ai_response = process_ai_query(query.strip())
+    ai_response = process_ai_query(query.strip(), on_token=on_token)
 
     if ai_response:
         return [markdown(ai_response)]
     return get_error_blocks()
 
 
-def process_ai_query(query: str) -> str | None:
+def process_ai_query(query: str, on_token: Callable[[str], None] | None = None) -> str | None:
     """Process the AI query using the agentic RAG agent.
 
     Args:
         query (str): The user's question.
+        on_token (Callable[[str], None] | None): An optional callback the first
+            answer is streamed to while it is generated.
 
     Returns:
         str | None: The AI response or None if error occurred.
 
     """
-    question_detector = QuestionDetector()
-    if not question_detector.is_owasp_question(text=query):
+    if not get_question_detector().is_owasp_question(text=query):
         return get_default_response()
 
-    agent = AgenticRAGAgent()
-    result = agent.run(query=query)
+    result = get_agent().run(query=query, on_token=on_token)
     return result["answer"]
 
 
+@lru_cache(maxsize=1)
+def get_agent() -> AgenticRAGAgent:
+    """Get the agent shared by all queries of the process.
+
+    Returns:
+        AgenticRAGAgent: The agent with its clients and compiled graph.
+
+    """
+    return AgenticRAGAgent()
+
+
+@lru_cache(maxsize=1)
+def get_question_detector() -> QuestionDetector:
+    """Get the question detector shared by all queries of the process.
+
+    Returns:
+        QuestionDetector: The question detector.
+
+    """
+    return QuestionDetector()
+
+
 def get_error_blocks() -> list[dict]:
     """Get error response blocks.
 
@@ -8,11 +8,13 @@ from django.template.defaultfilters import pluralize
 from apps.common.constants import NL
 from apps.common.utils import get_absolute_url, truncate
 from apps.slack.blocks import get_pagination_buttons, markdown
+from apps.slack.common.command_cache import cache_blocks
 from apps.slack.common.presentation import EntityPresentation
 from apps.slack.constants import FEEDBACK_SHARING_INVITE
 from apps.slack.utils import escape
 
 
+@cache_blocks("chapters")
 def get_blocks(
     limit: int = 10,
     page: int = 1,
@@ -7,11 +7,13 @@ from django.conf import settings
 from apps.common.constants import NL
 from apps.common.utils import get_absolute_url, truncate
 from apps.slack.blocks import get_pagination_buttons, markdown
+from apps.slack.common.command_cache import cache_blocks
 from apps.slack.common.presentation import EntityPresentation
 from apps.slack.constants import FEEDBACK_SHARING_INVITE
 from apps.slack.utils import escape
 
 
+@cache_blocks("users")
 def get_blocks(
     page: int = 1,
     search_query: str = "",
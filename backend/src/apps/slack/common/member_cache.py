@@ -0,0 +1,155 @@
+"""Slack workspace member cache."""
+
+from __future__ import annotations
+
+import logging
+import threading
+from typing import TYPE_CHECKING
+
+from slack_sdk.errors import SlackApiError
+
+from apps.slack.models.member import Member
+
+if TYPE_CHECKING:
+    from apps.slack.models.workspace import Workspace
+    from apps.slack.rate_limit import RateLimitedClient
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class MemberCache:
+    """Slack members of a workspace cached by their Slack user ID.
+
+    A preloaded cache holds all the workspace members stored in the database and
+    fills user misses with a single users.list pass, which suits bulk message
+    ingestion. Otherwise members are looked up one at a time. Members missing from
+    both are fetched with users.info or bots.info, and unknown IDs are cached too.
+    """
+
+    def __init__(
+        self, workspace: Workspace, client: RateLimitedClient, batch_size: int = 200
+    ) -> None:
+        """Initialize the member cache.
+
+        Args:
+            workspace (Workspace): The workspace whose members are cached.
+            client (RateLimitedClient): The Slack client used on cache misses.
+            batch_size (int): The number of members to list per request.
+
+        """
+        self.batch_size = batch_size
+        self.client = client
+        self.is_listed = False
+        self.is_preloaded = False
+        self.lock = threading.Lock()
+        self.members: dict[str, Member | None] = {}
+        self.workspace = workspace
+
+    def preload(self) -> None:
+        """Load all the workspace members from the database."""
+        with self.lock:
+            self.members.update(
+                (member.slack_user_id, member)
+                for member in Member.objects.filter(workspace=self.workspace).iterator()
+            )
+            self.is_preloaded = True
+
+    def get(self, slack_user_id: str, *, is_bot: bool = False) -> Member | None:
+        """Get a member, fetching it from Slack on a cache miss.
+
+        Args:
+            slack_user_id (str): The Slack user or bot ID.
+            is_bot (bool): Whether the ID is a bot ID.
+
+        Returns:
+            Member | None: The member or None if it can't be found.
+
+        """
+        with self.lock:
+            if slack_user_id in self.members:
+                return self.members[slack_user_id]
+
+            if not self.is_preloaded and (
+                member := Member.objects.filter(
+                    slack_user_id=slack_user_id, workspace=self.workspace
+                ).first()
+            ):
+                self.members[slack_user_id] = member
+                return member
+
+            if self.is_preloaded and not self.is_listed and not is_bot:
+                self.list_members()
+                if slack_user_id in self.members:
+                    return self.members[slack_user_id]
+
+            member = self.fetch_member(slack_user_id, is_bot=is_bot)
+            self.members[slack_user_id] = member
+
+            return member
+
+    def fetch_member(self, slack_user_id: str, *, is_bot: bool = False) -> Member | None:
+        """Fetch a single member from Slack and save it.
+
+        Args:
+            slack_user_id (str): The Slack user or bot ID.
+            is_bot (bool): Whether the ID is a bot ID.
+
+        Returns:
+            Member | None: The saved member or None if the fetch failed.
+
+        """
+        try:
+            if is_bot:
+                bot = self.client.call("bots_info", bot=slack_user_id)["bot"]
+                member_data = {
+                    "id": slack_user_id,
+                    "is_bot": True,
+                    "name": bot.get("name"),
+                    "real_name": bot.get("name"),
+                }
+            else:
+                member_data = self.client.call("users_info", user=slack_user_id)["user"]
+        except SlackApiError as e:
+            logger.warning("Failed to fetch member %s: %s", slack_user_id, e.response["error"])
+            return None
+
+        logger.info("Created member %s", slack_user_id)
+
+        return Member.update_data(member_data, self.workspace, save=True)
+
+    def list_members(self) -> None:
+        """Add the workspace members missing from the cache using users.list paging."""
+        self.is_listed = True
+        cursor = None
+        try:
+            while True:
+                response = self.client.call("users_list", cursor=cursor, limit=self.batch_size)
+                new_members_data = [
+                    member_data
+                    for member_data in response["members"]
+                    if member_data["id"] not in self.members
+                ]
+                # Members may be stored for another workspace.
+                existing_members = {
+                    member.slack_user_id: member
+                    for member in Member.objects.filter(
+                        slack_user_id__in=[member_data["id"] for member_data in new_members_data]
+                    )
+                }
+
+                members = []
+                for member_data in new_members_data:
+                    member = existing_members.get(member_data["id"]) or Member()
+                    member.from_slack(member_data, self.workspace)
+                    members.append(member)
+                    self.members[member.slack_user_id] = member
+
+                if members:
+                    logger.info("Saving %s listed members", len(members))
+                    Member.bulk_save(members)
+
+                response_metadata: dict[str, str] = response.get("response_metadata", {})
+                if not (cursor := response_metadata.get("next_cursor")):
+                    break
+        except SlackApiError as e:
+            logger.warning("Failed to list members: %s", e.response["error"])
@@ -0,0 +1,178 @@
+"""Local question pre-classifier for Slack OWASP bot."""
+
+from __future__ import annotations
+
+import math
+import re
+from collections import Counter
+from typing import TYPE_CHECKING
+
+from django.core.cache import cache
+
+from apps.slack.constants import (
+    OWASP_KEYWORDS,
+    QUESTION_CLASSIFIER_CACHE_KEY,
+    QUESTION_PHRASES,
+    QUESTION_WORDS,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+TOKEN_REGEX = re.compile(r"[a-z0-9][a-z0-9+#.-]*[a-z0-9+#]|[a-z0-9]")
+
+
+class QuestionClassifier:
+    """Cheap local pre-classifier of OWASP question candidates.
+
+    A message is a candidate when it is shaped like a question and either mentions
+    an OWASP keyword or its terms lean towards OWASP topics according to the term
+    weights learned from past Slack messages. Only candidates are sent to the LLM
+    based question detector.
+    """
+
+    MAX_TERMS = 5000
+    MIN_DOCUMENT_FREQUENCY = 3
+    MIN_SCORE = 0.0
+
+    def __init__(self, weights: dict[str, float] | None = None):
+        """Initialize the question classifier.
+
+        Args:
+            weights (dict[str, float], optional): The term weights, the trained ones
+                are loaded from the cache by default.
+
+        """
+        self.weights = cache.get(QUESTION_CLASSIFIER_CACHE_KEY) if weights is None else weights
+
+    @staticmethod
+    def tokenize(text: str) -> list[str]:
+        """Split text into lowercase terms.
+
+        Args:
+            text (str): The text to split.
+
+        Returns:
+            list[str]: The terms.
+
+        """
+        return TOKEN_REGEX.findall(text.lower())
+
+    @staticmethod
+    def has_owasp_keyword(text: str) -> bool:
+        """Check whether the text mentions an OWASP keyword.
+
+        Args:
+            text (str): The text to check.
+
+        Returns:
+            bool: True if any keyword is found.
+
+        """
+        terms = f" {' '.join(QuestionClassifier.tokenize(text))} "
+
+        return any(f" {keyword} " in terms for keyword in OWASP_KEYWORDS)
+
+    @staticmethod
+    def is_question_shaped(text: str) -> bool:
+        """Check whether the text looks like a question.
+
+        Args:
+            text (str): The text to check.
+
+        Returns:
+            bool: True if the text has a question mark, starts with a question word
+                or contains a question phrase.
+
+        """
+        if "?" in text:
+            return True
+
+        terms = QuestionClassifier.tokenize(text)
+        if not terms:
+            return False
+
+        phrase = f" {' '.join(terms)} "
+
+        return terms[0] in QUESTION_WORDS or any(f" {p} " in phrase for p in QUESTION_PHRASES)
+
+    @staticmethod
+    def train(texts: Iterable[str]) -> dict[str, float]:
+        """Learn term weights from past messages.
+
+        Messages mentioning OWASP keywords are weakly labeled as OWASP related. A term
+        weight is its smoothed log odds of appearing in OWASP related messages, which
+        extends the keyword list with the terms the community uses next to them.
+
+        Args:
+            texts (Iterable[str]): The past messages text.
+
+        Returns:
+            dict[str, float]: The weights of the most informative terms.
+
+        """
+        negative_frequencies: Counter[str] = Counter()
+        negative_count = 0
+        positive_frequencies: Counter[str] = Counter()
+        positive_count = 0
+        for text in texts:
+            terms = set(QuestionClassifier.tokenize(text))
+            if QuestionClassifier.has_owasp_keyword(text):
+                positive_frequencies.update(terms)
+                positive_count += 1
+            else:
+                negative_frequencies.update(terms)
+                negative_count += 1
+
+        if not positive_count or not negative_count:
+            return {}
+
+        weights = {
+            term: math.log((positive_frequencies[term] + 1) / (positive_count + 2))
+            - math.log((negative_frequencies[term] + 1) / (negative_count + 2))
+            for term in positive_frequencies | negative_frequencies
+            if positive_frequencies[term] + negative_frequencies[term]
+            >= QuestionClassifier.MIN_DOCUMENT_FREQUENCY
+        }
+
+        return dict(
+            sorted(weights.items(), key=lambda item: abs(item[1]), reverse=True)[
+                : QuestionClassifier.MAX_TERMS
+            ]
+        )
+
+    def score(self, text: str) -> float:
+        """Score how much the text terms lean towards OWASP topics.
+
+        Args:
+            text (str): The text to score.
+
+        Returns:
+            float: The mean weight of the known terms, 0.0 if there are none.
+
+        """
+        known_weights = [
+            self.weights[term] for term in set(self.tokenize(text)) if term in self.weights
+        ]
+
+        return sum(known_weights) / len(known_weights) if known_weights else 0.0
+
+    def is_candidate(self, text: str) -> bool:
+        """Check whether the text may be an OWASP question worth an LLM check.
+
+        Question shaped texts are candidates when no weights are trained yet.
+
+        Args:
+            text (str): The text to check.
+
+        Returns:
+            bool: True if the text is a candidate.
+
+        """
+        if not text or not text.strip() or not self.is_question_shaped(text):
+            return False
+
+        if not self.weights or self.has_owasp_keyword(text):
+            return True
+
+        return self.score(text) > self.MIN_SCORE
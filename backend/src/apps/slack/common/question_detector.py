@@ -12,6 +12,7 @@ from apps.ai.agent.tools.rag.retriever import Retriever
 from apps.ai.common.constants import (
     DEFAULT_SIMILARITY_THRESHOLD,
 )
+from apps.ai.common.token_budget import TokenBudget
 from apps.core.models.prompt import Prompt
 
 logger = logging.getLogger(__name__)
@@ -38,6 +39,7 @@ class QuestionDetector:
 
         self.openai_client = openai.OpenAI(api_key=openai_api_key)
         self.retriever = Retriever()
+        self.token_budget = TokenBudget()
 
     def is_owasp_question(self, text: str) -> bool:
         """Check if the input text is an OWASP-related question.
@@ -95,13 +97,15 @@ class QuestionDetector:
         system_prompt = prompt
         user_prompt = f'Question: "{text}"\n\n Context: {formatted_context}'
 
+        messages = [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt},
+        ]
         try:
+            self.token_budget.acquire(TokenBudget.estimate_tokens(messages, self.MAX_TOKENS))
             response = self.openai_client.chat.completions.create(
                 model=self.CHAT_MODEL,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt},
-                ],
+                messages=messages,
                 temperature=self.TEMPERATURE,
                 max_tokens=self.MAX_TOKENS,
             )
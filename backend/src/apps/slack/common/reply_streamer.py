@@ -0,0 +1,75 @@
+"""Slack reply streamer."""
+
+from __future__ import annotations
+
+import logging
+import time
+from typing import TYPE_CHECKING
+
+from slack_sdk.errors import SlackApiError
+
+from apps.slack.blocks import markdown
+from apps.slack.constants import AI_REPLY_STREAM_INTERVAL_SECONDS
+
+if TYPE_CHECKING:
+    from slack_sdk import WebClient
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class ReplyStreamer:
+    """Stream generated text into a posted Slack message.
+
+    Tokens are buffered and the message is updated at most once per interval,
+    which keeps chat.update calls within the Slack rate limits.
+    """
+
+    def __init__(
+        self,
+        client: WebClient,
+        channel: str,
+        ts: str,
+        interval: float = AI_REPLY_STREAM_INTERVAL_SECONDS,
+    ) -> None:
+        """Initialize the reply streamer.
+
+        Args:
+            client (WebClient): The Slack client.
+            channel (str): The channel ID of the message.
+            ts (str): The timestamp of the message to update.
+            interval (float): The minimum number of seconds between updates.
+
+        """
+        self.channel = channel
+        self.client = client
+        self.interval = interval
+        self.text = ""
+        self.ts = ts
+        self.updated_at: float | None = None
+
+    def __call__(self, token: str) -> None:
+        """Add a token and update the message if the interval has passed.
+
+        Args:
+            token (str): The generated text token.
+
+        """
+        self.text += token
+        if self.updated_at is None or time.monotonic() - self.updated_at >= self.interval:
+            self.flush()
+
+    def flush(self) -> None:
+        """Update the message with the text streamed so far."""
+        if not self.text.strip():
+            return
+
+        self.updated_at = time.monotonic()
+        try:
+            self.client.chat_update(
+                channel=self.channel,
+                ts=self.ts,
+                blocks=[markdown(f"{self.text}…")],
+                text=self.text,
+            )
+        except SlackApiError as e:
+            logger.warning("Failed to stream reply: %s", e.response["error"])
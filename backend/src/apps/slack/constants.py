@@ -2,6 +2,13 @@
 
 from apps.common.constants import NL
 
+AI_REPLY_STREAM_INTERVAL_SECONDS = 2
+
+COMMAND_CACHE_COMMANDS = ("chapters", "committees", "projects", "users")
+COMMAND_CACHE_KEY_PREFIX = "slack-command"
+COMMAND_CACHE_STALE_TTL_SECONDS = 7 * 86400  # 7 days.
+COMMAND_CACHE_TTL_SECONDS = 3600  # 1 hour.
+
 NEST_BOT_NAME = "NestBot"
 
 OWASP_APPSEC_CHANNEL_ID = "#C0F7D6DFH"
@@ -82,6 +89,61 @@ OWASP_KEYWORDS = {
 
 OWASP_WORKSPACE_ID = "T04T40NHX"
 
+QUESTION_CLASSIFIER_CACHE_KEY = "slack-question-classifier"
+QUESTION_PHRASES = {
+    "any idea",
+    "any suggestions",
+    "anyone know",
+    "can anyone",
+    "can someone",
+    "could anyone",
+    "could someone",
+    "does anyone",
+    "i wonder",
+    "is there",
+    "looking for",
+    "need help",
+    "please help",
+}
+QUESTION_WORDS = {
+    "am",
+    "are",
+    "can",
+    "could",
+    "did",
+    "do",
+    "does",
+    "how",
+    "is",
+    "should",
+    "what",
+    "when",
+    "where",
+    "which",
+    "who",
+    "why",
+    "will",
+    "would",
+}
+
+# Web API rate limit tiers, see https://docs.slack.dev/apis/web-api/rate-limits
+RATE_LIMIT_DEFAULT_TIER = 3
+RATE_LIMIT_METHOD_TIERS = {
+    "bots_info": 3,
+    "conversations_history": 3,
+    "conversations_replies": 3,
+    "search_messages": 2,
+    "users_info": 4,
+    "users_list": 2,
+}
+RATE_LIMIT_RETRY_AFTER_SECONDS = 30
+RATE_LIMIT_TIER_REQUESTS_PER_MINUTE = {
+    1: 1,
+    2: 20,
+    3: 50,
+    4: 100,
+}
+
 VIEW_PROJECTS_ACTION = "view_projects_action"
 VIEW_PROJECTS_ACTION_NEXT = "view_projects_action_next"
 VIEW_PROJECTS_ACTION_PREV = "view_projects_action_prev"
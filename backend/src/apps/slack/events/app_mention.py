@@ -4,6 +4,7 @@ import logging
 
 from apps.slack.blocks import markdown
 from apps.slack.common.handlers.ai import get_blocks
+from apps.slack.common.reply_streamer import ReplyStreamer
 from apps.slack.events.event import EventBase
 from apps.slack.models import Conversation
 
@@ -52,7 +53,10 @@ class AppMention(EventBase):
             thread_ts=thread_ts,
         )
 
-        reply_blocks = get_blocks(query=query)
+        reply_blocks = get_blocks(
+            query=query,
+            on_token=ReplyStreamer(client, channel_id, placeholder["ts"]),
+        )
         client.chat_update(
             channel=channel_id,
             ts=placeholder["ts"],
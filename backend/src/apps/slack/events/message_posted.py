@@ -1,15 +1,14 @@
 """Slack message event template."""
 
 import logging
-from datetime import timedelta
 
 import django_rq
 
-from apps.ai.common.constants import QUEUE_RESPONSE_TIME_MINUTES
-from apps.slack.common.question_detector import QuestionDetector
+from apps.slack.common.member_cache import MemberCache
 from apps.slack.events.event import EventBase
-from apps.slack.models import Conversation, Member, Message
-from apps.slack.services.message_auto_reply import generate_ai_reply_if_unanswered
+from apps.slack.models import Conversation, Message
+from apps.slack.rate_limit import RateLimitedClient
+from apps.slack.services.message_auto_reply import detect_owasp_question
 
 logger = logging.getLogger(__name__)
 
@@ -19,12 +18,12 @@ class MessagePosted(EventBase):
 
     event_type = "message"
 
-    def __init__(self):
-        """Initialize MessagePosted event handler."""
-        self.question_detector = QuestionDetector()
-
     def handle_event(self, event, client):
-        """Handle an incoming message event."""
+        """Handle an incoming message event.
+
+        The message is persisted and queued for question detection so that the
+        event is acknowledged without waiting for any LLM call.
+        """
         if event.get("subtype") or event.get("bot_id"):
             logger.info("Ignored message due to subtype, bot_id, or thread_ts.")
             return
@@ -52,22 +51,12 @@ class MessagePosted(EventBase):
             logger.warning("Conversation not found or assistant not enabled.")
             return
 
-        if not self.question_detector.is_owasp_question(text):
+        if not text.strip():
             return
 
-        try:
-            author = Member.objects.get(slack_user_id=user_id, workspace=conversation.workspace)
-        except Member.DoesNotExist:
-            user_info = client.users_info(user=user_id)
-            author = Member.update_data(user_info["user"], conversation.workspace, save=True)
-            logger.info("Created new member")
-
+        author = MemberCache(conversation.workspace, RateLimitedClient(client)).get(user_id)
         message = Message.update_data(
             data=event, conversation=conversation, author=author, save=True
         )
 
-        django_rq.get_queue("ai").enqueue_in(
-            timedelta(minutes=QUEUE_RESPONSE_TIME_MINUTES),
-            generate_ai_reply_if_unanswered,
-            message.id,
-        )
+        django_rq.get_queue("ai").enqueue(detect_owasp_question, message.id)
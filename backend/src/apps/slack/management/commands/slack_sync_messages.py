@@ -2,17 +2,21 @@
 
 import logging
 import os
-import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
+from queue import Empty, Queue
 
 from django.core.management.base import BaseCommand
+from django.db import connection
 from django.template.defaultfilters import pluralize
 from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
 
 from apps.github.models.user import User
 from apps.owasp.models.member_profile import MemberProfile
-from apps.slack.models import Conversation, Member, Message, Workspace
+from apps.slack.common.member_cache import MemberCache
+from apps.slack.models import Conversation, Message, Workspace
+from apps.slack.rate_limit import RateLimitedClient
 
 logger = logging.getLogger(__name__)
 
@@ -28,12 +32,6 @@ class Command(BaseCommand):
             default=999,
             help="Number of messages to retrieve per request",
         )
-        parser.add_argument(
-            "--delay",
-            type=float,
-            default=4,
-            help="Delay between API requests in seconds",
-        )
         parser.add_argument(
             "--channel-id",
             type=str,
@@ -45,6 +43,12 @@ class Command(BaseCommand):
             default=5,
             help="Maximum retries for rate-limited requests",
         )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=4,
+            help="Number of conversations to sync concurrently",
+        )
         parser.add_argument(
             "--slack-user-id",
             type=str,
@@ -69,8 +73,8 @@ class Command(BaseCommand):
     def handle(self, *args, **options):
         batch_size = options["batch_size"]
         channel_id = options["channel_id"]
-        delay = options["delay"]
         max_retries = options["max_retries"]
+        workers = max(options.get("workers", 1), 1)
         slack_user_id = options["slack_user_id"]
         github_user_id = options["github_user_id"]
         start_at = options["start_at"]
@@ -88,7 +92,6 @@ class Command(BaseCommand):
                 user_id=slack_user_id,
                 start_at=start_at,
                 end_at=end_at,
-                delay=delay,
                 max_retries=max_retries,
             )
             return
@@ -98,6 +101,7 @@ class Command(BaseCommand):
             self.stdout.write(self.style.WARNING("No workspaces found in the database"))
             return
 
+        conversations: Queue[tuple[RateLimitedClient, MemberCache, Conversation]] = Queue()
         for workspace in workspaces:
             self.stdout.write(f"\nProcessing workspace: {workspace.name}")
 
@@ -105,26 +109,64 @@ class Command(BaseCommand):
                 self.stdout.write(self.style.ERROR(f"No bot token found for {workspace}"))
                 continue
 
-            client = WebClient(token=bot_token)
+            # The client and member cache are shared by the workspace conversations workers.
+            client = RateLimitedClient(WebClient(token=bot_token), max_retries=max_retries)
+            member_cache = MemberCache(workspace, client)
+            member_cache.preload()
 
-            conversations = (
-                Conversation.objects.filter(slack_channel_id=channel_id)
+            for conversation in (
+                Conversation.objects.filter(slack_channel_id=channel_id, workspace=workspace)
                 if channel_id
                 else Conversation.objects.filter(sync_messages=True, workspace=workspace)
-            )
+            ):
+                conversations.put((client, member_cache, conversation))
 
-            for conversation in conversations:
-                self._fetch_conversation(
-                    batch_size=batch_size,
-                    client=client,
-                    conversation=conversation,
-                    delay=delay,
-                    include_replies=True,
-                    max_retries=max_retries,
-                )
+        self._sync_conversations(conversations, batch_size=batch_size, workers=workers)
 
         self.stdout.write(self.style.SUCCESS("\nFinished processing all workspaces"))
 
+    def _sync_conversations(
+        self,
+        conversations: Queue[tuple[RateLimitedClient, MemberCache, Conversation]],
+        batch_size: int,
+        workers: int,
+    ) -> None:
+        """Sync conversations using a pool of workers.
+
+        Args:
+            conversations (Queue): The conversations to sync with their workspace client
+                and member cache.
+            batch_size (int): The number of messages to retrieve per request.
+            workers (int): The number of concurrent workers.
+
+        """
+
+        def run_worker() -> None:
+            try:
+                while True:
+                    try:
+                        client, member_cache, conversation = conversations.get_nowait()
+                    except Empty:
+                        return
+
+                    self._fetch_conversation(
+                        batch_size=batch_size,
+                        client=client,
+                        conversation=conversation,
+                        include_replies=True,
+                        member_cache=member_cache,
+                    )
+            finally:
+                connection.close()
+
+        if workers == 1:
+            run_worker()
+            return
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for future in [executor.submit(run_worker) for _ in range(workers)]:
+                future.result()
+
     def _resolve_github_to_slack(self, github_login: str) -> str | None:
         """Resolve GitHub login to Slack user ID.
 
@@ -177,7 +219,6 @@ class Command(BaseCommand):
         user_id: str,
         start_at: str | None,
         end_at: str | None,
-        delay: float,
         max_retries: int,
     ):
         """Sync messages from a specific user using search API.
@@ -186,7 +227,6 @@ class Command(BaseCommand):
             user_id: Slack user ID to search for.
             start_at: Start date (YYYY-MM-DD).
             end_at: End date (YYYY-MM-DD).
-            delay: Delay between requests.
             max_retries: Max retry attempts.
 
         """
@@ -215,7 +255,7 @@ class Command(BaseCommand):
             )
             return
 
-        client = WebClient(token=search_token)
+        client = RateLimitedClient(WebClient(token=search_token), max_retries=max_retries)
 
         workspaces = Workspace.objects.all()
         if not workspaces.exists():
@@ -227,140 +267,119 @@ class Command(BaseCommand):
         for workspace in workspaces:
             self.stdout.write(f"\nProcessing workspace: {workspace.name}")
 
+            member_cache = MemberCache(workspace, client)
+
             # Search for messages using search.messages API
             query = f"from:<@{user_id}>"
             page = 1
-            retry_count = 0
 
             while True:
                 try:
-                    response = client.search_messages(
+                    response = client.call(
+                        "search_messages",
                         query=query,
                         count=100,
                         sort="timestamp",
                         sort_dir="desc",
                         page=page,
                     )
+                except SlackApiError as e:
+                    self.stdout.write(
+                        self.style.ERROR(f"Error searching messages: {e.response['error']}")
+                    )
+                    break
 
-                    self._handle_slack_response(response, "search_messages")
-                    retry_count = 0
+                self._handle_slack_response(response, "search_messages")
 
-                    messages_data = response.get("messages", {}).get("matches", [])
-                    if not messages_data:
-                        self.stdout.write(f"No more messages found for page {page}")
-                        break
+                messages_data = response.get("messages", {}).get("matches", [])
+                if not messages_data:
+                    self.stdout.write(f"No more messages found for page {page}")
+                    break
 
-                    self.stdout.write(
-                        f"  Processing {len(messages_data)} messages from page {page}"
-                    )
-                    logger.info("Processing %s messages from page %s", len(messages_data), page)
-
-                    messages_to_save = []
-                    should_stop = False
-
-                    for message_data in messages_data:
-                        # Parse message timestamp
-                        ts = message_data.get("ts", "0")
-                        message_time = datetime.fromtimestamp(float(ts), tz=UTC)
-
-                        # Stop if message is older than start_date
-                        if message_time < start_date:
-                            self.stdout.write(
-                                f"Reached messages older than {start_date.date()}, stopping"
-                            )
-                            should_stop = True
-                            break
-
-                        # Skip if message is newer than end_date
-                        if message_time > end_date:
-                            continue
-
-                        # Get or create conversation
-                        channel_id = message_data.get("channel", {}).get("id")
-                        if not channel_id:
-                            logger.warning("Message missing channel ID, skipping")
-                            continue
-
-                        conversation, _ = Conversation.objects.get_or_create(
-                            slack_channel_id=channel_id,
-                            workspace=workspace,
-                            defaults={
-                                "name": message_data.get("channel", {}).get("name", "unknown"),
-                            },
-                        )
+                self.stdout.write(f"  Processing {len(messages_data)} messages from page {page}")
+                logger.info("Processing %s messages from page %s", len(messages_data), page)
 
-                        # Create message - note: _create_message may return None if message
-                        # already exists or fails validation
-                        message = self._create_message(
-                            client=client,
-                            conversation=conversation,
-                            delay=delay,
-                            max_retries=max_retries,
-                            message_data=message_data,
-                        )
+                messages_to_save = []
+                should_stop = False
 
-                        if message:
-                            messages_to_save.append(message)
-                            logger.debug("Created message %s for saving", ts)
-                        else:
-                            logger.warning("Message %s returned None from _create_message", ts)
-                            self.stdout.write(f"    Skipped message {ts} (returned None)")
-
-                    logger.info(
-                        "Page %s: %s messages to save out of %s processed",
-                        page,
-                        len(messages_to_save),
-                        len(messages_data),
-                    )
+                for message_data in messages_data:
+                    # Parse message timestamp
+                    ts = message_data.get("ts", "0")
+                    message_time = datetime.fromtimestamp(float(ts), tz=UTC)
 
-                    if messages_to_save:
-                        Message.bulk_save(messages_to_save)
-                        total_messages += len(messages_to_save)
+                    # Stop if message is older than start_date
+                    if message_time < start_date:
                         self.stdout.write(
-                            self.style.SUCCESS(
-                                f"  Saved {len(messages_to_save)} messages from page {page}"
-                            )
+                            f"Reached messages older than {start_date.date()}, stopping"
                         )
-                        logger.info("Saved %s messages from page %s", len(messages_to_save), page)
-
-                    if should_stop:
+                        should_stop = True
                         break
 
-                    page += 1
-                    time.sleep(delay)
+                    # Skip if message is newer than end_date
+                    if message_time > end_date:
+                        continue
 
-                except SlackApiError as e:
-                    if e.response["error"] == "ratelimited":
-                        if retry_count >= max_retries:
-                            self.stdout.write(
-                                self.style.ERROR(f"Max retries ({max_retries}) exceeded")
-                            )
-                            break
-
-                        retry_after = int(e.response.headers.get("Retry-After", delay))
-                        retry_count += 1
-                        self.stdout.write(
-                            self.style.WARNING(f"Rate limited. Retrying after {retry_after}s")
-                        )
-                        time.sleep(retry_after)
+                    # Get or create conversation
+                    channel_id = message_data.get("channel", {}).get("id")
+                    if not channel_id:
+                        logger.warning("Message missing channel ID, skipping")
                         continue
 
+                    conversation, _ = Conversation.objects.get_or_create(
+                        slack_channel_id=channel_id,
+                        workspace=workspace,
+                        defaults={
+                            "name": message_data.get("channel", {}).get("name", "unknown"),
+                        },
+                    )
+
+                    # Create message - note: _create_message may return None if message
+                    # already exists or fails validation
+                    message = self._create_message(
+                        conversation=conversation,
+                        member_cache=member_cache,
+                        message_data=message_data,
+                    )
+
+                    if message:
+                        messages_to_save.append(message)
+                        logger.debug("Created message %s for saving", ts)
+                    else:
+                        logger.warning("Message %s returned None from _create_message", ts)
+                        self.stdout.write(f"    Skipped message {ts} (returned None)")
+
+                logger.info(
+                    "Page %s: %s messages to save out of %s processed",
+                    page,
+                    len(messages_to_save),
+                    len(messages_data),
+                )
+
+                if messages_to_save:
+                    Message.bulk_save(messages_to_save)
+                    total_messages += len(messages_to_save)
                     self.stdout.write(
-                        self.style.ERROR(f"Error searching messages: {e.response['error']}")
+                        self.style.SUCCESS(
+                            f"  Saved {len(messages_to_save)} messages from page {page}"
+                        )
                     )
+                    logger.info("Saved %s messages from page %s", len(messages_to_save), page)
+
+                if should_stop:
                     break
 
+                page += 1
+
         self.stdout.write(
             self.style.SUCCESS(f"\nFinished! Total messages synced: {total_messages}")
         )
 
     def _fetch_conversation(
         self,
-        client: WebClient,
+        client: RateLimitedClient,
         conversation: Conversation,
         batch_size: int,
-        delay: float,
-        max_retries: int,
+        member_cache: MemberCache,
         *,
         include_replies: bool = True,
     ):
@@ -372,9 +391,8 @@ class Command(BaseCommand):
                 batch_size=batch_size,
                 client=client,
                 conversation=conversation,
-                delay=delay,
                 include_replies=include_replies,
-                max_retries=max_retries,
+                member_cache=member_cache,
             )
 
             self.stdout.write(
@@ -390,60 +408,43 @@ class Command(BaseCommand):
     def _fetch_messages(
         self,
         batch_size: int,
-        client: WebClient,
+        client: RateLimitedClient,
         conversation: Conversation,
-        delay: float,
-        max_retries: int,
+        member_cache: MemberCache,
         *,
         include_replies: bool = True,
     ) -> None:
-        """Fetch all parent messages (non-thread) for a conversation."""
-        cursor = None
-        has_more = True
-        retry_count = 0
-        while has_more:
+        """Fetch all parent messages (non-thread) for a conversation.
+
+        A pass walks the history newer than the conversation high-water mark. The page
+        cursor is saved after each page so that an interrupted pass resumes where it
+        stopped, and the high-water mark moves to the pass newest message once the pass
+        is complete. The first pass saves its lower bound as the high-water mark so that
+        a resumed pass isn't bounded by the messages it has already saved.
+        """
+        if not conversation.sync_messages_ts:
+            conversation.sync_messages_ts = (
+                latest_message.ts if (latest_message := conversation.latest_message) else "0"
+            )
+        oldest = conversation.sync_messages_ts
+        cursor = conversation.sync_messages_cursor or None
+        pending_ts = conversation.sync_messages_pending_ts
+        while True:
             try:
-                response = client.conversations_history(
+                response = client.call(
+                    "conversations_history",
                     channel=conversation.slack_channel_id,
                     cursor=cursor,
                     limit=batch_size,
-                    oldest=conversation.latest_message.ts if conversation.latest_message else "0",
+                    oldest=oldest,
                 )
-
-                self._handle_slack_response(response, "conversations_history")
-                retry_count = 0
-
-                messages = [
-                    message
-                    for message_data in response.get("messages", [])
-                    if (
-                        message := self._create_message(
-                            client=client,
-                            conversation=conversation,
-                            delay=delay,
-                            max_retries=max_retries,
-                            message_data=message_data,
-                        )
-                    )
-                ]
-                cursor = response.get("response_metadata", {}).get("next_cursor")
-                has_more = bool(cursor)
             except SlackApiError as e:
-                if e.response["error"] == "ratelimited":
-                    if retry_count >= max_retries:
-                        self.stdout.write(
-                            self.style.ERROR(f"Max retries ({max_retries}) exceeded for history")
-                        )
-                        break
-
-                    retry_after = int(
-                        e.response.headers.get("Retry-After", delay * (retry_count + 1))
-                    )
-                    retry_count += 1
+                if e.response["error"] == "invalid_cursor" and cursor:
                     self.stdout.write(
-                        self.style.WARNING(f"Rate limited. Retrying after {retry_after} seconds")
+                        self.style.WARNING(f"Restarting {conversation.name} sync pass")
                     )
-                    time.sleep(retry_after)
+                    cursor = None
+                    pending_ts = ""
                     continue
 
                 self.stdout.write(
@@ -451,6 +452,25 @@ class Command(BaseCommand):
                 )
                 break
 
+            self._handle_slack_response(response, "conversations_history")
+
+            messages_data: list[dict] = response.get("messages", [])
+            if messages_data and not pending_ts:
+                # The first page of a pass holds the newest messages.
+                pending_ts = max((message_data["ts"] for message_data in messages_data), key=float)
+
+            messages = [
+                message
+                for message_data in messages_data
+                if (
+                    message := self._create_message(
+                        conversation=conversation,
+                        member_cache=member_cache,
+                        message_data=message_data,
+                    )
+                )
+            ]
+
             Message.bulk_save(messages.copy())
             if include_replies and messages:
                 self.stdout.write("Fetching message replies...")
@@ -458,85 +478,63 @@ class Command(BaseCommand):
                     if not message.has_replies:
                         continue
 
-                    self._fetch_replies(
-                        client=client,
-                        message=message,
-                        delay=delay,
-                        max_retries=max_retries,
-                    )
+                    self._fetch_replies(client=client, member_cache=member_cache, message=message)
+
+            cursor = response.get("response_metadata", {}).get("next_cursor") or None
+            conversation.sync_messages_cursor = cursor or ""
+            conversation.sync_messages_pending_ts = pending_ts if cursor else ""
+            if not cursor and pending_ts:
+                conversation.sync_messages_ts = pending_ts
+            conversation.save(
+                update_fields=(
+                    "sync_messages_cursor",
+                    "sync_messages_pending_ts",
+                    "sync_messages_ts",
+                )
+            )
+
+            if not cursor:
+                break
 
     def _fetch_replies(
-        self,
-        client: WebClient,
-        message: Message,
-        delay: float,
-        max_retries: int,
+        self, client: RateLimitedClient, member_cache: MemberCache, message: Message
     ):
         """Fetch all thread replies for parent messages."""
         replies = []
         try:
             cursor = None
-            has_more = True
-            retry_count = 0
-            while has_more:
-                try:
-                    params = {
-                        "channel": message.conversation.slack_channel_id,
-                        "cursor": cursor,
-                        "inclusive": False,
-                        "limit": 1000,
-                        "oldest": (
-                            latest_reply.ts if (latest_reply := message.latest_reply) else "0"
-                        ),
-                        "ts": message.slack_message_id,
-                    }
-                    response = client.conversations_replies(**params)
-                    self._handle_slack_response(response, "conversations_replies")
-                    retry_count = 0
-
-                    messages = response.get("messages", [])
-                    if not messages:
-                        break
+            oldest = latest_reply.ts if (latest_reply := message.latest_reply) else "0"
+            while True:
+                response = client.call(
+                    "conversations_replies",
+                    channel=message.conversation.slack_channel_id,
+                    cursor=cursor,
+                    inclusive=False,
+                    limit=1000,
+                    oldest=oldest,
+                    ts=message.slack_message_id,
+                )
+                self._handle_slack_response(response, "conversations_replies")
 
-                    replies += [
-                        reply
-                        for reply_data in messages
-                        if (
-                            reply := self._create_message(
-                                client=client,
-                                conversation=message.conversation,
-                                delay=delay,
-                                max_retries=max_retries,
-                                message_data=reply_data,
-                                parent_message=message,
-                            )
-                        )
-                    ]
+                messages = response.get("messages", [])
+                if not messages:
+                    break
 
-                    cursor = response.get("response_metadata", {}).get("next_cursor")
-                    has_more = bool(cursor)
-                except SlackApiError as e:
-                    if e.response["error"] == "ratelimited":
-                        if retry_count >= max_retries:
-                            self.stdout.write(
-                                self.style.ERROR(
-                                    f"Max retries ({max_retries}) exceeded for thread"
-                                )
-                            )
-                            break
-
-                        retry_after = int(
-                            e.response.headers.get("Retry-After", delay * (retry_count + 1))
-                        )
-                        retry_count += 1
-                        self.stdout.write(
-                            self.style.WARNING(
-                                f"Rate limited. Retrying after {retry_after} seconds"
-                            )
+                replies += [
+                    reply
+                    for reply_data in messages
+                    if (
+                        reply := self._create_message(
+                            conversation=message.conversation,
+                            member_cache=member_cache,
+                            message_data=reply_data,
+                            parent_message=message,
                         )
-                        time.sleep(retry_after)
-                        continue
-                    raise
+                    )
+                ]
+
+                if not (cursor := response.get("response_metadata", {}).get("next_cursor")):
+                    break
         except SlackApiError as e:
             self.stdout.write(
                 self.style.ERROR(
@@ -553,68 +551,16 @@ class Command(BaseCommand):
 
     def _create_message(
         self,
-        client: WebClient,
+        member_cache: MemberCache,
         message_data: dict,
         conversation: Conversation,
-        delay: float,
-        max_retries: int,
         *,
         parent_message: Message | None = None,
     ) -> Message | None:
         """Create Message instance using from_slack pattern."""
         author = None
-        slack_user_id = message_data.get("user") or message_data.get("bot_id")
-        if slack_user_id:
-            try:
-                author = Member.objects.get(
-                    slack_user_id=slack_user_id,
-                    workspace=conversation.workspace,
-                )
-            except Member.DoesNotExist:
-                retry_count = 0
-                while retry_count < max_retries:
-                    try:
-                        # User.
-                        if message_data.get("user"):
-                            user_info = client.users_info(user=slack_user_id)
-                            self._handle_slack_response(user_info, "users_info")
-
-                            author = Member.update_data(
-                                user_info["user"], conversation.workspace, save=True
-                            )
-                            self.stdout.write(
-                                self.style.SUCCESS(f"Created a new member: {slack_user_id}")
-                            )
-                        # Bot.
-                        else:
-                            bot_info = client.bots_info(bot=slack_user_id)
-                            self._handle_slack_response(bot_info, "bots_info")
-                            bot_data = {
-                                "id": slack_user_id,
-                                "is_bot": True,
-                                "name": bot_info["bot"].get("name"),
-                                "real_name": bot_info["bot"].get("name"),
-                            }
-                            author = Member.update_data(
-                                bot_data, conversation.workspace, save=True
-                            )
-                            self.stdout.write(
-                                self.style.SUCCESS(f"Created bot member: {slack_user_id}")
-                            )
-                        break
-                    except SlackApiError as e:
-                        if e.response.get("error") == "ratelimited":
-                            retry_after = int(e.response.headers.get("Retry-After", delay))
-                            retry_count += 1
-                            self.stdout.write(self.style.WARNING("Rate limited on member info"))
-                            time.sleep(retry_after)
-                        else:
-                            self.stdout.write(
-                                self.style.ERROR(
-                                    f"Failed to fetch member data for {slack_user_id}"
-                                )
-                            )
-                            break
+        if slack_user_id := message_data.get("user") or message_data.get("bot_id"):
+            author = member_cache.get(slack_user_id, is_bot=not message_data.get("user"))
 
         return Message.update_data(
             data=message_data,
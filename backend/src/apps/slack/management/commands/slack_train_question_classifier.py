@@ -0,0 +1,44 @@
+"""A command to train the Slack question pre-classifier."""
+
+from django.core.cache import cache
+from django.core.management.base import BaseCommand
+
+from apps.slack.common.question_classifier import QuestionClassifier
+from apps.slack.constants import QUESTION_CLASSIFIER_CACHE_KEY
+from apps.slack.models import Message
+
+
+class Command(BaseCommand):
+    help = "Train the Slack question pre-classifier from past messages."
+
+    def add_arguments(self, parser) -> None:
+        """Add command-line arguments to the parser.
+
+        Args:
+            parser (argparse.ArgumentParser): The argument parser instance.
+
+        """
+        parser.add_argument(
+            "--limit",
+            default=50000,
+            help="Number of the latest top-level messages to train on",
+            type=int,
+        )
+
+    def handle(self, *_args, **options) -> None:
+        """Handle the command execution."""
+        messages = (
+            Message.objects.filter(parent_message__isnull=True)
+            .exclude(text="")
+            .order_by("-created_at")
+            .values_list("text", flat=True)[: options["limit"]]
+        )
+        weights = QuestionClassifier.train(messages.iterator())
+        if not weights:
+            self.stdout.write(self.style.WARNING("Not enough messages to train on"))
+            return
+
+        cache.set(QUESTION_CLASSIFIER_CACHE_KEY, weights, timeout=None)
+        self.stdout.write(
+            self.style.SUCCESS(f"Trained question classifier with {len(weights)} terms")
+        )
@@ -0,0 +1,50 @@
+"""A command to backfill Slack messages text."""
+
+from django.core.management.base import BaseCommand
+
+from apps.slack.models import Message
+
+
+class Command(BaseCommand):
+    help = "Backfill Slack messages text and cleaned text from their raw data."
+
+    def add_arguments(self, parser) -> None:
+        """Add command-line arguments to the parser.
+
+        Args:
+            parser (argparse.ArgumentParser): The argument parser instance.
+
+        """
+        parser.add_argument(
+            "--batch-size",
+            default=1000,
+            help="Number of messages to update per batch",
+            type=int,
+        )
+
+    def handle(self, *_args, **options) -> None:
+        """Handle the command execution."""
+        batch_size = options["batch_size"]
+        messages = (
+            Message.objects.filter(raw_data__has_key="text", text="")
+            .exclude(raw_data__text="")
+            .only("id", "raw_data")
+            .order_by("id")
+        )
+
+        batch = []
+        updated_count = 0
+        for message in messages.iterator(chunk_size=batch_size):
+            message.text = message.raw_data["text"] or ""
+            message.cleaned_text = Message.clean_text(message.text)
+            batch.append(message)
+
+            if len(batch) == batch_size:
+                updated_count += len(batch)
+                Message.bulk_save(batch, fields=("cleaned_text", "text"))
+
+        if batch:
+            updated_count += len(batch)
+            Message.bulk_save(batch, fields=("cleaned_text", "text"))
+
+        self.stdout.write(self.style.SUCCESS(f"Updated text of {updated_count} messages"))
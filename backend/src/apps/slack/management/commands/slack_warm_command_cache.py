@@ -0,0 +1,24 @@
+"""A command to warm the Slack entity commands result cache."""
+
+from django.core.management.base import BaseCommand
+
+from apps.slack.commands.chapters import Chapters
+from apps.slack.commands.committees import Committees
+from apps.slack.commands.projects import Projects
+from apps.slack.commands.users import Users
+from apps.slack.common.command_cache import CommandCache
+from apps.slack.constants import COMMAND_CACHE_COMMANDS
+
+
+class Command(BaseCommand):
+    help = "Re-render the cached Slack entity commands results after an Algolia reindex."
+
+    def handle(self, *_args, **_options) -> None:
+        """Handle the command execution."""
+        for command_name in COMMAND_CACHE_COMMANDS:
+            CommandCache(command_name).invalidate()
+
+        for command_class in (Chapters, Committees, Projects, Users):
+            command = command_class()
+            command.render_blocks({"text": ""})
+            self.stdout.write(f"Warmed {command.command_name} command results")
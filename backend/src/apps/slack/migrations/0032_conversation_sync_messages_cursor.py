@@ -0,0 +1,34 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("slack", "0031_reactionrule_unique_conversation_report_type"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="conversation",
+            name="sync_messages_cursor",
+            field=models.CharField(
+                blank=True, default="", max_length=255, verbose_name="Sync messages cursor"
+            ),
+        ),
+        migrations.AddField(
+            model_name="conversation",
+            name="sync_messages_pending_ts",
+            field=models.CharField(
+                blank=True,
+                default="",
+                max_length=50,
+                verbose_name="Sync messages pending timestamp",
+            ),
+        ),
+        migrations.AddField(
+            model_name="conversation",
+            name="sync_messages_ts",
+            field=models.CharField(
+                blank=True, default="", max_length=50, verbose_name="Messages synced up to"
+            ),
+        ),
+    ]
@@ -0,0 +1,40 @@
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("slack", "0032_conversation_sync_messages_cursor"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="message",
+            name="cleaned_text",
+            field=models.TextField(blank=True, default="", verbose_name="Cleaned text"),
+        ),
+        migrations.AddField(
+            model_name="message",
+            name="text",
+            field=models.TextField(blank=True, default="", verbose_name="Text"),
+        ),
+        migrations.AddField(
+            model_name="message",
+            name="search_vector",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=django.contrib.postgres.search.SearchVector(
+                    "cleaned_text", config="english"
+                ),
+                output_field=django.contrib.postgres.search.SearchVectorField(),
+                verbose_name="Search vector",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="message",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="message_search_vector_gin_idx"
+            ),
+        ),
+    ]
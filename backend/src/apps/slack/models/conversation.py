@@ -44,6 +44,15 @@ class Conversation(TimestampedModel):
 
     # Additional attributes.
     sync_messages = models.BooleanField(verbose_name="Sync messages", default=False)
+    sync_messages_cursor = models.CharField(
+        verbose_name="Sync messages cursor", max_length=255, blank=True, default=""
+    )
+    sync_messages_pending_ts = models.CharField(
+        verbose_name="Sync messages pending timestamp", max_length=50, blank=True, default=""
+    )
+    sync_messages_ts = models.CharField(
+        verbose_name="Messages synced up to", max_length=50, blank=True, default=""
+    )
 
     def __str__(self):
         """Channel human readable representation."""
@@ -4,8 +4,12 @@ import re
 from datetime import UTC, datetime
 
 import emoji
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchQuery, SearchVector, SearchVectorField
 from django.db import models
+from django.db.models import QuerySet
 
+from apps.ai.common.constants import TEXT_SEARCH_CONFIG
 from apps.common.models import BulkSaveModel, TimestampedModel
 from apps.common.utils import truncate
 from apps.slack.models.conversation import Conversation
@@ -19,13 +23,24 @@ class Message(TimestampedModel):
         """Model options."""
 
         db_table = "slack_messages"
+        indexes = [
+            GinIndex(fields=["search_vector"], name="message_search_vector_gin_idx"),
+        ]
         verbose_name_plural = "Messages"
         unique_together = ("conversation", "slack_message_id")
 
+    cleaned_text = models.TextField(verbose_name="Cleaned text", blank=True, default="")
     created_at = models.DateTimeField(verbose_name="Created at")
     has_replies = models.BooleanField(verbose_name="Has replies", default=False)
     raw_data = models.JSONField(verbose_name="Raw data", default=dict)
+    search_vector = models.GeneratedField(
+        db_persist=True,
+        expression=SearchVector("cleaned_text", config=TEXT_SEARCH_CONFIG),
+        output_field=SearchVectorField(),
+        verbose_name="Search vector",
+    )
     slack_message_id = models.CharField(verbose_name="Slack message ID", max_length=50)
+    text = models.TextField(verbose_name="Text", blank=True, default="")
 
     # FKs.
     author = models.ForeignKey(
@@ -47,23 +62,9 @@ class Message(TimestampedModel):
         return (
             f"{self.raw_data['channel']} huddle"
             if self.raw_data.get("subtype") == "huddle_thread"
-            else truncate(self.raw_data["text"], 50)
+            else truncate(self.text, 50)
         )
 
-    @property
-    def cleaned_text(self) -> str:
-        """Get cleaned text from the message."""
-        if not self.text:
-            return ""
-
-        text = emoji.demojize(self.text)  # Remove emojis.
-        text = re.sub(r"<@U[A-Z0-9]+>", "", text)  # Remove user mentions.
-        text = re.sub(r"<https?://[^>]+>", "", text)  # Remove links.
-        text = re.sub(r":\w+:", "", text)  # Remove emoji aliases.
-        text = re.sub(r"\s+", " ", text)  # Normalize whitespace.
-
-        return text.strip()
-
     @property
     def latest_reply(self) -> "Message | None":
         """Get the latest reply to this message."""
@@ -81,15 +82,10 @@ class Message(TimestampedModel):
         """Get the subtype of the message if it exists."""
         return self.raw_data.get("subtype")
 
-    @property
-    def text(self) -> str:
-        """Get the text of the message."""
-        return self.raw_data.get("text", "")
-
     @property
     def ts(self) -> str:
         """Get the message timestamp."""
-        return self.raw_data["ts"]
+        return self.slack_message_id
 
     @property
     def url(self):
@@ -114,6 +110,8 @@ class Message(TimestampedModel):
         self.is_bot = message_data.get("bot_id") is not None
         self.raw_data = message_data
         self.slack_message_id = message_data.get("ts", "")
+        self.text = message_data.get("text", "")
+        self.cleaned_text = Message.clean_text(self.text)
 
         self.author = author
         self.conversation = conversation
@@ -124,6 +122,44 @@ class Message(TimestampedModel):
         """Bulk save messages."""
         BulkSaveModel.bulk_save(Message, messages, fields=fields)
 
+    @staticmethod
+    def clean_text(text: str) -> str:
+        """Clean message text for search and AI processing.
+
+        Args:
+            text (str): The message text.
+
+        Returns:
+            str: The text without emojis, user mentions and links.
+
+        """
+        if not text:
+            return ""
+
+        text = emoji.demojize(text)  # Remove emojis.
+        text = re.sub(r"<@U[A-Z0-9]+>", "", text)  # Remove user mentions.
+        text = re.sub(r"<https?://[^>]+>", "", text)  # Remove links.
+        text = re.sub(r":\w+:", "", text)  # Remove emoji aliases.
+        text = re.sub(r"\s+", " ", text)  # Normalize whitespace.
+
+        return text.strip()
+
+    @staticmethod
+    def search(query: str, queryset: QuerySet | None = None) -> QuerySet:
+        """Search messages by keywords using the full-text index.
+
+        Args:
+            query (str): The web search syntax query.
+            queryset (QuerySet, optional): The messages to search, all by default.
+
+        Returns:
+            QuerySet: The matching messages.
+
+        """
+        return (Message.objects.all() if queryset is None else queryset).filter(
+            search_vector=SearchQuery(query, config=TEXT_SEARCH_CONFIG, search_type="websearch")
+        )
+
     @staticmethod
     def update_data(
         data: dict,
@@ -0,0 +1,140 @@
+"""Slack Web API rate limits shared by concurrent callers."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING
+
+from slack_sdk.errors import SlackApiError
+
+from apps.slack.constants import (
+    RATE_LIMIT_DEFAULT_TIER,
+    RATE_LIMIT_METHOD_TIERS,
+    RATE_LIMIT_RETRY_AFTER_SECONDS,
+    RATE_LIMIT_TIER_REQUESTS_PER_MINUTE,
+)
+
+if TYPE_CHECKING:
+    from slack_sdk import WebClient
+    from slack_sdk.web import SlackResponse
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """Thread safe token bucket refilled at a constant rate."""
+
+    def __init__(self, requests_per_minute: int, capacity: int = 1) -> None:
+        """Initialize the token bucket.
+
+        Args:
+            requests_per_minute (int): The refill rate.
+            capacity (int): The maximum number of requests sent in a burst.
+
+        """
+        self.capacity = capacity
+        self.interval = 60 / requests_per_minute
+        self.lock = threading.Lock()
+        self.resume_at = 0.0
+        self.tokens = float(capacity)
+        self.updated_at = time.monotonic()
+
+    def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(
+                    self.capacity, self.tokens + (now - self.updated_at) / self.interval
+                )
+                self.updated_at = now
+                if now >= self.resume_at and self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+
+                delay = max(self.resume_at - now, (1 - self.tokens) * self.interval)
+
+            time.sleep(delay)
+
+    def pause(self, seconds: float) -> None:
+        """Stop handing out tokens for a while.
+
+        Args:
+            seconds (float): The pause duration.
+
+        """
+        with self.lock:
+            self.resume_at = max(self.resume_at, time.monotonic() + seconds)
+            self.tokens = 0.0
+
+
+class RateLimitedClient:
+    """Slack Web API client calling methods within their rate limit tiers.
+
+    Each method has its own token bucket shared by all threads using the client, so
+    a workspace client should be shared by all concurrent callers. Rate limited calls
+    pause the method bucket for the `Retry-After` period and are retried.
+    """
+
+    def __init__(self, client: WebClient, max_retries: int = 5) -> None:
+        """Initialize the rate limited client.
+
+        Args:
+            client (WebClient): The Slack Web API client.
+            max_retries (int): The maximum number of retries of rate limited calls.
+
+        """
+        self.buckets: dict[str, TokenBucket] = {}
+        self.client = client
+        self.lock = threading.Lock()
+        self.max_retries = max_retries
+
+    def get_bucket(self, method: str) -> TokenBucket:
+        """Get the token bucket of a method.
+
+        Args:
+            method (str): The WebClient method name.
+
+        Returns:
+            TokenBucket: The method token bucket.
+
+        """
+        with self.lock:
+            if method not in self.buckets:
+                tier = RATE_LIMIT_METHOD_TIERS.get(method, RATE_LIMIT_DEFAULT_TIER)
+                self.buckets[method] = TokenBucket(RATE_LIMIT_TIER_REQUESTS_PER_MINUTE[tier])
+
+            return self.buckets[method]
+
+    def call(self, method: str, **kwargs) -> SlackResponse:
+        """Call a Web API method once its rate limit allows it.
+
+        Args:
+            method (str): The WebClient method name, e.g. conversations_history.
+            **kwargs: The method arguments.
+
+        Returns:
+            SlackResponse: The method response.
+
+        Raises:
+            SlackApiError: If the call fails or is still rate limited after all retries.
+
+        """
+        bucket = self.get_bucket(method)
+        retry_count = 0
+        while True:
+            bucket.acquire()
+            try:
+                return getattr(self.client, method)(**kwargs)
+            except SlackApiError as e:
+                if e.response.get("error") != "ratelimited" or retry_count >= self.max_retries:
+                    raise
+
+                retry_after = float(
+                    e.response.headers.get("Retry-After", RATE_LIMIT_RETRY_AFTER_SECONDS)
+                )
+                retry_count += 1
+                logger.warning("Slack %s rate limited, retrying after %ss", method, retry_after)
+                bucket.pause(retry_after)
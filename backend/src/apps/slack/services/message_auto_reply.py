@@ -1,17 +1,45 @@
 """Slack service tasks for background processing."""
 
 import logging
+from datetime import timedelta
 
+import django_rq
 from django_rq import job
 from slack_sdk.errors import SlackApiError
 
+from apps.ai.common.constants import QUEUE_RESPONSE_TIME_MINUTES
 from apps.slack.apps import SlackConfig
-from apps.slack.common.handlers.ai import get_blocks, process_ai_query
+from apps.slack.common.handlers.ai import get_blocks, get_question_detector, process_ai_query
+from apps.slack.common.question_classifier import QuestionClassifier
 from apps.slack.models import Message
 
 logger = logging.getLogger(__name__)
 
 
+@job("ai")
+def detect_owasp_question(message_id: int):
+    """Check if a message is an OWASP question and schedule an AI reply.
+
+    Only the messages passing the local pre-classifier are checked with the LLM.
+    """
+    try:
+        message = Message.objects.get(pk=message_id)
+    except Message.DoesNotExist:
+        return
+
+    if not QuestionClassifier().is_candidate(message.text):
+        return
+
+    if not get_question_detector().is_owasp_question(message.text):
+        return
+
+    django_rq.get_queue("ai").enqueue_in(
+        timedelta(minutes=QUEUE_RESPONSE_TIME_MINUTES),
+        generate_ai_reply_if_unanswered,
+        message.id,
+    )
+
+
 @job("ai")
 def generate_ai_reply_if_unanswered(message_id: int):
     """Check if a message is still unanswered and generate AI reply."""
@@ -0,0 +1,6 @@
+from .command_cache import (
+    chapter_post_save_invalidate_command_cache,
+    committee_post_save_invalidate_command_cache,
+    project_post_save_invalidate_command_cache,
+    user_post_save_invalidate_command_cache,
+)
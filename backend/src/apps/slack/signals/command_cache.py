@@ -0,0 +1,34 @@
+"""Signal handlers for entity post_save to invalidate Slack command results."""
+
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from apps.github.models.user import User
+from apps.owasp.models.chapter import Chapter
+from apps.owasp.models.committee import Committee
+from apps.owasp.models.project import Project
+from apps.slack.common.command_cache import CommandCache
+
+
+@receiver(post_save, sender=Chapter)
+def chapter_post_save_invalidate_command_cache(sender, instance, **kwargs):  # noqa: ARG001
+    """Signal handler to invalidate the cached /chapters command results."""
+    CommandCache("chapters").invalidate()
+
+
+@receiver(post_save, sender=Committee)
+def committee_post_save_invalidate_command_cache(sender, instance, **kwargs):  # noqa: ARG001
+    """Signal handler to invalidate the cached /committees command results."""
+    CommandCache("committees").invalidate()
+
+
+@receiver(post_save, sender=Project)
+def project_post_save_invalidate_command_cache(sender, instance, **kwargs):  # noqa: ARG001
+    """Signal handler to invalidate the cached /projects command results."""
+    CommandCache("projects").invalidate()
+
+
+@receiver(post_save, sender=User)
+def user_post_save_invalidate_command_cache(sender, instance, **kwargs):  # noqa: ARG001
+    """Signal handler to invalidate the cached /users command results."""
+    CommandCache("users").invalidate()
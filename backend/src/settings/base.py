@@ -2,6 +2,7 @@
 
 import os
 import ssl
+import tempfile
 from pathlib import Path
 
 from configurations import Configuration, values
@@ -162,7 +163,14 @@ class Base(Configuration):
             "LOCATION": f"{'rediss' if REDIS_USE_TLS else 'redis'}://{REDIS_HOST}:6379",
             "OPTIONS": REDIS_CACHE_OPTIONS,
             "TIMEOUT": 300,
-        }
+        },
+        # GitHub conditional request responses are kept in a bounded local store
+        # instead of the Redis instance shared with the RQ queues.
+        "github-http": {
+            "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+            "LOCATION": Path(tempfile.gettempdir()) / "nest-github-http-cache",
+            "OPTIONS": {"MAX_ENTRIES": 2000},
+        },
     }
 
     RQ_QUEUES = {
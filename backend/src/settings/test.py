@@ -11,6 +11,10 @@ class Test(Base):
             "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
             "LOCATION": "test-cache",
         },
+        "github-http": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "test-github-http-cache",
+        },
     }
 
     IS_TEST_ENVIRONMENT = True
@@ -2,9 +2,17 @@
 
 from unittest.mock import MagicMock
 
+import pytest
+from django.core.cache import cache
+
 from apps.ai.agent.agent import AgenticRAGAgent
 
 
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+
+
 class TestAgenticRAGAgent:
     """Tests for AgenticRAGAgent."""
 
@@ -94,3 +102,42 @@ class TestAgenticRAGAgent:
         mock_graph_instance.add_edge.assert_any_call("generate", "evaluate")
         mock_graph_instance.add_conditional_edges.assert_called_once()
         mock_graph_instance.compile.assert_called_once()
+
+    def test_run_serves_cached_answer(self, mocker):
+        """Test repeated queries with the same chunks are answered from cache."""
+        mock_nodes = mocker.patch(f"{self.target_module}.AgentNodes").return_value
+        mock_nodes.retrieve.side_effect = lambda state: {
+            **state,
+            "context_chunks": [{"chunk_id": 2}, {"chunk_id": 1}],
+        }
+        mock_state_graph = mocker.patch(f"{self.target_module}.StateGraph")
+        mock_compiled_graph = mock_state_graph.return_value.compile.return_value
+        mock_compiled_graph.invoke.return_value = {
+            "answer": "Test answer",
+            "evaluation": {"complete": True},
+        }
+        tokens = []
+
+        agent = AgenticRAGAgent()
+        first_result = agent.run("What is OWASP?")
+        second_result = agent.run("what is  OWASP?", on_token=tokens.append)
+
+        mock_compiled_graph.invoke.assert_called_once()
+        assert second_result == first_result
+        assert tokens == ["Test answer"]
+
+    def test_run_does_not_cache_incomplete_answer(self, mocker):
+        """Test answers that did not pass evaluation are not cached."""
+        mock_nodes = mocker.patch(f"{self.target_module}.AgentNodes").return_value
+        mock_nodes.retrieve.side_effect = lambda state: {**state, "context_chunks": []}
+        mock_state_graph = mocker.patch(f"{self.target_module}.StateGraph")
+        mock_compiled_graph = mock_state_graph.return_value.compile.return_value
+        mock_compiled_graph.invoke.return_value = {"evaluation": {"complete": False}}
+        on_token = MagicMock()
+
+        agent = AgenticRAGAgent()
+        agent.run("What is OWASP?", on_token=on_token)
+        agent.run("What is OWASP?")
+
+        assert mock_compiled_graph.invoke.call_count == 2
+        assert mock_compiled_graph.invoke.call_args_list[0][0][0]["on_token"] is on_token
@@ -0,0 +1,48 @@
+"""Tests for the answer cache."""
+
+import pytest
+from django.core.cache import cache
+
+from apps.ai.agent.answer_cache import AnswerCache
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+
+
+class TestAnswerCache:
+    def test_answer_round_trip(self):
+        answer_cache = AnswerCache()
+        result = {"answer": "OWASP is a foundation."}
+
+        assert answer_cache.get_answer("What is OWASP?", [1, 2]) is None
+
+        answer_cache.set_answer("What is OWASP?", [1, 2], result)
+
+        assert answer_cache.get_answer("  what is OWASP? ", [2, 1]) == result
+
+    def test_answer_invalidated_by_chunks(self):
+        answer_cache = AnswerCache()
+        answer_cache.set_answer("What is OWASP?", [1, 2], {"answer": "OWASP"})
+
+        assert answer_cache.get_answer("What is OWASP?", [1, 3]) is None
+        assert answer_cache.get_answer("What is OWASP?", [1]) is None
+
+    def test_metadata_round_trip(self):
+        answer_cache = AnswerCache()
+
+        assert answer_cache.get_metadata("find projects") is None
+
+        answer_cache.set_metadata("find projects", {"entity_types": ["project"]})
+
+        assert answer_cache.get_metadata("Find projects") == {"entity_types": ["project"]}
+
+    def test_get_key(self):
+        answer_cache = AnswerCache()
+
+        assert answer_cache.get_key("answer", "query", []) != answer_cache.get_key(
+            "answer", "query"
+        )
+        assert answer_cache.get_key("answer", "query").startswith("ai-answer:answer:")
+        assert answer_cache.get_key("metadata", "query").startswith("ai-answer:metadata:")
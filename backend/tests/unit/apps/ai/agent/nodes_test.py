@@ -1,5 +1,6 @@
 import openai
 import pytest
+from django.core.cache import cache
 from django.core.exceptions import ObjectDoesNotExist
 
 from apps.ai.agent.nodes import AgentNodes
@@ -7,6 +8,10 @@ from apps.ai.common.constants import DEFAULT_CHUNKS_RETRIEVAL_LIMIT, DEFAULT_SIM
 
 
 class TestAgentNodes:
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        cache.clear()
+
     @pytest.fixture
     def mock_openai(self, mocker):
         mocker.patch("os.getenv", return_value="fake-key")
@@ -91,6 +96,19 @@ class TestAgentNodes:
         assert len(new_state["history"]) == 1
         assert new_state["history"][0]["answer"] == "Generated answer"
 
+    def test_generate_streams_first_answer_only(self, nodes):
+        on_token = lambda _: None  # noqa: E731
+        nodes.generator.generate_answer.return_value = "Generated answer"
+
+        nodes.generate({"query": "test query", "context_chunks": [], "on_token": on_token})
+        nodes.generate(
+            {"query": "test query", "context_chunks": [], "iteration": 1, "on_token": on_token}
+        )
+
+        calls = nodes.generator.generate_answer.call_args_list
+        assert calls[0].kwargs["on_token"] is on_token
+        assert calls[1].kwargs["on_token"] is None
+
     def test_evaluate_requires_more_context(self, nodes, mocker):
         state = {"query": "test", "answer": "unsure", "extracted_metadata": {}}
 
@@ -260,6 +278,23 @@ class TestAgentNodes:
         assert metadata["entity_types"] == ["project"]
         assert metadata["intent"] == "search"
 
+    def test_extract_query_metadata_cached(self, nodes, mocker):
+        """Test metadata of repeated queries is served from cache."""
+        mocker.patch(
+            "apps.ai.agent.nodes.Prompt.get_metadata_extractor_prompt", return_value="sys prompt"
+        )
+
+        mock_response = mocker.Mock()
+        mock_response.choices = [mocker.Mock()]
+        mock_response.choices[0].message.content = '{"entity_types": ["project"]}'
+        nodes.openai_client.chat.completions.create.return_value = mock_response
+
+        nodes.extract_query_metadata("find OWASP projects")
+        metadata = nodes.extract_query_metadata("Find  OWASP projects")
+
+        assert metadata == {"entity_types": ["project"]}
+        nodes.openai_client.chat.completions.create.assert_called_once()
+
     def test_call_evaluator_openai_error(self, nodes, mocker):
         nodes.generator.prepare_context.return_value = "ctx"
         mocker.patch(
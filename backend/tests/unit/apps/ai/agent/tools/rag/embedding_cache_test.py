@@ -0,0 +1,98 @@
+"""Tests for the query embedding cache."""
+
+from unittest.mock import patch
+
+import pytest
+from django.core.cache import cache
+
+from apps.ai.agent.tools.rag.embedding_cache import EmbeddingCache
+
+
+@pytest.fixture(autouse=True)
+def clear_embedding_cache():
+    EmbeddingCache.reset()
+    cache.clear()
+
+
+class TestEmbeddingCache:
+    """Test cases for the EmbeddingCache class."""
+
+    def test_for_model_returns_shared_instance(self):
+        """Test the same instance is returned per model."""
+        assert EmbeddingCache.for_model("model-a") is EmbeddingCache.for_model("model-a")
+        assert EmbeddingCache.for_model("model-a") is not EmbeddingCache.for_model("model-b")
+
+    def test_get_key_is_namespaced_by_model(self):
+        """Test cache keys differ per model and ignore whitespace differences."""
+        cache_a = EmbeddingCache("model-a")
+        cache_b = EmbeddingCache("model-b")
+
+        assert cache_a.get_key("what is  ZAP?") == cache_a.get_key(" what is ZAP? ")
+        assert cache_a.get_key("what is ZAP?") != cache_b.get_key("what is ZAP?")
+        assert cache_a.get_key("what is ZAP?").startswith("ai-query-embedding:model-a:")
+
+    def test_get_miss(self):
+        """Test a cache miss is counted."""
+        embedding_cache = EmbeddingCache("model")
+
+        assert embedding_cache.get("query") is None
+        assert embedding_cache.stats == {"local_hits": 0, "misses": 1, "shared_hits": 0}
+
+    def test_get_local_hit(self):
+        """Test a local hit does not reach the shared cache."""
+        embedding_cache = EmbeddingCache("model")
+        embedding_cache.set("query", [0.1, 0.2])
+
+        with patch("apps.ai.agent.tools.rag.embedding_cache.cache") as mock_cache:
+            assert embedding_cache.get("query") == [0.1, 0.2]
+            mock_cache.get.assert_not_called()
+
+        assert embedding_cache.stats["local_hits"] == 1
+
+    def test_get_shared_hit(self):
+        """Test a shared hit fills the local tier."""
+        EmbeddingCache("model").set("query", [0.1, 0.2])
+        embedding_cache = EmbeddingCache("model")
+
+        assert embedding_cache.get("query") == [0.1, 0.2]
+        assert embedding_cache.get("query") == [0.1, 0.2]
+        assert embedding_cache.stats == {"local_hits": 1, "misses": 0, "shared_hits": 1}
+
+    def test_shared_cache_errors_fall_back(self):
+        """Test shared cache failures are logged and treated as misses."""
+        embedding_cache = EmbeddingCache("model")
+
+        with (
+            patch("apps.ai.agent.tools.rag.embedding_cache.cache") as mock_cache,
+            patch("apps.ai.agent.tools.rag.embedding_cache.logger") as mock_logger,
+        ):
+            mock_cache.get.side_effect = ConnectionError
+            mock_cache.set.side_effect = ConnectionError
+
+            assert embedding_cache.get("query") is None
+            embedding_cache.set("query", [0.1])
+
+        assert embedding_cache.get("query") == [0.1]
+        assert embedding_cache.stats["misses"] == 1
+        assert mock_logger.warning.call_count == 2
+
+    def test_local_entry_expires(self):
+        """Test expired local entries fall back to the shared tier."""
+        embedding_cache = EmbeddingCache("model", local_ttl=0)
+        embedding_cache.set("query", [0.1])
+
+        assert embedding_cache.get("query") == [0.1]
+        assert embedding_cache.stats == {"local_hits": 0, "misses": 0, "shared_hits": 1}
+
+    def test_local_lru_eviction(self):
+        """Test the least recently used local entry is evicted."""
+        embedding_cache = EmbeddingCache("model", local_max_size=2)
+        embedding_cache.set("first", [1.0])
+        embedding_cache.set("second", [2.0])
+        embedding_cache.get("first")
+        embedding_cache.set("third", [3.0])
+
+        assert list(embedding_cache.local) == [
+            embedding_cache.get_key("first"),
+            embedding_cache.get_key("third"),
+        ]
@@ -129,6 +129,30 @@ class TestGenerator:
             assert call_args[1]["messages"][0]["role"] == "system"
             assert call_args[1]["messages"][1]["role"] == "user"
 
+    def test_generate_answer_streamed(self):
+        """Test answer tokens are passed to the callback as they are generated."""
+        with (
+            patch.dict(os.environ, {"DJANGO_OPEN_AI_SECRET_KEY": "test-key"}),
+            patch("openai.OpenAI") as mock_openai,
+            patch(
+                "apps.core.models.prompt.Prompt.get_rag_system_prompt",
+                return_value="System prompt",
+            ),
+        ):
+            events = [MagicMock(), MagicMock(), MagicMock(choices=[])]
+            events[0].choices[0].delta.content = "OWASP is "
+            events[1].choices[0].delta.content = "a foundation. "
+            mock_openai.return_value.chat.completions.create.return_value = iter(events)
+            tokens = []
+
+            generator = Generator()
+            result = generator.generate_answer("What is OWASP?", [], on_token=tokens.append)
+
+            assert result == "OWASP is a foundation."
+            assert tokens == ["OWASP is ", "a foundation. "]
+            call_args = mock_openai.return_value.chat.completions.create.call_args
+            assert call_args[1]["stream"] is True
+
     def test_generate_answer_with_custom_model(self):
         """Test answer generation with custom chat model."""
         with (
@@ -315,8 +339,7 @@ class TestGenerator:
 
             chunks = [{"source_name": "Test", "text": "Test content"}]
 
-            with pytest.raises(AttributeError):
-                generator.generate_answer("Test query", chunks)
+            assert generator.generate_answer("Test query", chunks) == ""
 
     def test_constants(self):
         """Test class constants have expected values."""
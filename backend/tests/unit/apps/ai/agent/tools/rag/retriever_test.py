@@ -5,10 +5,29 @@ from unittest.mock import MagicMock, patch
 
 import openai
 import pytest
+from django.core.cache import cache
 
+from apps.ai.agent.tools.rag.embedding_cache import EmbeddingCache
 from apps.ai.agent.tools.rag.retriever import Retriever
 
 
+@pytest.fixture(autouse=True)
+def clear_embedding_cache():
+    EmbeddingCache.reset()
+    cache.clear()
+
+
+class FakeEmbeddings:
+    """Fake OpenAI embeddings resource."""
+
+    def __init__(self):
+        self.calls = []
+
+    def create(self, input, model):  # noqa: A002
+        self.calls.append(input)
+        return MagicMock(data=[MagicMock(embedding=[float(len(text)) for text in input])])
+
+
 class TestRetriever:
     """Test cases for the Retriever class."""
 
@@ -67,6 +86,30 @@ class TestRetriever:
                 input=["test query"], model="text-embedding-3-small"
             )
 
+    def test_get_query_embedding_cached(self):
+        """Test the embeddings API is called once per distinct query."""
+        with (
+            patch.dict(os.environ, {"DJANGO_OPEN_AI_SECRET_KEY": "test-key"}),
+            patch("openai.OpenAI") as mock_openai,
+        ):
+            fake_embeddings = FakeEmbeddings()
+            mock_openai.return_value = MagicMock(embeddings=fake_embeddings)
+
+            retriever = Retriever()
+            for query in ("first query", "second query", " first   query ", "second query"):
+                retriever.get_query_embedding(query)
+
+            assert fake_embeddings.calls == [["first query"], ["second query"]]
+            assert retriever.embedding_cache.stats == {
+                "local_hits": 2,
+                "misses": 2,
+                "shared_hits": 0,
+            }
+
+            EmbeddingCache.reset()
+            assert Retriever().get_query_embedding("first query") == [11.0]
+            assert len(fake_embeddings.calls) == 2
+
     def test_get_query_embedding_openai_error(self):
         """Test query embedding with OpenAI API error."""
         with (
@@ -449,8 +492,11 @@ class TestRetriever:
             "project",
         }
 
+    @patch("apps.ai.agent.tools.rag.retriever.transaction")
+    @patch("apps.ai.agent.tools.rag.retriever.Retriever.set_search_options")
+    @patch("apps.ai.agent.tools.rag.retriever.Retriever.get_entity_type_ids")
     @patch("apps.ai.agent.tools.rag.retriever.Chunk")
-    def test_retrieve_with_app_label_content_types(self, mock_chunk):
+    def test_retrieve_with_app_label_content_types(self, mock_chunk, mock_get_entity_type_ids, *_):
         """Test retrieve method with app_label.model content types filter."""
         with (
             patch.dict(os.environ, {"DJANGO_OPEN_AI_SECRET_KEY": "test-key"}),
@@ -474,15 +520,20 @@ class TestRetriever:
             mock_final.__getitem__ = MagicMock(return_value=[])
 
             retriever = Retriever()
+            mock_get_entity_type_ids.return_value = [1]
             result = retriever.retrieve("test query", content_types=["owasp.chapter"])
 
             assert result == []
             mock_chunk.objects.annotate.assert_called_once()
             mock_annotated.filter.assert_called_once()
-            mock_filtered.filter.assert_called_once()
+            mock_filtered.filter.assert_called_once_with(context__entity_type_id__in=[1])
+            mock_final.order_by.assert_called_once_with("distance")
+            mock_get_entity_type_ids.assert_called_once_with(["owasp.chapter"])
 
+    @patch("apps.ai.agent.tools.rag.retriever.transaction")
+    @patch("apps.ai.agent.tools.rag.retriever.Retriever.set_search_options")
     @patch("apps.ai.agent.tools.rag.retriever.Chunk")
-    def test_retrieve_successful_with_chunks(self, mock_chunk):
+    def test_retrieve_successful_with_chunks(self, mock_chunk, *_):
         """Test retrieve method with successful chunk retrieval."""
         with (
             patch.dict(os.environ, {"DJANGO_OPEN_AI_SECRET_KEY": "test-key"}),
@@ -499,18 +550,22 @@ class TestRetriever:
             mock_content_object.__class__.__name__ = "Chapter"
             mock_content_object.suggested_location = "New York"
 
+            mock_content_object.pk = "123"
+
             mock_entity_type = MagicMock()
+            mock_entity_type.id = 1
             mock_entity_type.model = "chapter"
+            mock_entity_type.get_all_objects_for_this_type.return_value = [mock_content_object]
 
             mock_context = MagicMock()
-            mock_context.entity = mock_content_object
             mock_context.entity_type = mock_entity_type
+            mock_context.entity_type_id = 1
             mock_context.entity_id = "123"
 
             mock_chunk_instance = MagicMock()
             mock_chunk_instance.id = 1
             mock_chunk_instance.text = "Test chunk text"
-            mock_chunk_instance.similarity = 0.85
+            mock_chunk_instance.distance = 0.15
             mock_chunk_instance.context = mock_context
 
             mock_annotated = MagicMock()
@@ -527,13 +582,17 @@ class TestRetriever:
 
             assert len(result) == 1
             assert result[0]["text"] == "Test chunk text"
+            assert result[0]["similarity"] == pytest.approx(0.85)
             assert result[0]["source_type"] == "chapter"
             assert result[0]["source_name"] == "Test Chapter"
             assert result[0]["source_id"] == "123"
             assert "additional_context" in result[0]
 
+    @patch("apps.ai.agent.tools.rag.retriever.transaction")
+    @patch("apps.ai.agent.tools.rag.retriever.Retriever.set_search_options")
+    @patch("apps.ai.agent.tools.rag.retriever.Retriever.get_entity_type_ids")
     @patch("apps.ai.agent.tools.rag.retriever.Chunk")
-    def test_retrieve_with_content_types_filter(self, mock_chunk):
+    def test_retrieve_with_content_types_filter(self, mock_chunk, mock_get_entity_type_ids, *_):
         """Test retrieve method with content types filter."""
         with (
             patch.dict(os.environ, {"DJANGO_OPEN_AI_SECRET_KEY": "test-key"}),
@@ -557,16 +616,21 @@ class TestRetriever:
             mock_final.__getitem__ = MagicMock(return_value=[])
 
             retriever = Retriever()
+            mock_get_entity_type_ids.return_value = [1]
             result = retriever.retrieve("test query", content_types=["chapter"])
 
             assert result == []
             mock_chunk.objects.annotate.assert_called_once()
             mock_annotated.filter.assert_called_once()
-            mock_filtered.filter.assert_called_once()
+            mock_filtered.filter.assert_called_once_with(context__entity_type_id__in=[1])
+            mock_final.order_by.assert_called_once_with("distance")
+            mock_get_entity_type_ids.assert_called_once_with(["chapter"])
 
+    @patch("apps.ai.agent.tools.rag.retriever.transaction")
+    @patch("apps.ai.agent.tools.rag.retriever.Retriever.set_search_options")
     @patch("apps.ai.agent.tools.rag.retriever.logger")
     @patch("apps.ai.agent.tools.rag.retriever.Chunk")
-    def test_retrieve_with_none_content_object(self, mock_chunk, mock_logger):
+    def test_retrieve_with_none_content_object(self, mock_chunk, mock_logger, *_):
         """Test retrieve method when content object is None."""
         with (
             patch.dict(os.environ, {"DJANGO_OPEN_AI_SECRET_KEY": "test-key"}),
@@ -599,6 +663,128 @@ class TestRetriever:
                 "Content object is None for chunk %s. Skipping.", 1
             )
 
+    @patch("apps.ai.agent.tools.rag.retriever.Retriever.get_hybrid_chunks")
+    @patch("apps.ai.agent.tools.rag.retriever.Retriever.get_entity_type_ids")
+    @patch("apps.ai.agent.tools.rag.retriever.Chunk")
+    def test_retrieve_hybrid(self, mock_chunk, mock_get_entity_type_ids, mock_get_hybrid_chunks):
+        """Test retrieve method in hybrid mode."""
+        with (
+            patch.dict(os.environ, {"DJANGO_OPEN_AI_SECRET_KEY": "test-key"}),
+            patch("openai.OpenAI") as mock_openai,
+        ):
+            mock_openai.return_value.embeddings = FakeEmbeddings()
+            mock_get_entity_type_ids.return_value = [1]
+            mock_get_hybrid_chunks.return_value = []
+
+            retriever = Retriever()
+            result = retriever.retrieve(
+                "OWASP ZAP", limit=5, content_types=["project"], hybrid=True
+            )
+
+            assert result == []
+            mock_get_hybrid_chunks.assert_called_once_with("OWASP ZAP", [9.0], 5, 0.1, [1])
+            mock_chunk.objects.annotate.assert_not_called()
+
+    @patch("apps.ai.agent.tools.rag.retriever.prefetch_related_objects")
+    @patch("apps.ai.agent.tools.rag.retriever.transaction")
+    @patch("apps.ai.agent.tools.rag.retriever.Retriever.set_search_options")
+    @patch("apps.ai.agent.tools.rag.retriever.Chunk")
+    def test_get_hybrid_chunks(
+        self, mock_chunk, mock_set_search_options, mock_transaction, mock_prefetch
+    ):
+        """Test hybrid chunks are fused in a single raw query."""
+        with (
+            patch.dict(os.environ, {"DJANGO_OPEN_AI_SECRET_KEY": "test-key"}),
+            patch("openai.OpenAI"),
+        ):
+            chunks = [MagicMock(), MagicMock()]
+            mock_chunk.objects.raw.return_value = iter(chunks)
+
+            retriever = Retriever()
+            result = retriever.get_hybrid_chunks("CVE-2021-44228", [0.1, 0.2], 8, 0.25, None)
+
+            assert result == chunks
+            mock_set_search_options.assert_called_once()
+            mock_prefetch.assert_called_once_with(chunks, "context__entity_type")
+
+            sql, params = mock_chunk.objects.raw.call_args[0]
+            assert "websearch_to_tsquery" in sql
+            assert "UNION ALL" in sql
+            assert params == {
+                "candidates_limit": 32,
+                "config": "english",
+                "embedding": "[0.1, 0.2]",
+                "entity_type_ids": None,
+                "limit": 8,
+                "max_distance": 0.75,
+                "query": "CVE-2021-44228",
+                "rrf_k": 60,
+            }
+
+    def test_get_entities(self):
+        """Test entities are loaded with one query per entity type."""
+        with (
+            patch.dict(os.environ, {"DJANGO_OPEN_AI_SECRET_KEY": "test-key"}),
+            patch("openai.OpenAI"),
+        ):
+            retriever = Retriever()
+
+            message_type = MagicMock(id=1, model="message")
+            messages = [MagicMock(pk=10), MagicMock(pk=11)]
+            message_queryset = message_type.get_all_objects_for_this_type.return_value
+            message_queryset.select_related.return_value = messages
+            project_type = MagicMock(id=2, model="project")
+            project = MagicMock(pk=20)
+            project_type.get_all_objects_for_this_type.return_value = [project]
+
+            chunks = [
+                MagicMock(context=MagicMock(entity_type=message_type, entity_id=10)),
+                MagicMock(context=MagicMock(entity_type=project_type, entity_id=20)),
+                MagicMock(context=MagicMock(entity_type=message_type, entity_id=11)),
+                MagicMock(context=MagicMock(entity_type=message_type, entity_id=10)),
+                MagicMock(context=None),
+            ]
+
+            result = retriever.get_entities(chunks)
+
+            assert result == {(1, 10): messages[0], (1, 11): messages[1], (2, 20): project}
+            message_type.get_all_objects_for_this_type.assert_called_once_with(pk__in={10, 11})
+            message_queryset.select_related.assert_called_once_with(
+                "author", "conversation", "parent_message"
+            )
+            project_type.get_all_objects_for_this_type.assert_called_once_with(pk__in={20})
+
+    @patch("apps.ai.agent.tools.rag.retriever.ContentType")
+    def test_get_entity_type_ids(self, mock_content_type):
+        """Test resolving content type names to content type IDs."""
+        with (
+            patch.dict(os.environ, {"DJANGO_OPEN_AI_SECRET_KEY": "test-key"}),
+            patch("openai.OpenAI"),
+        ):
+            mock_content_type.objects.filter.return_value.values_list.return_value = [1, 2]
+
+            retriever = Retriever()
+            result = retriever.get_entity_type_ids(["owasp.Chapter", "project"])
+
+            assert result == [1, 2]
+            content_type_query = mock_content_type.objects.filter.call_args[0][0]
+            assert ("app_label", "owasp") in content_type_query.children[0].children
+            assert ("model", "project") in content_type_query.children
+
+    @patch("apps.ai.agent.tools.rag.retriever.connection")
+    def test_set_search_options(self, mock_connection):
+        """Test HNSW search options are set for the current transaction."""
+        with (
+            patch.dict(os.environ, {"DJANGO_OPEN_AI_SECRET_KEY": "test-key"}),
+            patch("openai.OpenAI"),
+        ):
+            mock_cursor = mock_connection.cursor.return_value.__enter__.return_value
+
+            Retriever().set_search_options()
+
+            mock_cursor.execute.assert_any_call("SET LOCAL hnsw.ef_search = %s", [100])
+            mock_cursor.execute.assert_any_call("SET LOCAL hnsw.iterative_scan = relaxed_order")
+
     def test_get_additional_context_message_with_author(self):
         """Test getting additional context for message with named author."""
         with (
@@ -39,6 +39,27 @@ def mock_queryset():
     return Mock()
 
 
+class FakeQuerySet:
+    """Minimal queryset supporting primary key keyset pagination."""
+
+    def __init__(self, entities):
+        self.entities = entities
+
+    def __getitem__(self, slice_obj):
+        """Slice the entities."""
+        return self.entities[slice_obj]
+
+    def count(self):
+        return len(self.entities)
+
+    def filter(self, pk__gt):
+        return FakeQuerySet([entity for entity in self.entities if entity.pk > pk__gt])
+
+    def order_by(self, field):
+        assert field == "pk"
+        return FakeQuerySet(sorted(self.entities, key=lambda entity: entity.pk))
+
+
 class ConcreteAICommand(BaseAICommand):
     """Concrete implementation of BaseAICommand for testing."""
 
@@ -101,7 +122,7 @@ class TestBaseAICommand:
 
         command.add_common_arguments(parser)
 
-        assert parser.add_argument.call_count == 3
+        assert parser.add_argument.call_count == 4
 
         calls = parser.add_argument.call_args_list
 
@@ -118,6 +139,9 @@ class TestBaseAICommand:
         assert calls[2][1]["default"] == 50
         assert "Number of test_entities to process in each batch" in calls[2][1]["help"]
 
+        assert calls[3][0] == ("--resume",)
+        assert calls[3][1]["action"] == "store_true"
+
     def test_add_arguments_calls_common(self, command):
         parser = Mock()
 
@@ -203,40 +227,36 @@ class TestBaseAICommand:
             call_args = mock_write.call_args[0][0]
             assert "DJANGO_OPEN_AI_SECRET_KEY environment variable not set" in str(call_args)
 
-    def test_handle_batch_processing_empty_queryset(self, command, mock_queryset):
-        mock_queryset.count.return_value = 0
+    def test_handle_batch_processing_empty_queryset(self, command):
         process_batch_func = Mock()
 
         with patch.object(command.stdout, "write") as mock_write:
-            command.handle_batch_processing(mock_queryset, 10, process_batch_func)
+            command.handle_batch_processing(FakeQuerySet([]), 10, process_batch_func)
 
             mock_write.assert_called_once_with("No test_entities found to process")
             process_batch_func.assert_not_called()
 
     def test_handle_batch_processing_with_data(self, command):
-        mock_entities = [Mock() for _ in range(15)]
-
-        mock_queryset = Mock()
-        mock_queryset.count.return_value = 15
-
-        def mock_getitem(slice_obj):
-            start = slice_obj.start or 0
-            stop = slice_obj.stop
-            return mock_entities[start:stop]
-
-        mock_queryset.__getitem__ = Mock(side_effect=mock_getitem)
-
+        queryset = FakeQuerySet([Mock(pk=pk) for pk in range(15, 0, -1)])
         process_batch_func = Mock(side_effect=[5, 5, 5])
 
-        with patch.object(command.stdout, "write") as mock_write:
-            command.handle_batch_processing(mock_queryset, 5, process_batch_func)
+        with (
+            patch("apps.ai.common.base.ai_command.cache") as mock_cache,
+            patch.object(command.stdout, "write") as mock_write,
+        ):
+            command.handle_batch_processing(
+                queryset, 5, process_batch_func, checkpoint_key="checkpoint"
+            )
 
             assert process_batch_func.call_count == 3
 
             calls = process_batch_func.call_args_list
-            assert len(calls[0][0][0]) == 5
-            assert len(calls[1][0][0]) == 5
-            assert len(calls[2][0][0]) == 5
+            assert [entity.pk for entity in calls[0][0][0]] == [1, 2, 3, 4, 5]
+            assert [entity.pk for entity in calls[1][0][0]] == [6, 7, 8, 9, 10]
+            assert [entity.pk for entity in calls[2][0][0]] == [11, 12, 13, 14, 15]
+
+            assert [call[0][1] for call in mock_cache.set.call_args_list] == [5, 10, 15]
+            mock_cache.delete.assert_called_once_with("checkpoint")
 
             write_calls = mock_write.call_args_list
             assert len(write_calls) == 2
@@ -244,22 +264,11 @@ class TestBaseAICommand:
             assert "Completed processing 15/15 test_entities" in str(write_calls[1])
 
     def test_handle_batch_processing_partial_processing(self, command):
-        mock_entities = [Mock() for _ in range(10)]
-
-        mock_queryset = Mock()
-        mock_queryset.count.return_value = 10
-
-        def mock_getitem(slice_obj):
-            start = slice_obj.start or 0
-            stop = slice_obj.stop
-            return mock_entities[start:stop]
-
-        mock_queryset.__getitem__ = Mock(side_effect=mock_getitem)
-
+        queryset = FakeQuerySet([Mock(pk=pk) for pk in range(1, 11)])
         process_batch_func = Mock(side_effect=[3, 2])
 
         with patch.object(command.stdout, "write") as mock_write:
-            command.handle_batch_processing(mock_queryset, 5, process_batch_func)
+            command.handle_batch_processing(queryset, 5, process_batch_func)
 
             assert process_batch_func.call_count == 2
 
@@ -267,3 +276,78 @@ class TestBaseAICommand:
             assert len(write_calls) == 2
             assert "Found 10 test_entities to process" in str(write_calls[0])
             assert "Completed processing 5/10 test_entities" in str(write_calls[1])
+
+    def test_handle_batch_processing_resume(self, command):
+        queryset = FakeQuerySet([Mock(pk=pk) for pk in range(1, 11)])
+        process_batch_func = Mock(side_effect=[4])
+
+        with (
+            patch("apps.ai.common.base.ai_command.cache") as mock_cache,
+            patch.object(command.stdout, "write") as mock_write,
+        ):
+            mock_cache.get.return_value = 6
+            command.handle_batch_processing(
+                queryset, 5, process_batch_func, checkpoint_key="checkpoint", resume=True
+            )
+
+            mock_cache.get.assert_called_once_with("checkpoint")
+            assert [entity.pk for entity in process_batch_func.call_args[0][0]] == [7, 8, 9, 10]
+            mock_write.assert_any_call("Resuming after test_entity with ID 6")
+            mock_write.assert_any_call("Found 4 test_entities to process")
+
+    def test_handle_batch_processing_resume_without_checkpoint(self, command):
+        queryset = FakeQuerySet([Mock(pk=pk) for pk in range(1, 4)])
+        process_batch_func = Mock(side_effect=[3])
+
+        with (
+            patch("apps.ai.common.base.ai_command.cache") as mock_cache,
+            patch.object(command.stdout, "write"),
+        ):
+            mock_cache.get.return_value = None
+            command.handle_batch_processing(
+                queryset, 5, process_batch_func, checkpoint_key="checkpoint", resume=True
+            )
+
+            assert len(process_batch_func.call_args[0][0]) == 3
+
+    def test_handle_batch_processing_interrupted_keeps_checkpoint(self, command):
+        queryset = FakeQuerySet([Mock(pk=pk) for pk in range(1, 11)])
+        process_batch_func = Mock(side_effect=[5, RuntimeError("Interrupted")])
+
+        with (
+            patch("apps.ai.common.base.ai_command.cache") as mock_cache,
+            patch.object(command.stdout, "write"),
+            pytest.raises(RuntimeError),
+        ):
+            command.handle_batch_processing(
+                queryset, 5, process_batch_func, checkpoint_key="checkpoint"
+            )
+
+        mock_cache.set.assert_called_once_with("checkpoint", 5, timeout=604800)
+        mock_cache.delete.assert_not_called()
+
+    def test_handle_batch_processing_without_checkpoint_key(self, command):
+        queryset = FakeQuerySet([Mock(pk=pk) for pk in range(1, 4)])
+        process_batch_func = Mock(side_effect=[3])
+
+        with (
+            patch("apps.ai.common.base.ai_command.cache") as mock_cache,
+            patch.object(command.stdout, "write"),
+        ):
+            command.handle_batch_processing(queryset, 5, process_batch_func, resume=True)
+
+        assert len(process_batch_func.call_args[0][0]) == 3
+        mock_cache.get.assert_not_called()
+        mock_cache.set.assert_not_called()
+        mock_cache.delete.assert_not_called()
+
+    @pytest.mark.parametrize(
+        ("options", "expected"),
+        [
+            ({}, "ai-command-checkpoint:ai_command_test:default"),
+            ({"all": True}, "ai-command-checkpoint:ai_command_test:all"),
+            ({"all": False, "test_entity_key": "project-x"}, None),
+        ],
+    )
+    def test_get_checkpoint_key(self, command, options, expected):
+        assert command.get_checkpoint_key(options) == expected
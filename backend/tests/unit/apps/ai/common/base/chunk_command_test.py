@@ -53,11 +53,9 @@ def mock_context():
     """Return a mock context instance."""
     context = Mock(spec=Context)
     context.id = 1
-    context.content_type_id = 1
-    context.object_id = 1
-    context.chunks.aggregate.return_value = {"latest_created": None}
-    context.chunks.all.return_value.delete.return_value = (0, {})
-    context.nest_updated_at = Mock()
+    context.entity_id = 1
+    context.latest_chunk_updated_at = None
+    context.nest_updated_at = datetime(2024, 1, 2, tzinfo=UTC)
     return context
 
 
@@ -77,11 +75,29 @@ def mock_chunks():
         chunk = Mock(spec=Chunk)
         chunk.id = i + 1
         chunk.text = f"Chunk text {i + 1}"
-        chunk.context_id = 1
+        chunk.context = Mock(id=1)
         chunks.append(chunk)
     return chunks
 
 
+@pytest.fixture
+def mock_pipeline_class():
+    """Patch the embedding pipeline class."""
+    with patch("apps.ai.common.base.chunk_command.EmbeddingPipeline") as pipeline_class:
+        yield pipeline_class
+
+
+@pytest.fixture
+def mock_pipeline(mock_pipeline_class):
+    """Return the patched embedding pipeline instance."""
+    return mock_pipeline_class.return_value
+
+
+def set_contexts(mock_context_filter, contexts):
+    """Set contexts returned by the context queryset."""
+    mock_context_filter.return_value.annotate.return_value.order_by.return_value = contexts
+
+
 class TestBaseChunkCommand:
     """Test suite for the BaseChunkCommand class."""
 
@@ -114,10 +130,12 @@ class TestBaseChunkCommand:
         command,
         mock_entity,
         mock_content_type,
+        mock_pipeline,
     ):
         """Test process_chunks_batch when no context is found."""
         mock_get_content_type.return_value = mock_content_type
-        mock_context_filter.return_value.first.return_value = None
+        set_contexts(mock_context_filter, [])
+        mock_pipeline.run.return_value = []
 
         with patch.object(command.stdout, "write") as mock_write:
             result = command.process_chunks_batch([mock_entity])
@@ -126,6 +144,35 @@ class TestBaseChunkCommand:
             mock_write.assert_called_once()
             warning_call = mock_write.call_args[0][0]
             assert "No context found for test_entity test-key-123" in str(warning_call)
+            mock_pipeline.add.assert_not_called()
+
+    @patch("apps.ai.common.base.chunk_command.ContentType.objects.get_for_model")
+    @patch("apps.ai.common.base.chunk_command.Context.objects.filter")
+    def test_process_chunks_batch_loads_contexts_once(
+        self,
+        mock_context_filter,
+        mock_get_content_type,
+        command,
+        mock_content_type,
+        mock_pipeline,
+    ):
+        """Test contexts of all entities are loaded with a single query."""
+        entities = [Mock(id=i, test_key=f"key-{i}") for i in (1, 2)]
+        first_context = Mock(entity_id=1, latest_chunk_updated_at=None)
+        duplicate_context = Mock(entity_id=1, latest_chunk_updated_at=None)
+        mock_get_content_type.return_value = mock_content_type
+        set_contexts(mock_context_filter, [first_context, duplicate_context])
+        mock_pipeline.run.return_value = []
+
+        with patch.object(command.stdout, "write") as mock_write:
+            command.process_chunks_batch(entities)
+
+        mock_context_filter.assert_called_once_with(
+            entity_type=mock_content_type, entity_id__in=[1, 2]
+        )
+        mock_pipeline.add.assert_called_once()
+        assert mock_pipeline.add.call_args[0][0] is first_context
+        assert "No context found for test_entity key-2" in str(mock_write.call_args_list)
 
     @patch("apps.ai.common.base.chunk_command.ContentType.objects.get_for_model")
     @patch("apps.ai.common.base.chunk_command.Context.objects.filter")
@@ -137,10 +184,12 @@ class TestBaseChunkCommand:
         mock_entity,
         mock_context,
         mock_content_type,
+        mock_pipeline,
     ):
         """Test process_chunks_batch when extracted content is empty."""
         mock_get_content_type.return_value = mock_content_type
-        mock_context_filter.return_value.first.return_value = mock_context
+        set_contexts(mock_context_filter, [mock_context])
+        mock_pipeline.run.return_value = []
 
         with (
             patch.object(command, "extract_content", return_value=("", "")),
@@ -167,11 +216,13 @@ class TestBaseChunkCommand:
         mock_entity,
         mock_context,
         mock_content_type,
+        mock_pipeline,
     ):
         """Test process_chunks_batch when no chunks are created from text."""
         mock_get_content_type.return_value = mock_content_type
-        mock_context_filter.return_value.first.return_value = mock_context
+        set_contexts(mock_context_filter, [mock_context])
         mock_split_text.return_value = []
+        mock_pipeline.run.return_value = []
 
         with patch.object(command.stdout, "write") as mock_write:
             result = command.process_chunks_batch([mock_entity])
@@ -195,15 +246,15 @@ class TestBaseChunkCommand:
         mock_entity,
         mock_context,
         mock_content_type,
+        mock_pipeline,
     ):
         """Test process_chunks_batch when chunks are already up to date."""
         mock_get_content_type.return_value = mock_content_type
 
         mock_context.nest_updated_at = datetime(2024, 1, 1, tzinfo=UTC)
-        mock_context.chunks.aggregate.return_value = {
-            "latest_created": datetime(2024, 1, 2, tzinfo=UTC)
-        }
-        mock_context_filter.return_value.first.return_value = mock_context
+        mock_context.latest_chunk_updated_at = datetime(2024, 1, 2, tzinfo=UTC)
+        set_contexts(mock_context_filter, [mock_context])
+        mock_pipeline.run.return_value = []
 
         with patch.object(command.stdout, "write") as mock_write:
             result = command.process_chunks_batch([mock_entity])
@@ -211,16 +262,15 @@ class TestBaseChunkCommand:
             assert result == 0
             calls = [str(call) for call in mock_write.call_args_list]
             assert any("already up to date" in str(call) for call in calls)
+            mock_pipeline.add.assert_not_called()
 
     @patch("apps.ai.common.base.chunk_command.ContentType.objects.get_for_model")
     @patch("apps.ai.common.base.chunk_command.Context.objects.filter")
     @patch("apps.ai.models.chunk.Chunk.split_text")
-    @patch("apps.ai.common.base.chunk_command.create_chunks_and_embeddings")
     @patch("apps.ai.models.chunk.Chunk.bulk_save")
     def test_process_chunks_batch_success(
         self,
         mock_bulk_save,
-        mock_create_chunks,
         mock_split_text,
         mock_context_filter,
         mock_get_content_type,
@@ -229,29 +279,22 @@ class TestBaseChunkCommand:
         mock_context,
         mock_content_type,
         mock_chunks,
+        mock_pipeline_class,
+        mock_pipeline,
     ):
         """Test successful chunk processing."""
         mock_get_content_type.return_value = mock_content_type
-        mock_context_filter.return_value.first.return_value = mock_context
-        mock_split_text.return_value = ["chunk1", "chunk2", "chunk3"]
-        mock_create_chunks.return_value = mock_chunks
+        set_contexts(mock_context_filter, [mock_context])
+        mock_split_text.return_value = ["chunk3", "chunk1", "chunk2"]
+        mock_pipeline.run.return_value = mock_chunks
         command.openai_client = Mock()
 
-        with (
-            patch("apps.ai.models.chunk.Chunk.objects.filter") as mock_chunk_filter,
-            patch.object(command.stdout, "write") as mock_write,
-        ):
-            mock_qs = Mock()
-            mock_qs.values_list.return_value = []
-            mock_chunk_filter.return_value = mock_qs
+        with patch.object(command.stdout, "write") as mock_write:
             result = command.process_chunks_batch([mock_entity])
 
             assert result == 1
-            _, kwargs = mock_create_chunks.call_args
-            assert set(kwargs["chunk_texts"]) == {"chunk1", "chunk2", "chunk3"}
-            assert kwargs["context"] == mock_context
-            assert kwargs["openai_client"] == command.openai_client
-            assert not kwargs["save"]
+            mock_pipeline_class.assert_called_once_with(command.openai_client, max_workers=4)
+            mock_pipeline.add.assert_called_once_with(mock_context, ["chunk1", "chunk2", "chunk3"])
             mock_bulk_save.assert_called_once_with(mock_chunks)
             mock_write.assert_has_calls(
                 [
@@ -263,57 +306,56 @@ class TestBaseChunkCommand:
     @patch("apps.ai.common.base.chunk_command.ContentType.objects.get_for_model")
     @patch("apps.ai.common.base.chunk_command.Context.objects.filter")
     @patch("apps.ai.models.chunk.Chunk.split_text")
-    @patch("apps.ai.common.base.chunk_command.create_chunks_and_embeddings")
     @patch("apps.ai.models.chunk.Chunk.bulk_save")
     def test_process_chunks_batch_multiple_entities(
         self,
         mock_bulk_save,
-        mock_create_chunks,
         mock_split_text,
         mock_context_filter,
         mock_get_content_type,
         command,
-        mock_context,
         mock_content_type,
-        mock_chunks,
+        mock_pipeline,
     ):
-        """Test processing multiple entities in a batch."""
+        """Test chunk texts of multiple entities go through a single pipeline run."""
         entities = []
+        contexts = []
+        chunks = []
         for i in range(3):
             entity = Mock()
             entity.id = i + 1
             entity.test_key = f"test-key-{i + 1}"
-            entity.is_active = True
             entities.append(entity)
+            context = Mock(id=i + 1, entity_id=i + 1, latest_chunk_updated_at=None)
+            contexts.append(context)
+            chunks.extend([Mock(context=context), Mock(context=context)])
 
         mock_get_content_type.return_value = mock_content_type
-        mock_context_filter.return_value.first.return_value = mock_context
+        set_contexts(mock_context_filter, contexts)
         mock_split_text.return_value = ["chunk1", "chunk2"]
-        mock_create_chunks.return_value = mock_chunks[:2]
+        mock_pipeline.run.return_value = chunks
         command.openai_client = Mock()
 
-        with (
-            patch("apps.ai.models.chunk.Chunk.objects.filter") as mock_chunk_filter,
-            patch.object(command.stdout, "write"),
-        ):
-            mock_qs = Mock()
-            mock_qs.values_list.return_value = []
-            mock_chunk_filter.return_value = mock_qs
+        with patch.object(command.stdout, "write") as mock_write:
             result = command.process_chunks_batch(entities)
 
             assert result == 3
-            assert mock_create_chunks.call_count == 3
+            assert mock_pipeline.add.call_count == 3
+            mock_pipeline.run.assert_called_once()
             mock_bulk_save.assert_called_once()
             bulk_save_args = mock_bulk_save.call_args[0][0]
             assert len(bulk_save_args) == 6
+            mock_write.assert_any_call(
+                command.style.SUCCESS("Created 2 new chunks for test-key-2")
+            )
 
     @patch("apps.ai.common.base.chunk_command.ContentType.objects.get_for_model")
     @patch("apps.ai.common.base.chunk_command.Context.objects.filter")
     @patch("apps.ai.models.chunk.Chunk.split_text")
-    @patch("apps.ai.common.base.chunk_command.create_chunks_and_embeddings")
-    def test_process_chunks_batch_create_chunks_fails(
+    @patch("apps.ai.models.chunk.Chunk.bulk_save")
+    def test_process_chunks_batch_embedding_fails(
         self,
-        mock_create_chunks,
+        mock_bulk_save,
         mock_split_text,
         mock_context_filter,
         mock_get_content_type,
@@ -321,65 +363,58 @@ class TestBaseChunkCommand:
         mock_entity,
         mock_context,
         mock_content_type,
+        mock_pipeline,
     ):
-        """Test process_chunks_batch when create_chunks_and_embeddings fails."""
+        """Test process_chunks_batch when no embeddings are created."""
         mock_get_content_type.return_value = mock_content_type
-        mock_context_filter.return_value.first.return_value = mock_context
+        set_contexts(mock_context_filter, [mock_context])
         mock_split_text.return_value = ["chunk1", "chunk2"]
-        mock_create_chunks.return_value = None
+        mock_pipeline.run.return_value = []
         command.openai_client = Mock()
 
-        result = command.process_chunks_batch([mock_entity])
+        with patch.object(command.stdout, "write") as mock_write:
+            result = command.process_chunks_batch([mock_entity])
 
         assert result == 0
-        mock_create_chunks.assert_called_once()
+        mock_pipeline.run.assert_called_once()
+        mock_bulk_save.assert_not_called()
+        assert not [
+            call
+            for call in mock_write.call_args_list
+            if "Created" in str(call) and "new chunks" in str(call)
+        ]
 
+    @patch("apps.ai.common.base.chunk_command.ContentType.objects.get_for_model")
+    @patch("apps.ai.common.base.chunk_command.Context.objects.filter")
+    @patch("apps.ai.models.chunk.Chunk.split_text")
+    @patch("apps.ai.models.chunk.Chunk.bulk_save")
     def test_process_chunks_batch_content_combination(
-        self, command, mock_entity, mock_context, mock_content_type
+        self,
+        mock_bulk_save,
+        mock_split_text,
+        mock_context_filter,
+        mock_get_content_type,
+        command,
+        mock_entity,
+        mock_context,
+        mock_content_type,
+        mock_pipeline,
     ):
         """Test that metadata and prose content are properly combined."""
-        with (
-            patch(
-                "apps.ai.common.base.chunk_command.ContentType.objects.get_for_model"
-            ) as mock_get_content_type,
-            patch(
-                "apps.ai.common.base.chunk_command.Context.objects.filter"
-            ) as mock_context_filter,
-            patch("apps.ai.models.chunk.Chunk.split_text") as mock_split_text,
-            patch(
-                "apps.ai.common.base.chunk_command.create_chunks_and_embeddings"
-            ) as mock_create_chunks,
-            patch("apps.ai.models.chunk.Chunk.bulk_save"),
-        ):
-            mock_get_content_type.return_value = mock_content_type
-            mock_context_filter.return_value.first.return_value = mock_context
-            mock_split_text.return_value = ["chunk1"]
-            mock_create_chunks.return_value = [Mock()]
-            command.openai_client = Mock()
-
-            with patch.object(
-                command,
-                "extract_content",
-                return_value=("prose", "metadata"),
-            ):
-                with patch("apps.ai.models.chunk.Chunk.objects.filter") as mock_chunk_filter:
-                    mock_qs = Mock()
-                    mock_qs.values_list.return_value = []
-                    mock_chunk_filter.return_value = mock_qs
-                    command.process_chunks_batch([mock_entity])
-
-                expected_content = "metadata\n\nprose"
-                mock_split_text.assert_called_once_with(expected_content)
-
-            mock_split_text.reset_mock()
-            with patch.object(command, "extract_content", return_value=("prose", "")):
-                with patch("apps.ai.models.chunk.Chunk.objects.filter") as mock_chunk_filter:
-                    mock_qs = Mock()
-                    mock_qs.values_list.return_value = []
-                    mock_chunk_filter.return_value = mock_qs
-                    command.process_chunks_batch([mock_entity])
-
-                mock_split_text.assert_called_with("prose")
+        mock_get_content_type.return_value = mock_content_type
+        set_contexts(mock_context_filter, [mock_context])
+        mock_split_text.return_value = ["chunk1"]
+        mock_pipeline.run.return_value = [Mock(context=mock_context)]
+        command.openai_client = Mock()
+
+        with patch.object(command, "extract_content", return_value=("prose", "metadata")):
+            command.process_chunks_batch([mock_entity])
+        mock_split_text.assert_called_once_with("metadata\n\nprose")
+
+        mock_split_text.reset_mock()
+        with patch.object(command, "extract_content", return_value=("prose", "")):
+            command.process_chunks_batch([mock_entity])
+        mock_split_text.assert_called_with("prose")
 
     @patch.object(BaseChunkCommand, "setup_openai_client")
     @patch.object(BaseChunkCommand, "get_queryset")
@@ -391,23 +426,26 @@ class TestBaseChunkCommand:
         mock_setup_client.return_value = True
         mock_queryset = Mock()
         mock_get_queryset.return_value = mock_queryset
-        options = {"batch_size": 10}
+        options = {"batch_size": 10, "max_workers": 2, "resume": False}
 
         command.handle(**options)
 
+        assert command.max_workers == 2
         mock_setup_client.assert_called_once()
         mock_get_queryset.assert_called_once_with(options)
         mock_handle_batch.assert_called_once_with(
             queryset=mock_queryset,
             batch_size=10,
             process_batch_func=command.process_chunks_batch,
+            checkpoint_key="ai-command-checkpoint:chunk_command_test:default",
+            resume=False,
         )
 
     @patch.object(BaseChunkCommand, "setup_openai_client")
     def test_handle_method_openai_setup_fails(self, mock_setup_client, command):
         """Test the handle method when OpenAI client setup fails."""
         mock_setup_client.return_value = False
-        options = {"batch_size": 10}
+        options = {"batch_size": 10, "max_workers": 2}
 
         with (
             patch.object(command, "get_queryset") as mock_get_queryset,
@@ -419,52 +457,55 @@ class TestBaseChunkCommand:
             mock_get_queryset.assert_not_called()
             mock_handle_batch.assert_not_called()
 
+    def test_add_arguments(self, command):
+        """Test the embedding concurrency argument is added."""
+        parser = Mock()
+
+        command.add_arguments(parser)
+
+        parser.add_argument.assert_any_call(
+            "--max-workers",
+            type=int,
+            default=4,
+            help="Maximum number of concurrent embedding requests",
+        )
+
+    @patch("apps.ai.common.base.chunk_command.ContentType.objects.get_for_model")
+    @patch("apps.ai.common.base.chunk_command.Context.objects.filter")
+    @patch("apps.ai.models.chunk.Chunk.split_text")
+    @patch("apps.ai.models.chunk.Chunk.bulk_save")
     def test_process_chunks_batch_metadata_only_content(
-        self, command, mock_entity, mock_context, mock_content_type
+        self,
+        mock_bulk_save,
+        mock_split_text,
+        mock_context_filter,
+        mock_get_content_type,
+        command,
+        mock_entity,
+        mock_context,
+        mock_content_type,
+        mock_pipeline,
     ):
         """Test process_chunks_batch with only metadata content."""
-        with (
-            patch(
-                "apps.ai.common.base.chunk_command.ContentType.objects.get_for_model"
-            ) as mock_get_content_type,
-            patch(
-                "apps.ai.common.base.chunk_command.Context.objects.filter"
-            ) as mock_context_filter,
-            patch("apps.ai.models.chunk.Chunk.split_text") as mock_split_text,
-            patch(
-                "apps.ai.common.base.chunk_command.create_chunks_and_embeddings"
-            ) as mock_create_chunks,
-            patch("apps.ai.models.chunk.Chunk.bulk_save") as mock_bulk_save,
-        ):
-            mock_get_content_type.return_value = mock_content_type
-            mock_context_filter.return_value.first.return_value = mock_context
-            mock_split_text.return_value = ["chunk1"]
-            mock_create_chunks.return_value = [Mock()]
-            command.openai_client = Mock()
-
-            with patch.object(
-                command,
-                "extract_content",
-                return_value=("", "metadata"),
-            ):
-                with patch("apps.ai.models.chunk.Chunk.objects.filter") as mock_chunk_filter:
-                    mock_qs = Mock()
-                    mock_qs.values_list.return_value = []
-                    mock_chunk_filter.return_value = mock_qs
-                    command.process_chunks_batch([mock_entity])
-
-                mock_split_text.assert_called_once_with("metadata\n\n")
-                mock_bulk_save.assert_called_once()
+        mock_get_content_type.return_value = mock_content_type
+        set_contexts(mock_context_filter, [mock_context])
+        mock_split_text.return_value = ["chunk1"]
+        mock_pipeline.run.return_value = [Mock(context=mock_context)]
+        command.openai_client = Mock()
+
+        with patch.object(command, "extract_content", return_value=("", "metadata")):
+            command.process_chunks_batch([mock_entity])
+
+        mock_split_text.assert_called_once_with("metadata\n\n")
+        mock_bulk_save.assert_called_once()
 
     @patch("apps.ai.common.base.chunk_command.ContentType.objects.get_for_model")
     @patch("apps.ai.common.base.chunk_command.Context.objects.filter")
     @patch("apps.ai.models.chunk.Chunk.split_text")
-    @patch("apps.ai.common.base.chunk_command.create_chunks_and_embeddings")
     @patch("apps.ai.models.chunk.Chunk.bulk_save")
     def test_process_chunks_batch_with_duplicates(
         self,
         mock_bulk_save,
-        mock_create_chunks,
         mock_split_text,
         mock_context_filter,
         mock_get_content_type,
@@ -473,12 +514,13 @@ class TestBaseChunkCommand:
         mock_context,
         mock_content_type,
         mock_chunks,
+        mock_pipeline,
     ):
         """Test that duplicate chunk texts are filtered out before processing."""
         mock_get_content_type.return_value = mock_content_type
-        mock_context_filter.return_value.first.return_value = mock_context
+        set_contexts(mock_context_filter, [mock_context])
         mock_split_text.return_value = ["chunk1", "chunk2", "chunk1", "chunk3", "chunk2"]
-        mock_create_chunks.return_value = mock_chunks
+        mock_pipeline.run.return_value = mock_chunks
         command.openai_client = Mock()
 
         with patch.object(command.stdout, "write"):
@@ -486,128 +528,124 @@ class TestBaseChunkCommand:
 
             assert result == 1
             mock_split_text.assert_called_once()
-            _, kwargs = mock_create_chunks.call_args
-            assert set(kwargs["chunk_texts"]) == {"chunk1", "chunk2", "chunk3"}
-            assert kwargs["context"] == mock_context
-            assert kwargs["openai_client"] == command.openai_client
-            assert not kwargs["save"]
+            mock_pipeline.add.assert_called_once_with(mock_context, ["chunk1", "chunk2", "chunk3"])
             mock_bulk_save.assert_called_once_with(mock_chunks)
 
+    @patch("apps.ai.common.base.chunk_command.ContentType.objects.get_for_model")
+    @patch("apps.ai.common.base.chunk_command.Context.objects.filter")
     def test_process_chunks_batch_whitespace_only_content(
-        self, command, mock_entity, mock_context, mock_content_type
+        self,
+        mock_context_filter,
+        mock_get_content_type,
+        command,
+        mock_entity,
+        mock_context,
+        mock_content_type,
+        mock_pipeline,
     ):
         """Test process_chunks_batch with whitespace-only content."""
+        mock_get_content_type.return_value = mock_content_type
+        set_contexts(mock_context_filter, [mock_context])
+        mock_pipeline.run.return_value = []
+
         with (
-            patch(
-                "apps.ai.common.base.chunk_command.ContentType.objects.get_for_model"
-            ) as mock_get_content_type,
-            patch(
-                "apps.ai.common.base.chunk_command.Context.objects.filter"
-            ) as mock_context_filter,
+            patch.object(command, "extract_content", return_value=("   \n\t  ", "  \t\n  ")),
+            patch.object(command.stdout, "write") as mock_write,
         ):
-            mock_get_content_type.return_value = mock_content_type
-            mock_context_filter.return_value.first.return_value = mock_context
-
-            with (
-                patch.object(command, "extract_content", return_value=("   \n\t  ", "  \t\n  ")),
-                patch.object(command.stdout, "write") as mock_write,
-            ):
-                result = command.process_chunks_batch([mock_entity])
+            result = command.process_chunks_batch([mock_entity])
 
-                assert result == 0
-                expected_calls = [
-                    call("Context for test-key-123 requires chunk creation/update"),
-                    call("No content to chunk for test_entity test-key-123"),
-                ]
-                mock_write.assert_has_calls(expected_calls)
+            assert result == 0
+            expected_calls = [
+                call("Context for test-key-123 requires chunk creation/update"),
+                call("No content to chunk for test_entity test-key-123"),
+            ]
+            mock_write.assert_has_calls(expected_calls)
 
     @patch("apps.ai.common.base.chunk_command.ContentType.objects.get_for_model")
     @patch("apps.ai.common.base.chunk_command.Context.objects.filter")
+    @patch("apps.ai.common.base.chunk_command.Chunk.objects")
     @patch("apps.ai.models.chunk.Chunk.split_text")
-    @patch("apps.ai.common.base.chunk_command.create_chunks_and_embeddings")
     @patch("apps.ai.models.chunk.Chunk.bulk_save")
-    def test_process_chunks_batch_deletes_stale_chunks(
+    def test_process_chunks_batch_diffs_updated_chunks(
         self,
         mock_bulk_save,
-        mock_create_chunks,
         mock_split_text,
+        mock_chunk_objects,
         mock_context_filter,
         mock_get_content_type,
         command,
         mock_entity,
         mock_context,
         mock_content_type,
+        mock_pipeline,
     ):
-        """Test that stale chunks are deleted when context is updated."""
+        """Test that only new chunk texts are embedded and vanished ones deleted."""
         mock_get_content_type.return_value = mock_content_type
-
-        latest_timestamp = datetime(2024, 1, 1, tzinfo=UTC)
-        mock_context.nest_updated_at = datetime(2024, 1, 2, tzinfo=UTC)
-        mock_context.chunks.aggregate.return_value = {"latest_created": latest_timestamp}
-
-        mock_delete_qs = Mock()
-        mock_delete_qs.delete.return_value = (5, {})
-        mock_context.chunks.all.return_value = mock_delete_qs
-
-        mock_context_filter.return_value.first.return_value = mock_context
-        mock_split_text.return_value = ["new chunk"]
-        mock_create_chunks.return_value = [Mock()]
+        mock_context.latest_chunk_updated_at = datetime(2024, 1, 1, tzinfo=UTC)
+        set_contexts(mock_context_filter, [mock_context])
+
+        mock_chunk_objects.filter.return_value.values_list.return_value = [
+            (1, "kept chunk"),
+            (1, "old chunk"),
+        ]
+        mock_split_text.return_value = ["kept chunk", "new chunk"]
+        mock_pipeline.run.return_value = [Mock(context=mock_context)]
         command.openai_client = Mock()
 
         with patch.object(command.stdout, "write") as mock_write:
             result = command.process_chunks_batch([mock_entity])
 
             assert result == 1
-            mock_delete_qs.delete.assert_called_once()
-            mock_write.assert_any_call("Deleted 5 stale chunks for test-key-123")
+            mock_pipeline.add.assert_called_once_with(mock_context, ["new chunk"])
+            mock_chunk_objects.filter.return_value.delete.assert_called_once()
+            mock_chunk_objects.filter.return_value.update.assert_not_called()
+            mock_write.assert_any_call("Deleted 1 stale chunks for test-key-123")
             mock_bulk_save.assert_called_once()
 
     @patch("apps.ai.common.base.chunk_command.ContentType.objects.get_for_model")
     @patch("apps.ai.common.base.chunk_command.Context.objects.filter")
+    @patch("apps.ai.common.base.chunk_command.Chunk.objects")
     @patch("apps.ai.models.chunk.Chunk.split_text")
-    @patch("apps.ai.common.base.chunk_command.create_chunks_and_embeddings")
-    @patch("apps.ai.models.chunk.Chunk.bulk_save")
-    @patch("apps.ai.common.base.chunk_command.is_valid_json")
-    def test_process_chunks_batch_with_valid_json_content(
+    def test_process_chunks_batch_keeps_unchanged_chunks(
         self,
-        mock_is_valid_json,
-        mock_bulk_save,
-        mock_create_chunks,
         mock_split_text,
+        mock_chunk_objects,
         mock_context_filter,
         mock_get_content_type,
         command,
         mock_entity,
         mock_context,
         mock_content_type,
+        mock_pipeline,
     ):
-        """Test processing chunks when content is valid JSON."""
+        """Test that unchanged chunks are kept and marked as fresh."""
         mock_get_content_type.return_value = mock_content_type
-        mock_context_filter.return_value.first.return_value = mock_context
+        mock_context.latest_chunk_updated_at = datetime(2024, 1, 1, tzinfo=UTC)
+        set_contexts(mock_context_filter, [mock_context])
 
-        json_content = '{"key": "value", "data": "test"}'
-        mock_is_valid_json.return_value = True
-        mock_split_text.return_value = ["chunk1"]
-        mock_create_chunks.return_value = [Mock()]
+        mock_chunk_objects.filter.return_value.values_list.return_value = [(1, "kept chunk")]
+        mock_split_text.return_value = ["kept chunk"]
+        mock_pipeline.run.return_value = []
         command.openai_client = Mock()
 
-        with (
-            patch.object(command, "extract_content", return_value=(json_content, "metadata")),
-            patch.object(command.stdout, "write"),
-        ):
+        with patch.object(command.stdout, "write"):
             result = command.process_chunks_batch([mock_entity])
 
-            assert result == 1
-            mock_split_text.assert_called_once_with(json_content)
-            mock_bulk_save.assert_called_once()
+        assert result == 0
+        mock_pipeline.add.assert_not_called()
+        mock_chunk_objects.filter.return_value.delete.assert_not_called()
+        mock_chunk_objects.filter.assert_called_with(context_id__in=[1])
+        mock_chunk_objects.filter.return_value.update.assert_called_once()
 
     @patch("apps.ai.common.base.chunk_command.ContentType.objects.get_for_model")
     @patch("apps.ai.common.base.chunk_command.Context.objects.filter")
     @patch("apps.ai.models.chunk.Chunk.split_text")
-    @patch("apps.ai.common.base.chunk_command.create_chunks_and_embeddings")
-    def test_process_chunks_batch_creates_chunks_returns_none(
+    @patch("apps.ai.models.chunk.Chunk.bulk_save")
+    @patch("apps.ai.common.base.chunk_command.is_valid_json")
+    def test_process_chunks_batch_with_valid_json_content(
         self,
-        mock_create_chunks,
+        mock_is_valid_json,
+        mock_bulk_save,
         mock_split_text,
         mock_context_filter,
         mock_get_content_type,
@@ -615,21 +653,24 @@ class TestBaseChunkCommand:
         mock_entity,
         mock_context,
         mock_content_type,
+        mock_pipeline,
     ):
-        """Test when create_chunks_and_embeddings returns None or empty list."""
+        """Test processing chunks when content is valid JSON."""
         mock_get_content_type.return_value = mock_content_type
-        mock_context_filter.return_value.first.return_value = mock_context
+        set_contexts(mock_context_filter, [mock_context])
+
+        json_content = '{"key": "value", "data": "test"}'
+        mock_is_valid_json.return_value = True
         mock_split_text.return_value = ["chunk1"]
-        mock_create_chunks.return_value = None
+        mock_pipeline.run.return_value = [Mock(context=mock_context)]
         command.openai_client = Mock()
 
-        with patch.object(command.stdout, "write") as mock_write:
+        with (
+            patch.object(command, "extract_content", return_value=(json_content, "metadata")),
+            patch.object(command.stdout, "write"),
+        ):
             result = command.process_chunks_batch([mock_entity])
 
-            assert result == 0
-            success_calls = [
-                call
-                for call in mock_write.call_args_list
-                if "Created" in str(call) and "new chunks" in str(call)
-            ]
-            assert not success_calls
+            assert result == 1
+            mock_split_text.assert_called_once_with(json_content)
+            mock_bulk_save.assert_called_once()
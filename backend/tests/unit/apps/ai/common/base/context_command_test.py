@@ -226,7 +226,7 @@ class TestBaseContextCommand:
         """Test the handle method."""
         mock_queryset = Mock()
         mock_get_queryset.return_value = mock_queryset
-        options = {"batch_size": 10}
+        options = {"batch_size": 10, "resume": True}
 
         command.handle(**options)
 
@@ -235,6 +235,8 @@ class TestBaseContextCommand:
             queryset=mock_queryset,
             batch_size=10,
             process_batch_func=command.process_context_batch,
+            checkpoint_key="ai-command-checkpoint:context_command_test:default",
+            resume=True,
         )
 
     def test_source_name_usage(self, command, mock_entity, mock_context):
@@ -0,0 +1,136 @@
+"""Tests for the embedding pipeline."""
+
+from unittest.mock import MagicMock, Mock, patch
+
+import httpx
+import openai
+import pytest
+
+from apps.ai.common.embedding_pipeline import EmbeddingPipeline
+from apps.ai.models.context import Context
+
+
+def make_rate_limit_error(retry_after=None):
+    headers = {"retry-after": retry_after} if retry_after is not None else {}
+    response = httpx.Response(
+        429, headers=headers, request=httpx.Request("POST", "https://api.openai.com")
+    )
+    return openai.RateLimitError("Rate limit", response=response, body=None)
+
+
+class FakeEmbeddings:
+    """Fake OpenAI embeddings resource."""
+
+    def __init__(self, errors=None):
+        self.calls = []
+        self.errors = list(errors or [])
+
+    def create(self, input, model):  # noqa: A002
+        self.calls.append(input)
+        if self.errors:
+            raise self.errors.pop(0)
+        return MagicMock(data=[MagicMock(embedding=[float(len(text))]) for text in input])
+
+
+@pytest.fixture
+def contexts():
+    return [Context(id=1), Context(id=2)]
+
+
+@pytest.fixture
+def mock_existing_chunks():
+    with patch("apps.ai.common.embedding_pipeline.Chunk.objects.filter") as mock_filter:
+        mock_filter.return_value.values_list.return_value = []
+        yield mock_filter
+
+
+class TestEmbeddingPipeline:
+    def test_run_without_requests(self):
+        client = Mock()
+
+        assert EmbeddingPipeline(client).run() == []
+        client.embeddings.create.assert_not_called()
+
+    def test_run_packs_texts_of_multiple_contexts(self, contexts, mock_existing_chunks):
+        fake_embeddings = FakeEmbeddings()
+        pipeline = EmbeddingPipeline(Mock(embeddings=fake_embeddings), max_batch_inputs=3)
+        pipeline.add(contexts[0], ["a", "bb"])
+        pipeline.add(contexts[1], ["ccc", "dddd"])
+
+        chunks = pipeline.run()
+
+        assert fake_embeddings.calls == [["a", "bb", "ccc"], ["dddd"]]
+        assert sorted((chunk.context.id, chunk.text, chunk.embedding) for chunk in chunks) == [
+            (1, "a", [1.0]),
+            (1, "bb", [2.0]),
+            (2, "ccc", [3.0]),
+            (2, "dddd", [4.0]),
+        ]
+        assert pipeline.requests == []
+        mock_existing_chunks.assert_called_once()
+
+    def test_run_skips_existing_and_duplicate_chunks(self, contexts, mock_existing_chunks):
+        mock_existing_chunks.return_value.values_list.return_value = [(1, "a")]
+        fake_embeddings = FakeEmbeddings()
+        pipeline = EmbeddingPipeline(Mock(embeddings=fake_embeddings))
+        pipeline.add(contexts[0], ["a", "b", "b"])
+        pipeline.add(contexts[1], ["a"])
+
+        chunks = pipeline.run()
+
+        assert fake_embeddings.calls == [["b", "a"]]
+        assert [(chunk.context.id, chunk.text) for chunk in chunks] == [(1, "b"), (2, "a")]
+        mock_existing_chunks.assert_called_once_with(context_id__in={1, 2}, text__in={"a", "b"})
+
+    def test_pack_respects_token_limit(self, contexts):
+        pipeline = EmbeddingPipeline(Mock(), max_batch_tokens=30)
+        requests = [(contexts[0], "x" * 40), (contexts[0], "y" * 40), (contexts[1], "z" * 200)]
+
+        assert [len(batch) for batch in pipeline.pack(requests)] == [2, 1]
+
+    @patch("apps.ai.common.embedding_pipeline.time.sleep")
+    def test_embed_retries_rate_limited_requests(self, mock_sleep):
+        fake_embeddings = FakeEmbeddings(errors=[make_rate_limit_error("2")])
+        pipeline = EmbeddingPipeline(Mock(embeddings=fake_embeddings))
+
+        assert pipeline.embed(["text"]) == [[4.0]]
+        assert len(fake_embeddings.calls) == 2
+        assert mock_sleep.call_args[0][0] == pytest.approx(2, abs=0.1)
+
+    @patch("apps.ai.common.embedding_pipeline.EMBEDDING_MAX_RETRIES", 1)
+    @patch("apps.ai.common.embedding_pipeline.time.sleep")
+    def test_run_skips_failed_batches(self, mock_sleep, contexts, mock_existing_chunks):
+        fake_embeddings = FakeEmbeddings(errors=[make_rate_limit_error()] * 2)
+        pipeline = EmbeddingPipeline(Mock(embeddings=fake_embeddings))
+        pipeline.add(contexts[0], ["text"])
+
+        assert pipeline.run() == []
+        assert len(fake_embeddings.calls) == 2
+
+    def test_embed_does_not_retry_other_errors(self):
+        fake_embeddings = FakeEmbeddings(errors=[openai.OpenAIError("Invalid request")])
+        pipeline = EmbeddingPipeline(Mock(embeddings=fake_embeddings))
+
+        with pytest.raises(openai.OpenAIError):
+            pipeline.embed(["text"])
+        assert len(fake_embeddings.calls) == 1
+
+    @pytest.mark.parametrize(
+        ("retry_after", "attempt", "expected"),
+        [
+            ("3", 0, 3.0),
+            ("120", 0, 60.0),
+            ("invalid", 2, 4.0),
+            (None, 0, 1.0),
+            (None, 3, 8.0),
+            (None, 10, 60.0),
+        ],
+    )
+    def test_get_retry_delay(self, retry_after, attempt, expected):
+        error = make_rate_limit_error(retry_after)
+
+        assert EmbeddingPipeline.get_retry_delay(error, attempt) == expected
+
+    def test_estimate_tokens(self):
+        assert EmbeddingPipeline.estimate_tokens("") == 1
+        assert EmbeddingPipeline.estimate_tokens("x" * 200) == 51
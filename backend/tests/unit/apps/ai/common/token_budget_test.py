@@ -0,0 +1,53 @@
+"""Tests for the token budget."""
+
+from unittest.mock import patch
+
+import pytest
+from django.core.cache import cache
+
+from apps.ai.common.token_budget import TokenBudget
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+
+
+class TestTokenBudget:
+    @patch("apps.ai.common.token_budget.time")
+    def test_acquire_within_budget(self, mock_time):
+        mock_time.time.return_value = 120.0
+        token_budget = TokenBudget(tokens_per_minute=100)
+
+        token_budget.acquire(60)
+        token_budget.acquire(40)
+
+        mock_time.sleep.assert_not_called()
+        assert cache.get("ai-token-budget:2") == 100
+
+    @patch("apps.ai.common.token_budget.time")
+    def test_acquire_waits_for_next_window(self, mock_time):
+        mock_time.time.side_effect = [150.0, 180.0]
+        token_budget = TokenBudget(tokens_per_minute=100)
+        cache.set("ai-token-budget:2", 80)
+
+        token_budget.acquire(40)
+
+        mock_time.sleep.assert_called_once_with(30.0)
+        assert cache.get("ai-token-budget:2") == 80
+        assert cache.get("ai-token-budget:3") == 40
+
+    @patch("apps.ai.common.token_budget.time")
+    def test_acquire_caps_large_requests(self, mock_time):
+        mock_time.time.return_value = 0.0
+        token_budget = TokenBudget(tokens_per_minute=100)
+
+        token_budget.acquire(500)
+
+        mock_time.sleep.assert_not_called()
+        assert cache.get("ai-token-budget:0") == 100
+
+    def test_estimate_tokens(self):
+        messages = [{"content": "x" * 40, "role": "system"}, {"content": "", "role": "user"}]
+
+        assert TokenBudget.estimate_tokens(messages, 100) == 112
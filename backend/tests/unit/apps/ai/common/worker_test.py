@@ -0,0 +1,68 @@
+"""Tests for the thread worker."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from rq.timeouts import TimerDeathPenalty
+
+from apps.ai.common.worker import ThreadWorker
+
+
+class TestThreadWorker:
+    @patch.object(ThreadWorker, "_set_ip_address")
+    def test_thread_worker(self, mock_set_ip_address):
+        connection = MagicMock()
+        connection.connection_pool.connection_kwargs = {}
+        worker = ThreadWorker(["ai"], connection=connection)
+
+        assert worker.death_penalty_class is TimerDeathPenalty
+        assert worker.dequeue_timeout == 5
+
+        worker.request_thread_stop()
+
+        assert worker._stop_requested
+
+    @patch("apps.ai.common.worker.close_old_connections")
+    @patch("rq.worker.SimpleWorker.perform_job", return_value=True)
+    @patch.object(ThreadWorker, "_set_ip_address")
+    def test_perform_job_closes_old_connections(
+        self, mock_set_ip_address, mock_perform_job, mock_close_old_connections
+    ):
+        connection = MagicMock()
+        connection.connection_pool.connection_kwargs = {}
+        worker = ThreadWorker(["ai"], connection=connection)
+        mock_perform_job.side_effect = lambda *_args: (
+            mock_close_old_connections.assert_called_once() or True
+        )
+
+        assert worker.perform_job(MagicMock(), MagicMock())
+
+        assert mock_close_old_connections.call_count == 2
+
+    @patch("apps.ai.common.worker.close_old_connections")
+    @patch("rq.worker.SimpleWorker.perform_job", side_effect=RuntimeError("Job failed"))
+    @patch.object(ThreadWorker, "_set_ip_address")
+    def test_perform_job_error_closes_old_connections(
+        self, mock_set_ip_address, mock_perform_job, mock_close_old_connections
+    ):
+        connection = MagicMock()
+        connection.connection_pool.connection_kwargs = {}
+        worker = ThreadWorker(["ai"], connection=connection)
+
+        with pytest.raises(RuntimeError):
+            worker.perform_job(MagicMock(), MagicMock())
+
+        assert mock_close_old_connections.call_count == 2
+
+    @patch("apps.ai.common.worker.connection")
+    @patch("rq.worker.SimpleWorker.work", return_value=True)
+    @patch.object(ThreadWorker, "_set_ip_address")
+    def test_work_closes_connection(self, mock_set_ip_address, mock_work, mock_db_connection):
+        connection = MagicMock()
+        connection.connection_pool.connection_kwargs = {}
+        worker = ThreadWorker(["ai"], connection=connection)
+
+        assert worker.work(burst=True)
+
+        mock_work.assert_called_once_with(burst=True)
+        mock_db_connection.close.assert_called_once_with()
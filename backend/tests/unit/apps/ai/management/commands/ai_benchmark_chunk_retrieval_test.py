@@ -0,0 +1,65 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from apps.ai.management.commands.ai_benchmark_chunk_retrieval import Command
+
+OPTIONS = {
+    "dimensions": 3,
+    "ef_search": 40,
+    "keep_table": False,
+    "limit": 5,
+    "queries": 4,
+    "reuse_table": False,
+    "rows": 25_000,
+}
+
+
+@pytest.fixture
+def command():
+    command = Command()
+    command.stdout = MagicMock()
+    return command
+
+
+class TestAiBenchmarkChunkRetrievalCommand:
+    @patch("apps.ai.management.commands.ai_benchmark_chunk_retrieval.transaction")
+    @patch("apps.ai.management.commands.ai_benchmark_chunk_retrieval.connection")
+    def test_handle(self, mock_connection, mock_transaction, command):
+        cursor = mock_connection.cursor.return_value.__enter__.return_value
+
+        command.handle(**OPTIONS)
+
+        executed = [str(call.args[0]) for call in cursor.execute.call_args_list]
+        assert sum("INSERT INTO" in statement for statement in executed) == 3
+        assert sum("USING hnsw" in statement for statement in executed) == 1
+        assert "DROP TABLE IF EXISTS" in executed[-1]
+        assert executed.count("SET LOCAL hnsw.ef_search = %s") == 12
+        cursor.execute.assert_any_call("SET LOCAL hnsw.ef_search = %s", [40])
+
+        output = [call.args[0] for call in command.stdout.write.call_args_list]
+        assert any(line.startswith("exact: p50=") for line in output)
+        assert any(line.startswith("hnsw: p50=") for line in output)
+        assert any(line.startswith("hnsw-filtered: p50=") for line in output)
+
+    @patch("apps.ai.management.commands.ai_benchmark_chunk_retrieval.transaction")
+    @patch("apps.ai.management.commands.ai_benchmark_chunk_retrieval.connection")
+    def test_handle_reuse_and_keep_table(self, mock_connection, mock_transaction, command):
+        cursor = mock_connection.cursor.return_value.__enter__.return_value
+
+        command.handle(**{**OPTIONS, "keep_table": True, "reuse_table": True})
+
+        executed = [str(call.args[0]) for call in cursor.execute.call_args_list]
+        assert not any("CREATE" in statement for statement in executed)
+        assert not any("DROP TABLE" in statement for statement in executed)
+
+    @pytest.mark.parametrize(
+        ("latencies", "expected"),
+        [
+            ([], (0.0, 0.0)),
+            ([5.0], (5.0, 5.0)),
+            ([float(value) for value in range(1, 101)], (50.5, 95.05)),
+        ],
+    )
+    def test_get_percentiles(self, command, latencies, expected):
+        assert command.get_percentiles(latencies) == pytest.approx(expected)
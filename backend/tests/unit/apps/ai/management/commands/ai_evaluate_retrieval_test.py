@@ -0,0 +1,88 @@
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from apps.ai.management.commands.ai_evaluate_retrieval import Command
+
+OPTIONS = {"file_name": "eval.json", "limit": 5, "similarity_threshold": 0.1}
+
+
+@pytest.fixture
+def command():
+    command = Command()
+    command.stderr = MagicMock()
+    command.stdout = MagicMock()
+    return command
+
+
+@pytest.fixture
+def dataset_dir(tmp_path):
+    eval_dir = tmp_path / "data" / "retrieval-eval"
+    eval_dir.mkdir(parents=True)
+    (eval_dir / "eval.json").write_text(
+        json.dumps(
+            {
+                "queries": [
+                    {
+                        "query": "What is OWASP ZAP?",
+                        "relevant": [
+                            {"source_name": "OWASP ZAP", "source_type": "project"},
+                            {"source_name": "OWASP London", "source_type": "chapter"},
+                        ],
+                    }
+                ]
+            }
+        )
+    )
+    with patch("apps.ai.management.commands.ai_evaluate_retrieval.settings") as mock_settings:
+        mock_settings.BASE_DIR = tmp_path
+        yield eval_dir
+
+
+class TestAiEvaluateRetrievalCommand:
+    @patch("apps.ai.management.commands.ai_evaluate_retrieval.Retriever")
+    def test_handle(self, mock_retriever_class, command, dataset_dir):
+        mock_retriever = mock_retriever_class.return_value
+        mock_retriever.retrieve.side_effect = [
+            [{"source_name": "OWASP ZAP", "source_type": "project"}],
+            [
+                {"source_name": "OWASP ZAP", "source_type": "project"},
+                {"source_name": "OWASP London", "source_type": "chapter"},
+            ],
+        ]
+
+        command.handle(**OPTIONS)
+
+        assert [call.kwargs["hybrid"] for call in mock_retriever.retrieve.call_args_list] == [
+            False,
+            True,
+        ]
+        output = [call.args[0] for call in command.stdout.write.call_args_list]
+        assert "vector: recall@5=0.50 What is OWASP ZAP?" in output
+        assert "hybrid: recall@5=1.00 What is OWASP ZAP?" in output
+        assert any("vector: mean recall@5=0.500" in line for line in output)
+        assert any("hybrid: mean recall@5=1.000" in line for line in output)
+
+    @patch("apps.ai.management.commands.ai_evaluate_retrieval.Retriever")
+    def test_handle_file_not_found(self, mock_retriever_class, command, dataset_dir):
+        command.handle(**{**OPTIONS, "file_name": "missing.json"})
+
+        mock_retriever_class.assert_not_called()
+        assert "File not found" in command.stderr.write.call_args[0][0]
+
+    @patch("apps.ai.management.commands.ai_evaluate_retrieval.Retriever")
+    def test_handle_retriever_error(self, mock_retriever_class, command, dataset_dir):
+        mock_retriever_class.side_effect = ValueError("API key not set")
+
+        command.handle(**OPTIONS)
+
+        command.stdout.write.assert_not_called()
+        command.stderr.write.assert_called_once()
+
+    def test_get_recall(self, command):
+        chunks = [{"source_name": "OWASP ZAP", "source_type": "project"}]
+
+        assert command.get_recall(chunks, set()) == 0.0
+        assert command.get_recall(chunks, {("project", "OWASP ZAP")}) == 1.0
+        assert command.get_recall(chunks, {("chapter", "OWASP ZAP")}) == 0.0
@@ -0,0 +1,47 @@
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+
+
+class TestAiRunAgenticRagCommand:
+    target_module = "apps.ai.management.commands.ai_run_agentic_rag"
+
+    @patch(f"{target_module}.AgenticRAGAgent")
+    def test_handle_streams_answer(self, mock_agent_class):
+        def run(*, on_token, **_kwargs):
+            on_token("OWASP is")
+            on_token(" a foundation.")
+            return {"answer": "OWASP is a foundation."}
+
+        mock_agent_class.return_value.run.side_effect = run
+        stdout = StringIO()
+
+        call_command("ai_run_agentic_rag", query="What is OWASP?", stdout=stdout)
+
+        output = stdout.getvalue()
+        assert "Draft answer:\nOWASP is a foundation." in output
+        assert "Agentic RAG workflow completed" in output
+        assert "\nAnswer:" not in output
+
+    @patch(f"{target_module}.AgenticRAGAgent")
+    def test_handle_prints_revised_answer(self, mock_agent_class):
+        def run(*, on_token, **_kwargs):
+            on_token("Draft")
+            return {"answer": "Revised answer"}
+
+        mock_agent_class.return_value.run.side_effect = run
+        stdout = StringIO()
+
+        call_command("ai_run_agentic_rag", stdout=stdout)
+
+        assert "\nAnswer:\nRevised answer" in stdout.getvalue()
+
+    @patch(f"{target_module}.AgenticRAGAgent")
+    def test_handle_agent_error(self, mock_agent_class):
+        mock_agent_class.side_effect = ValueError("Missing API key")
+        stderr = StringIO()
+
+        call_command("ai_run_agentic_rag", stderr=stderr, stdout=StringIO())
+
+        assert "Missing API key" in stderr.getvalue()
@@ -0,0 +1,46 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from apps.ai.management.commands.ai_run_worker import Command
+
+
+@pytest.fixture
+def command():
+    command = Command()
+    command.stdout = MagicMock()
+    return command
+
+
+class TestAiRunWorkerCommand:
+    def test_add_arguments(self, command):
+        parser = MagicMock()
+        command.add_arguments(parser)
+
+        assert [call[0][0] for call in parser.add_argument.call_args_list] == [
+            "--concurrency",
+            "--queue",
+            "--burst",
+            "--with-scheduler",
+        ]
+
+    @patch("apps.ai.management.commands.ai_run_worker.ThreadWorker")
+    @patch("apps.ai.management.commands.ai_run_worker.django_rq")
+    def test_handle(self, mock_django_rq, mock_worker_class, command):
+        workers = [MagicMock(), MagicMock(), MagicMock()]
+        mock_worker_class.side_effect = workers
+
+        command.handle(burst=True, concurrency=3, queue="ai", with_scheduler=True)
+
+        mock_django_rq.get_queue.assert_called_once_with("ai")
+        workers[0].work.assert_called_once_with(burst=True, with_scheduler=True)
+        workers[1].work.assert_called_once_with(burst=True, with_scheduler=False)
+        workers[2].work.assert_called_once_with(burst=True, with_scheduler=False)
+
+    def test_stop_workers(self, command):
+        workers = [MagicMock(), MagicMock()]
+
+        command.stop_workers(workers)
+
+        for worker in workers:
+            worker.request_thread_stop.assert_called_once()
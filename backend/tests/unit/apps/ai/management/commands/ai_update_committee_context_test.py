@@ -219,7 +219,7 @@ class TestAiCreateCommitteeContextCommand:
             mock_get_queryset.return_value = mock_queryset
 
             with patch.object(command, "handle_batch_processing") as mock_batch_processing:
-                options = {"batch_size": 50}
+                options = {"batch_size": 50, "resume": False}
                 command.handle(**options)
 
                 mock_get_queryset.assert_called_once_with(options)
@@ -227,4 +227,6 @@ class TestAiCreateCommitteeContextCommand:
                     queryset=mock_queryset,
                     batch_size=50,
                     process_batch_func=command.process_context_batch,
+                    checkpoint_key="ai-command-checkpoint:ai_update_committee_context:default",
+                    resume=False,
                 )
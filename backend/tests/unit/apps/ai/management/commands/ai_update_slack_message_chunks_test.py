@@ -52,6 +52,14 @@ class TestAiCreateSlackMessageChunksCommand:
         content = command.extract_content(mock_message)
         assert content == ("", "")
 
+    def test_get_base_queryset(self, command):
+        """Test the get_base_queryset method skips the raw data."""
+        with patch.object(Message, "objects") as mock_objects:
+            result = command.get_base_queryset()
+
+        mock_objects.all.return_value.defer.assert_called_once_with("raw_data")
+        assert result == mock_objects.all.return_value.defer.return_value
+
     def test_get_default_queryset(self, command):
         """Test the get_default_queryset method."""
         with patch.object(command, "get_base_queryset") as mock_base:
@@ -65,7 +73,7 @@ class TestAiCreateSlackMessageChunksCommand:
         parser = Mock()
         command.add_arguments(parser)
 
-        assert parser.add_argument.call_count == 3
+        assert parser.add_argument.call_count == 5
         calls = parser.add_argument.call_args_list
 
         assert calls[0][0] == ("--message-key",)
@@ -80,3 +88,9 @@ class TestAiCreateSlackMessageChunksCommand:
         assert calls[2][1]["type"] is int
         assert calls[2][1]["default"] == 100
         assert "Number of messages to process in each batch" in calls[2][1]["help"]
+
+        assert calls[3][0] == ("--max-workers",)
+        assert calls[3][1]["type"] is int
+
+        assert calls[4][0] == ("--resume",)
+        assert calls[4][1]["action"] == "store_true"
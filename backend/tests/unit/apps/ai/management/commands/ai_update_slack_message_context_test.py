@@ -57,6 +57,14 @@ class TestAiCreateSlackMessageContextCommand:
         content = command.extract_content(mock_message)
         assert content == ("", "")
 
+    def test_get_base_queryset(self, command):
+        """Test the get_base_queryset method skips the raw data."""
+        with patch.object(Message, "objects") as mock_objects:
+            result = command.get_base_queryset()
+
+        mock_objects.all.return_value.defer.assert_called_once_with("raw_data")
+        assert result == mock_objects.all.return_value.defer.return_value
+
     def test_get_default_queryset(self, command):
         """Test the get_default_queryset method."""
         with patch.object(command, "get_base_queryset") as mock_base:
@@ -70,7 +78,7 @@ class TestAiCreateSlackMessageContextCommand:
         parser = Mock()
         command.add_arguments(parser)
 
-        assert parser.add_argument.call_count == 3
+        assert parser.add_argument.call_count == 4
         calls = parser.add_argument.call_args_list
 
         assert calls[0][0] == ("--message-key",)
@@ -85,3 +93,6 @@ class TestAiCreateSlackMessageContextCommand:
         assert calls[2][1]["type"] is int
         assert calls[2][1]["default"] == 50
         assert "Number of messages to process in each batch" in calls[2][1]["help"]
+
+        assert calls[3][0] == ("--resume",)
+        assert calls[3][1]["action"] == "store_true"
@@ -0,0 +1,56 @@
+"""Tests for the benchmark_bulk_save Django management command."""
+
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
+
+from apps.common.management.commands.benchmark_bulk_save import Command
+from apps.github.models.label import Label
+
+COMMAND_PATH = "apps.common.management.commands.benchmark_bulk_save"
+
+
+class TestBenchmarkBulkSaveCommand:
+    @mock.patch(f"{COMMAND_PATH}.transaction")
+    @mock.patch.object(Command, "save_by_primary_key")
+    @mock.patch.object(Command, "save_by_natural_key")
+    def test_handle(self, mock_natural_key, mock_primary_key, mock_transaction):
+        stdout = StringIO()
+
+        call_command("benchmark_bulk_save", "--rows", "3", stdout=stdout)
+
+        node_ids = ["benchmark-label-0", "benchmark-label-1", "benchmark-label-2"]
+        for mock_save in (mock_natural_key, mock_primary_key):
+            assert mock_save.call_args_list == [
+                mock.call(node_ids, "000000"),
+                mock.call(node_ids, "ffffff"),
+                mock.call(node_ids, "ffffff"),
+            ]
+        assert mock_transaction.set_rollback.call_count == 2
+        assert mock_transaction.set_rollback.call_args.args == (True,)
+        output = stdout.getvalue().splitlines()
+        assert output[0].startswith("primary key: insert ")
+        assert output[1].startswith("upsert: insert ")
+
+    @mock.patch(f"{COMMAND_PATH}.BulkSaveModel.bulk_save")
+    def test_save_by_natural_key(self, mock_bulk_save):
+        Command().save_by_natural_key(["L_1"], "ffffff")
+
+        model, labels = mock_bulk_save.call_args.args
+        assert model is Label
+        assert [(label.node_id, label.color) for label in labels] == [("L_1", "ffffff")]
+        assert mock_bulk_save.call_args.kwargs == {"unique_fields": ("node_id",)}
+
+    @mock.patch(f"{COMMAND_PATH}.BulkSaveModel.bulk_save")
+    def test_save_by_primary_key(self, mock_bulk_save):
+        existing_label = Label(node_id="L_1")
+        existing_label.pk = 1
+        with mock.patch.object(Label, "objects") as mock_objects:
+            mock_objects.get.side_effect = [existing_label, Label.DoesNotExist]
+            Command().save_by_primary_key(["L_1", "L_2"], "ffffff")
+
+        _, labels = mock_bulk_save.call_args.args
+        assert labels[0] is existing_label
+        assert labels[1].pk is None
+        assert [label.color for label in labels] == ["ffffff", "ffffff"]
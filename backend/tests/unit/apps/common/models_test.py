@@ -1,8 +1,14 @@
+import datetime
 from unittest.mock import MagicMock
 
 import pytest
+from django.db.models import Q
 
-from apps.common.models import BulkSaveModel, models
+from apps.common.models import BulkSaveModel, BulkSaveResult, models
+from apps.github.models.daily_contribution import DailyContribution
+from apps.github.models.label import Label
+from apps.github.models.user import User
+from apps.slack.models.message import Message
 
 
 class TestBulkSaveModel:
@@ -40,3 +46,168 @@ class TestBulkSaveModel:
         mock_model.objects.bulk_update.assert_called_once()
 
         assert len(mock_objects) == 0
+
+    def test_bulk_save_default_fields_skip_generated(self):
+        message = Message(id=1)
+
+        with pytest.MonkeyPatch.context() as monkeypatch:
+            mock_objects = MagicMock()
+            monkeypatch.setattr(Message, "objects", mock_objects)
+
+            BulkSaveModel.bulk_save(Message, [message])
+
+        fields = mock_objects.bulk_update.call_args.kwargs["fields"]
+        assert "cleaned_text" in fields
+        assert "search_vector" not in fields
+
+    def test_bulk_save_unique_fields_upserts(self):
+        unchanged = Label(node_id="L_1", name="bug", description="", color="d73a4a")
+        changed = Label(node_id="L_2", name="docs", description="", color="0075ca")
+        new = Label(node_id="L_3", name="new", description="", color="ffffff")
+        objects = [unchanged, changed, new]
+
+        with pytest.MonkeyPatch.context() as monkeypatch:
+            mock_objects = MagicMock()
+            monkeypatch.setattr(Label, "objects", mock_objects)
+            mock_objects.filter.return_value.values_list.return_value = [
+                (1, "L_1", "bug", "", "d73a4a", 0, False),
+                (2, "L_2", "docs", "", "000000", 0, False),
+            ]
+
+            result = BulkSaveModel.bulk_save(Label, objects, unique_fields=("node_id",))
+
+        assert result == BulkSaveResult(created=1, unchanged=1, updated=1)
+        mock_objects.filter.assert_called_once()
+        assert mock_objects.filter.call_args.args[0].children == [
+            ("node_id__in", {"L_1", "L_2", "L_3"})
+        ]
+        mock_objects.filter.return_value.values_list.assert_called_once_with(
+            "pk", "node_id", "name", "description", "color", "sequence_id", "is_default"
+        )
+        mock_objects.bulk_create.assert_called_once_with(
+            [changed, new],
+            batch_size=1000,
+            unique_fields=("node_id",),
+            update_conflicts=True,
+            update_fields=[
+                "name",
+                "description",
+                "color",
+                "sequence_id",
+                "is_default",
+                "nest_updated_at",
+            ],
+        )
+        mock_objects.bulk_update.assert_not_called()
+        assert unchanged.pk == 1
+        assert len(objects) == 0
+
+    def test_bulk_save_unique_fields_skips_unchanged(self):
+        objects = [Label(node_id="L_1", name="bug", description="", color="d73a4a")]
+
+        with pytest.MonkeyPatch.context() as monkeypatch:
+            mock_objects = MagicMock()
+            monkeypatch.setattr(Label, "objects", mock_objects)
+            mock_objects.filter.return_value.values_list.return_value = [
+                (1, "L_1", "bug", "", "d73a4a", 0, False),
+            ]
+
+            BulkSaveModel.bulk_save(Label, objects, unique_fields=("node_id",))
+
+        mock_objects.bulk_create.assert_not_called()
+
+    def test_bulk_save_unique_fields_deduplicates_objects(self):
+        first = Label(node_id="L_1", name="bug", description="", color="000000")
+        last = Label(node_id="L_1", name="bug", description="", color="d73a4a")
+        objects = [first, last]
+
+        with pytest.MonkeyPatch.context() as monkeypatch:
+            mock_objects = MagicMock()
+            monkeypatch.setattr(Label, "objects", mock_objects)
+            mock_objects.filter.return_value.values_list.return_value = []
+
+            result = BulkSaveModel.bulk_save(Label, objects, unique_fields=("node_id",))
+
+        assert result == BulkSaveResult(created=1)
+        assert mock_objects.bulk_create.call_args.args[0] == [last]
+
+    def test_bulk_save_unique_fields_matches_null_key_parts(self):
+        contribution = DailyContribution(
+            count=2, date=datetime.date(2025, 1, 1), kind="commit", repository_id=1
+        )
+
+        with pytest.MonkeyPatch.context() as monkeypatch:
+            mock_objects = MagicMock()
+            monkeypatch.setattr(DailyContribution, "objects", mock_objects)
+            mock_objects.filter.return_value.values_list.return_value = [
+                (5, datetime.date(2025, 1, 1), None, 1, "commit", 2),
+            ]
+
+            result = DailyContribution.bulk_save([contribution])
+
+        assert result == BulkSaveResult(unchanged=1)
+        key_filter = mock_objects.filter.call_args.args[0]
+        assert key_filter == (
+            Q(date__in={datetime.date(2025, 1, 1)})
+            & (Q(user_id__in=set()) | Q(user_id__isnull=True))
+            & Q(repository_id__in={1})
+            & Q(kind__in={"commit"})
+        )
+        mock_objects.bulk_create.assert_not_called()
+        assert contribution.pk == 5
+
+
+class TestDirtyFieldsMixin:
+    @pytest.fixture
+    def mock_user_objects(self):
+        with pytest.MonkeyPatch.context() as monkeypatch:
+            mock_objects = MagicMock()
+            monkeypatch.setattr(User, "objects", mock_objects)
+            yield mock_objects
+
+    def load_user(self, pk, contributions_count, contribution_data=None):
+        return User.from_db(
+            "default",
+            ["id", "contributions_count", "contribution_data"],
+            [pk, contributions_count, contribution_data or {}],
+        )
+
+    def test_get_dirty_fields(self):
+        user = self.load_user(1, 5)
+
+        assert user.get_dirty_fields(("contributions_count",)) == set()
+
+        user.contributions_count = 6
+
+        assert user.get_dirty_fields(("contributions_count",)) == {"contributions_count"}
+        assert "login" in user.get_dirty_fields()
+
+    def test_get_dirty_fields_mutated_value(self):
+        user = self.load_user(1, 5, contribution_data={"2025-01-01": 1})
+
+        user.contribution_data["2025-01-01"] = 2
+
+        assert user.get_dirty_fields(("contribution_data",)) == {"contribution_data"}
+
+    def test_new_instance_is_dirty(self):
+        assert User(contributions_count=5).get_dirty_fields(("contributions_count",)) == {
+            "contributions_count"
+        }
+
+    def test_bulk_save_skips_unchanged(self, mock_user_objects):
+        unchanged = self.load_user(1, 5)
+        changed = self.load_user(2, 5)
+        changed.contributions_count = 7
+        new = User(contributions_count=1)
+
+        result = BulkSaveModel.bulk_save(
+            User, [unchanged, changed, new], fields=("contributions_count",)
+        )
+
+        assert result == BulkSaveResult(created=1, unchanged=1, updated=1)
+        mock_user_objects.bulk_create.assert_called_once_with([new], 1000)
+        mock_user_objects.bulk_update.assert_called_once_with(
+            [changed], fields=("contributions_count",), batch_size=1000
+        )
+        assert changed.get_dirty_fields(("contributions_count",)) == set()
+        assert new.get_dirty_fields(("contributions_count",)) == set()
@@ -9,6 +9,14 @@ from github.GithubException import BadCredentialsException
 from apps.github.auth import GitHubAppAuth, get_github_client
 
 
+@pytest.fixture(autouse=True)
+def mock_enable_conditional_requests():
+    with mock.patch(
+        "apps.github.auth.enable_conditional_requests", side_effect=lambda gh: gh
+    ) as mock_enable:
+        yield mock_enable
+
+
 class TestGitHubAppAuth:
     """Test GitHub App authentication."""
 
@@ -156,7 +164,7 @@ class TestGitHubAppAuth:
                 )
                 assert client == mock_client
 
-    def test_get_github_client_with_pat_fallback(self):
+    def test_get_github_client_with_pat_fallback(self, mock_enable_conditional_requests):
         """Test GitHub client creation with PAT fallback."""
         with (
             mock.patch("apps.github.auth.settings") as mock_settings,
@@ -170,6 +178,7 @@ class TestGitHubAppAuth:
             mock_github.return_value = mock_client
             client = auth.get_github_client()
             mock_github.assert_called_once_with("test-pat", per_page=100)
+            mock_enable_conditional_requests.assert_called_once_with(mock_client)
             assert client == mock_client
 
     def test_get_github_client_with_custom_per_page(self):
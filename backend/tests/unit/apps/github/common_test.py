@@ -12,6 +12,7 @@ from apps.github.common import sync_issue_comments, sync_repository
 def mock_common_deps(mocker):
     """Mock all dependencies for the sync_repository function."""
     mocks = {
+        "DailyContribution": mocker.patch("apps.github.common.DailyContribution"),
         "Organization": mocker.patch("apps.github.common.Organization"),
         "User": mocker.patch("apps.github.common.User"),
         "Repository": mocker.patch("apps.github.common.Repository"),
@@ -25,8 +26,15 @@ def mock_common_deps(mocker):
             "apps.github.common.check_owasp_site_repository", return_value=False
         ),
         "logger": mocker.patch("apps.github.common.logger"),
+        "IdentityMap": mocker.patch("apps.github.common.IdentityMap"),
+        "RelationWriter": mocker.patch("apps.github.common.RelationWriter"),
     }
 
+    # Delegate identity map updates to the model update_data methods.
+    mocks["IdentityMap"].return_value.update.side_effect = lambda model, gh_object, **kwargs: (
+        model.update_data(gh_object, **kwargs)
+    )
+
     mock_repository = mocks["Repository"].update_data.return_value
     mock_repository.is_archived = False
     mock_repository.track_issues = True
@@ -69,6 +77,7 @@ def gh_item_factory():
     def _create_item(**kwargs):
         item = MagicMock()
         item.updated_at = kwargs.pop("updated_at", timezone.now())
+        item.created_at = kwargs.pop("created_at", item.updated_at)
         item.pull_request = kwargs.pop("pull_request", None)
         item.milestone = kwargs.pop("milestone", None)
         item.assignees = kwargs.pop("assignees", [])
@@ -97,10 +106,38 @@ class TestSyncRepository:
         mock_gh_repository.get_releases.assert_called_once()
         mock_common_deps["Release"].bulk_save.assert_called_once()
         mock_common_deps["RepositoryContributor"].bulk_save.assert_called_once()
+        mock_common_deps["IdentityMap"].return_value.flush.assert_called_once()
+        mock_common_deps["DailyContribution"].refresh.assert_not_called()
 
         assert org == mock_common_deps["Organization"].update_data.return_value
         assert repo == mock_common_deps["Repository"].update_data.return_value
 
+    def test_refreshes_daily_contributions_since_earliest_contribution(
+        self, mock_common_deps, mock_gh_repository, mock_repo, gh_item_factory
+    ):
+        """Tests the rollup refresh starts at the earliest synced contribution date."""
+        now = timezone.now()
+        mock_repo.latest_updated_issue = None
+        mock_repo.latest_updated_pull_request = None
+        mock_repo.project = None
+        mock_repo.track_issues = True
+        mock_gh_repository.get_issues.return_value = [
+            gh_item_factory(created_at=now - td(days=400))
+        ]
+        mock_gh_repository.get_pulls.return_value = [gh_item_factory(created_at=now - td(days=3))]
+        mock_common_deps["Release"].objects.filter.return_value.values_list.return_value = set()
+        mock_gh_repository.get_releases.return_value = [
+            MagicMock(published_at=now - td(days=10)),
+            MagicMock(published_at=None),
+        ]
+
+        sync_repository(mock_gh_repository)
+
+        mock_common_deps["DailyContribution"].refresh.assert_called_once_with(
+            repository_ids=[mock_repo.id],
+            start_date=timezone.localdate(now - td(days=400)),
+        )
+
     def test_owasp_site_repo_skips_languages_and_releases(
         self, mock_common_deps, mock_gh_repository
     ):
@@ -165,6 +202,35 @@ class TestSyncRepository:
             "Couldn't get GitHub issue label %s", issue_url_mock
         )
 
+    def test_label_skipped_when_label_update_returns_none(
+        self, mock_common_deps, mock_gh_repository, gh_item_factory
+    ):
+        """Tests that labels without a node ID are not written."""
+        gh_issue = gh_item_factory(labels=[MagicMock(), MagicMock()])
+        mock_gh_repository.get_issues.return_value = [gh_issue]
+        valid_label = MagicMock()
+        mock_common_deps["Label"].update_data.side_effect = [valid_label, None]
+
+        sync_repository(mock_gh_repository)
+
+        mock_common_deps["RelationWriter"].return_value.set_related.assert_any_call(
+            mock_common_deps["Issue"].update_data.return_value, "labels", [valid_label]
+        )
+
+    def test_milestone_skipped_when_milestone_update_returns_none(
+        self, mock_common_deps, mock_gh_repository, gh_item_factory
+    ):
+        """Tests that milestones without a node ID are skipped."""
+        gh_milestone = gh_item_factory(labels=[MagicMock()])
+        mock_gh_repository.get_milestones.return_value = [gh_milestone]
+        mock_common_deps["Milestone"].update_data.return_value = None
+
+        sync_repository(mock_gh_repository)
+
+        mock_common_deps["Label"].update_data.assert_not_called()
+        for call in mock_common_deps["RelationWriter"].return_value.set_related.call_args_list:
+            assert call.args[0] is not None
+
     def test_contributor_sync_skips_if_user_update_fails(
         self, mock_common_deps, mock_gh_repository
     ):
@@ -189,6 +255,7 @@ class TestSyncRepository:
             gh_valid,
             repository=mock_common_deps["Repository"].update_data.return_value,
             user=valid_user,
+            save=False,
         )
         mock_common_deps["RepositoryContributor"].bulk_save.assert_called_once_with([gh_valid])
 
@@ -296,7 +363,9 @@ class TestSyncRepository:
         sync_repository(mock_gh_repository)
 
         mock_common_deps["User"].update_data.assert_any_call(gh_assignee)
-        mock_pr_instance.assignees.add.assert_called_once_with(mock_user_instance)
+        mock_common_deps["RelationWriter"].return_value.set_related.assert_any_call(
+            mock_pr_instance, "assignees", [mock_user_instance]
+        )
 
     def test_milestone_sync_stops_when_older_than_until(
         self, mock_common_deps, mock_gh_repository, mock_repo, gh_item_factory
@@ -328,6 +397,38 @@ class TestSyncRepository:
 
         assert mock_common_deps["PullRequest"].update_data.call_count == 1
 
+    def test_shared_identity_map_is_not_flushed(
+        self, mock_common_deps, mock_gh_repository, gh_item_factory
+    ):
+        """Tests that a shared identity map is used and left for the caller to flush."""
+        identity_map = MagicMock()
+        gh_assignee = MagicMock()
+        mock_gh_repository.get_issues.return_value = [gh_item_factory(assignees=[gh_assignee])]
+
+        sync_repository(mock_gh_repository, identity_map=identity_map)
+
+        mock_common_deps["IdentityMap"].assert_not_called()
+        identity_map.update.assert_any_call(mock_common_deps["User"], gh_assignee)
+        identity_map.flush.assert_not_called()
+
+    def test_graphql_fetches_issues_and_pull_requests(
+        self, mocker, mock_common_deps, mock_gh_repository, gh_item_factory
+    ):
+        """Tests that issues and pull requests are fetched with GraphQL when enabled."""
+        mock_fetcher = mocker.patch("apps.github.common.RepositoryGraphQLFetcher")
+        gh_issue = gh_item_factory()
+        gh_pull_request = gh_item_factory()
+        mock_fetcher.return_value.get_issues.return_value = [gh_issue]
+        mock_fetcher.return_value.get_pull_requests.return_value = [gh_pull_request]
+
+        sync_repository(mock_gh_repository, graphql=True)
+
+        mock_fetcher.assert_called_once_with(mock_gh_repository)
+        mock_gh_repository.get_issues.assert_not_called()
+        mock_gh_repository.get_pulls.assert_not_called()
+        mock_common_deps["Issue"].update_data.assert_called_once()
+        mock_common_deps["PullRequest"].update_data.assert_called_once()
+
     def test_issue_assignee_skipped_when_user_update_returns_none(
         self, mock_common_deps, mock_gh_repository, gh_item_factory
     ):
@@ -349,7 +450,9 @@ class TestSyncRepository:
 
         sync_repository(mock_gh_repository)
 
-        mock_issue_instance.assignees.add.assert_called_once_with(valid_user)
+        mock_common_deps["RelationWriter"].return_value.set_related.assert_any_call(
+            mock_issue_instance, "assignees", [valid_user]
+        )
 
     def test_pull_request_assignee_skipped_when_user_update_returns_none(
         self, mock_common_deps, mock_gh_repository, gh_item_factory
@@ -372,7 +475,9 @@ class TestSyncRepository:
 
         sync_repository(mock_gh_repository)
 
-        mock_pr_instance.assignees.add.assert_called_once_with(valid_user)
+        mock_common_deps["RelationWriter"].return_value.set_related.assert_any_call(
+            mock_pr_instance, "assignees", [valid_user]
+        )
 
     def test_pull_request_label_sync_handles_unknownobjectexception(
         self, mock_common_deps, mock_gh_repository, gh_item_factory
@@ -429,9 +534,10 @@ class TestSyncRepository:
         mock_gh_repository.get_issues.return_value = [gh_issue]
         gh_pr = gh_item_factory(milestone=gh_item_factory(), labels=[MagicMock()])
         mock_gh_repository.get_pulls.return_value = [gh_pr]
+        pr_label = MagicMock()
         mock_common_deps["Label"].update_data.side_effect = [
             UnknownObjectException(status=404, data={}, headers={}),
-            MagicMock(),
+            pr_label,
         ]
 
         sync_repository(
@@ -454,8 +560,11 @@ class TestSyncRepository:
             mock_common_deps["Milestone"].update_data.return_value.url,
         )
         mock_common_deps["Issue"].update_data.assert_called_once()
-        mock_common_deps["Issue"].update_data.return_value.assignees.add.assert_called_once_with(
-            mock_common_deps["User"].update_data.return_value
+        relation_writer = mock_common_deps["RelationWriter"].return_value
+        relation_writer.set_related.assert_any_call(
+            mock_common_deps["Issue"].update_data.return_value,
+            "assignees",
+            [mock_common_deps["User"].update_data.return_value],
         )
         mock_common_deps["PullRequest"].update_data.assert_called_once()
         mock_common_deps["Milestone"].update_data.assert_any_call(
@@ -463,7 +572,12 @@ class TestSyncRepository:
             author=mock_common_deps["User"].update_data.return_value,
             repository=mock_repo,
         )
-        mock_common_deps["PullRequest"].update_data.return_value.labels.add.assert_called_once()
+        relation_writer.set_related.assert_any_call(
+            mock_common_deps["PullRequest"].update_data.return_value,
+            "labels",
+            [pr_label],
+        )
+        relation_writer.flush.assert_called_once()
 
 
 class TestSyncIssueComments:
@@ -0,0 +1,135 @@
+import json
+from datetime import UTC, datetime
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from apps.github.graphql_fetcher import (
+    ISSUES_QUERY,
+    PULL_REQUESTS_QUERY,
+    RepositoryGraphQLFetcher,
+)
+from apps.github.models.issue import Issue
+from apps.github.models.label import Label
+from apps.github.models.milestone import Milestone
+from apps.github.models.pull_request import PullRequest
+from apps.github.models.user import User
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures" / "graphql"
+
+
+def load_fixture(name):
+    with (FIXTURES_DIR / name).open() as file:
+        return json.load(file)
+
+
+@pytest.fixture
+def gh_repository():
+    gh_repository = MagicMock()
+    gh_repository.full_name = "OWASP/Nest"
+    gh_repository.requester.graphql_query.side_effect = lambda query, variables: (
+        {},
+        (
+            load_fixture("pull_requests.json")
+            if query == PULL_REQUESTS_QUERY
+            else load_fixture(
+                "issues_page_2.json" if variables["cursor"] else "issues_page_1.json"
+            )
+        ),
+    )
+    return gh_repository
+
+
+class TestRepositoryGraphQLFetcher:
+    def test_get_issues_pages(self, gh_repository):
+        fetcher = RepositoryGraphQLFetcher(gh_repository)
+
+        issues = list(fetcher.get_issues())
+
+        assert [issue.number for issue in issues] == [101, 100, 99]
+        graphql_query = gh_repository.requester.graphql_query
+        assert graphql_query.call_count == 2
+        first_call, second_call = graphql_query.call_args_list
+        assert first_call.args[0] == ISSUES_QUERY
+        assert first_call.args[1]["cursor"] is None
+        assert first_call.args[1]["name"] == "Nest"
+        assert first_call.args[1]["owner"] == "OWASP"
+        assert second_call.args[1]["cursor"] == "Y3Vyc29yOnYyOpK5MjAyNC0wNi0wM1QxMjowMDowMFo="
+
+    def test_get_issues_stops_paging(self, gh_repository):
+        fetcher = RepositoryGraphQLFetcher(gh_repository)
+
+        issue = next(fetcher.get_issues())
+
+        assert issue.number == 101
+        gh_repository.requester.graphql_query.assert_called_once()
+
+    def test_issue_conversion(self, gh_repository):
+        issue, locked_issue, bot_issue = RepositoryGraphQLFetcher(gh_repository).get_issues()
+
+        assert issue.raw_data == {"node_id": "I_kwDOMZ8Vrs600101"}
+        assert issue.id == 2300000101
+        assert issue.comments == 5
+        assert issue.html_url == "https://github.com/OWASP/Nest/issues/101"
+        assert issue.pull_request is None
+        assert issue.state == "open"
+        assert issue.updated_at == datetime(2024, 6, 5, 12, tzinfo=UTC)
+        assert [assignee.login for assignee in issue.assignees] == ["arkid15r", "kasya"]
+        assert [label.name for label in issue.labels] == ["bug", "good first issue"]
+        assert issue.milestone.closed_issues == 10
+        assert issue.milestone.open_issues == 3
+        assert issue.milestone.creator.login == "arkid15r"
+        assert issue.milestone.state == "open"
+
+        assert locked_issue.user is None
+        assert locked_issue.active_lock_reason == "too heated"
+        assert locked_issue.state == "closed"
+        assert locked_issue.state_reason == "not_planned"
+
+        assert bot_issue.user.login == "dependabot[bot]"
+        assert bot_issue.user.type == "Bot"
+        assert bot_issue.user.followers is None
+
+    def test_pull_request_conversion(self, gh_repository):
+        merged_pull_request, pull_request = RepositoryGraphQLFetcher(
+            gh_repository
+        ).get_pull_requests()
+
+        assert merged_pull_request.state == "closed"
+        assert merged_pull_request.merged_at == datetime(2024, 6, 4, 10, tzinfo=UTC)
+        assert merged_pull_request.user.login == "dependabot[bot]"
+        assert [label.name for label in merged_pull_request.labels] == ["dependencies"]
+        assert pull_request.state == "open"
+        assert pull_request.merged_at is None
+        assert pull_request.milestone is None
+
+    def test_objects_populate_models(self, gh_repository):
+        fetcher = RepositoryGraphQLFetcher(gh_repository)
+        gh_issue = next(fetcher.get_issues())
+        gh_pull_request = next(fetcher.get_pull_requests())
+
+        author = User()
+        author.from_github(gh_issue.user)
+        milestone = Milestone()
+        milestone.from_github(gh_issue.milestone)
+        label = Label()
+        label.from_github(gh_issue.labels[0])
+        issue = Issue()
+        issue.from_github(gh_issue, author=author, milestone=milestone)
+        pull_request = PullRequest()
+        pull_request.from_github(gh_pull_request)
+
+        assert author.login == "kasya"
+        assert author.followers_count == 12
+        assert author.public_repositories_count == 8
+        assert not author.is_bot
+        assert milestone.title == "v1.0"
+        assert milestone.url == "https://github.com/OWASP/Nest/milestone/3"
+        assert label.color == "d73a4a"
+        assert issue.comments_count == 5
+        assert issue.sequence_id == 2300000101
+        assert issue.title == "Issue 101"
+        assert pull_request.state == "closed"
+        assert pull_request.number == 102
+        assert User.get_node_id(gh_issue.user) == "MDQ6VXNlcj5873153"
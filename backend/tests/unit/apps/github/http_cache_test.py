@@ -0,0 +1,206 @@
+"""Tests for the GitHub conditional request cache."""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+import pytest
+from django.core.cache import cache, caches
+from github import Github
+from requests import PreparedRequest, Response
+
+from apps.github.http_cache import (
+    ConditionalHTTPRequestsConnection,
+    ConditionalHTTPSRequestsConnection,
+    ConditionalRequestAdapter,
+    enable_conditional_requests,
+    set_connection_class,
+)
+
+github_http_cache = caches["github-http"]
+
+REPOSITORY_FIXTURE = {
+    "full_name": "OWASP/Nest",
+    "id": 1,
+    "name": "Nest",
+    "stargazers_count": 42,
+}
+REPOSITORY_ETAG = '"repository-etag"'
+
+
+class GitHubRequestHandler(BaseHTTPRequestHandler):
+    """Stand-in GitHub API serving a recorded repository response."""
+
+    requests: list[dict[str, str]] = []
+
+    def do_GET(self):
+        """Serve the recorded response honoring If-None-Match."""
+        self.requests.append(dict(self.headers))
+        if self.headers.get("If-None-Match") == REPOSITORY_ETAG:
+            self.send_response(304)
+            self.send_header("ETag", REPOSITORY_ETAG)
+            self.send_header("X-RateLimit-Limit", "5000")
+            self.send_header("X-RateLimit-Remaining", "4999")
+            self.end_headers()
+            return
+
+        body = json.dumps(REPOSITORY_FIXTURE).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", REPOSITORY_ETAG)
+        self.send_header("X-RateLimit-Limit", "5000")
+        self.send_header("X-RateLimit-Remaining", "4998")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        """Silence request logging."""
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    github_http_cache.clear()
+    yield
+    github_http_cache.clear()
+
+
+@pytest.fixture
+def github_server():
+    GitHubRequestHandler.requests = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), GitHubRequestHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def make_request(url="https://api.github.com/repos/OWASP/Nest", method="GET"):
+    request = PreparedRequest()
+    request.prepare(method=method, url=url, headers={"Accept": "application/json"})
+    return request
+
+
+def make_response(status_code, headers=None, content=b""):
+    response = Response()
+    response._content = content
+    response._content_consumed = True
+    response.headers.update(headers or {})
+    response.status_code = status_code
+    response.url = "https://api.github.com/repos/OWASP/Nest"
+    return response
+
+
+class TestConditionalRequestAdapter:
+    def test_get_key_ignores_credentials(self):
+        request = make_request()
+        authorized_request = make_request()
+        authorized_request.headers["Authorization"] = "token test"
+
+        key = ConditionalRequestAdapter.get_key(request)
+
+        assert key.startswith("github-http:")
+        assert key == ConditionalRequestAdapter.get_key(authorized_request)
+        assert key != ConditionalRequestAdapter.get_key(
+            make_request("https://api.github.com/repos/OWASP/www")
+        )
+
+    def test_send_stores_response_with_etag(self):
+        adapter = ConditionalRequestAdapter()
+        request = make_request()
+        response = make_response(200, {"ETag": REPOSITORY_ETAG}, b"{}")
+
+        with mock.patch("requests.adapters.HTTPAdapter.send", return_value=response):
+            assert adapter.send(request) is response
+
+        entry = github_http_cache.get(ConditionalRequestAdapter.get_key(request))
+        assert entry["body"] == b"{}"
+        assert entry["headers"]["etag"] == REPOSITORY_ETAG
+        assert cache.get(ConditionalRequestAdapter.get_key(request)) is None
+
+    def test_send_skips_response_without_validators(self):
+        adapter = ConditionalRequestAdapter()
+        request = make_request()
+
+        with mock.patch(
+            "requests.adapters.HTTPAdapter.send", return_value=make_response(200, content=b"{}")
+        ):
+            adapter.send(request)
+
+        assert github_http_cache.get(ConditionalRequestAdapter.get_key(request)) is None
+
+    def test_send_serves_not_modified_response_from_cache(self):
+        adapter = ConditionalRequestAdapter()
+        request = make_request()
+        github_http_cache.set(
+            ConditionalRequestAdapter.get_key(request),
+            {
+                "body": b'{"id": 1}',
+                "headers": {
+                    "etag": REPOSITORY_ETAG,
+                    "last-modified": "Mon, 01 Jan 2024 00:00:00 GMT",
+                    "x-ratelimit-remaining": "10",
+                },
+            },
+        )
+        not_modified = make_response(304, {"X-RateLimit-Remaining": "4999"})
+
+        with mock.patch(
+            "requests.adapters.HTTPAdapter.send", return_value=not_modified
+        ) as mock_send:
+            response = adapter.send(request)
+
+        sent_request = mock_send.call_args.args[0]
+        assert sent_request.headers["If-None-Match"] == REPOSITORY_ETAG
+        assert sent_request.headers["If-Modified-Since"] == "Mon, 01 Jan 2024 00:00:00 GMT"
+        assert response.status_code == 200
+        assert response.json() == {"id": 1}
+        assert response.headers["X-RateLimit-Remaining"] == "4999"
+
+    def test_send_skips_non_get_requests(self):
+        adapter = ConditionalRequestAdapter()
+        request = make_request(method="POST")
+        response = make_response(200, {"ETag": REPOSITORY_ETAG})
+
+        with mock.patch("requests.adapters.HTTPAdapter.send", return_value=response):
+            assert adapter.send(request) is response
+
+        assert github_http_cache.get(ConditionalRequestAdapter.get_key(request)) is None
+
+
+class TestEnableConditionalRequests:
+    def test_replaces_connection_class(self):
+        https_client = enable_conditional_requests(Github())
+        http_client = enable_conditional_requests(Github(base_url="http://127.0.0.1"))
+
+        assert (
+            https_client.requester._Requester__connectionClass
+            is ConditionalHTTPSRequestsConnection
+        )
+        assert (
+            http_client.requester._Requester__connectionClass is ConditionalHTTPRequestsConnection
+        )
+
+    def test_set_connection_class_unsupported_requester(self):
+        requester = mock.Mock(spec=[])
+
+        with mock.patch("apps.github.http_cache.logger") as mock_logger:
+            assert not set_connection_class(requester, ConditionalHTTPSRequestsConnection)
+
+        mock_logger.warning.assert_called_once()
+
+    def test_revalidates_repeated_requests(self, github_server):
+        host, port = github_server.server_address
+        gh = enable_conditional_requests(Github(base_url=f"http://{host}:{port}", retry=None))
+
+        first = gh.get_repo("OWASP/Nest", lazy=False)
+        second = gh.get_repo("OWASP/Nest", lazy=False)
+
+        assert first.stargazers_count == second.stargazers_count == 42
+        assert second.full_name == "OWASP/Nest"
+        assert len(GitHubRequestHandler.requests) == 2
+        assert "If-None-Match" not in GitHubRequestHandler.requests[0]
+        assert GitHubRequestHandler.requests[1]["If-None-Match"] == REPOSITORY_ETAG
+        assert gh.requester.rate_limiting[0] == 4999
@@ -0,0 +1,154 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+import pytest
+from django.db import IntegrityError
+
+from apps.github.identity_map import IdentityMap
+
+
+def create_gh_object(node_id):
+    gh_object = MagicMock()
+    gh_object.node_id = node_id
+    return gh_object
+
+
+def create_instance(node_id, pk=1):
+    instance = MagicMock()
+    instance.node_id = node_id
+    instance.pk = pk
+    return instance
+
+
+@pytest.fixture(autouse=True)
+def mock_atomic(mocker):
+    return mocker.patch("apps.github.identity_map.transaction.atomic")
+
+
+@pytest.fixture
+def model():
+    model = MagicMock()
+    model.objects.filter.return_value = []
+    model.side_effect = lambda node_id: create_instance(node_id, pk=None)
+    return model
+
+
+class TestIdentityMap:
+    def test_update_existing_entity_once(self, model):
+        instance = create_instance("U_1")
+        model.objects.filter.return_value = [instance]
+        identity_map = IdentityMap()
+        gh_user = create_gh_object("U_1")
+
+        first = identity_map.update(model, gh_user)
+        second = identity_map.update(model, create_gh_object("U_1"))
+
+        assert first is second is instance
+        model.objects.filter.assert_called_once_with(node_id__in={"U_1"})
+        instance.from_github.assert_called_once_with(gh_user)
+        instance.save.assert_not_called()
+        assert identity_map.dirty[model] == {"U_1"}
+
+    def test_update_new_entity_is_saved(self, model):
+        identity_map = IdentityMap()
+
+        instance = identity_map.update(model, create_gh_object("U_2"), author="author")
+
+        model.assert_called_once_with(node_id="U_2")
+        instance.from_github.assert_called_once()
+        assert instance.from_github.call_args.kwargs == {"author": "author"}
+        instance.save.assert_called_once()
+        assert not identity_map.dirty[model]
+        assert not identity_map.missing[model]
+
+    def test_update_without_node_id(self, model):
+        model.get_node_id.return_value = None
+        identity_map = IdentityMap()
+
+        assert identity_map.update(model, None) is None
+        assert identity_map.update(model, create_gh_object(None)) is None
+        model.objects.filter.assert_not_called()
+
+    def test_load_queries_unseen_node_ids_once(self, model):
+        model.objects.filter.return_value = [create_instance("U_1")]
+        identity_map = IdentityMap()
+        gh_objects = [create_gh_object("U_1"), create_gh_object("U_2"), None]
+
+        identity_map.load(model, gh_objects)
+        identity_map.load(model, gh_objects)
+        identity_map.update(model, create_gh_object("U_2"))
+
+        model.objects.filter.assert_called_once_with(node_id__in={"U_1", "U_2"})
+        assert identity_map.missing[model] == set()
+        assert set(identity_map.instances[model]) == {"U_1", "U_2"}
+
+    def test_flush_bulk_saves_dirty_entities(self, model):
+        instance = create_instance("U_1")
+        model.objects.filter.return_value = [instance]
+        identity_map = IdentityMap()
+        identity_map.update(model, create_gh_object("U_1"))
+
+        identity_map.flush()
+        identity_map.flush()
+
+        model.bulk_save.assert_called_once_with([instance])
+
+    def test_update_new_entity_inserted_concurrently(self, model):
+        existing = create_instance("U_2")
+        model.objects.get.return_value = existing
+        identity_map = IdentityMap()
+        identity_map.load(model, [create_gh_object("U_2")])
+
+        def create_duplicate(node_id):
+            instance = create_instance(node_id, pk=None)
+            instance.save.side_effect = IntegrityError("duplicate key value")
+            return instance
+
+        model.side_effect = create_duplicate
+        gh_user = create_gh_object("U_2")
+
+        instance = identity_map.update(model, gh_user)
+
+        assert instance is existing
+        model.objects.get.assert_called_once_with(node_id="U_2")
+        existing.from_github.assert_called_once_with(gh_user)
+        assert identity_map.dirty[model] == {"U_2"}
+        assert not identity_map.missing[model]
+        assert identity_map.update(model, create_gh_object("U_2")) is existing
+
+    def test_update_same_new_entity_from_concurrent_maps(self, model):
+        rows = {}
+        lock = threading.Lock()
+        barrier = threading.Barrier(2)
+
+        def insert(instance):
+            # Both maps saw the entity as missing before either inserts it.
+            barrier.wait()
+            with lock:
+                if instance.node_id in rows:
+                    raise IntegrityError
+                instance.pk = len(rows) + 1
+                rows[instance.node_id] = instance
+
+        def create_new(node_id):
+            instance = create_instance(node_id, pk=None)
+            instance.save.side_effect = lambda: insert(instance)
+            return instance
+
+        model.side_effect = create_new
+        model.objects.get.side_effect = lambda node_id: rows[node_id]
+        identity_maps = [IdentityMap(), IdentityMap()]
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            instances = list(
+                executor.map(
+                    lambda identity_map: identity_map.update(model, create_gh_object("U_3")),
+                    identity_maps,
+                )
+            )
+
+        assert instances[0] is instances[1] is rows["U_3"]
+        assert len(rows) == 1
+        assert all(not identity_map.missing[model] for identity_map in identity_maps)
+        assert sorted(len(identity_map.dirty[model]) for identity_map in identity_maps) == [0, 1]
@@ -37,6 +37,12 @@ def mock_gh(mock_get_github_client):
     return mock_gh_instance
 
 
+@pytest.fixture
+def mock_daily_contribution():
+    with patch("apps.github.management.commands.github_sync_user.DailyContribution") as mock:
+        yield mock
+
+
 @pytest.fixture
 def mock_user():
     with patch("apps.github.management.commands.github_sync_user.User") as mock:
@@ -312,6 +318,7 @@ class TestGithubSyncUserCommand:
         mock_issue,
         mock_gh,
         default_options,
+        mock_daily_contribution,
     ):
         mock_repository = MagicMock()
         mock_qs = mock_repo_contributor.filter.return_value
@@ -345,6 +352,9 @@ class TestGithubSyncUserCommand:
         mock_commit.bulk_save.assert_called_once()
         mock_pr.bulk_save.assert_called_once()
         mock_issue.bulk_save.assert_called_once()
+        mock_daily_contribution.refresh.assert_called_once_with(
+            user_ids=[mock_user.update_data.return_value.id]
+        )
         mock_populate.assert_called_once()
 
     @patch(
@@ -556,6 +566,7 @@ class TestGithubSyncUserCommand:
         mock_commit,
         mock_gh,
         default_options,
+        mock_daily_contribution,
     ):
         """Test handling commits where gh_commit.committer is None."""
         (
@@ -778,6 +789,7 @@ class TestGithubSyncUserCommand:
         mock_commit,
         mock_gh,
         default_options,
+        mock_daily_contribution,
     ):
         """Test commit committer reference update."""
         (
@@ -0,0 +1,67 @@
+"""Test cases for the github_update_daily_contributions command."""
+
+from datetime import UTC, date, datetime
+from unittest import mock
+
+import pytest
+
+from apps.common.models import BulkSaveResult
+from apps.github.management.commands.github_update_daily_contributions import Command
+
+
+class TestUpdateDailyContributionsCommand:
+    """Test suite for the update daily contributions command."""
+
+    @pytest.fixture
+    def command(self):
+        return Command()
+
+    def test_command_help_text(self, command):
+        assert command.help == "Update GitHub daily contributions rollup."
+
+    def test_add_arguments(self, command):
+        parser = mock.Mock()
+        command.add_arguments(parser)
+
+        assert parser.add_argument.call_count == 2
+        assert parser.add_argument.call_args_list[0].args == ("--days",)
+        assert parser.add_argument.call_args_list[1].args == ("--offset",)
+
+    @mock.patch("apps.github.management.commands.github_update_daily_contributions.Repository")
+    @mock.patch(
+        "apps.github.management.commands.github_update_daily_contributions.DailyContribution"
+    )
+    def test_handle_all_days(self, mock_daily_contribution, mock_repository, command):
+        mock_repository.objects.order_by.return_value.values_list.return_value = [1, 2, 3]
+        mock_daily_contribution.refresh.return_value = BulkSaveResult(created=1, updated=1)
+
+        with mock.patch.object(command, "stdout") as mock_stdout:
+            command.handle(days=None, offset=1)
+
+        assert mock_daily_contribution.refresh.call_args_list == [
+            mock.call(repository_ids=[2], start_date=None),
+            mock.call(repository_ids=[3], start_date=None),
+        ]
+        mock_stdout.write.assert_any_call("2 of 3     repository #2\n")
+        mock_stdout.write.assert_called_with(
+            "Updated daily contributions: 2 created, 2 updated, 0 unchanged\n"
+        )
+
+    @mock.patch("apps.github.management.commands.github_update_daily_contributions.timezone")
+    @mock.patch("apps.github.management.commands.github_update_daily_contributions.Repository")
+    @mock.patch(
+        "apps.github.management.commands.github_update_daily_contributions.DailyContribution"
+    )
+    def test_handle_recent_days(
+        self, mock_daily_contribution, mock_repository, mock_timezone, command
+    ):
+        mock_repository.objects.order_by.return_value.values_list.return_value = [1]
+        mock_daily_contribution.refresh.return_value = BulkSaveResult()
+        mock_timezone.now.return_value = datetime(2025, 1, 31, 12, tzinfo=UTC)
+
+        with mock.patch.object(command, "stdout"):
+            command.handle(days=30, offset=0)
+
+        mock_daily_contribution.refresh.assert_called_once_with(
+            repository_ids=[1], start_date=date(2025, 1, 1)
+        )
@@ -1,6 +1,7 @@
 from unittest import mock
 
 import pytest
+from django.core.cache import cache
 
 from apps.github.management.commands.github_update_owasp_organization import (
     Chapter,
@@ -8,9 +9,43 @@ from apps.github.management.commands.github_update_owasp_organization import (
     Committee,
     Project,
     Repository,
+    SyncProgress,
 )
 
 
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+def create_gh_client():
+    mock_gh_client = mock.Mock()
+    mock_gh_client.requester.rate_limiting = (5000, 5000)
+    mock_gh_client.create_from_raw_data.side_effect = lambda _klass, raw_data, _headers: raw_data[
+        "repository"
+    ]
+    return mock_gh_client
+
+
+class TestSyncProgress:
+    def test_mark_synced(self):
+        progress = SyncProgress()
+        progress.mark_synced(["Nest", "www-project-nest"])
+
+        assert progress.get_synced(["Nest", "www-chapter-test", "www-project-nest"]) == {
+            "Nest",
+            "www-project-nest",
+        }
+
+    def test_resume(self):
+        SyncProgress().mark_synced(["Nest"])
+
+        assert SyncProgress(resume=True).get_synced(["Nest"]) == {"Nest"}
+        assert SyncProgress().get_synced(["Nest"]) == set()
+
+
 class TestGithubUpdateOwaspOrganization:
     @pytest.fixture
     def command(self):
@@ -19,7 +54,13 @@ class TestGithubUpdateOwaspOrganization:
     @pytest.mark.parametrize(
         ("argument_name", "expected_properties"),
         [
-            ("--offset", {"default": 0, "required": False, "type": int}),
+            (
+                "--graphql",
+                {
+                    "action": "store_true",
+                    "help": "Fetch issues and pull requests using the GitHub GraphQL API",
+                },
+            ),
             (
                 "--repository",
                 {
@@ -30,6 +71,22 @@ class TestGithubUpdateOwaspOrganization:
                     ),
                 },
             ),
+            (
+                "--resume",
+                {
+                    "action": "store_true",
+                    "help": "Skip repositories synced by the previous organization run",
+                },
+            ),
+            (
+                "--workers",
+                {
+                    "default": 1,
+                    "required": False,
+                    "type": int,
+                    "help": "Number of repositories to sync concurrently",
+                },
+            ),
         ],
     )
     def test_add_arguments(self, command, argument_name, expected_properties):
@@ -38,30 +95,30 @@ class TestGithubUpdateOwaspOrganization:
         mock_parser.add_argument.assert_any_call(argument_name, **expected_properties)
 
     @pytest.mark.parametrize(
-        ("repository_name", "offset", "expected_calls"),
+        ("repository_name", "workers", "expected_calls"),
         [
             (
                 "www-project-test",
-                0,
+                1,
                 {"project": 1, "chapter": 0, "committee": 0},
             ),
             (
                 "www-chapter-test",
-                0,
+                1,
                 {"project": 0, "chapter": 1, "committee": 0},
             ),
             (
                 "www-committee-test",
-                0,
+                1,
                 {"project": 0, "chapter": 0, "committee": 1},
             ),
             (
                 "www-event-test",
-                0,
+                1,
                 {"project": 0, "chapter": 0, "committee": 0},
             ),
-            (None, 0, {"project": 1, "chapter": 1, "committee": 1, "event": 1}),
-            (None, 1, {"project": 0, "chapter": 1, "committee": 1, "event": 1}),
+            (None, 1, {"project": 1, "chapter": 1, "committee": 1, "event": 1}),
+            (None, 3, {"project": 1, "chapter": 1, "committee": 1, "event": 1}),
         ],
     )
     @mock.patch(
@@ -74,10 +131,10 @@ class TestGithubUpdateOwaspOrganization:
         mock_get_github_client,
         command,
         repository_name,
-        offset,
+        workers,
         expected_calls,
     ):
-        mock_gh_client = mock.Mock()
+        mock_gh_client = create_gh_client()
         mock_get_github_client.return_value = mock_gh_client
         mock_org = mock.Mock()
         mock_gh_client.get_organization.return_value = mock_org
@@ -86,6 +143,7 @@ class TestGithubUpdateOwaspOrganization:
             mock_repo = mock.Mock()
             mock_repo.name = name
             mock_repo.organization.raw_data = {"node_id": "12345"}
+            mock_repo.raw_data = {"repository": mock_repo}
             return mock_repo
 
         mock_repos = [
@@ -141,9 +199,9 @@ class TestGithubUpdateOwaspOrganization:
             mock_repository_objects.filter.return_value.count.return_value = 1
 
             command.stdout = mock.MagicMock()
-            command.handle(repository=repository_name, offset=offset)
+            command.handle(repository=repository_name, workers=workers)
 
-            mock_get_github_client.assert_called_once()
+            assert mock_get_github_client.call_count == (workers + 1 if workers > 1 else 1)
             mock_gh_client.get_organization.assert_called_once_with("OWASP")
 
             if repository_name:
@@ -166,9 +224,9 @@ class TestGithubUpdateOwaspOrganization:
                 assert mock_committee_update.call_count == expected_calls["committee"]
                 assert command.stdout.write.call_count > 0
 
-            mock_project_bulk_save.assert_called_once()
-            mock_chapter_bulk_save.assert_called_once()
-            mock_committee_bulk_save.assert_called_once()
+            assert mock_project_bulk_save.call_count == workers
+            assert mock_chapter_bulk_save.call_count == workers
+            assert mock_committee_bulk_save.call_count == workers
 
     @mock.patch(
         "apps.github.management.commands.github_update_owasp_organization.get_github_client"
@@ -183,7 +241,7 @@ class TestGithubUpdateOwaspOrganization:
         command,
     ):
         """Tests the full organization sync."""
-        mock_gh_client = mock.Mock()
+        mock_gh_client = create_gh_client()
         mock_get_github_client.return_value = mock_gh_client
         mock_org = mock.Mock()
         mock_org.public_repos = 3
@@ -193,6 +251,7 @@ class TestGithubUpdateOwaspOrganization:
             mock_repo = mock.Mock()
             mock_repo.name = name
             mock_repo.html_url = f"https://github.com/OWASP/{name}"
+            mock_repo.raw_data = {"repository": mock_repo}
             return mock_repo
 
         class PaginatedListMock(list):
@@ -239,7 +298,7 @@ class TestGithubUpdateOwaspOrganization:
             mock_project_objects.all.return_value = [mock_project, mock_project_no_repo]
             mock_repository_objects.filter.return_value.count.return_value = 2
             command.stdout = mock.MagicMock()
-            command.handle(repository=None, offset=0)
+            command.handle(repository=None)
             assert mock_sync_repository.call_count == 3
             mock_logger.exception.assert_called_once_with(
                 "Error syncing repository %s", "https://github.com/OWASP/www-chapter-error"
@@ -250,3 +309,46 @@ class TestGithubUpdateOwaspOrganization:
             mock_project_objects.all.assert_called_once()
             mock_project.repositories.add.assert_called_once_with(mock_project.owasp_repository)
             mock_project_no_repo.repositories.add.assert_not_called()
+
+    @mock.patch(
+        "apps.github.management.commands.github_update_owasp_organization.get_github_client"
+    )
+    @mock.patch("apps.github.management.commands.github_update_owasp_organization.sync_repository")
+    def test_handle_resume(self, mock_sync_repository, mock_get_github_client, command):
+        """Tests resuming the organization sync skips synced repositories only."""
+        mock_gh_client = create_gh_client()
+        mock_get_github_client.return_value = mock_gh_client
+        mock_org = mock.Mock()
+        mock_gh_client.get_organization.return_value = mock_org
+
+        repos = []
+        for name in ("www-project-synced", "www-project-error", "www-project-new"):
+            mock_repo = mock.Mock()
+            mock_repo.name = name
+            mock_repo.raw_data = {"repository": mock_repo}
+            repos.append(mock_repo)
+        mock_org.get_repos.return_value = repos
+        mock_sync_repository.side_effect = [Exception("Sync failed"), (None, mock.Mock())]
+        SyncProgress().mark_synced(["www-project-synced"])
+
+        with (
+            mock.patch.object(Project, "bulk_save"),
+            mock.patch.object(Chapter, "bulk_save"),
+            mock.patch.object(Committee, "bulk_save"),
+            mock.patch.object(Project, "update_data"),
+            mock.patch.object(Project, "objects") as mock_project_objects,
+            mock.patch.object(Repository, "objects"),
+        ):
+            mock_project_objects.all.return_value = []
+            command.stdout = mock.MagicMock()
+            command.handle(repository=None, resume=True)
+
+        synced_repos = [call.args[0] for call in mock_sync_repository.call_args_list]
+        assert synced_repos == repos[1:]
+        command.stdout.write.assert_any_call(
+            "2 of 3       https://github.com/OWASP/www-project-error\n"
+        )
+        assert SyncProgress(resume=True).get_synced([repo.name for repo in repos]) == {
+            "www-project-synced",
+            "www-project-new",
+        }
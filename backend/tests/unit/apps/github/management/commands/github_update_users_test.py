@@ -4,6 +4,7 @@ from unittest.mock import MagicMock, patch
 
 from django.core.management.base import BaseCommand
 
+from apps.common.models import BulkSaveResult
 from apps.github.management.commands.github_update_users import Command
 
 
@@ -44,6 +45,10 @@ class TestGithubUpdateUsersCommand:
         mock_users_queryset.__getitem__.return_value = [mock_user1, mock_user2, mock_user3]
 
         mock_user.objects.order_by.return_value = mock_users_queryset
+        mock_user.bulk_save.side_effect = [
+            BulkSaveResult(unchanged=1, updated=1),
+            BulkSaveResult(updated=1),
+        ]
 
         mock_rc_objects = MagicMock()
         mock_rc_objects.exclude.return_value.values.return_value.annotate.return_value = [
@@ -64,10 +69,13 @@ class TestGithubUpdateUsersCommand:
         mock_rc_objects.exclude.return_value.values.assert_called_once_with("user_id")
         mock_rc_objects.exclude.return_value.values.return_value.annotate.assert_called_once()
 
-        assert command.stdout.write.call_count == 3
+        assert command.stdout.write.call_count == 4
         command.stdout.write.assert_any_call("1 of 3     User 1\n")
         command.stdout.write.assert_any_call("2 of 3     User 2\n")
         command.stdout.write.assert_any_call("3 of 3     User 3\n")
+        command.stdout.write.assert_called_with(
+            "Updated users: 0 created, 2 updated, 1 unchanged\n"
+        )
 
         assert mock_user1.contributions_count == 10
         assert mock_user2.contributions_count == 20
@@ -105,7 +113,7 @@ class TestGithubUpdateUsersCommand:
         mock_users_queryset.count.assert_called_once()
         mock_users_queryset.__getitem__.assert_called_once_with(slice(1, None))
 
-        assert command.stdout.write.call_count == 2
+        assert command.stdout.write.call_count == 3
         command.stdout.write.assert_any_call("2 of 2     User 2\n")
         command.stdout.write.assert_any_call("3 of 2     User 3\n")
 
@@ -139,7 +147,7 @@ class TestGithubUpdateUsersCommand:
         command.stdout = MagicMock()
         command.handle(offset=0)
 
-        assert command.stdout.write.call_count == 2
+        assert command.stdout.write.call_count == 3
         command.stdout.write.assert_any_call("1 of 2     User 1\n")
         command.stdout.write.assert_any_call("2 of 2     User 2\n")
 
@@ -172,7 +180,8 @@ class TestGithubUpdateUsersCommand:
         command.stdout = MagicMock()
         command.handle(offset=0)
 
-        command.stdout.write.assert_called_once_with("1 of 1     User 1\n")
+        assert command.stdout.write.call_count == 2
+        command.stdout.write.assert_any_call("1 of 1     User 1\n")
 
         assert mock_user1.contributions_count == 15
 
@@ -198,7 +207,7 @@ class TestGithubUpdateUsersCommand:
         command.stdout = MagicMock()
         command.handle(offset=0)
 
-        command.stdout.write.assert_not_called()
+        command.stdout.write.assert_called_once()
 
         assert mock_user.bulk_save.call_count == 1
         assert mock_user.bulk_save.call_args_list[-1][0][0] == []
@@ -228,7 +237,7 @@ class TestGithubUpdateUsersCommand:
         command.stdout = MagicMock()
         command.handle(offset=0)
 
-        assert command.stdout.write.call_count == 2
+        assert command.stdout.write.call_count == 3
         command.stdout.write.assert_any_call("1 of 2     User 1\n")
         command.stdout.write.assert_any_call("2 of 2     User 2\n")
 
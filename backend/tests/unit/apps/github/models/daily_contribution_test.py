@@ -0,0 +1,110 @@
+from datetime import date
+from unittest import mock
+
+import pytest
+
+from apps.common.models import BulkSaveResult
+from apps.github.models.daily_contribution import DailyContribution
+
+DAILY_CONTRIBUTION_OBJECTS_PATH = "apps.github.models.daily_contribution.DailyContribution.objects"
+
+
+class TestDailyContribution:
+    @pytest.fixture
+    def mock_source(self):
+        source = mock.Mock()
+        grouped = source.objects.filter.return_value.order_by.return_value.annotate.return_value
+        grouped.values_list.return_value.annotate.return_value = [
+            (date(2025, 1, 1), 10, 1, 2),
+            (date(2025, 1, 2), None, 1, 1),
+        ]
+
+        return source
+
+    def test_str(self):
+        contribution = DailyContribution(count=3, date=date(2025, 1, 1), kind="commit")
+
+        assert str(contribution) == "3 commit contribution(s) on 2025-01-01"
+
+    def test_bulk_save(self):
+        mock_contributions = [mock.Mock(id=None)]
+        with mock.patch("apps.common.models.BulkSaveModel.bulk_save") as mock_bulk_save:
+            result = DailyContribution.bulk_save(mock_contributions)
+
+        assert result == mock_bulk_save.return_value
+        mock_bulk_save.assert_called_once_with(
+            DailyContribution,
+            mock_contributions,
+            unique_fields=("date", "user", "repository", "kind"),
+        )
+
+    def test_get_sources(self):
+        sources = DailyContribution.get_sources()
+
+        assert set(sources) == set(DailyContribution.Kind)
+        assert sources[DailyContribution.Kind.RELEASE][1:] == ("published_at", {"is_draft": False})
+
+    def test_refresh(self, mock_source):
+        with (
+            mock.patch.object(
+                DailyContribution,
+                "get_sources",
+                return_value={DailyContribution.Kind.COMMIT: (mock_source, "created_at", {})},
+            ),
+            mock.patch(DAILY_CONTRIBUTION_OBJECTS_PATH) as mock_objects,
+            mock.patch.object(
+                DailyContribution, "bulk_save", return_value=BulkSaveResult(created=2)
+            ) as mock_bulk_save,
+        ):
+            mock_objects.filter.return_value.values_list.return_value = [
+                (5, date(2025, 1, 1), 10, 1, "commit"),
+                (6, date(2024, 12, 31), 10, 1, "commit"),
+            ]
+
+            result = DailyContribution.refresh(repository_ids=[1])
+
+        assert result == BulkSaveResult(created=2)
+        mock_source.objects.filter.assert_called_once_with(
+            repository_id__in=[1],
+            created_at__isnull=False,
+            repository__isnull=False,
+        )
+        mock_objects.filter.assert_any_call(repository_id__in=[1])
+        mock_objects.filter.assert_called_with(pk__in=[6])
+        mock_objects.filter.return_value.delete.assert_called_once()
+
+        contributions = mock_bulk_save.call_args.args[0]
+        assert [(c.date, c.user_id, c.repository_id, c.kind, c.count) for c in contributions] == [
+            (date(2025, 1, 1), 10, 1, "commit", 2),
+            (date(2025, 1, 2), None, 1, "commit", 1),
+        ]
+
+    def test_refresh_user_since_date(self, mock_source):
+        source_queryset = mock_source.objects.filter.return_value
+        source_queryset.filter.return_value = source_queryset
+
+        with (
+            mock.patch.object(
+                DailyContribution,
+                "get_sources",
+                return_value={DailyContribution.Kind.ISSUE: (mock_source, "created_at", {})},
+            ),
+            mock.patch(DAILY_CONTRIBUTION_OBJECTS_PATH) as mock_objects,
+            mock.patch.object(DailyContribution, "bulk_save"),
+        ):
+            existing_contributions = mock_objects.filter.return_value.filter.return_value
+            existing_contributions.values_list.return_value = [
+                (5, date(2025, 1, 1), 10, 1, "issue"),
+            ]
+
+            DailyContribution.refresh(start_date=date(2025, 1, 1), user_ids=[10])
+
+        mock_source.objects.filter.assert_called_once_with(
+            author_id__in=[10],
+            created_at__isnull=False,
+            repository__isnull=False,
+        )
+        source_queryset.filter.assert_called_once_with(created_at__date__gte=date(2025, 1, 1))
+        mock_objects.filter.assert_called_once_with(user_id__in=[10])
+        mock_objects.filter.return_value.filter.assert_called_once_with(date__gte=date(2025, 1, 1))
+        mock_objects.filter.return_value.delete.assert_not_called()
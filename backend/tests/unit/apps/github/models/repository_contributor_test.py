@@ -37,7 +37,9 @@ class TestRepositoryContributor(TestCase):
         with patch("apps.common.models.BulkSaveModel.bulk_save") as mock_bulk_save:
             RepositoryContributor.bulk_save(mock_repository_contributors)
             mock_bulk_save.assert_called_once_with(
-                RepositoryContributor, mock_repository_contributors
+                RepositoryContributor,
+                mock_repository_contributors,
+                unique_fields=("repository", "user"),
             )
 
     def test_str(self):
@@ -64,28 +66,8 @@ class TestRepositoryContributor(TestCase):
         expected_str = "testuser has made 0 contributions to test_repository"
         assert str(contributor) == expected_str
 
-    def test_update_data_existing(self):
-        """Test update_data for an existing contributor."""
-        gh_contributor_mock = Mock(contributions=20)
-        repository_mock = Mock(spec=Repository, _state=Mock(db=None))
-        user_mock = Mock(spec=User, _state=Mock(db=None))
-        existing_contributor = Mock(spec=RepositoryContributor)
-
-        with patch(
-            "apps.github.models.repository_contributor.RepositoryContributor.objects.get",
-            return_value=existing_contributor,
-        ) as mock_get:
-            contributor = RepositoryContributor.update_data(
-                gh_contributor_mock, repository_mock, user_mock
-            )
-
-            mock_get.assert_called_once_with(repository=repository_mock, user=user_mock)
-            existing_contributor.from_github.assert_called_once_with(gh_contributor_mock)
-            existing_contributor.save.assert_called_once()
-            assert contributor == existing_contributor
-
-    def test_update_data_creates_new(self):
-        """Test update_data creates a new contributor if one does not exist."""
+    def test_update_data(self):
+        """Test update_data upserts the contributor on its natural key."""
         gh_contributor_mock = Mock(contributions=15)
         repository_mock = Mock(spec=Repository, _state=Mock(db=None))
         user_mock = Mock(spec=User, _state=Mock(db=None))
@@ -93,21 +75,20 @@ class TestRepositoryContributor(TestCase):
         with (
             patch(
                 "apps.github.models.repository_contributor.RepositoryContributor.objects.get",
-                side_effect=RepositoryContributor.DoesNotExist,
             ) as mock_get,
             patch(
-                "apps.github.models.repository_contributor.RepositoryContributor.save",
-            ) as mock_save,
+                "apps.github.models.repository_contributor.RepositoryContributor.bulk_save",
+            ) as mock_bulk_save,
         ):
             contributor = RepositoryContributor.update_data(
                 gh_contributor_mock, repository_mock, user_mock
             )
 
-            mock_get.assert_called_once_with(repository=repository_mock, user=user_mock)
+            mock_get.assert_not_called()
             assert contributor.repository == repository_mock
             assert contributor.user == user_mock
             assert contributor.contributions_count == 15
-            mock_save.assert_called_once()
+            mock_bulk_save.assert_called_once_with([contributor])
 
     def test_str_singular(self):
         """Test the __str__ method for a single contribution."""
@@ -126,18 +107,16 @@ class TestRepositoryContributor(TestCase):
         gh_contributor_mock = Mock(contributions=20)
         repository_mock = Mock(spec=Repository, _state=Mock(db=None))
         user_mock = Mock(spec=User, _state=Mock(db=None))
-        existing_contributor = Mock(spec=RepositoryContributor)
 
         with patch(
-            "apps.github.models.repository_contributor.RepositoryContributor.objects.get",
-            return_value=existing_contributor,
-        ) as mock_get:
-            RepositoryContributor.update_data(
+            "apps.github.models.repository_contributor.RepositoryContributor.bulk_save",
+        ) as mock_bulk_save:
+            contributor = RepositoryContributor.update_data(
                 gh_contributor_mock, repository_mock, user_mock, save=False
             )
-            mock_get.assert_called_once_with(repository=repository_mock, user=user_mock)
-            existing_contributor.from_github.assert_called_once_with(gh_contributor_mock)
-            assert existing_contributor.save.call_count == 0
+
+            assert contributor.contributions_count == 20
+            mock_bulk_save.assert_not_called()
 
     def _setup_mock_queryset(self, mock_objects):
         mock_queryset = MagicMock()
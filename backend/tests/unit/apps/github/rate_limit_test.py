@@ -0,0 +1,51 @@
+from unittest import mock
+
+from apps.github.rate_limit import RateLimitBudget
+
+
+def create_gh_client(remaining, reset_time=1000):
+    gh = mock.Mock()
+    gh.requester.rate_limiting = (remaining, 5000)
+    gh.requester.rate_limiting_resettime = reset_time
+    return gh
+
+
+class TestRateLimitBudget:
+    def test_update_above_reserve(self):
+        budget = RateLimitBudget(reserve=100)
+        budget.update(create_gh_client(101))
+
+        assert budget.resume_at == 0.0
+
+    def test_update_unknown_rate_limit(self):
+        budget = RateLimitBudget(reserve=100)
+        budget.update(create_gh_client(-1))
+
+        assert budget.resume_at == 0.0
+
+    def test_update_within_reserve(self):
+        budget = RateLimitBudget(reserve=100)
+        budget.update(create_gh_client(100, reset_time=2000))
+        budget.update(create_gh_client(50, reset_time=1500))
+
+        assert budget.resume_at == 2000.0
+
+    @mock.patch("apps.github.rate_limit.time")
+    def test_wait_until_reset(self, mock_time):
+        mock_time.time.return_value = 1900.0
+        budget = RateLimitBudget()
+        budget.resume_at = 2000.0
+
+        budget.wait()
+
+        mock_time.sleep.assert_called_once_with(100.0)
+
+    @mock.patch("apps.github.rate_limit.time")
+    def test_wait_with_budget(self, mock_time):
+        mock_time.time.return_value = 2001.0
+        budget = RateLimitBudget()
+        budget.resume_at = 2000.0
+
+        budget.wait()
+
+        mock_time.sleep.assert_not_called()
@@ -0,0 +1,73 @@
+from unittest import mock
+
+import pytest
+
+from apps.github.models.issue import Issue
+from apps.github.models.label import Label
+from apps.github.models.user import User
+from apps.github.relation_writer import RelationWriter
+
+
+@pytest.fixture
+def through_objects():
+    with mock.patch.object(Issue.assignees.through, "objects") as mock_objects:
+        mock_objects.filter.return_value.values_list.return_value = [
+            (1, 1, 10),
+            (2, 1, 11),
+        ]
+        yield mock_objects
+
+
+def create_issue(pk):
+    issue = Issue()
+    issue.pk = pk
+    return issue
+
+
+def create_user(pk):
+    user = User()
+    user.pk = pk
+    return user
+
+
+class TestRelationWriter:
+    def test_flush_writes_diff(self, through_objects):
+        writer = RelationWriter()
+        writer.set_related(create_issue(1), "assignees", [create_user(10), create_user(12)])
+        writer.set_related(create_issue(2), "assignees", [])
+
+        writer.flush()
+
+        through_objects.filter.assert_any_call(issue_id__in={1: {10, 12}, 2: set()})
+        through_objects.filter.assert_any_call(pk__in=[2])
+        through_objects.filter.return_value.delete.assert_called_once()
+        (created_rows,) = through_objects.bulk_create.call_args.args
+        assert [(row.issue_id, row.user_id) for row in created_rows] == [(1, 12)]
+        assert not writer.relations
+
+    def test_flush_unchanged_relation_writes_nothing(self, through_objects):
+        writer = RelationWriter()
+        writer.set_related(create_issue(1), "assignees", [create_user(10), create_user(11)])
+
+        writer.flush()
+
+        through_objects.filter.assert_called_once()
+        through_objects.filter.return_value.delete.assert_not_called()
+        through_objects.bulk_create.assert_not_called()
+
+    def test_flush_uses_relation_through_table(self):
+        label = Label()
+        label.pk = 5
+        writer = RelationWriter()
+        writer.set_related(create_issue(1), "labels", [label])
+
+        with mock.patch.object(Issue.labels.through, "objects") as mock_objects:
+            mock_objects.filter.return_value.values_list.return_value = []
+            writer.flush()
+
+        mock_objects.filter.assert_called_once_with(issue_id__in={1: {5}})
+        mock_objects.filter.return_value.values_list.assert_called_once_with(
+            "pk", "issue_id", "label_id"
+        )
+        (created_rows,) = mock_objects.bulk_create.call_args.args
+        assert [(row.issue_id, row.label_id) for row in created_rows] == [(1, 5)]
@@ -6,6 +6,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 from django.test import SimpleTestCase
 
+from apps.common.models import BulkSaveResult
 from apps.nest.management.commands.base_badge_command import BaseBadgeCommand
 
 
@@ -98,3 +99,50 @@ class TestBaseBadgeCommand(SimpleTestCase):
         output = out.getvalue()
         assert "Removed 'Test Badge' badge from 3 users" in output
         users_to_remove.update.assert_called_once_with(is_active=False)
+
+    @patch("apps.nest.management.commands.base_badge_command.UserBadge")
+    @patch("apps.nest.management.commands.base_badge_command.Badge")
+    def test_skips_unchanged_writes(self, mock_badge, mock_user_badge):
+        """Test that unchanged badges and user badges are not written."""
+        badge = MagicMock()
+        badge.name = "Test Badge"
+        badge.get_dirty_fields.return_value = set()
+        mock_badge.objects.get_or_create.return_value = (badge, False)
+
+        eligible_users = MagicMock()
+        eligible_users.exclude.return_value = [MagicMock()]
+        MockCommand.get_eligible_users = MagicMock(return_value=eligible_users)
+
+        mock_user_badge.bulk_save.return_value = BulkSaveResult(unchanged=1)
+        mock_user_badge.objects.filter.return_value.exclude.return_value.count.return_value = 0
+
+        out = StringIO()
+        cmd = MockCommand()
+        cmd.stdout = out
+        cmd.handle()
+
+        badge.get_dirty_fields.assert_called_once_with(("css_class", "description", "weight"))
+        badge.save.assert_not_called()
+        assert "Added 'Test Badge' badge to 0 users" in out.getvalue()
+
+    @patch("apps.nest.management.commands.base_badge_command.UserBadge")
+    @patch("apps.nest.management.commands.base_badge_command.Badge")
+    def test_saves_changed_badge_fields(self, mock_badge, mock_user_badge):
+        """Test that only changed badge fields are saved."""
+        badge = MagicMock()
+        badge.name = "Test Badge"
+        badge.get_dirty_fields.return_value = {"weight", "css_class"}
+        mock_badge.objects.get_or_create.return_value = (badge, False)
+
+        eligible_users = MagicMock()
+        eligible_users.exclude.return_value = []
+        MockCommand.get_eligible_users = MagicMock(return_value=eligible_users)
+
+        mock_user_badge.bulk_save.return_value = BulkSaveResult()
+        mock_user_badge.objects.filter.return_value.exclude.return_value.count.return_value = 0
+
+        cmd = MockCommand()
+        cmd.stdout = StringIO()
+        cmd.handle()
+
+        badge.save.assert_called_once_with(update_fields=["css_class", "weight"])
@@ -62,7 +62,9 @@ class TestUserBadgeModel:
 
             UserBadge.bulk_save(user_badges, fields=fields)
 
-            mock_bulk_save.assert_called_once_with(UserBadge, user_badges, fields=fields)
+            mock_bulk_save.assert_called_once_with(
+                UserBadge, user_badges, fields=fields, unique_fields=("badge", "user")
+            )
 
     def test_bulk_save_without_fields(self):
         """Test bulk_save with fields=None."""
@@ -71,4 +73,6 @@ class TestUserBadgeModel:
 
             UserBadge.bulk_save(user_badges)
 
-            mock_bulk_save.assert_called_once_with(UserBadge, user_badges, fields=None)
+            mock_bulk_save.assert_called_once_with(
+                UserBadge, user_badges, fields=None, unique_fields=("badge", "user")
+            )
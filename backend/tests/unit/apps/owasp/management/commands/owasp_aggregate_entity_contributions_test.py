@@ -2,7 +2,7 @@
 
 import io
 from argparse import ArgumentParser
-from datetime import UTC, datetime, timedelta
+from datetime import UTC, date, datetime, timedelta
 from unittest import mock
 
 import pytest
@@ -10,6 +10,8 @@ import pytest
 from apps.owasp.management.commands.owasp_aggregate_entity_contributions import Command
 from apps.owasp.models import Chapter, Project
 
+COMMAND_PATH = "apps.owasp.management.commands.owasp_aggregate_entity_contributions"
+
 
 class MockQuerySet:
     """Mock QuerySet that supports slicing and iteration without database access."""
@@ -35,18 +37,10 @@ class MockQuerySet:
         """Mock order_by method."""
         return self
 
-    def select_related(self, *_):
-        """Mock select_related method."""
-        return self
-
     def prefetch_related(self, *_):
         """Mock prefetch_related method."""
         return self
 
-    def count(self):
-        """Return count of items."""
-        return len(self._items)
-
     def __len__(self):
         """Return length of items."""
         return len(self._items)
@@ -55,503 +49,243 @@ class MockQuerySet:
 class TestOwaspAggregateContributions:
     @pytest.fixture
     def command(self):
-        return Command()
-
-    def test_add_arguments(self, command):
-        """Test add_arguments adds expected arguments."""
-        parser = ArgumentParser()
-        command.add_arguments(parser)
-        args = parser.parse_args(["--entity-type", "chapter"])
-        assert args.entity_type == "chapter"
-        assert args.days == 365
-        assert args.key is None
-        assert args.offset == 0
-
-    @mock.patch("apps.owasp.management.commands.owasp_aggregate_entity_contributions.Chapter")
-    def test_handle_empty_entities(self, mock_chapter_model, command):
-        """Test handle with empty entities list."""
-        mock_chapter_model.objects.filter.return_value = MockQuerySet([])
-        mock_chapter_model.bulk_save = mock.Mock()
-        mock_chapter_model._meta = mock.Mock()
-        mock_chapter_model._meta.verbose_name_plural = "chapters"
-
-        command.handle(entity_type="chapter", days=365, offset=0)
+        command = Command()
+        command.stdout = io.StringIO()
+        return command
 
-        mock_chapter_model.bulk_save.assert_not_called()
+    @pytest.fixture(autouse=True)
+    def mock_cache(self):
+        with mock.patch(f"{COMMAND_PATH}.cache") as mock_cache:
+            mock_cache.get.return_value = None
+            yield mock_cache
 
     @pytest.fixture
     def mock_chapter(self):
         chapter = mock.Mock(spec=Chapter)
+        chapter.contribution_data = {}
+        chapter.id = 10
         chapter.key = "www-chapter-test"
         chapter.name = "Test Chapter"
-        chapter.owasp_repository = mock.Mock()
-        chapter.owasp_repository.id = 1
-        # Fix Django ORM compatibility.
-        chapter.owasp_repository.resolve_expression = mock.Mock(
-            return_value=chapter.owasp_repository
-        )
-        chapter.owasp_repository.get_source_expressions = mock.Mock(return_value=[])
+        chapter.owasp_repository_id = 1
         return chapter
 
     @pytest.fixture
     def mock_project(self):
         project = mock.Mock(spec=Project)
+        project.contribution_data = {}
+        project.id = 20
         project.key = "www-project-test"
         project.name = "Test Project"
-        project.owasp_repository = mock.Mock()
-        project.owasp_repository.id = 1
-        # Fix Django ORM compatibility.
-        project.owasp_repository.resolve_expression = mock.Mock(
-            return_value=project.owasp_repository
-        )
-        project.owasp_repository.get_source_expressions = mock.Mock(return_value=[])
-
-        # Mock additional repositories.
-        additional_repo1 = mock.Mock(id=2)
-        additional_repo1.resolve_expression = mock.Mock(return_value=additional_repo1)
-        additional_repo1.get_source_expressions = mock.Mock(return_value=[])
-
-        additional_repo2 = mock.Mock(id=3)
-        additional_repo2.resolve_expression = mock.Mock(return_value=additional_repo2)
-        additional_repo2.get_source_expressions = mock.Mock(return_value=[])
-
-        project.repositories.all.return_value = [additional_repo1, additional_repo2]
+        project.owasp_repository_id = 1
+        project.repositories.all.return_value = [mock.Mock(id=2), mock.Mock(id=3)]
         return project
 
-    def test_aggregate_contribution_dates_helper(self, command):
-        """Test the helper method that aggregates dates."""
-        contribution_map = {}
+    def test_add_arguments(self, command):
+        """Test add_arguments adds expected arguments."""
+        parser = ArgumentParser()
+        command.add_arguments(parser)
+        args = parser.parse_args(["--entity-type", "chapter"])
+        assert args.entity_type == "chapter"
+        assert args.days == 365
+        assert not args.incremental
+        assert args.key is None
+        assert args.offset == 0
 
-        # Create mock queryset with dates.
-        mock_dates = [
-            datetime(2024, 11, 16, 10, 0, 0, tzinfo=UTC),
-            datetime(2024, 11, 16, 14, 0, 0, tzinfo=UTC),
-            datetime(2024, 11, 17, 9, 0, 0, tzinfo=UTC),
-            None,
-        ]
+    def test_get_repository_ids(self, command, mock_chapter, mock_project):
+        assert command._get_repository_ids(mock_chapter) == [1]
+        assert sorted(command._get_repository_ids(mock_project)) == [1, 2, 3]
 
-        mock_queryset = mock.Mock()
-        mock_queryset.values_list.return_value = mock_dates
+        mock_chapter.owasp_repository_id = None
+        assert command._get_repository_ids(mock_chapter) == []
 
-        command._aggregate_contribution_dates(
-            mock_queryset,
-            "created_at",
-            contribution_map,
+    @mock.patch(f"{COMMAND_PATH}.DailyContribution")
+    def test_get_contribution_counts(self, mock_daily_contribution, command):
+        """Test that daily contribution counts are read from the rollup."""
+        values_list = (
+            mock_daily_contribution.objects.filter.return_value.order_by.return_value.values_list
         )
-
-        assert contribution_map == {
-            "2024-11-16": 2,
-            "2024-11-17": 1,
-        }
-
-    @mock.patch("apps.owasp.management.commands.owasp_aggregate_entity_contributions.Commit")
-    @mock.patch("apps.owasp.management.commands.owasp_aggregate_entity_contributions.Issue")
-    @mock.patch("apps.owasp.management.commands.owasp_aggregate_entity_contributions.PullRequest")
-    @mock.patch("apps.owasp.management.commands.owasp_aggregate_entity_contributions.Release")
-    def test_aggregate_chapter_contributions(
-        self,
-        mock_release,
-        mock_pr,
-        mock_issue,
-        mock_commit,
-        command,
-        mock_chapter,
-    ):
-        """Test aggregating contributions for a chapter."""
-        start_date = datetime.now(tz=UTC) - timedelta(days=365)
-
-        # Mock querysets.
-        mock_commit.objects.filter.return_value.values_list.return_value = [
-            datetime(2024, 11, 16, 10, 0, 0, tzinfo=UTC),
-        ]
-        mock_issue.objects.filter.return_value.values_list.return_value = [
-            datetime(2024, 11, 16, 11, 0, 0, tzinfo=UTC),
-        ]
-        mock_pr.objects.filter.return_value.values_list.return_value = [
-            datetime(2024, 11, 17, 10, 0, 0, tzinfo=UTC),
+        values_list.return_value.annotate.return_value = [
+            ("commit", 1, date(2024, 11, 16), 2),
+            ("release", 1, date(2024, 11, 17), 1),
         ]
-        mock_release.objects.filter.return_value.values_list.return_value = [
-            datetime(2024, 11, 17, 12, 0, 0, tzinfo=UTC),
-        ]
-
-        result = command.aggregate_contributions(mock_chapter, start_date)
-
-        assert result == {
-            "2024-11-16": 2,
-            "2024-11-17": 2,
-        }
+        start_date = datetime(2024, 1, 1, tzinfo=UTC)
 
-    @mock.patch("apps.owasp.management.commands.owasp_aggregate_entity_contributions.Commit")
-    @mock.patch("apps.owasp.management.commands.owasp_aggregate_entity_contributions.Issue")
-    @mock.patch("apps.owasp.management.commands.owasp_aggregate_entity_contributions.PullRequest")
-    @mock.patch("apps.owasp.management.commands.owasp_aggregate_entity_contributions.Release")
-    def test_aggregate_project_contributions(
-        self,
-        mock_release,
-        mock_pr,
-        mock_issue,
-        mock_commit,
-        command,
-        mock_project,
-    ):
-        """Test aggregating contributions for a project."""
-        start_date = datetime.now(tz=UTC) - timedelta(days=365)
+        rows = command.get_contribution_counts([1], start_date)
 
-        # Mock querysets.
-        mock_commit.objects.filter.return_value.values_list.return_value = [
-            datetime(2024, 11, 16, 10, 0, 0, tzinfo=UTC),
-            datetime(2024, 11, 16, 14, 0, 0, tzinfo=UTC),
-        ]
-        mock_issue.objects.filter.return_value.values_list.return_value = [
-            datetime(2024, 11, 17, 11, 0, 0, tzinfo=UTC),
-        ]
-        mock_pr.objects.filter.return_value.values_list.return_value = [
-            datetime(2024, 11, 18, 10, 0, 0, tzinfo=UTC),
-        ]
-        mock_release.objects.filter.return_value.values_list.return_value = [
-            datetime(2024, 11, 18, 12, 0, 0, tzinfo=UTC),
+        assert rows == [
+            ("commits", 1, date(2024, 11, 16), 2),
+            ("releases", 1, date(2024, 11, 17), 1),
         ]
+        mock_daily_contribution.objects.filter.assert_called_once_with(
+            date__gte=date(2024, 1, 1), repository_id__in=[1]
+        )
+        values_list.assert_called_once_with("kind", "repository_id", "date")
 
-        result = command.aggregate_contributions(mock_project, start_date)
+    @mock.patch(f"{COMMAND_PATH}.DailyContribution")
+    def test_get_contribution_counts_totals(self, mock_daily_contribution, command):
+        """Test that non daily counts are grouped by kind and repository only."""
+        values_list = (
+            mock_daily_contribution.objects.filter.return_value.order_by.return_value.values_list
+        )
+        values_list.return_value.annotate.return_value = [("issue", 2, 5)]
 
-        assert result == {
-            "2024-11-16": 2,
-            "2024-11-17": 1,
-            "2024-11-18": 2,
-        }
+        rows = command.get_contribution_counts([2], datetime(2024, 1, 1, tzinfo=UTC), daily=False)
 
-    def test_aggregate_chapter_without_repository(self, command, mock_chapter):
-        """Test that chapters without repositories return empty map."""
-        mock_chapter.owasp_repository = None
-        start_date = datetime.now(tz=UTC) - timedelta(days=365)
-
-        result = command.aggregate_contributions(mock_chapter, start_date)
-
-        assert result == {}
-
-    def test_aggregate_project_without_repositories(self, command, mock_project):
-        """Test that projects without repositories return empty map."""
-        mock_project.owasp_repository = None
-        mock_project.repositories.all.return_value = []
-        start_date = datetime.now(tz=UTC) - timedelta(days=365)
-
-        result = command.aggregate_contributions(mock_project, start_date)
-
-        assert result == {}
-
-    @mock.patch("apps.owasp.management.commands.owasp_aggregate_entity_contributions.Chapter")
-    @mock.patch("apps.owasp.management.commands.owasp_aggregate_entity_contributions.Commit")
-    @mock.patch("apps.owasp.management.commands.owasp_aggregate_entity_contributions.Issue")
-    @mock.patch("apps.owasp.management.commands.owasp_aggregate_entity_contributions.PullRequest")
-    @mock.patch("apps.owasp.management.commands.owasp_aggregate_entity_contributions.Release")
-    def test_handle_chapters_only(
-        self,
-        mock_release,
-        mock_pr,
-        mock_issue,
-        mock_commit,
-        mock_chapter_model,
-        command,
-        mock_chapter,
-    ):
-        """Test command execution for chapters only."""
-        mock_chapter_model.objects.filter.return_value = MockQuerySet([mock_chapter])
-        mock_chapter_model.bulk_save = mock.Mock()
+        assert rows == [("issues", 2, None, 5)]
+        values_list.assert_called_once_with("kind", "repository_id")
 
-        # Mock ORM queries to return counts.
-        mock_commit.objects.filter.return_value.count.return_value = 5
-        mock_issue.objects.filter.return_value.count.return_value = 3
-        mock_pr.objects.filter.return_value.count.return_value = 2
-        mock_release.objects.filter.return_value.count.return_value = 1
+    def test_aggregate_contributions(self, command, mock_chapter, mock_project):
+        """Test daily counts are fanned out to entities by repository."""
+        mock_chapter.contribution_data = {"2023-01-01": 9}
+        start_date = datetime(2024, 1, 1, tzinfo=UTC)
 
         with mock.patch.object(
             command,
-            "aggregate_contributions",
-            return_value={"2024-11-16": 5},
-        ):
-            command.handle(entity_type="chapter", days=365, offset=0)
-
-        assert mock_chapter.contribution_data == {"2024-11-16": 5}
-        mock_chapter_model.bulk_save.assert_called()
-
-    @mock.patch("apps.owasp.management.commands.owasp_aggregate_entity_contributions.Project")
-    @mock.patch("apps.owasp.management.commands.owasp_aggregate_entity_contributions.Commit")
-    @mock.patch("apps.owasp.management.commands.owasp_aggregate_entity_contributions.Issue")
-    @mock.patch("apps.owasp.management.commands.owasp_aggregate_entity_contributions.PullRequest")
-    @mock.patch("apps.owasp.management.commands.owasp_aggregate_entity_contributions.Release")
-    def test_handle_projects_only(
-        self,
-        mock_release,
-        mock_pr,
-        mock_issue,
-        mock_commit,
-        mock_project_model,
-        command,
-        mock_project,
-    ):
-        """Test command execution for projects only."""
-        mock_project_model.objects.filter.return_value = MockQuerySet([mock_project])
-        mock_project_model.bulk_save = mock.Mock()
+            "get_contribution_counts",
+            return_value=[
+                ("commits", 1, date(2024, 11, 16), 2),
+                ("issues", 2, date(2024, 11, 16), 3),
+                ("releases", 3, date(2024, 11, 17), 1),
+            ],
+        ) as mock_counts:
+            command.aggregate_contributions([mock_chapter, mock_project], start_date)
+
+        mock_counts.assert_called_once()
+        assert sorted(mock_counts.call_args.args[0]) == [1, 2, 3]
+        assert mock_chapter.contribution_data == {"2024-11-16": 2}
+        assert mock_chapter.contribution_stats == {
+            "commits": 2,
+            "issues": 0,
+            "pull_requests": 0,
+            "releases": 0,
+            "total": 2,
+        }
+        assert mock_project.contribution_data == {"2024-11-16": 5, "2024-11-17": 1}
+        assert mock_project.contribution_stats == {
+            "commits": 2,
+            "issues": 3,
+            "pull_requests": 0,
+            "releases": 1,
+            "total": 6,
+        }
 
-        # Mock ORM queries to return counts.
-        mock_commit.objects.filter.return_value.count.return_value = 8
-        mock_issue.objects.filter.return_value.count.return_value = 4
-        mock_pr.objects.filter.return_value.count.return_value = 3
-        mock_release.objects.filter.return_value.count.return_value = 2
+    def test_aggregate_contributions_incremental(self, command, mock_project):
+        """Test only days since the last run are recomputed."""
+        mock_project.contribution_data = {
+            "2023-12-31": 4,
+            "2024-11-15": 7,
+            "2024-11-16": 1,
+        }
+        start_date = datetime(2024, 1, 1, tzinfo=UTC)
+        since = datetime(2024, 11, 16, tzinfo=UTC)
 
         with mock.patch.object(
             command,
-            "aggregate_contributions",
-            return_value={"2024-11-16": 10},
-        ):
-            command.handle(entity_type="project", days=365, offset=0)
-
-        assert mock_project.contribution_data == {"2024-11-16": 10}
-        assert mock_project.contribution_stats is not None
-        assert "commits" in mock_project.contribution_stats
-        mock_project_model.bulk_save.assert_called()
-
-    @mock.patch("apps.owasp.management.commands.owasp_aggregate_entity_contributions.Chapter")
-    @mock.patch("apps.owasp.management.commands.owasp_aggregate_entity_contributions.Project")
-    @mock.patch("apps.owasp.management.commands.owasp_aggregate_entity_contributions.Commit")
-    @mock.patch("apps.owasp.management.commands.owasp_aggregate_entity_contributions.Issue")
-    @mock.patch("apps.owasp.management.commands.owasp_aggregate_entity_contributions.PullRequest")
-    @mock.patch("apps.owasp.management.commands.owasp_aggregate_entity_contributions.Release")
-    def test_handle_both_entities(
-        self,
-        mock_release,
-        mock_pr,
-        mock_issue,
-        mock_commit,
-        mock_project_model,
-        mock_chapter_model,
-        command,
-        mock_chapter,
-        mock_project,
-    ):
-        """Test command execution for both chapters and projects (run separately)."""
-        mock_chapter_model.objects.filter.return_value = MockQuerySet([mock_chapter])
-        mock_project_model.objects.filter.return_value = MockQuerySet([mock_project])
-        mock_chapter_model.bulk_save = mock.Mock()
-        mock_project_model.bulk_save = mock.Mock()
+            "get_contribution_counts",
+            side_effect=[
+                [("commits", 1, date(2024, 11, 16), 2)],
+                [("commits", 1, None, 9), ("pull_requests", 2, None, 1)],
+            ],
+        ) as mock_counts:
+            command.aggregate_contributions([mock_project], start_date, since)
+
+        assert mock_counts.call_args_list[0].args[1] == since
+        assert mock_counts.call_args_list[1].args[1] == start_date
+        assert mock_counts.call_args_list[1].kwargs == {"daily": False}
+        assert mock_project.contribution_data == {"2024-11-15": 7, "2024-11-16": 2}
+        assert mock_project.contribution_stats == {
+            "commits": 9,
+            "issues": 0,
+            "pull_requests": 1,
+            "releases": 0,
+            "total": 10,
+        }
 
-        # Mock ORM queries to return counts.
-        mock_commit.objects.filter.return_value.count.return_value = 5
-        mock_issue.objects.filter.return_value.count.return_value = 3
-        mock_pr.objects.filter.return_value.count.return_value = 2
-        mock_release.objects.filter.return_value.count.return_value = 1
+    def test_aggregate_contributions_without_repositories(self, command, mock_chapter):
+        mock_chapter.owasp_repository_id = None
 
-        with mock.patch.object(
-            command,
-            "aggregate_contributions",
-            return_value={"2024-11-16": 5},
-        ):
-            command.handle(entity_type="chapter", days=365, offset=0)
-            command.handle(entity_type="project", days=365, offset=0)
-
-        mock_chapter_model.bulk_save.assert_called()
-        mock_project_model.bulk_save.assert_called()
-
-    @mock.patch("apps.owasp.management.commands.owasp_aggregate_entity_contributions.Chapter")
-    @mock.patch("apps.owasp.management.commands.owasp_aggregate_entity_contributions.Commit")
-    @mock.patch("apps.owasp.management.commands.owasp_aggregate_entity_contributions.Issue")
-    @mock.patch("apps.owasp.management.commands.owasp_aggregate_entity_contributions.PullRequest")
-    @mock.patch("apps.owasp.management.commands.owasp_aggregate_entity_contributions.Release")
-    def test_handle_with_specific_key(
-        self,
-        mock_release,
-        mock_pr,
-        mock_issue,
-        mock_commit,
-        mock_chapter_model,
-        command,
-        mock_chapter,
-    ):
-        """Test command execution with a specific entity key."""
-        mock_chapter_model.objects.filter.return_value = MockQuerySet([mock_chapter])
-        mock_chapter_model.bulk_save = mock.Mock()
+        with mock.patch.object(command, "get_contribution_counts") as mock_counts:
+            command.aggregate_contributions([mock_chapter], datetime.now(tz=UTC))
 
-        # Mock ORM queries to return counts.
-        mock_commit.objects.filter.return_value.count.return_value = 3
-        mock_issue.objects.filter.return_value.count.return_value = 2
-        mock_pr.objects.filter.return_value.count.return_value = 1
-        mock_release.objects.filter.return_value.count.return_value = 1
+        mock_counts.assert_not_called()
+        assert mock_chapter.contribution_data == {}
+        assert mock_chapter.contribution_stats["total"] == 0
 
-        with mock.patch.object(
-            command,
-            "aggregate_contributions",
-            return_value={"2024-11-16": 3},
-        ):
-            command.handle(entity_type="chapter", key="www-chapter-test", days=365, offset=0)
-
-        # Verify filter was called with the specific key.
-        mock_chapter_model.objects.filter.assert_called()
-
-    @mock.patch("apps.owasp.management.commands.owasp_aggregate_entity_contributions.Chapter")
-    @mock.patch("apps.owasp.management.commands.owasp_aggregate_entity_contributions.Commit")
-    @mock.patch("apps.owasp.management.commands.owasp_aggregate_entity_contributions.Issue")
-    @mock.patch("apps.owasp.management.commands.owasp_aggregate_entity_contributions.PullRequest")
-    @mock.patch("apps.owasp.management.commands.owasp_aggregate_entity_contributions.Release")
-    def test_handle_with_offset(
-        self,
-        mock_release,
-        mock_pr,
-        mock_issue,
-        mock_commit,
-        mock_chapter_model,
-        command,
-        mock_chapter,
-    ):
-        """Test command execution with offset parameter."""
-        chapters = [mock_chapter, mock_chapter, mock_chapter]
-        mock_chapter_model.objects.filter.return_value = MockQuerySet(chapters)
-        mock_chapter_model.bulk_save = mock.Mock()
+    @mock.patch(f"{COMMAND_PATH}.Chapter")
+    def test_handle_empty_entities(self, mock_chapter_model, command):
+        """Test handle with empty entities list."""
+        mock_chapter_model.objects.filter.return_value = MockQuerySet([])
+        mock_chapter_model._meta.verbose_name_plural = "chapters"
 
-        # Mock ORM queries to return counts.
-        mock_commit.objects.filter.return_value.count.return_value = 1
-        mock_issue.objects.filter.return_value.count.return_value = 1
-        mock_pr.objects.filter.return_value.count.return_value = 1
-        mock_release.objects.filter.return_value.count.return_value = 0
+        command.handle(entity_type="chapter", days=365, offset=0)
 
-        with mock.patch.object(
-            command,
-            "aggregate_contributions",
-            return_value={"2024-11-16": 1},
-        ) as mock_aggregate:
-            command.handle(entity_type="chapter", offset=2, days=365)
+        mock_chapter_model.bulk_save.assert_not_called()
 
-        # Verify that offset was applied correctly.
-        assert mock_aggregate.call_count == 1, (
-            "Expected aggregate to be called once for 1 remaining chapter after offset"
-        )
-        mock_aggregate.assert_called_once()
-        mock_chapter_model.bulk_save.assert_called_once()
-
-    @mock.patch("apps.owasp.management.commands.owasp_aggregate_entity_contributions.Chapter")
-    @mock.patch("apps.owasp.management.commands.owasp_aggregate_entity_contributions.Commit")
-    @mock.patch("apps.owasp.management.commands.owasp_aggregate_entity_contributions.Issue")
-    @mock.patch("apps.owasp.management.commands.owasp_aggregate_entity_contributions.PullRequest")
-    @mock.patch("apps.owasp.management.commands.owasp_aggregate_entity_contributions.Release")
-    def test_handle_custom_days(
-        self,
-        mock_release,
-        mock_pr,
-        mock_issue,
-        mock_commit,
-        mock_chapter_model,
-        command,
-        mock_chapter,
-    ):
-        """Test command execution with custom days parameter."""
+    @mock.patch(f"{COMMAND_PATH}.Chapter")
+    def test_handle_chapters(self, mock_chapter_model, command, mock_chapter, mock_cache):
+        """Test command execution for chapters."""
         mock_chapter_model.objects.filter.return_value = MockQuerySet([mock_chapter])
-        mock_chapter_model.bulk_save = mock.Mock()
 
-        mock_commit.objects.filter.return_value.count.return_value = 0
-        mock_issue.objects.filter.return_value.count.return_value = 0
-        mock_pr.objects.filter.return_value.count.return_value = 0
-        mock_release.objects.filter.return_value.count.return_value = 0
-
-        with mock.patch.object(
-            command,
-            "aggregate_contributions",
-            return_value={},
-        ) as mock_aggregate:
+        with mock.patch.object(command, "aggregate_contributions") as mock_aggregate:
             command.handle(entity_type="chapter", days=90, offset=0)
 
-        # Verify aggregate was called with correct start_date.
-        mock_aggregate.assert_called()
-        call_args = mock_aggregate.call_args[0]
-        start_date = call_args[1]
-        expected_start = datetime.now(tz=UTC) - timedelta(days=90)
+        entities, start_date, since = mock_aggregate.call_args.args
+        assert entities == [mock_chapter]
+        assert abs((datetime.now(tz=UTC) - timedelta(days=90) - start_date).total_seconds()) < 1
+        assert since is None
+        mock_chapter_model.bulk_save.assert_called_once_with(
+            [mock_chapter], fields=("contribution_data", "contribution_stats")
+        )
+        mock_cache.set.assert_called_once()
+        assert mock_cache.set.call_args.args[0] == "owasp-contributions-last-run:chapter:90"
 
-        # Allow 1 second tolerance for test execution time.
-        assert abs((expected_start - start_date).total_seconds()) < 1
+    @mock.patch(f"{COMMAND_PATH}.Project")
+    def test_handle_projects_incremental(
+        self, mock_project_model, command, mock_project, mock_cache
+    ):
+        """Test incremental command execution for projects."""
+        mock_project_model.objects.filter.return_value = MockQuerySet([mock_project])
+        mock_cache.get.return_value = datetime.now(tz=UTC) - timedelta(days=2)
 
-    def test_calculate_contribution_stats_no_repositories(self, command, mock_chapter):
-        """Test calculate_contribution_stats when entity has no repositories."""
-        mock_chapter.owasp_repository = None
-        start_date = datetime.now(tz=UTC) - timedelta(days=365)
+        with mock.patch.object(command, "aggregate_contributions") as mock_aggregate:
+            command.handle(entity_type="project", days=365, incremental=True, offset=0)
 
-        result = command.calculate_contribution_stats(mock_chapter, start_date)
-        assert result == {
-            "commits": 0,
-            "issues": 0,
-            "pull_requests": 0,
-            "releases": 0,
-            "total": 0,
-        }
+        since = mock_aggregate.call_args.args[2]
+        assert since == (datetime.now(tz=UTC) - timedelta(days=2)).replace(
+            hour=0, minute=0, second=0, microsecond=0
+        )
+        mock_cache.get.assert_called_once_with("owasp-contributions-last-run:project:365")
+        mock_project_model.bulk_save.assert_called_once_with(
+            [mock_project], fields=["contribution_data", "contribution_stats"]
+        )
+        assert "Recomputing contributions since" in command.stdout.getvalue()
 
-    @mock.patch("apps.owasp.management.commands.owasp_aggregate_entity_contributions.Project")
-    @mock.patch("apps.owasp.management.commands.owasp_aggregate_entity_contributions.Commit")
-    @mock.patch("apps.owasp.management.commands.owasp_aggregate_entity_contributions.Issue")
-    @mock.patch("apps.owasp.management.commands.owasp_aggregate_entity_contributions.PullRequest")
-    @mock.patch("apps.owasp.management.commands.owasp_aggregate_entity_contributions.Release")
-    def test_handle_project_with_key_filter(
-        self,
-        mock_release,
-        mock_pr,
-        mock_issue,
-        mock_commit,
-        mock_project_model,
-        command,
-        mock_project,
-    ):
-        """Test projects with key filter."""
-        mock_project_model.objects.filter.return_value = MockQuerySet([mock_project])
-        mock_project_model.bulk_save = mock.Mock()
+    @mock.patch(f"{COMMAND_PATH}.Chapter")
+    def test_handle_with_offset(self, mock_chapter_model, command, mock_chapter, mock_cache):
+        """Test command execution with offset parameter."""
+        mock_chapter_model.objects.filter.return_value = MockQuerySet(
+            [mock.Mock(), mock.Mock(), mock_chapter]
+        )
 
-        mock_commit.objects.filter.return_value.count.return_value = 0
-        mock_issue.objects.filter.return_value.count.return_value = 0
-        mock_pr.objects.filter.return_value.count.return_value = 0
-        mock_release.objects.filter.return_value.count.return_value = 0
+        with mock.patch.object(command, "aggregate_contributions") as mock_aggregate:
+            command.handle(entity_type="chapter", offset=2, days=365)
 
-        with mock.patch.object(
-            command,
-            "aggregate_contributions",
-            return_value={},
-        ):
-            command.handle(entity_type="project", key="www-project-test", days=365, offset=0)
+        assert mock_aggregate.call_args.args[0] == [mock_chapter]
+        mock_cache.set.assert_not_called()
 
-        mock_project_model.objects.filter.assert_called()
-        mock_project_model.bulk_save.assert_called()
-
-    @mock.patch("apps.owasp.management.commands.owasp_aggregate_entity_contributions.Project")
-    @mock.patch("apps.owasp.management.commands.owasp_aggregate_entity_contributions.Commit")
-    @mock.patch("apps.owasp.management.commands.owasp_aggregate_entity_contributions.Issue")
-    @mock.patch("apps.owasp.management.commands.owasp_aggregate_entity_contributions.PullRequest")
-    @mock.patch("apps.owasp.management.commands.owasp_aggregate_entity_contributions.Release")
-    def test_handle_project_with_offset(
-        self,
-        mock_release,
-        mock_pr,
-        mock_issue,
-        mock_commit,
-        mock_project_model,
-        command,
-        mock_project,
-    ):
-        """Test projects with offset."""
-        projects = [mock_project, mock_project, mock_project]
-        mock_project_model.objects.filter.return_value = MockQuerySet(projects)
-        mock_project_model.bulk_save = mock.Mock()
+    @mock.patch(f"{COMMAND_PATH}.Project")
+    def test_handle_with_key(self, mock_project_model, command, mock_project, mock_cache):
+        """Test projects with key filter."""
+        mock_project_model.objects.filter.return_value = MockQuerySet([mock_project])
 
-        mock_commit.objects.filter.return_value.count.return_value = 0
-        mock_issue.objects.filter.return_value.count.return_value = 0
-        mock_pr.objects.filter.return_value.count.return_value = 0
-        mock_release.objects.filter.return_value.count.return_value = 0
+        with mock.patch.object(command, "aggregate_contributions"):
+            command.handle(entity_type="project", key="www-project-test", days=365, offset=0)
 
-        with mock.patch.object(
-            command,
-            "aggregate_contributions",
-            return_value={},
-        ) as mock_aggregate:
-            command.handle(entity_type="project", offset=2, days=365)
-        assert mock_aggregate.call_count == 1
         mock_project_model.bulk_save.assert_called_once()
+        mock_cache.set.assert_not_called()
 
     def test_handle_invalid_entity_type(self, command):
         """Test handle with invalid entity_type."""
-        command.stdout = io.StringIO()
         command.style = mock.Mock()
         command.style.SUCCESS = lambda msg: msg
         command.handle(entity_type="invalid", days=365, offset=0)
@@ -4,6 +4,7 @@ from argparse import ArgumentParser
 from datetime import UTC, datetime, timedelta
 from unittest import mock
 
+from apps.github.models.daily_contribution import MEMBER_CONTRIBUTION_KINDS
 from apps.owasp.management.commands.owasp_aggregate_member_contributions import Command
 
 
@@ -67,23 +68,15 @@ class TestAggregateContributionsCommand:
 
         with (
             mock.patch(
-                "apps.owasp.management.commands.owasp_aggregate_member_contributions.Commit"
-            ) as mock_commit,
-            mock.patch(
-                "apps.owasp.management.commands.owasp_aggregate_member_contributions.PullRequest"
-            ) as mock_pr,
-            mock.patch(
-                "apps.owasp.management.commands.owasp_aggregate_member_contributions.Issue"
-            ) as mock_issue,
+                "apps.owasp.management.commands.owasp_aggregate_member_contributions.DailyContribution"
+            ) as mock_daily_contribution,
             mock.patch(
                 "apps.owasp.management.commands.owasp_aggregate_member_contributions.timezone.now"
             ) as mock_tz_now,
         ):
             mock_tz_now.return_value = fixed_now
 
-            mock_commit.objects.filter.return_value = MockQuerySet([])
-            mock_pr.objects.filter.return_value = MockQuerySet([])
-            mock_issue.objects.filter.return_value = MockQuerySet([])
+            mock_daily_contribution.objects.filter.return_value = MockQuerySet([])
 
             result = command._aggregate_user_contributions(mock_user, start_date)
 
@@ -100,32 +93,21 @@ class TestAggregateContributionsCommand:
 
         with (
             mock.patch(
-                "apps.owasp.management.commands.owasp_aggregate_member_contributions.Commit"
-            ) as mock_commit,
-            mock.patch(
-                "apps.owasp.management.commands.owasp_aggregate_member_contributions.PullRequest"
-            ) as mock_pr,
-            mock.patch(
-                "apps.owasp.management.commands.owasp_aggregate_member_contributions.Issue"
-            ) as mock_issue,
+                "apps.owasp.management.commands.owasp_aggregate_member_contributions.DailyContribution"
+            ) as mock_daily_contribution,
             mock.patch(
                 "apps.owasp.management.commands.owasp_aggregate_member_contributions.timezone"
             ) as mock_tz,
         ):
             mock_tz.now.return_value = datetime(2024, 1, 5, tzinfo=UTC)
 
-            mock_commit.objects.filter.return_value = MockQuerySet(
+            mock_daily_contribution.objects.filter.return_value = MockQuerySet(
                 [
-                    {"date": datetime(2024, 1, 1, 10, 0, tzinfo=UTC).date(), "count": 2},
-                    {"date": datetime(2024, 1, 2, 10, 0, tzinfo=UTC).date(), "count": 1},
+                    {"date": datetime(2024, 1, 1, tzinfo=UTC).date(), "count": 3},
+                    {"date": datetime(2024, 1, 2, tzinfo=UTC).date(), "count": 1},
+                    {"date": datetime(2024, 1, 3, tzinfo=UTC).date(), "count": 3},
                 ]
             )
-            mock_pr.objects.filter.return_value = MockQuerySet(
-                [{"date": datetime(2024, 1, 1, 11, 0, tzinfo=UTC).date(), "count": 1}]
-            )
-            mock_issue.objects.filter.return_value = MockQuerySet(
-                [{"date": datetime(2024, 1, 3, 12, 0, tzinfo=UTC).date(), "count": 3}]
-            )
 
             result = command._aggregate_user_contributions(mock_user, start_date)
 
@@ -136,6 +118,11 @@ class TestAggregateContributionsCommand:
             assert result["2024-01-03"] == 3
             assert result["2024-01-04"] == 0
             assert result["2024-01-05"] == 0
+            mock_daily_contribution.objects.filter.assert_called_once_with(
+                date__gte=start_date.date(),
+                kind__in=MEMBER_CONTRIBUTION_KINDS,
+                user=mock_user,
+            )
 
     def test_handle_with_specific_user_found(self):
         """Test handle method with specific user that exists."""
@@ -271,23 +258,15 @@ class TestAggregateContributionsCommand:
 
         with (
             mock.patch(
-                "apps.owasp.management.commands.owasp_aggregate_member_contributions.Commit"
-            ) as mock_commit,
-            mock.patch(
-                "apps.owasp.management.commands.owasp_aggregate_member_contributions.PullRequest"
-            ) as mock_pr,
-            mock.patch(
-                "apps.owasp.management.commands.owasp_aggregate_member_contributions.Issue"
-            ) as mock_issue,
+                "apps.owasp.management.commands.owasp_aggregate_member_contributions.DailyContribution"
+            ) as mock_daily_contribution,
             mock.patch(
                 "apps.owasp.management.commands.owasp_aggregate_member_contributions.timezone"
             ) as mock_tz,
         ):
             mock_tz.now.return_value = datetime(2024, 1, 3, tzinfo=UTC)
 
-            mock_commit.objects.filter.return_value = MockQuerySet([])
-            mock_pr.objects.filter.return_value = MockQuerySet([])
-            mock_issue.objects.filter.return_value = MockQuerySet([])
+            mock_daily_contribution.objects.filter.return_value = MockQuerySet([])
 
             result = command._aggregate_user_contributions(mock_user, start_date)
 
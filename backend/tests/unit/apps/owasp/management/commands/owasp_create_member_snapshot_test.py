@@ -1,10 +1,11 @@
 import io
 from argparse import ArgumentParser
-from datetime import UTC, datetime
+from datetime import UTC, date, datetime
 from unittest import mock
 
 import pytest
 
+from apps.github.models.daily_contribution import MEMBER_CONTRIBUTION_KINDS
 from apps.owasp.management.commands.owasp_create_member_snapshot import Command
 
 
@@ -43,149 +44,68 @@ class TestOwaspCreateMemberSnapshotCommand:
         error_output = err.getvalue()
         assert "Invalid date format" in error_output
 
-    def test_generate_heatmap_data(self, command):
-        start_at = datetime(2025, 1, 1, tzinfo=UTC)
-        end_at = datetime(2025, 10, 1, tzinfo=UTC)
+    @mock.patch("apps.owasp.management.commands.owasp_create_member_snapshot.DailyContribution")
+    def test_get_daily_contributions(self, mock_daily_contribution, command):
+        mock_user = mock.Mock()
 
-        # Mock contributions with different dates
-        mock_commit_1 = mock.Mock()
-        mock_commit_1.created_at = datetime(2025, 1, 15, tzinfo=UTC)
+        result = command.get_daily_contributions(
+            mock_user,
+            datetime(2025, 1, 1, tzinfo=UTC),
+            datetime(2025, 10, 1, tzinfo=UTC),
+        )
 
-        mock_commit_2 = mock.Mock()
-        mock_commit_2.created_at = datetime(2025, 1, 15, tzinfo=UTC)
+        assert result == mock_daily_contribution.objects.filter.return_value.order_by.return_value
+        mock_daily_contribution.objects.filter.assert_called_once_with(
+            date__gte=date(2025, 1, 1),
+            date__lte=date(2025, 10, 1),
+            kind__in=MEMBER_CONTRIBUTION_KINDS,
+            user=mock_user,
+        )
 
-        mock_pr = mock.Mock()
-        mock_pr.created_at = datetime(2025, 1, 16, tzinfo=UTC)
+    def test_generate_heatmap_data(self, command):
+        start_at = datetime(2025, 1, 1, tzinfo=UTC)
+        end_at = datetime(2025, 10, 1, tzinfo=UTC)
+        mock_user = mock.Mock()
 
-        mock_issue = mock.Mock()
-        mock_issue.created_at = datetime(2025, 1, 15, tzinfo=UTC)
+        with mock.patch.object(command, "get_daily_contributions") as mock_daily_contributions:
+            daily_counts = mock_daily_contributions.return_value.values_list.return_value
+            daily_counts.annotate.return_value = [
+                (date(2025, 1, 15), 3),
+                (date(2025, 1, 16), 1),
+            ]
 
-        # Call the actual method
-        result = command.generate_heatmap_data(
-            [mock_commit_1, mock_commit_2],
-            [mock_pr],
-            [mock_issue],
-            start_at,
-            end_at,
-        )
+            result = command.generate_heatmap_data(mock_user, start_at, end_at)
 
-        # All dates should be initialized
-        assert "2025-01-15" in result
+        mock_daily_contributions.assert_called_once_with(mock_user, start_at, end_at)
         assert result["2025-01-15"] == 3
-        assert "2025-01-16" in result
         assert result["2025-01-16"] == 1
         # Check a date without contributions is 0
         assert result["2025-01-01"] == 0
+        assert len(result) == 274
 
     def test_generate_heatmap_data_empty_contributions(self, command):
         start_at = datetime(2025, 1, 1, tzinfo=UTC)
         end_at = datetime(2025, 1, 3, tzinfo=UTC)
 
-        result = command.generate_heatmap_data([], [], [], start_at, end_at)
+        with mock.patch.object(command, "get_daily_contributions") as mock_daily_contributions:
+            daily_counts = mock_daily_contributions.return_value.values_list.return_value
+            daily_counts.annotate.return_value = []
+
+            result = command.generate_heatmap_data(mock.Mock(), start_at, end_at)
 
         # All dates should be initialized to 0
         assert result == {"2025-01-01": 0, "2025-01-02": 0, "2025-01-03": 0}
 
-    def test_generate_heatmap_data_single_date(self, command):
-        start_at = datetime(2025, 1, 1, tzinfo=UTC)
-        end_at = datetime(2025, 1, 10, tzinfo=UTC)
-
-        mock_commit = mock.Mock()
-        mock_commit.created_at = datetime(2025, 1, 10, tzinfo=UTC)
-
-        mock_pr = mock.Mock()
-        mock_pr.created_at = datetime(2025, 1, 10, tzinfo=UTC)
-
-        mock_issue = mock.Mock()
-        mock_issue.created_at = datetime(2025, 1, 10, tzinfo=UTC)
-
-        result = command.generate_heatmap_data(
-            [mock_commit], [mock_pr], [mock_issue], start_at, end_at
-        )
-
-        # Should have all dates in range
-        assert result["2025-01-10"] == 3
-        assert result["2025-01-01"] == 0
-        assert len(result) == 10  # 10 days from Jan 1 to Jan 10
-
-    def test_generate_heatmap_data_filters_by_date_range(self, command):
-        start_at = datetime(2025, 1, 1, tzinfo=UTC)
-        end_at = datetime(2025, 1, 5, tzinfo=UTC)
-
-        # Create contributions: one before, one within, one after range
-        mock_commit_before = mock.Mock()
-        mock_commit_before.created_at = datetime(2024, 12, 31, tzinfo=UTC)
-
-        mock_commit_in_range = mock.Mock()
-        mock_commit_in_range.created_at = datetime(2025, 1, 3, tzinfo=UTC)
-
-        mock_pr_after = mock.Mock()
-        mock_pr_after.created_at = datetime(2025, 1, 10, tzinfo=UTC)
-
-        result = command.generate_heatmap_data(
-            [mock_commit_before, mock_commit_in_range],
-            [mock_pr_after],
-            [],
-            start_at,
-            end_at,
-        )
-
-        # Should have all dates in range initialized
-        assert result["2025-01-03"] == 1
-        assert result["2025-01-01"] == 0
-        assert result["2025-01-02"] == 0
-        # Dates outside range should not be included
-        assert "2024-12-31" not in result
-        assert "2025-01-10" not in result
-
-    def test_generate_entity_contributions_filters_by_date_range(self, command):
+    def test_generate_entity_contributions_project(self, command):
         start_at = datetime(2025, 1, 1, tzinfo=UTC)
         end_at = datetime(2025, 10, 1, tzinfo=UTC)
 
-        # Mock user and entity setup
         mock_user = mock.Mock()
         mock_user.id = 1
 
-        # Mock repository
         mock_repo = mock.Mock()
         mock_repo.id = 100
 
-        # Create contributions: one before, two within, one after range
-        mock_commit_before = mock.Mock()
-        mock_commit_before.created_at = datetime(2024, 12, 31, tzinfo=UTC)
-        mock_commit_before.repository_id = 100
-
-        mock_commit_in_range = mock.Mock()
-        mock_commit_in_range.created_at = datetime(2025, 1, 15, tzinfo=UTC)
-        mock_commit_in_range.repository_id = 100
-
-        mock_pr_after = mock.Mock()
-        mock_pr_after.created_at = datetime(2025, 10, 2, tzinfo=UTC)
-        mock_pr_after.repository_id = 100
-
-        mock_issue_in_range = mock.Mock()
-        mock_issue_in_range.created_at = datetime(2025, 5, 1, tzinfo=UTC)
-        mock_issue_in_range.repository_id = 100
-
-        # Create mock querysets with select_related
-        # The method needs both .select_related() to work and direct iteration
-        commit_list = [mock_commit_before, mock_commit_in_range]
-        pr_list = [mock_pr_after]
-        issue_list = [mock_issue_in_range]
-
-        mock_commits = mock.Mock()
-        mock_commits.select_related.return_value = iter(commit_list)
-        mock_commits.__iter__ = lambda _: iter(commit_list)
-
-        mock_prs = mock.Mock()
-        mock_prs.select_related.return_value = iter(pr_list)
-        mock_prs.__iter__ = lambda _: iter(pr_list)
-
-        mock_issues = mock.Mock()
-        mock_issues.select_related.return_value = iter(issue_list)
-        mock_issues.__iter__ = lambda _: iter(issue_list)
-
-        # Mock the database queries
         with (
             mock.patch(
                 "apps.owasp.management.commands.owasp_create_member_snapshot.Project"
@@ -196,39 +116,34 @@ class TestOwaspCreateMemberSnapshotCommand:
             mock.patch(
                 "apps.owasp.management.commands.owasp_create_member_snapshot.EntityMember"
             ) as mock_entity_member,
+            mock.patch.object(command, "get_daily_contributions") as mock_daily_contributions,
         ):
-            # Setup mocks
             mock_content_type.objects.get_for_model.return_value = mock.Mock(id=1)
-            mock_entity_member.objects.filter.return_value.values_list.return_value = [
-                1,
-                2,
-            ]
+            mock_entity_member.objects.filter.return_value.values_list.return_value = [1, 2]
 
             mock_project = mock.Mock()
             mock_project.nest_key = "test-project"
             mock_project.repositories.all.return_value = [mock_repo]
 
-            # Mock the first filter call (for initializing all led entities)
-            # and the second call (for building repo_to_entity mapping)
             mock_filter = mock.Mock()
             mock_filter.prefetch_related.return_value = [mock_project]
-            # Make the filter mock iterable for the initialization loop
             mock_filter.__iter__ = lambda _: iter([mock_project])
             mock_project_model.objects.filter.return_value = mock_filter
 
+            repository_contributions = mock_daily_contributions.return_value.filter
+            repository_counts = repository_contributions.return_value.values_list.return_value
+            repository_counts.annotate.return_value = [(100, 2)]
+
             result = command.generate_entity_contributions(
                 mock_user,
-                mock_commits,
-                mock_prs,
-                mock_issues,
                 entity_type="project",
                 start_at=start_at,
                 end_at=end_at,
             )
 
-            # Only contributions within date range should be counted
-            # 1 commit + 1 issue = 2 (PR is after end_at, commit_before is before start_at)
-            assert result == {"test-project": 2}
+        assert result == {"test-project": 2}
+        mock_daily_contributions.assert_called_once_with(mock_user, start_at, end_at)
+        repository_contributions.assert_called_once_with(repository_id__in=[100])
 
     def test_generate_repository_contributions(self, command):
         start_at = datetime(2025, 1, 1, tzinfo=UTC)
@@ -511,24 +426,6 @@ class TestOwaspCreateMemberSnapshotCommand:
 
         assert result == {}
 
-    def test_generate_heatmap_data_empty_issues(self, command):
-        """Test generate_heatmap_data with issue outside date range."""
-        start_at = datetime(2025, 1, 1, tzinfo=UTC)
-        end_at = datetime(2025, 1, 3, tzinfo=UTC)
-
-        mock_commit = mock.Mock()
-        mock_commit.created_at = datetime(2025, 1, 1, tzinfo=UTC)
-
-        mock_issue_out_of_range = mock.Mock()
-        mock_issue_out_of_range.created_at = datetime(2025, 2, 1, tzinfo=UTC)
-
-        result = command.generate_heatmap_data(
-            [mock_commit], [], [mock_issue_out_of_range], start_at, end_at
-        )
-
-        assert result["2025-01-01"] == 1
-        assert result["2025-01-02"] == 0
-
     def test_generate_entity_contributions_unmatched_repos(self, command):
         """Test entity_contributions where contributions' repos don't match led entities."""
         start_at = datetime(2025, 1, 1, tzinfo=UTC)
@@ -537,30 +434,6 @@ class TestOwaspCreateMemberSnapshotCommand:
         mock_user = mock.Mock()
         mock_user.id = 1
 
-        mock_commit = mock.Mock()
-        mock_commit.created_at = datetime(2025, 3, 1, tzinfo=UTC)
-        mock_commit.repository_id = 999
-
-        mock_pr = mock.Mock()
-        mock_pr.created_at = datetime(2025, 3, 1, tzinfo=UTC)
-        mock_pr.repository_id = 999
-
-        mock_issue = mock.Mock()
-        mock_issue.created_at = datetime(2025, 3, 1, tzinfo=UTC)
-        mock_issue.repository_id = 999
-
-        mock_commits = mock.Mock()
-        mock_commits.select_related.return_value = [mock_commit]
-        mock_commits.__iter__ = lambda _: iter([mock_commit])
-
-        mock_prs = mock.Mock()
-        mock_prs.select_related.return_value = [mock_pr]
-        mock_prs.__iter__ = lambda _: iter([mock_pr])
-
-        mock_issues = mock.Mock()
-        mock_issues.select_related.return_value = [mock_issue]
-        mock_issues.__iter__ = lambda _: iter([mock_issue])
-
         with (
             mock.patch(
                 "apps.owasp.management.commands.owasp_create_member_snapshot.Chapter"
@@ -571,6 +444,7 @@ class TestOwaspCreateMemberSnapshotCommand:
             mock.patch(
                 "apps.owasp.management.commands.owasp_create_member_snapshot.EntityMember"
             ) as mock_entity_member,
+            mock.patch.object(command, "get_daily_contributions") as mock_daily_contributions,
         ):
             mock_content_type.objects.get_for_model.return_value = mock.Mock(id=1)
             mock_entity_member.objects.filter.return_value.values_list.return_value = [1]
@@ -584,17 +458,19 @@ class TestOwaspCreateMemberSnapshotCommand:
             mock_filter.__iter__ = lambda _: iter([mock_chapter])
             mock_chapter_model.objects.filter.return_value = mock_filter
 
+            repository_contributions = mock_daily_contributions.return_value.filter
+            repository_counts = repository_contributions.return_value.values_list.return_value
+            repository_counts.annotate.return_value = []
+
             result = command.generate_entity_contributions(
                 mock_user,
-                mock_commits,
-                mock_prs,
-                mock_issues,
                 entity_type="chapter",
                 start_at=start_at,
                 end_at=end_at,
             )
 
         assert result == {"test-chapter": 0}
+        repository_contributions.assert_called_once_with(repository_id__in=[100])
 
 
 class TestHandleMethod:
@@ -984,6 +860,18 @@ class TestHandleMethod:
 class TestGenerateEntityContributionsChapter:
     """Tests for chapter entity contributions."""
 
+    target_module = "apps.owasp.management.commands.owasp_create_member_snapshot"
+
+    def _mock_chapter(self, mock_chapter_model, owasp_repository_id):
+        mock_chapter = mock.Mock()
+        mock_chapter.nest_key = "test-chapter"
+        mock_chapter.owasp_repository_id = owasp_repository_id
+
+        mock_filter = mock.Mock()
+        mock_filter.select_related.return_value = [mock_chapter]
+        mock_filter.__iter__ = lambda _: iter([mock_chapter])
+        mock_chapter_model.objects.filter.return_value = mock_filter
+
     def test_generate_entity_contributions_chapter(self):
         """Test chapter entity contributions."""
         command = Command()
@@ -993,61 +881,22 @@ class TestGenerateEntityContributionsChapter:
         mock_user = mock.Mock()
         mock_user.id = 1
 
-        mock_repo = mock.Mock()
-        mock_repo.id = 100
-
-        mock_commit = mock.Mock()
-        mock_commit.created_at = datetime(2025, 1, 15, tzinfo=UTC)
-        mock_commit.repository_id = 100
-
-        mock_pr = mock.Mock()
-        mock_pr.created_at = datetime(2025, 2, 1, tzinfo=UTC)
-        mock_pr.repository_id = 100
-
-        mock_issue = mock.Mock()
-        mock_issue.created_at = datetime(2025, 3, 1, tzinfo=UTC)
-        mock_issue.repository_id = 100
-
-        commit_list = [mock_commit]
-        pr_list = [mock_pr]
-        issue_list = [mock_issue]
-
-        mock_commits = mock.Mock()
-        mock_commits.select_related.return_value = iter(commit_list)
-        mock_commits.__iter__ = lambda _: iter(commit_list)
-
-        mock_prs = mock.Mock()
-        mock_prs.select_related.return_value = iter(pr_list)
-        mock_prs.__iter__ = lambda _: iter(pr_list)
-
-        mock_issues = mock.Mock()
-        mock_issues.select_related.return_value = iter(issue_list)
-        mock_issues.__iter__ = lambda _: iter(issue_list)
-
-        target_module = "apps.owasp.management.commands.owasp_create_member_snapshot"
-
         with (
-            mock.patch(f"{target_module}.Chapter") as mock_chapter_model,
-            mock.patch(f"{target_module}.ContentType") as mock_content_type,
-            mock.patch(f"{target_module}.EntityMember") as mock_entity_member,
+            mock.patch(f"{self.target_module}.Chapter") as mock_chapter_model,
+            mock.patch(f"{self.target_module}.ContentType") as mock_content_type,
+            mock.patch(f"{self.target_module}.EntityMember") as mock_entity_member,
+            mock.patch.object(command, "get_daily_contributions") as mock_daily_contributions,
         ):
             mock_content_type.objects.get_for_model.return_value = mock.Mock(id=2)
             mock_entity_member.objects.filter.return_value.values_list.return_value = [1]
+            self._mock_chapter(mock_chapter_model, 100)
 
-            mock_chapter = mock.Mock()
-            mock_chapter.nest_key = "test-chapter"
-            mock_chapter.owasp_repository_id = 100
-
-            mock_filter = mock.Mock()
-            mock_filter.select_related.return_value = [mock_chapter]
-            mock_filter.__iter__ = lambda _: iter([mock_chapter])
-            mock_chapter_model.objects.filter.return_value = mock_filter
+            repository_contributions = mock_daily_contributions.return_value.filter
+            repository_counts = repository_contributions.return_value.values_list.return_value
+            repository_counts.annotate.return_value = [(100, 3)]
 
             result = command.generate_entity_contributions(
                 mock_user,
-                mock_commits,
-                mock_prs,
-                mock_issues,
                 entity_type="chapter",
                 start_at=start_at,
                 end_at=end_at,
@@ -1064,154 +913,22 @@ class TestGenerateEntityContributionsChapter:
         mock_user = mock.Mock()
         mock_user.id = 1
 
-        mock_commits = mock.Mock()
-        mock_commits.select_related.return_value = iter([])
-        mock_commits.__iter__ = lambda _: iter([])
-
-        mock_prs = mock.Mock()
-        mock_prs.select_related.return_value = iter([])
-        mock_prs.__iter__ = lambda _: iter([])
-
-        mock_issues = mock.Mock()
-        mock_issues.select_related.return_value = iter([])
-        mock_issues.__iter__ = lambda _: iter([])
-
-        target_module = "apps.owasp.management.commands.owasp_create_member_snapshot"
-
         with (
-            mock.patch(f"{target_module}.Chapter") as mock_chapter_model,
-            mock.patch(f"{target_module}.ContentType") as mock_content_type,
-            mock.patch(f"{target_module}.EntityMember") as mock_entity_member,
+            mock.patch(f"{self.target_module}.Chapter") as mock_chapter_model,
+            mock.patch(f"{self.target_module}.ContentType") as mock_content_type,
+            mock.patch(f"{self.target_module}.EntityMember") as mock_entity_member,
+            mock.patch.object(command, "get_daily_contributions") as mock_daily_contributions,
         ):
             mock_content_type.objects.get_for_model.return_value = mock.Mock(id=2)
             mock_entity_member.objects.filter.return_value.values_list.return_value = [1]
-
-            mock_chapter = mock.Mock()
-            mock_chapter.nest_key = "test-chapter"
-            mock_chapter.owasp_repository_id = None
-
-            mock_filter = mock.Mock()
-            mock_filter.select_related.return_value = [mock_chapter]
-            mock_filter.__iter__ = lambda _: iter([mock_chapter])
-            mock_chapter_model.objects.filter.return_value = mock_filter
+            self._mock_chapter(mock_chapter_model, None)
 
             result = command.generate_entity_contributions(
                 mock_user,
-                mock_commits,
-                mock_prs,
-                mock_issues,
                 entity_type="chapter",
                 start_at=start_at,
                 end_at=end_at,
             )
-            assert result == {"test-chapter": 0}
-
-    def test_generate_entity_contributions_pr_outside_date_range(self):
-        """Test PR contribution with created_at = None or outside range."""
-        command = Command()
-        start_at = datetime(2025, 1, 1, tzinfo=UTC)
-        end_at = datetime(2025, 10, 1, tzinfo=UTC)
 
-        mock_user = mock.Mock()
-        mock_user.id = 1
-
-        mock_pr = mock.Mock()
-        mock_pr.created_at = None
-        mock_pr.repository_id = 100
-
-        mock_commits = mock.Mock()
-        mock_commits.select_related.return_value = iter([])
-        mock_commits.__iter__ = lambda _: iter([])
-
-        mock_prs = mock.Mock()
-        mock_prs.select_related.return_value = iter([mock_pr])
-        mock_prs.__iter__ = lambda _: iter([mock_pr])
-
-        mock_issues = mock.Mock()
-        mock_issues.select_related.return_value = iter([])
-        mock_issues.__iter__ = lambda _: iter([])
-
-        target_module = "apps.owasp.management.commands.owasp_create_member_snapshot"
-
-        with (
-            mock.patch(f"{target_module}.Chapter") as mock_chapter_model,
-            mock.patch(f"{target_module}.ContentType") as mock_content_type,
-            mock.patch(f"{target_module}.EntityMember") as mock_entity_member,
-        ):
-            mock_content_type.objects.get_for_model.return_value = mock.Mock(id=2)
-            mock_entity_member.objects.filter.return_value.values_list.return_value = [1]
-
-            mock_chapter = mock.Mock()
-            mock_chapter.nest_key = "test-chapter"
-            mock_chapter.owasp_repository_id = 100
-
-            mock_filter = mock.Mock()
-            mock_filter.select_related.return_value = [mock_chapter]
-            mock_filter.__iter__ = lambda _: iter([mock_chapter])
-            mock_chapter_model.objects.filter.return_value = mock_filter
-
-            result = command.generate_entity_contributions(
-                mock_user,
-                mock_commits,
-                mock_prs,
-                mock_issues,
-                entity_type="chapter",
-                start_at=start_at,
-                end_at=end_at,
-            )
-            assert result == {"test-chapter": 0}
-
-    def test_generate_entity_contributions_issue_outside_date_range(self):
-        """Test issue contribution with created_at = None or outside range."""
-        command = Command()
-        start_at = datetime(2025, 1, 1, tzinfo=UTC)
-        end_at = datetime(2025, 10, 1, tzinfo=UTC)
-
-        mock_user = mock.Mock()
-        mock_user.id = 1
-
-        mock_issue = mock.Mock()
-        mock_issue.created_at = None
-        mock_issue.repository_id = 100
-
-        mock_commits = mock.Mock()
-        mock_commits.select_related.return_value = iter([])
-        mock_commits.__iter__ = lambda _: iter([])
-
-        mock_prs = mock.Mock()
-        mock_prs.select_related.return_value = iter([])
-        mock_prs.__iter__ = lambda _: iter([])
-
-        mock_issues = mock.Mock()
-        mock_issues.select_related.return_value = iter([mock_issue])
-        mock_issues.__iter__ = lambda _: iter([mock_issue])
-
-        target_module = "apps.owasp.management.commands.owasp_create_member_snapshot"
-
-        with (
-            mock.patch(f"{target_module}.Chapter") as mock_chapter_model,
-            mock.patch(f"{target_module}.ContentType") as mock_content_type,
-            mock.patch(f"{target_module}.EntityMember") as mock_entity_member,
-        ):
-            mock_content_type.objects.get_for_model.return_value = mock.Mock(id=2)
-            mock_entity_member.objects.filter.return_value.values_list.return_value = [1]
-
-            mock_chapter = mock.Mock()
-            mock_chapter.nest_key = "test-chapter"
-            mock_chapter.owasp_repository_id = 100
-
-            mock_filter = mock.Mock()
-            mock_filter.select_related.return_value = [mock_chapter]
-            mock_filter.__iter__ = lambda _: iter([mock_chapter])
-            mock_chapter_model.objects.filter.return_value = mock_filter
-
-            result = command.generate_entity_contributions(
-                mock_user,
-                mock_commits,
-                mock_prs,
-                mock_issues,
-                entity_type="chapter",
-                start_at=start_at,
-                end_at=end_at,
-            )
             assert result == {"test-chapter": 0}
+            mock_daily_contributions.assert_not_called()
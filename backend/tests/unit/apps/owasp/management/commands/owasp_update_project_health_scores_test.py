@@ -4,11 +4,11 @@ from unittest.mock import MagicMock, patch
 import pytest
 from django.core.management import call_command
 
+from apps.common.models import BulkSaveResult
 from apps.owasp.management.commands.owasp_update_project_health_scores import Command
-from apps.owasp.models.project_health_metrics import ProjectHealthMetrics
-from apps.owasp.models.project_health_requirements import ProjectHealthRequirements
+from apps.owasp.project_health_scoring import LATEST_SCORING_PROFILE_VERSION, SCORING_PROFILES
 
-EXPECTED_SCORE = 34.0
+COMMAND_PATH = "apps.owasp.management.commands.owasp_update_project_health_scores"
 
 
 class TestUpdateProjectHealthMetricsScoreCommand:
@@ -19,66 +19,58 @@ class TestUpdateProjectHealthMetricsScoreCommand:
         self.command = Command()
         with (
             patch(
-                "apps.owasp.models.project_health_metrics.ProjectHealthMetrics.objects.filter"
+                "apps.owasp.models.project_health_metrics.ProjectHealthMetrics.objects"
             ) as metrics_patch,
-            patch(
-                "apps.owasp.models.project_health_requirements.ProjectHealthRequirements.objects.all"
-            ) as requirements_patch,
+            patch(f"{COMMAND_PATH}.score_project_health_metrics") as score_patch,
             patch(
                 "apps.owasp.models.project_health_metrics.ProjectHealthMetrics.bulk_save"
             ) as bulk_save_patch,
         ):
             self.mock_metrics = metrics_patch
-            self.mock_requirements = requirements_patch
+            self.mock_score = score_patch
             self.mock_bulk_save = bulk_save_patch
+            self.mock_bulk_save.return_value = BulkSaveResult(updated=1)
             yield
 
     def test_handle_successful_update(self):
         """Test successful metrics score update."""
-        fields_weights = {
-            "age_days": (5, 6),
-            "contributors_count": (5, 6),
-            "forks_count": (5, 6),
-            "last_release_days": (5, 6),
-            "last_commit_days": (5, 6),
-            "open_issues_count": (7, 6),
-            "open_pull_requests_count": (5, 6),
-            "owasp_page_last_update_days": (5, 6),
-            "last_pull_request_days": (5, 6),
-            "recent_releases_count": (5, 6),
-            "stars_count": (5, 6),
-            "total_pull_requests_count": (5, 6),
-            "total_releases_count": (5, 6),
-            "unanswered_issues_count": (7, 6),
-            "unassigned_issues_count": (7, 6),
-        }
+        scored_metrics = [MagicMock()]
+        self.mock_score.return_value = scored_metrics
 
-        # Create mock metrics with test data
-        mock_metric = MagicMock(spec=ProjectHealthMetrics)
-        mock_requirements = MagicMock(spec=ProjectHealthRequirements)
-        for field, (metric_weight, requirement_weight) in fields_weights.items():
-            setattr(mock_metric, field, metric_weight)
-            setattr(mock_requirements, field, requirement_weight)
-        mock_metric.project.level = "test_level"
-        mock_metric.project.name = "Test Project"
-        mock_metric.is_funding_requirements_compliant = True
-        mock_metric.is_leader_requirements_compliant = True
-        self.mock_metrics.return_value.select_related.return_value = [mock_metric]
-        self.mock_requirements.return_value = [mock_requirements]
-        mock_requirements.level = "test_level"
-        # Execute command
         with patch("sys.stdout", new=self.stdout):
             call_command("owasp_update_project_health_scores")
 
-        self.mock_requirements.assert_called_once()
-
-        # Check if score was calculated correctly
+        self.mock_metrics.filter.assert_called_once_with(score__isnull=True)
+        self.mock_score.assert_called_once_with(
+            self.mock_metrics.filter.return_value,
+            SCORING_PROFILES[LATEST_SCORING_PROFILE_VERSION],
+        )
         self.mock_bulk_save.assert_called_once_with(
-            [mock_metric],
+            scored_metrics,
             fields=[
                 "score",
+                "score_profile_version",
             ],
         )
-        assert mock_metric.score == EXPECTED_SCORE
-        assert "Updated project health scores successfully." in self.stdout.getvalue()
-        assert "Updating score for project: Test Project" in self.stdout.getvalue()
+        assert (
+            "Updated project health scores successfully: 0 created, 1 updated, 0 unchanged."
+            in self.stdout.getvalue()
+        )
+
+    def test_handle_backfill(self):
+        """Test historical metrics re-scoring."""
+        self.mock_score.return_value = []
+
+        with patch("sys.stdout", new=self.stdout):
+            call_command(
+                "owasp_update_project_health_scores",
+                "--backfill",
+                "--profile",
+                str(LATEST_SCORING_PROFILE_VERSION),
+            )
+
+        self.mock_metrics.exclude.assert_called_once_with(
+            score_profile_version=LATEST_SCORING_PROFILE_VERSION
+        )
+        self.mock_metrics.filter.assert_not_called()
+        assert f"scoring profile v{LATEST_SCORING_PROFILE_VERSION}" in self.stdout.getvalue()
@@ -0,0 +1,122 @@
+from datetime import UTC, datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from apps.owasp.models.project_health_requirements import ProjectHealthRequirements
+from apps.owasp.project_health_scoring import (
+    LATEST_SCORING_PROFILE_VERSION,
+    SCORING_PROFILES,
+    compute_scores,
+    get_days_since,
+    score_project_health_metrics,
+)
+
+EXPECTED_SCORE = 34.0
+NOW = datetime(2025, 6, 1, 12, tzinfo=UTC)
+
+
+def days_ago(days, reference=NOW):
+    return reference - timedelta(days=days)
+
+
+def create_row(pk, reference=NOW, **kwargs):
+    return {
+        "contributors_count": 5,
+        "created_at": days_ago(5, reference),
+        "forks_count": 5,
+        "id": pk,
+        "is_funding_requirements_compliant": True,
+        "is_leader_requirements_compliant": True,
+        "last_committed_at": days_ago(5, reference),
+        "last_released_at": days_ago(5, reference),
+        "nest_created_at": reference,
+        "open_issues_count": 7,
+        "open_pull_requests_count": 5,
+        "owasp_page_last_updated_at": days_ago(5, reference),
+        "project__level": "flagship",
+        "pull_request_last_created_at": days_ago(5, reference),
+        "recent_releases_count": 5,
+        "score": None,
+        "score_profile_version": None,
+        "stars_count": 5,
+        "total_pull_requests_count": 5,
+        "total_releases_count": 5,
+        "unanswered_issues_count": 7,
+        "unassigned_issues_count": 7,
+    } | kwargs
+
+
+@pytest.fixture
+def profile():
+    return SCORING_PROFILES[LATEST_SCORING_PROFILE_VERSION]
+
+
+@pytest.fixture
+def requirements():
+    requirements = ProjectHealthRequirements(level="flagship")
+    for field in SCORING_PROFILES[LATEST_SCORING_PROFILE_VERSION].fields:
+        setattr(requirements, field, 6)
+    requirements.is_funding_requirements_compliant = True
+    requirements.is_leader_requirements_compliant = True
+
+    with patch.object(ProjectHealthRequirements, "objects") as mock_objects:
+        mock_objects.all.return_value = [requirements]
+        yield requirements
+
+
+def create_queryset(rows):
+    queryset = MagicMock()
+    queryset.order_by.return_value.values_list.side_effect = lambda *fields: [
+        tuple(row[field] for field in fields) for row in rows
+    ]
+    return queryset
+
+
+class TestComputeScores:
+    def test_compute_scores(self, profile):
+        metrics = {field: np.array([5, 10]) for field in profile.fields}
+        requirements = {field: np.array([6, 6]) for field in profile.fields}
+
+        scores = compute_scores(profile, metrics, requirements)
+
+        assert scores.tolist() == [
+            sum(profile.backward_weights.values()),
+            sum(profile.forward_weights.values()),
+        ]
+
+
+class TestGetDaysSince:
+    def test_get_days_since(self):
+        references = np.array([NOW.timestamp()] * 3)
+
+        days = get_days_since([days_ago(3), NOW - timedelta(hours=30), None], references)
+
+        assert days.tolist() == [3, 1, 0]
+
+
+class TestScoreProjectHealthMetrics:
+    def test_scores_changed_metrics(self, profile, requirements):
+        historical_reference = days_ago(400)
+        queryset = create_queryset(
+            [
+                create_row(1),
+                create_row(2, score=EXPECTED_SCORE, score_profile_version=profile.version),
+                create_row(3, project__level="other"),
+                create_row(4, reference=historical_reference, score=20.0),
+                create_row(5, last_released_at=None),
+            ]
+        )
+
+        metrics = score_project_health_metrics(queryset, profile)
+
+        assert [(m.id, m.score, m.score_profile_version) for m in metrics] == [
+            (1, EXPECTED_SCORE, profile.version),
+            (4, EXPECTED_SCORE, profile.version),
+            (5, EXPECTED_SCORE, profile.version),
+        ]
+        queryset.order_by.return_value.values_list.assert_called_once()
+
+    def test_no_metrics(self, profile, requirements):
+        assert score_project_health_metrics(create_queryset([]), profile) == []
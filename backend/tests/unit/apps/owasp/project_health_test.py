@@ -0,0 +1,88 @@
+from unittest.mock import MagicMock, patch
+
+from django.db.models.base import ModelState
+
+from apps.owasp.models.project import Project
+from apps.owasp.models.project_health_metrics import ProjectHealthMetrics
+from apps.owasp.project_health import (
+    evaluate_project_health_metrics,
+    get_project_aggregates,
+)
+
+PROJECT_HEALTH_PATH = "apps.owasp.project_health"
+
+
+def create_project(pk, leaders_raw):
+    project = Project(
+        contributors_count=10,
+        forks_count=2,
+        key=f"www-project-{pk}",
+        leaders_raw=leaders_raw,
+        name=f"Project {pk}",
+        open_issues_count=3,
+        releases_count=4,
+        stars_count=100,
+    )
+    project.pk = pk
+    project._state = ModelState()
+    return project
+
+
+class TestGetProjectAggregates:
+    def test_groups_by_project(self):
+        queryset = MagicMock()
+        grouped = queryset.filter.return_value.order_by.return_value.values.return_value
+        grouped.annotate.return_value = [
+            {"project_id": 1, "total_issues_count": 5},
+            {"project_id": 2, "total_issues_count": 7},
+        ]
+
+        result = get_project_aggregates(
+            queryset, "repository__project", [1, 2], total_issues_count="count"
+        )
+
+        assert result == {1: {"total_issues_count": 5}, 2: {"total_issues_count": 7}}
+        queryset.filter.assert_called_once_with(repository__project__in=[1, 2])
+        grouped.annotate.assert_called_once_with(total_issues_count="count")
+
+
+class TestEvaluateProjectHealthMetrics:
+    @patch(f"{PROJECT_HEALTH_PATH}.get_project_aggregates")
+    def test_evaluate(self, mock_get_project_aggregates):
+        project = create_project(1, ["Leader 1", "Leader 2"])
+        other_project = create_project(2, ["Leader 1"])
+        projects = MagicMock()
+        projects.select_related.return_value = [project, other_project]
+        mock_get_project_aggregates.side_effect = [
+            {1: {"total_issues_count": 5, "unanswered_issues_count": 1}},
+            {1: {"open_pull_requests_count": 2, "total_pull_requests_count": 9}},
+            {2: {"recent_releases_count": 1}},
+            {2: {"repositories_count": 1}},
+        ]
+
+        metrics, other_metrics = evaluate_project_health_metrics(projects)
+
+        projects.select_related.assert_called_once_with("owasp_repository")
+        assert mock_get_project_aggregates.call_count == 4
+        for call in mock_get_project_aggregates.call_args_list:
+            assert call.args[2] == [1, 2]
+
+        assert isinstance(metrics, ProjectHealthMetrics)
+        assert metrics.project == project
+        assert metrics.contributors_count == 10
+        assert metrics.is_funding_requirements_compliant
+        assert metrics.is_leader_requirements_compliant
+        assert metrics.open_issues_count == 3
+        assert metrics.open_pull_requests_count == 2
+        assert metrics.owasp_page_last_updated_at is None
+        assert metrics.recent_releases_count == 0
+        assert metrics.total_issues_count == 5
+        assert metrics.total_pull_requests_count == 9
+        assert metrics.total_releases_count == 4
+        assert metrics.unanswered_issues_count == 1
+
+        assert other_metrics.project == other_project
+        assert not other_metrics.is_funding_requirements_compliant
+        assert not other_metrics.is_leader_requirements_compliant
+        assert other_metrics.recent_releases_count == 1
+        assert other_metrics.total_issues_count == 0
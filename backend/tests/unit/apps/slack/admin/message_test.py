@@ -0,0 +1,37 @@
+from unittest.mock import MagicMock, patch
+
+from django.contrib.admin.sites import AdminSite
+
+from apps.slack.admin.message import MessageAdmin
+from apps.slack.models.message import Message
+
+
+class TestMessageAdmin:
+    def test_get_search_results(self):
+        admin = MessageAdmin(Message, AdminSite())
+        queryset = MagicMock()
+        search_queryset = MagicMock()
+
+        with (
+            patch(
+                "django.contrib.admin.ModelAdmin.get_search_results",
+                return_value=(search_queryset, False),
+            ),
+            patch.object(Message, "search") as mock_search,
+        ):
+            result, may_have_duplicates = admin.get_search_results(None, queryset, "zap")
+
+        mock_search.assert_called_once_with("zap", queryset=queryset)
+        search_queryset.__ior__.assert_called_once_with(mock_search.return_value)
+        assert result == search_queryset.__ior__.return_value
+        assert not may_have_duplicates
+
+    def test_get_search_results_empty_term(self):
+        admin = MessageAdmin(Message, AdminSite())
+        queryset = MagicMock()
+
+        with patch.object(Message, "search") as mock_search:
+            result, _ = admin.get_search_results(None, queryset, "")
+
+        mock_search.assert_not_called()
+        assert result == queryset
@@ -6,8 +6,10 @@ from unittest.mock import MagicMock, Mock, patch
 import pytest
 from django.core.management import call_command
 
+from apps.slack.common.member_cache import MemberCache
 from apps.slack.management.commands.slack_sync_messages import Command
 from apps.slack.models import Conversation, Member, Message, Workspace
+from apps.slack.rate_limit import RateLimitedClient, TokenBucket
 
 CONSTANT_4 = 4
 CONSTANT_7 = 7
@@ -24,6 +26,12 @@ TEST_THREAD_TS = "1605000000.000200"
 class TestSlackSyncMessagesCommand:
     """Test cases for the slack_sync_messages management command."""
 
+    @pytest.fixture(autouse=True)
+    def mock_token_bucket_acquire(self):
+        """Skip the rate limit waits."""
+        with patch.object(TokenBucket, "acquire"):
+            yield
+
     @pytest.fixture
     def command(self):
         """Create a Command instance for testing."""
@@ -53,6 +61,9 @@ class TestSlackSyncMessagesCommand:
         conversation = Mock(spec=Conversation)
         conversation.name = "general"
         conversation.slack_channel_id = TEST_CHANNEL_ID
+        conversation.sync_messages_cursor = ""
+        conversation.sync_messages_pending_ts = ""
+        conversation.sync_messages_ts = ""
         conversation.workspace = Mock()
         return conversation
 
@@ -160,7 +171,6 @@ class TestSlackSyncMessagesCommand:
             command.stdout = stdout
             command.handle(
                 batch_size=200,
-                delay=0.5,
                 channel_id=None,
                 max_retries=5,
                 slack_user_id=None,
@@ -183,7 +193,6 @@ class TestSlackSyncMessagesCommand:
             command.stdout = stdout
             command.handle(
                 batch_size=200,
-                delay=0.5,
                 channel_id=None,
                 max_retries=5,
                 slack_user_id=None,
@@ -196,10 +205,8 @@ class TestSlackSyncMessagesCommand:
         assert "No bot token found for Workspace No Token" in output
 
     @patch("apps.slack.management.commands.slack_sync_messages.WebClient")
-    @patch("apps.slack.management.commands.slack_sync_messages.time.sleep")
     def test_handle_successful_sync(
         self,
-        mock_sleep,
         mock_web_client,
         command,
         mock_workspace,
@@ -236,7 +243,8 @@ class TestSlackSyncMessagesCommand:
             patch.object(Workspace.objects, "all", return_value=mock_workspaces),
             patch.object(Conversation.objects, "filter", return_value=mock_conversations),
             patch.object(Message.objects, "filter") as mock_message_filter,
-            patch.object(Member.objects, "get", return_value=mock_member),
+            patch.object(MemberCache, "preload") as mock_preload,
+            patch.object(MemberCache, "get", return_value=mock_member),
             patch.object(Message, "update_data", return_value=mock_message),
             patch.object(Message, "bulk_save") as mock_bulk_save,
         ):
@@ -244,7 +252,6 @@ class TestSlackSyncMessagesCommand:
             command.stdout = stdout
             command.handle(
                 batch_size=200,
-                delay=0.5,
                 channel_id=None,
                 max_retries=5,
                 slack_user_id=None,
@@ -254,6 +261,7 @@ class TestSlackSyncMessagesCommand:
             )
 
         mock_bulk_save.assert_called()
+        mock_preload.assert_called_once()
 
         output = stdout.getvalue()
         assert "Processing workspace: Test Workspace" in output
@@ -283,19 +291,18 @@ class TestSlackSyncMessagesCommand:
             patch.object(Member, "update_data", return_value=Mock(spec=Member)),
         ):
             result = command._create_message(
-                client=mock_client,
+                member_cache=MemberCache(
+                    mock_conversation.workspace, RateLimitedClient(mock_client)
+                ),
                 message_data=message_data,
                 conversation=mock_conversation,
-                delay=0.5,
-                max_retries=5,
                 parent_message=None,
             )
 
         assert result is not None
 
-    @patch("apps.slack.management.commands.slack_sync_messages.time.sleep")
     def test_create_message_member_not_found(
-        self, mock_sleep, command, mock_conversation, mock_user_info_response
+        self, command, mock_conversation, mock_user_info_response
     ):
         """Test _create_message when member is not found."""
         message_data = {
@@ -308,25 +315,24 @@ class TestSlackSyncMessagesCommand:
         mock_client.users_info.return_value = mock_user_info_response
         mock_member = Mock(spec=Member)
 
-        stdout = StringIO()
+        member_cache = MemberCache(mock_conversation.workspace, RateLimitedClient(mock_client))
         with (
-            patch.object(Member.objects, "get", side_effect=Member.DoesNotExist),
+            patch.object(
+                Member.objects, "filter", return_value=Mock(first=Mock(return_value=None))
+            ),
             patch.object(Member, "update_data", return_value=mock_member),
             patch.object(Message, "update_data", return_value=Mock(spec=Message)),
         ):
-            command.stdout = stdout
             result = command._create_message(
-                client=mock_client,
+                member_cache=member_cache,
                 message_data=message_data,
                 conversation=mock_conversation,
-                delay=0.5,
-                max_retries=5,
                 parent_message=None,
             )
 
         assert result is not None
-        output = stdout.getvalue()
-        assert "Created a new member: U12345" in output
+        mock_client.users_info.assert_called_once_with(user="U12345")
+        assert member_cache.members["U12345"] is mock_member
 
     @patch("apps.slack.management.commands.slack_sync_messages.Message.update_data")
     def test_create_message_regular_message(
@@ -343,13 +349,15 @@ class TestSlackSyncMessagesCommand:
         mock_update_data.return_value = mock_message
 
         mock_client = Mock()
-        with patch.object(Member.objects, "get", return_value=mock_member):
+        with patch.object(
+            Member.objects, "filter", return_value=Mock(first=Mock(return_value=mock_member))
+        ):
             result = command._create_message(
-                client=mock_client,
+                member_cache=MemberCache(
+                    mock_conversation.workspace, RateLimitedClient(mock_client)
+                ),
                 message_data=message_data,
                 conversation=mock_conversation,
-                delay=0.5,
-                max_retries=5,
                 parent_message=None,
             )
 
@@ -362,9 +370,8 @@ class TestSlackSyncMessagesCommand:
             save=False,
         )
 
-    @patch("apps.slack.management.commands.slack_sync_messages.time.sleep")
     def test_fetch_thread_replies_success(
-        self, mock_sleep, command, mock_conversation, mock_member, mock_slack_replies_response
+        self, command, mock_conversation, mock_member, mock_slack_replies_response
     ):
         """Test _fetch_replies successful execution."""
         mock_client = Mock()
@@ -380,17 +387,18 @@ class TestSlackSyncMessagesCommand:
 
         with (
             patch.object(Message.objects, "filter") as mock_filter,
-            patch.object(Member.objects, "get", return_value=mock_member),
+            patch.object(
+                Member.objects, "filter", return_value=Mock(first=Mock(return_value=mock_member))
+            ),
             patch.object(Message, "update_data", return_value=mock_reply),
             patch.object(Message, "bulk_save") as mock_bulk_save,
         ):
             mock_filter.return_value.order_by.return_value.first.return_value = None
 
             command._fetch_replies(
-                client=mock_client,
+                client=RateLimitedClient(mock_client),
+                member_cache=MemberCache(mock_parent.conversation.workspace, Mock()),
                 message=mock_parent,
-                delay=0.5,
-                max_retries=5,
             )
 
         mock_client.conversations_replies.assert_called_once()
@@ -427,10 +435,10 @@ class TestSlackSyncMessagesCommand:
         )
 
         parser.add_argument.assert_any_call(
-            "--delay",
-            type=float,
+            "--workers",
+            type=int,
             default=4,
-            help="Delay between API requests in seconds",
+            help="Number of conversations to sync concurrently",
         )
 
         parser.add_argument.assert_any_call(
@@ -496,7 +504,6 @@ class TestSlackSyncMessagesCommand:
                 user_id="U12345",
                 start_at="2025-01-01",
                 end_at="2025-10-01",
-                delay=1.0,
                 max_retries=3,
             )
 
@@ -553,7 +560,6 @@ class TestSlackSyncMessagesCommand:
                 user_id="U12345",
                 start_at=None,
                 end_at=None,
-                delay=0.1,
                 max_retries=3,
             )
 
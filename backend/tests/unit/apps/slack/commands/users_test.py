@@ -1,11 +1,17 @@
 from unittest.mock import MagicMock, patch
 
 import pytest
+from django.core.cache import cache
 
 from apps.slack.commands.users import Users
 from apps.slack.common.presentation import EntityPresentation
 
 
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+
+
 class TestUsersHandler:
     @pytest.fixture
     def mock_command(self):
@@ -0,0 +1,161 @@
+from unittest.mock import MagicMock
+
+import pytest
+from django.core.cache import cache
+
+from apps.slack.common.command_cache import CommandCache, cache_blocks
+from apps.slack.common.presentation import EntityPresentation
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+
+
+class TestCommandCache:
+    @pytest.fixture
+    def mock_time(self, mocker):
+        mock_time = mocker.patch("apps.slack.common.command_cache.time")
+        mock_time.time.return_value = 1000.0
+
+        return mock_time
+
+    def test_get_blocks_renders_once(self, mock_time):
+        command_cache = CommandCache("projects")
+        render = MagicMock(return_value=[{"type": "section"}])
+
+        assert command_cache.get_blocks(render) == [{"type": "section"}]
+        assert command_cache.get_blocks(render, search_query="  ") == [{"type": "section"}]
+
+        render.assert_called_once_with(
+            limit=10, page=1, presentation=EntityPresentation(), search_query=""
+        )
+
+    def test_get_key_normalizes_query(self):
+        command_cache = CommandCache("projects")
+        presentation = EntityPresentation()
+
+        key = command_cache.get_key(
+            limit=10, page=1, presentation=presentation, search_query=" Juice  Shop "
+        )
+
+        assert key == command_cache.get_key(
+            limit=10, page=1, presentation=presentation, search_query="Juice Shop"
+        )
+        assert key != command_cache.get_key(
+            limit=10, page=1, presentation=presentation, search_query="juice shop"
+        )
+
+    @pytest.mark.parametrize(
+        "options",
+        [
+            {"limit": 5},
+            {"page": 2},
+            {"presentation": EntityPresentation(include_pagination=False)},
+            {"search_query": "zap"},
+        ],
+    )
+    def test_get_key_by_options(self, options):
+        command_cache = CommandCache("projects")
+        default_options = {
+            "limit": 10,
+            "page": 1,
+            "presentation": EntityPresentation(),
+            "search_query": "",
+        }
+
+        key = command_cache.get_key(**default_options)
+
+        assert key.startswith("slack-command:projects:")
+        assert key != command_cache.get_key(**{**default_options, **options})
+        assert key != CommandCache("chapters").get_key(**default_options)
+
+    def test_get_blocks_expired(self, mock_time):
+        command_cache = CommandCache("projects", ttl=60)
+        render = MagicMock(side_effect=[[{"text": "old"}], [{"text": "new"}]])
+
+        command_cache.get_blocks(render)
+        mock_time.time.return_value = 1061.0
+
+        assert command_cache.get_blocks(render) == [{"text": "new"}]
+
+    def test_get_blocks_invalidated(self, mock_time):
+        command_cache = CommandCache("projects")
+        render = MagicMock(side_effect=[[{"text": "old"}], [{"text": "new"}]])
+
+        command_cache.get_blocks(render)
+        mock_time.time.return_value = 1001.0
+        command_cache.invalidate()
+        mock_time.time.return_value = 1002.0
+
+        assert command_cache.get_blocks(render) == [{"text": "new"}]
+        assert command_cache.get_blocks(render) == [{"text": "new"}]
+        assert render.call_count == 2
+
+    def test_get_blocks_invalidate_other_command(self, mock_time):
+        command_cache = CommandCache("projects")
+        render = MagicMock(return_value=[{"text": "projects"}])
+
+        command_cache.get_blocks(render)
+        mock_time.time.return_value = 1001.0
+        CommandCache("chapters").invalidate()
+
+        command_cache.get_blocks(render)
+
+        render.assert_called_once()
+
+    def test_get_blocks_serves_stale_on_error(self, mock_time, mocker):
+        mock_logger = mocker.patch("apps.slack.common.command_cache.logger")
+        command_cache = CommandCache("projects")
+        render = MagicMock(side_effect=[[{"text": "old"}], Exception("Algolia is down")])
+
+        command_cache.get_blocks(render)
+        command_cache.invalidate()
+        mock_time.time.return_value = 1001.0
+
+        assert command_cache.get_blocks(render) == [{"text": "old"}]
+        mock_logger.warning.assert_called_once()
+
+    def test_get_blocks_error_without_stale(self):
+        render = MagicMock(side_effect=Exception("Algolia is down"))
+
+        with pytest.raises(Exception, match="Algolia is down"):
+            CommandCache("projects").get_blocks(render)
+
+
+class TestCacheBlocks:
+    def test_cache_blocks(self):
+        render = MagicMock(return_value=[{"type": "section"}])
+
+        def get_blocks(page=1, search_query="", limit=10, presentation=None):
+            return render(
+                page=page, search_query=search_query, limit=limit, presentation=presentation
+            )
+
+        cached_get_blocks = cache_blocks("users")(get_blocks)
+
+        assert cached_get_blocks(2, " OWASP  ZAP ") == [{"type": "section"}]
+        assert cached_get_blocks(page=2, search_query="OWASP ZAP", limit=10) == [
+            {"type": "section"}
+        ]
+
+        render.assert_called_once_with(
+            page=2, search_query="OWASP ZAP", limit=10, presentation=EntityPresentation()
+        )
+
+    def test_cache_blocks_keeps_query_case(self):
+        render = MagicMock(return_value=[{"type": "section"}])
+
+        def get_blocks(page=1, search_query="", limit=10, presentation=None):
+            return render(
+                page=page, search_query=search_query, limit=limit, presentation=presentation
+            )
+
+        cached_get_blocks = cache_blocks("projects")(get_blocks)
+        cached_get_blocks(search_query="OWASP ZAP")
+        cached_get_blocks(search_query="owasp zap")
+
+        assert [call.kwargs["search_query"] for call in render.call_args_list] == [
+            "OWASP ZAP",
+            "owasp zap",
+        ]
@@ -1,17 +1,25 @@
 """Tests for AI handler functionality."""
 
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
 from apps.slack.common.handlers.ai import (
+    get_agent,
     get_blocks,
     get_default_response,
     get_error_blocks,
+    get_question_detector,
     process_ai_query,
 )
 
 
+@pytest.fixture(autouse=True)
+def clear_shared_instances():
+    get_agent.cache_clear()
+    get_question_detector.cache_clear()
+
+
 class TestAiHandler:
     """Test cases for AI handler functionality."""
 
@@ -31,7 +39,7 @@ class TestAiHandler:
 
         result = get_blocks(query)
 
-        mock_process_ai_query.assert_called_once_with(query.strip())
+        mock_process_ai_query.assert_called_once_with(query.strip(), on_token=None)
         mock_markdown.assert_called_once_with(ai_response)
         assert result == [expected_block]
 
@@ -47,7 +55,7 @@ class TestAiHandler:
 
         result = get_blocks(query)
 
-        mock_process_ai_query.assert_called_once_with(query.strip())
+        mock_process_ai_query.assert_called_once_with(query.strip(), on_token=None)
         mock_get_error_blocks.assert_called_once()
         assert result == error_blocks
 
@@ -63,7 +71,7 @@ class TestAiHandler:
 
         result = get_blocks(query)
 
-        mock_process_ai_query.assert_called_once_with(query.strip())
+        mock_process_ai_query.assert_called_once_with(query.strip(), on_token=None)
         mock_get_error_blocks.assert_called_once()
         assert result == error_blocks
 
@@ -87,7 +95,7 @@ class TestAiHandler:
         mock_question_detector_class.assert_called_once()
         mock_question_detector.is_owasp_question.assert_called_once_with(text=query)
         mock_agent_class.assert_called_once()
-        mock_agent.run.assert_called_once_with(query=query)
+        mock_agent.run.assert_called_once_with(query=query, on_token=None)
         assert result == expected_response
 
     @patch("apps.slack.common.handlers.ai.AgenticRAGAgent")
@@ -110,7 +118,7 @@ class TestAiHandler:
         mock_question_detector_class.assert_called_once()
         mock_question_detector.is_owasp_question.assert_called_once_with(text=query)
         mock_agent_class.assert_called_once()
-        mock_agent.run.assert_called_once_with(query=query)
+        mock_agent.run.assert_called_once_with(query=query, on_token=None)
 
     @patch("apps.slack.common.handlers.ai.AgenticRAGAgent")
     @patch("apps.slack.common.handlers.ai.QuestionDetector")
@@ -131,7 +139,7 @@ class TestAiHandler:
         mock_question_detector_class.assert_called_once()
         mock_question_detector.is_owasp_question.assert_called_once_with(text=query)
         mock_agent_class.assert_called_once()
-        mock_agent.run.assert_called_once_with(query=query)
+        mock_agent.run.assert_called_once_with(query=query, on_token=None)
         assert result is None
 
     @patch("apps.slack.common.handlers.ai.QuestionDetector")
@@ -177,4 +185,34 @@ class TestAiHandler:
                 query_with_whitespace = "  What is OWASP?  "
                 get_blocks(query_with_whitespace)
 
-                mock_process_ai_query.assert_called_once_with("What is OWASP?")
+                mock_process_ai_query.assert_called_once_with("What is OWASP?", on_token=None)
+
+    @patch("apps.slack.common.handlers.ai.AgenticRAGAgent")
+    @patch("apps.slack.common.handlers.ai.QuestionDetector")
+    def test_process_ai_query_reuses_instances(
+        self, mock_question_detector_class, mock_agent_class
+    ):
+        """Test the agent and question detector are reused across queries."""
+        mock_question_detector_class.return_value.is_owasp_question.return_value = True
+        mock_agent_class.return_value.run.return_value = {"answer": "OWASP"}
+
+        process_ai_query("What is OWASP?")
+        process_ai_query("What is OWASP ZAP?")
+
+        mock_question_detector_class.assert_called_once()
+        mock_agent_class.assert_called_once()
+        assert mock_agent_class.return_value.run.call_count == 2
+
+    @patch("apps.slack.common.handlers.ai.get_agent")
+    @patch("apps.slack.common.handlers.ai.get_question_detector")
+    def test_process_ai_query_streams_tokens(self, mock_get_question_detector, mock_get_agent):
+        """Test the token callback is passed to the agent."""
+        mock_get_question_detector.return_value.is_owasp_question.return_value = True
+        mock_get_agent.return_value.run.return_value = {"answer": "OWASP"}
+        on_token = MagicMock()
+
+        get_blocks("What is OWASP?", on_token=on_token)
+
+        mock_get_agent.return_value.run.assert_called_once_with(
+            query="What is OWASP?", on_token=on_token
+        )
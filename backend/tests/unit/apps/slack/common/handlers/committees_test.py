@@ -1,11 +1,17 @@
 from unittest.mock import patch
 
 import pytest
+from django.core.cache import cache
 
 from apps.slack.common.handlers.committees import get_blocks
 from apps.slack.common.presentation import EntityPresentation
 
 
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+
+
 class TestCommitteeHandler:
     @pytest.fixture
     def mock_committee_data(self):
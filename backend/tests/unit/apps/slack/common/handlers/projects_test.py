@@ -1,11 +1,17 @@
 from unittest.mock import patch
 
 import pytest
+from django.core.cache import cache
 
 from apps.slack.common.handlers.projects import get_blocks
 from apps.slack.common.presentation import EntityPresentation
 
 
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+
+
 class TestProjectHandler:
     @pytest.fixture
     def mock_project_data(self):
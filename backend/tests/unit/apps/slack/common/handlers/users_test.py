@@ -1,9 +1,15 @@
 import pytest
+from django.core.cache import cache
 
 from apps.slack.common.handlers.users import get_blocks
 from apps.slack.common.presentation import EntityPresentation
 
 
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+
+
 @pytest.fixture
 def mock_users_data():
     return {
@@ -58,7 +64,7 @@ class TestGetUsersBlocks:
     ):
         mocker.patch("apps.github.index.search.user.get_users", return_value=mock_users_data)
         mock_get_pagination = mocker.patch(
-            "apps.slack.common.handlers.users.get_pagination_buttons"
+            "apps.slack.common.handlers.users.get_pagination_buttons", return_value=[]
         )
         presentation = EntityPresentation(include_pagination=include_pagination)
         get_blocks(presentation=presentation)
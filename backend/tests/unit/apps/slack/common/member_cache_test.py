@@ -0,0 +1,159 @@
+from unittest.mock import MagicMock
+
+import pytest
+from slack_sdk.errors import SlackApiError
+
+from apps.slack.common.member_cache import MemberCache
+
+
+class TestMemberCache:
+    target_module = "apps.slack.common.member_cache"
+
+    @pytest.fixture
+    def mock_member_model(self, mocker):
+        return mocker.patch(f"{self.target_module}.Member")
+
+    @pytest.fixture
+    def mock_client(self):
+        return MagicMock()
+
+    @pytest.fixture
+    def workspace(self):
+        return MagicMock()
+
+    @pytest.fixture
+    def member_cache(self, mock_client, workspace):
+        return MemberCache(workspace, mock_client)
+
+    def create_member(self, slack_user_id):
+        member = MagicMock()
+        member.slack_user_id = slack_user_id
+
+        return member
+
+    def test_preload(self, member_cache, mock_member_model, workspace):
+        member = self.create_member("U1")
+        mock_member_model.objects.filter.return_value.iterator.return_value = [member]
+
+        member_cache.preload()
+
+        mock_member_model.objects.filter.assert_called_once_with(workspace=workspace)
+        assert member_cache.is_preloaded
+        assert member_cache.get("U1") is member
+        member_cache.client.call.assert_not_called()
+
+    def test_get_point_lookup(self, member_cache, mock_member_model, workspace):
+        member = self.create_member("U1")
+        mock_member_model.objects.filter.return_value.first.return_value = member
+
+        assert member_cache.get("U1") is member
+        assert member_cache.get("U1") is member
+
+        mock_member_model.objects.filter.assert_called_once_with(
+            slack_user_id="U1", workspace=workspace
+        )
+        member_cache.client.call.assert_not_called()
+
+    def test_get_fetches_user(self, member_cache, mock_member_model, workspace):
+        mock_member_model.objects.filter.return_value.first.return_value = None
+        user_data = {"id": "U1", "name": "user"}
+        member_cache.client.call.return_value = {"ok": True, "user": user_data}
+
+        member = member_cache.get("U1")
+
+        assert member is mock_member_model.update_data.return_value
+        member_cache.client.call.assert_called_once_with("users_info", user="U1")
+        mock_member_model.update_data.assert_called_once_with(user_data, workspace, save=True)
+
+    def test_get_fetches_bot(self, member_cache, mock_member_model, workspace):
+        mock_member_model.objects.filter.return_value.first.return_value = None
+        member_cache.client.call.return_value = {"ok": True, "bot": {"name": "Bot"}}
+
+        member_cache.get("B1", is_bot=True)
+
+        member_cache.client.call.assert_called_once_with("bots_info", bot="B1")
+        mock_member_model.update_data.assert_called_once_with(
+            {"id": "B1", "is_bot": True, "name": "Bot", "real_name": "Bot"},
+            workspace,
+            save=True,
+        )
+
+    def test_get_caches_failed_fetch(self, member_cache, mock_member_model):
+        mock_member_model.objects.filter.return_value.first.return_value = None
+        member_cache.client.call.side_effect = SlackApiError(
+            message="Not found", response={"ok": False, "error": "user_not_found"}
+        )
+
+        assert member_cache.get("U1") is None
+        assert member_cache.get("U1") is None
+
+        member_cache.client.call.assert_called_once()
+        mock_member_model.update_data.assert_not_called()
+
+    def test_get_preloaded_miss_lists_members(self, member_cache, mock_member_model, workspace):
+        mock_member_model.objects.filter.return_value.iterator.return_value = [
+            self.create_member("U1")
+        ]
+        member_cache.preload()
+
+        existing_member = self.create_member("U3")
+        new_member = self.create_member("U2")
+        mock_member_model.objects.filter.return_value = [existing_member]
+        mock_member_model.return_value = new_member
+        member_cache.client.call.side_effect = [
+            {
+                "ok": True,
+                "members": [{"id": "U1"}, {"id": "U2"}],
+                "response_metadata": {"next_cursor": "page-2"},
+            },
+            {
+                "ok": True,
+                "members": [{"id": "U3"}],
+                "response_metadata": {"next_cursor": ""},
+            },
+            {"ok": True, "bot": {"name": "Bot"}},
+        ]
+
+        assert member_cache.get("U2") is new_member
+        assert member_cache.get("U3") is existing_member
+        assert member_cache.get("U4", is_bot=True) is not None
+
+        assert member_cache.client.call.call_args_list == [
+            (("users_list",), {"cursor": None, "limit": 200}),
+            (("users_list",), {"cursor": "page-2", "limit": 200}),
+            (("bots_info",), {"bot": "U4"}),
+        ]
+        mock_member_model.objects.filter.assert_any_call(slack_user_id__in=["U2"])
+        new_member.from_slack.assert_called_once_with({"id": "U2"}, workspace)
+        existing_member.from_slack.assert_called_once_with({"id": "U3"}, workspace)
+        assert mock_member_model.bulk_save.call_count == 2
+
+    def test_get_preloaded_miss_lists_members_once(self, member_cache, mock_member_model):
+        mock_member_model.objects.filter.return_value.iterator.return_value = []
+        member_cache.preload()
+        member_cache.client.call.side_effect = [
+            {"ok": True, "members": [], "response_metadata": {"next_cursor": ""}},
+            SlackApiError(message="Not found", response={"ok": False, "error": "user_not_found"}),
+            SlackApiError(message="Not found", response={"ok": False, "error": "user_not_found"}),
+        ]
+
+        assert member_cache.get("U1") is None
+        assert member_cache.get("U2") is None
+
+        assert [call.args[0] for call in member_cache.client.call.call_args_list] == [
+            "users_list",
+            "users_info",
+            "users_info",
+        ]
+
+    def test_list_members_error(self, member_cache, mock_member_model, mocker):
+        mock_logger = mocker.patch(f"{self.target_module}.logger")
+        member_cache.client.call.side_effect = SlackApiError(
+            message="Fatal", response={"ok": False, "error": "fatal_error"}
+        )
+
+        member_cache.list_members()
+
+        assert member_cache.is_listed
+        mock_member_model.bulk_save.assert_not_called()
+        mock_logger.warning.assert_called_once_with("Failed to list members: %s", "fatal_error")
@@ -0,0 +1,107 @@
+"""Tests for question classifier functionality."""
+
+from unittest.mock import patch
+
+import pytest
+
+from apps.slack.common.question_classifier import QuestionClassifier
+from apps.slack.constants import QUESTION_CLASSIFIER_CACHE_KEY
+
+
+class TestQuestionClassifier:
+    """Test cases for QuestionClassifier functionality."""
+
+    @pytest.fixture
+    def classifier(self):
+        """Fixture to provide a trained QuestionClassifier instance."""
+        return QuestionClassifier(weights={"asvs": 2.0, "lunch": -3.0, "zap": 1.5})
+
+    @patch("apps.slack.common.question_classifier.cache")
+    def test_init_loads_cached_weights(self, mock_cache):
+        """Test that the trained weights are loaded from the cache."""
+        mock_cache.get.return_value = {"zap": 1.0}
+
+        assert QuestionClassifier().weights == {"zap": 1.0}
+        mock_cache.get.assert_called_once_with(QUESTION_CLASSIFIER_CACHE_KEY)
+
+    def test_tokenize(self):
+        """Test text tokenization."""
+        assert QuestionClassifier.tokenize("What's OWASP Top-10, C++ or ZAP?") == [
+            "what",
+            "s",
+            "owasp",
+            "top-10",
+            "c++",
+            "or",
+            "zap",
+        ]
+
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            ("Is there a cheat sheet series on XSS", True),
+            ("How to prevent SQL injection", True),
+            ("Anyone know a good SAST tool", True),
+            ("Thanks everyone for joining today", False),
+            ("", False),
+        ],
+    )
+    def test_is_question_shaped(self, text, expected):
+        """Test question shape heuristics."""
+        assert QuestionClassifier.is_question_shaped(text) is expected
+
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            ("Where is the Juice Shop repo?", True),
+            ("Is OWASP hiring?", True),
+            ("Where is the juice?", False),
+            ("Any news on the project?", True),
+        ],
+    )
+    def test_has_owasp_keyword(self, text, expected):
+        """Test OWASP keyword matching on whole terms."""
+        assert QuestionClassifier.has_owasp_keyword(text) is expected
+
+    def test_train(self):
+        """Test that terms used next to OWASP keywords get positive weights."""
+        texts = [
+            *["How do I run ZAP for security testing?"] * 3,
+            *["Where should we go for lunch?"] * 3,
+        ]
+
+        weights = QuestionClassifier.train(texts)
+
+        assert weights["zap"] > 0
+        assert weights["lunch"] < 0
+        assert "security" in weights
+
+    def test_train_without_both_labels(self):
+        """Test that no weights are learned from single label messages."""
+        assert QuestionClassifier.train(["Where should we go for lunch?"] * 5) == {}
+
+    def test_score(self, classifier):
+        """Test mean weight scoring of known terms."""
+        assert classifier.score("Is ZAP or ASVS better?") == pytest.approx(1.75)
+        assert classifier.score("Nothing known here") == pytest.approx(0.0)
+
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            ("What is the ASVS level 2?", True),
+            ("Any lunch plans?", False),
+            ("What is OWASP lunch?", True),
+            ("ASVS is great", False),
+            ("   ", False),
+        ],
+    )
+    def test_is_candidate(self, classifier, text, expected):
+        """Test candidate selection."""
+        assert classifier.is_candidate(text) is expected
+
+    def test_is_candidate_without_weights(self):
+        """Test that question shaped texts are candidates before training."""
+        classifier = QuestionClassifier(weights={})
+
+        assert classifier.is_candidate("Any lunch plans?")
+        assert not classifier.is_candidate("Lunch was great")
@@ -0,0 +1,56 @@
+from unittest.mock import MagicMock
+
+import pytest
+from slack_sdk.errors import SlackApiError
+
+from apps.slack.common.reply_streamer import ReplyStreamer
+
+
+class TestReplyStreamer:
+    @pytest.fixture
+    def mock_time(self, mocker):
+        return mocker.patch("apps.slack.common.reply_streamer.time")
+
+    def test_updates_message_per_interval(self, mock_time):
+        client = MagicMock()
+        streamer = ReplyStreamer(client, "C123", "123.456", interval=2)
+
+        mock_time.monotonic.return_value = 100.0
+        streamer("OWASP")
+        mock_time.monotonic.return_value = 101.0
+        streamer(" is")
+        mock_time.monotonic.return_value = 102.0
+        streamer(" a foundation.")
+
+        assert client.chat_update.call_count == 2
+        client.chat_update.assert_called_with(
+            channel="C123",
+            ts="123.456",
+            blocks=[
+                {
+                    "type": "section",
+                    "text": {"type": "mrkdwn", "text": "OWASP is a foundation.…"},
+                }
+            ],
+            text="OWASP is a foundation.",
+        )
+
+    def test_skips_blank_text(self, mock_time):
+        client = MagicMock()
+        mock_time.monotonic.return_value = 100.0
+
+        ReplyStreamer(client, "C123", "123.456")("  ")
+
+        client.chat_update.assert_not_called()
+
+    def test_update_error(self, mock_time, mocker):
+        mock_logger = mocker.patch("apps.slack.common.reply_streamer.logger")
+        mock_time.monotonic.return_value = 100.0
+        client = MagicMock()
+        client.chat_update.side_effect = SlackApiError(
+            message="Rate limited", response={"ok": False, "error": "ratelimited"}
+        )
+
+        ReplyStreamer(client, "C123", "123.456")("OWASP")
+
+        mock_logger.warning.assert_called_once_with("Failed to stream reply: %s", "ratelimited")
@@ -1,3 +1,4 @@
+from apps.slack.common.reply_streamer import ReplyStreamer
 from apps.slack.events.app_mention import AppMention
 
 
@@ -73,7 +74,10 @@ class TestAppMention:
         handler.handle_event(event, client)
 
         client.chat_postMessage.assert_called()
-        mock_get_blocks.assert_called_with(query="Help me")
+        mock_get_blocks.assert_called_with(query="Help me", on_token=mocker.ANY)
+        streamer = mock_get_blocks.call_args.kwargs["on_token"]
+        assert isinstance(streamer, ReplyStreamer)
+        assert (streamer.channel, streamer.ts) == ("C123456", "999.999")
         client.chat_update.assert_called_with(
             channel="C123456",
             ts="999.999",
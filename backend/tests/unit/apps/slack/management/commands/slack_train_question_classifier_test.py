@@ -0,0 +1,54 @@
+from io import StringIO
+from unittest.mock import MagicMock
+
+from apps.slack.constants import QUESTION_CLASSIFIER_CACHE_KEY
+from apps.slack.management.commands.slack_train_question_classifier import Command
+
+COMMAND_PATH = "apps.slack.management.commands.slack_train_question_classifier"
+
+
+class TestTrainQuestionClassifierCommand:
+    def test_add_arguments(self):
+        parser = MagicMock()
+        Command().add_arguments(parser)
+
+        assert parser.add_argument.call_args.args == ("--limit",)
+        assert parser.add_argument.call_args.kwargs["default"] == 50000
+
+    def test_handle(self, mocker):
+        mock_message = mocker.patch(f"{COMMAND_PATH}.Message")
+        mock_cache = mocker.patch(f"{COMMAND_PATH}.cache")
+        mock_train = mocker.patch(
+            f"{COMMAND_PATH}.QuestionClassifier.train", return_value={"zap": 1.0}
+        )
+        top_level_messages = mock_message.objects.filter.return_value.exclude.return_value
+        messages = top_level_messages.order_by.return_value.values_list.return_value
+        messages.__getitem__.return_value.iterator.return_value = ["What is ZAP?"]
+
+        command = Command()
+        command.stdout = StringIO()
+        command.handle(limit=10)
+
+        mock_message.objects.filter.assert_called_once_with(parent_message__isnull=True)
+        mock_message.objects.filter.return_value.exclude.assert_called_once_with(text="")
+        top_level_messages.order_by.return_value.values_list.assert_called_once_with(
+            "text", flat=True
+        )
+        messages.__getitem__.assert_called_once_with(slice(None, 10, None))
+        assert list(mock_train.call_args.args[0]) == ["What is ZAP?"]
+        mock_cache.set.assert_called_once_with(
+            QUESTION_CLASSIFIER_CACHE_KEY, {"zap": 1.0}, timeout=None
+        )
+        assert "Trained question classifier with 1 terms" in command.stdout.getvalue()
+
+    def test_handle_not_enough_messages(self, mocker):
+        mocker.patch(f"{COMMAND_PATH}.Message")
+        mock_cache = mocker.patch(f"{COMMAND_PATH}.cache")
+        mocker.patch(f"{COMMAND_PATH}.QuestionClassifier.train", return_value={})
+
+        command = Command()
+        command.stdout = StringIO()
+        command.handle(limit=10)
+
+        mock_cache.set.assert_not_called()
+        assert "Not enough messages to train on" in command.stdout.getvalue()
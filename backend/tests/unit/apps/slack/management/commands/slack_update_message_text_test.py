@@ -0,0 +1,44 @@
+from io import StringIO
+from unittest.mock import MagicMock
+
+from apps.slack.management.commands.slack_update_message_text import Command
+from apps.slack.models.message import Message
+
+COMMAND_PATH = "apps.slack.management.commands.slack_update_message_text"
+
+
+class TestUpdateMessageTextCommand:
+    def test_add_arguments(self):
+        parser = MagicMock()
+        Command().add_arguments(parser)
+
+        assert parser.add_argument.call_args.args == ("--batch-size",)
+        assert parser.add_argument.call_args.kwargs["default"] == 1000
+
+    def test_handle(self, mocker):
+        mock_message = mocker.patch(f"{COMMAND_PATH}.Message")
+        mock_message.clean_text.side_effect = Message.clean_text
+        saved_batches = []
+        mock_message.bulk_save.side_effect = lambda batch, **_kwargs: (
+            saved_batches.append([m.cleaned_text for m in batch]),
+            batch.clear(),
+        )
+        messages = [
+            MagicMock(raw_data={"text": "Hi <@U123>"}),
+            MagicMock(raw_data={"text": "What is ZAP? :smile:"}),
+            MagicMock(raw_data={"text": None}),
+        ]
+        queryset = mock_message.objects.filter.return_value.exclude.return_value
+        queryset.only.return_value.order_by.return_value.iterator.return_value = messages
+
+        command = Command()
+        command.stdout = StringIO()
+        command.handle(batch_size=2)
+
+        mock_message.objects.filter.assert_called_once_with(raw_data__has_key="text", text="")
+        mock_message.objects.filter.return_value.exclude.assert_called_once_with(raw_data__text="")
+        queryset.only.assert_called_once_with("id", "raw_data")
+        assert saved_batches == [["Hi", "What is ZAP?"], [""]]
+        mock_message.bulk_save.assert_called_with([], fields=("cleaned_text", "text"))
+        assert messages[0].text == "Hi <@U123>"
+        assert "Updated text of 3 messages" in command.stdout.getvalue()
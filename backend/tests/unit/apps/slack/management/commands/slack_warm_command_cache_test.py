@@ -0,0 +1,56 @@
+from io import StringIO
+from unittest.mock import MagicMock, patch
+
+import pytest
+from django.core.cache import cache
+from django.core.management import call_command
+
+from apps.slack.common.command_cache import CommandCache
+from apps.slack.common.presentation import EntityPresentation
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+
+
+class TestSlackWarmCommandCache:
+    target_module = "apps.slack.management.commands.slack_warm_command_cache"
+
+    def test_handle(self):
+        stdout = StringIO()
+
+        with patch.object(
+            CommandCache, "get_blocks", autospec=True, return_value=[]
+        ) as mock_get_blocks:
+            call_command("slack_warm_command_cache", stdout=stdout)
+
+        assert [call.args[0].command for call in mock_get_blocks.call_args_list] == [
+            "chapters",
+            "committees",
+            "projects",
+            "users",
+        ]
+        for call in mock_get_blocks.call_args_list:
+            assert call.kwargs == {
+                "limit": 10,
+                "page": 1,
+                "presentation": EntityPresentation(include_pagination=False),
+                "search_query": "",
+            }
+        assert "Warmed /projects command results" in stdout.getvalue()
+
+    @patch("apps.slack.management.commands.slack_warm_command_cache.CommandCache")
+    def test_handle_invalidates_commands(self, mock_command_cache, mocker):
+        for command in ("Chapters", "Committees", "Projects", "Users"):
+            mocker.patch(f"{self.target_module}.{command}")
+
+        call_command("slack_warm_command_cache", stdout=MagicMock())
+
+        assert [call.args[0] for call in mock_command_cache.call_args_list] == [
+            "chapters",
+            "committees",
+            "projects",
+            "users",
+        ]
+        assert mock_command_cache.return_value.invalidate.call_count == 4
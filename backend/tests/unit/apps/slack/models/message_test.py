@@ -1,5 +1,7 @@
 from unittest.mock import MagicMock, Mock, patch
 
+from django.contrib.postgres.search import SearchQuery
+
 from apps.slack.models.conversation import Conversation
 from apps.slack.models.member import Member
 from apps.slack.models.message import Message
@@ -178,7 +180,7 @@ class TestMessageModel:
             patched_message_save.assert_called_once()
 
     def test_str_method(self):
-        message = Message(raw_data={"text": "Short message"})
+        message = Message(text="Short message")
         assert str(message) == "Short message"
 
     def test_str_method_huddle_thread(self):
@@ -189,42 +191,36 @@ class TestMessageModel:
         assert str(message) == "C123 huddle"
 
     def test_cleaned_text_empty(self):
-        """Test cleaned_text returns empty string when text is empty."""
-        message = Message(raw_data={"text": ""})
-        assert message.cleaned_text == ""
+        """Test clean_text returns empty string when text is empty."""
+        assert Message.clean_text("") == ""
 
     def test_cleaned_text_removes_emojis(self):
-        """Test cleaned_text removes emojis."""
-        message = Message(raw_data={"text": "Hello 👋 World"})
-        result = message.cleaned_text
+        """Test clean_text removes emojis."""
+        result = Message.clean_text("Hello 👋 World")
         assert "👋" not in result
         assert "Hello" in result
         assert "World" in result
 
     def test_cleaned_text_removes_user_mentions(self):
-        """Test cleaned_text removes user mentions."""
-        message = Message(raw_data={"text": "Hey <@U12345678> check this"})
-        result = message.cleaned_text
+        """Test clean_text removes user mentions."""
+        result = Message.clean_text("Hey <@U12345678> check this")
         assert "<@U12345678>" not in result
         assert "Hey" in result
         assert "check this" in result
 
     def test_cleaned_text_removes_links(self):
-        """Test cleaned_text removes links."""
-        message = Message(raw_data={"text": "Check <https://example.com|link>"})
-        result = message.cleaned_text
+        """Test clean_text removes links."""
+        result = Message.clean_text("Check <https://example.com|link>")
         assert "https://example.com" not in result
 
     def test_cleaned_text_removes_emoji_aliases(self):
-        """Test cleaned_text removes emoji aliases."""
-        message = Message(raw_data={"text": "Great :smile: work"})
-        result = message.cleaned_text
+        """Test clean_text removes emoji aliases."""
+        result = Message.clean_text("Great :smile: work")
         assert ":smile:" not in result
 
     def test_cleaned_text_normalizes_whitespace(self):
-        """Test cleaned_text normalizes multiple whitespaces."""
-        message = Message(raw_data={"text": "Hello    World"})
-        result = message.cleaned_text
+        """Test clean_text normalizes multiple whitespaces."""
+        result = Message.clean_text("Hello    World")
         assert "    " not in result
 
     def test_subtype_property(self):
@@ -237,19 +233,38 @@ class TestMessageModel:
         message = Message(raw_data={"text": "test"})
         assert message.subtype is None
 
-    def test_text_property(self):
-        """Test text property returns text from raw_data."""
-        message = Message(raw_data={"text": "Hello world"})
-        assert message.text == "Hello world"
+    def test_from_slack_text(self):
+        """Test from_slack materializes the text and cleaned text."""
+        message = Message()
+        message.from_slack(
+            {"text": "Hey <@U12345678>   check :smile:", "ts": "1234567890.123456"},
+            create_model_mock(Conversation),
+        )
+
+        assert message.text == "Hey <@U12345678>   check :smile:"
+        assert message.cleaned_text == "Hey check"
+
+    def test_from_slack_text_default(self):
+        """Test from_slack sets empty text when the message has none."""
+        message = Message()
+        message.from_slack({"ts": "1234567890.123456"}, create_model_mock(Conversation))
 
-    def test_text_property_default(self):
-        """Test text property returns empty string when no text."""
-        message = Message(raw_data={})
         assert message.text == ""
+        assert message.cleaned_text == ""
+
+    def test_search(self, mocker):
+        """Test search filters messages using the full-text search vector."""
+        mock_objects = mocker.patch("apps.slack.models.message.Message.objects")
+
+        result = Message.search("zap scan")
+
+        search_query = mock_objects.all.return_value.filter.call_args.kwargs["search_vector"]
+        assert result == mock_objects.all.return_value.filter.return_value
+        assert search_query == SearchQuery("zap scan", config="english", search_type="websearch")
 
     def test_ts_property(self):
-        """Test ts property returns timestamp from raw_data."""
-        message = Message(raw_data={"ts": "1234567890.123456", "text": ""})
+        """Test ts property returns the Slack message ID."""
+        message = Message(slack_message_id="1234567890.123456")
         assert message.ts == "1234567890.123456"
 
     def test_url_property(self):
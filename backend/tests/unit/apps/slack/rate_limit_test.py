@@ -0,0 +1,120 @@
+from unittest import mock
+
+import pytest
+from slack_sdk.errors import SlackApiError
+
+from apps.slack.rate_limit import RateLimitedClient, TokenBucket
+
+
+def create_ratelimited_error(retry_after="2"):
+    response = mock.MagicMock()
+    response.get.side_effect = lambda key, default=None: (
+        "ratelimited" if key == "error" else default
+    )
+    response.headers = {"Retry-After": retry_after}
+
+    return SlackApiError(message="Rate limited", response=response)
+
+
+class TestTokenBucket:
+    @mock.patch("apps.slack.rate_limit.time")
+    def test_acquire_available_token(self, mock_time):
+        mock_time.monotonic.return_value = 100.0
+        bucket = TokenBucket(requests_per_minute=60)
+
+        bucket.acquire()
+
+        mock_time.sleep.assert_not_called()
+        assert bucket.tokens == 0.0
+
+    @mock.patch("apps.slack.rate_limit.time")
+    def test_acquire_waits_for_refill(self, mock_time):
+        mock_time.monotonic.side_effect = [100.0, 100.0, 100.5, 101.0]
+        bucket = TokenBucket(requests_per_minute=60)
+
+        bucket.acquire()
+        bucket.acquire()
+
+        mock_time.sleep.assert_called_once_with(0.5)
+
+    @mock.patch("apps.slack.rate_limit.time")
+    def test_acquire_waits_for_pause(self, mock_time):
+        mock_time.monotonic.side_effect = [100.0, 100.0, 100.0, 130.0]
+        bucket = TokenBucket(requests_per_minute=60)
+
+        bucket.pause(30)
+        bucket.acquire()
+
+        mock_time.sleep.assert_called_once_with(30.0)
+
+    @mock.patch("apps.slack.rate_limit.time")
+    def test_pause_keeps_latest_resume(self, mock_time):
+        mock_time.monotonic.return_value = 100.0
+        bucket = TokenBucket(requests_per_minute=60)
+
+        bucket.pause(30)
+        bucket.pause(10)
+
+        assert bucket.resume_at == 130.0
+
+
+class TestRateLimitedClient:
+    @pytest.fixture(autouse=True)
+    def mock_acquire(self):
+        with mock.patch.object(TokenBucket, "acquire") as mock_acquire:
+            yield mock_acquire
+
+    def test_get_bucket_by_tier(self):
+        client = RateLimitedClient(mock.Mock())
+
+        assert client.get_bucket("search_messages").interval == 3.0
+        assert client.get_bucket("users_info").interval == 0.6
+        assert client.get_bucket("unknown_method").interval == 1.2
+        assert client.get_bucket("users_info") is client.get_bucket("users_info")
+
+    def test_call(self, mock_acquire):
+        web_client = mock.Mock()
+        client = RateLimitedClient(web_client)
+
+        response = client.call("users_info", user="U123")
+
+        assert response == web_client.users_info.return_value
+        web_client.users_info.assert_called_once_with(user="U123")
+        mock_acquire.assert_called_once()
+
+    def test_call_retries_after_rate_limit(self):
+        web_client = mock.Mock()
+        web_client.conversations_history.side_effect = [
+            create_ratelimited_error(),
+            {"ok": True},
+        ]
+        client = RateLimitedClient(web_client)
+
+        with mock.patch.object(TokenBucket, "pause") as mock_pause:
+            response = client.call("conversations_history", channel="C123")
+
+        assert response == {"ok": True}
+        mock_pause.assert_called_once_with(2.0)
+        assert web_client.conversations_history.call_count == 2
+
+    def test_call_max_retries_exceeded(self):
+        web_client = mock.Mock()
+        web_client.conversations_history.side_effect = create_ratelimited_error()
+        client = RateLimitedClient(web_client, max_retries=1)
+
+        with pytest.raises(SlackApiError):
+            client.call("conversations_history", channel="C123")
+
+        assert web_client.conversations_history.call_count == 2
+
+    def test_call_other_error(self):
+        web_client = mock.Mock()
+        web_client.users_info.side_effect = SlackApiError(
+            message="Not found", response={"ok": False, "error": "user_not_found"}
+        )
+        client = RateLimitedClient(web_client)
+
+        with pytest.raises(SlackApiError):
+            client.call("users_info", user="U123")
+
+        web_client.users_info.assert_called_once()
@@ -0,0 +1,33 @@
+"""Tests for the Slack command cache signal handlers."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from apps.slack.signals.command_cache import (
+    chapter_post_save_invalidate_command_cache,
+    committee_post_save_invalidate_command_cache,
+    project_post_save_invalidate_command_cache,
+    user_post_save_invalidate_command_cache,
+)
+
+
+class TestPostSaveInvalidateCommandCache:
+    """Tests for the entity post_save signal handlers."""
+
+    @pytest.mark.parametrize(
+        ("handler", "command"),
+        [
+            (chapter_post_save_invalidate_command_cache, "chapters"),
+            (committee_post_save_invalidate_command_cache, "committees"),
+            (project_post_save_invalidate_command_cache, "projects"),
+            (user_post_save_invalidate_command_cache, "users"),
+        ],
+    )
+    @patch("apps.slack.signals.command_cache.CommandCache")
+    def test_invalidates_command_cache(self, mock_command_cache, handler, command):
+        """Test signal invalidates the entity command results."""
+        handler(sender=None, instance=MagicMock())
+
+        mock_command_cache.assert_called_once_with(command)
+        mock_command_cache.return_value.invalidate.assert_called_once_with()